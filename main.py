@@ -110,7 +110,11 @@ def _generate_analytics_report(
     """Generate analytics reports if available."""
     if deps and hasattr(deps, "analytics") and deps.analytics:
         try:
-            deps.analytics.generate_reports(force_mode=hasattr(args, "force") and args.force)
+            cache_metrics = deps.cache_service.metrics_summary()
+        except RuntimeError:
+            cache_metrics = None  # Cache service never initialized
+        try:
+            deps.analytics.generate_reports(force_mode=hasattr(args, "force") and args.force, cache_metrics=cache_metrics)
             if logger_console:
                 logger_console.info("📊 Analytics HTML report generated")
         except (OSError, RuntimeError, ValueError) as e:
@@ -215,6 +215,9 @@ Examples:
         # Rotate encryption keys command
         CLI._add_rotate_keys_command(subparsers)
 
+        # Import MusicBrainz dump command
+        CLI._add_import_musicbrainz_command(subparsers)
+
         return parser
 
     @staticmethod
@@ -276,6 +279,26 @@ Examples:
             help="Skip creating backup of old encryption key",
         )
 
+    @staticmethod
+    def _add_import_musicbrainz_command(subparsers: _SubParsersAction) -> None:
+        """Add import MusicBrainz dump command."""
+        parser = subparsers.add_parser(
+            "import_musicbrainz",
+            aliases=["mb-import"],
+            help="Import MusicBrainz dump files into the local lookup store",
+            description="Load release-group, release, artist-credit and artist-credit-name dumps (JSON Lines or TSV) into the local store",
+        )
+        parser.add_argument(
+            "files",
+            nargs="+",
+            help="Dump files; the entity is inferred from each file name unless --entity is given",
+        )
+        parser.add_argument(
+            "--entity",
+            choices=["release-group", "release", "artist-credit", "artist-credit-name"],
+            help="Entity type of all given files",
+        )
+
     def parse_args(self, args: list[str] | None = None) -> argparse.Namespace:
         """Parse command-line arguments.
 
@@ -20,7 +20,6 @@ from core.run_tracking import IncrementalRunTracker
 from core.tracks.artist_renamer import ArtistRenamer
 from core.tracks.genre_manager import GenreManager
 from core.tracks.incremental_filter import IncrementalFilterService
-from core.tracks.track_delta import has_identity_changed
 from core.tracks.track_processor import TrackProcessor
 from core.tracks.year_retriever import YearRetriever
 from metrics.change_reports import (
@@ -32,7 +31,6 @@ from metrics.change_reports import (
 if TYPE_CHECKING:
     from core.models.track_models import ChangeLogEntry, TrackDict
     from datetime import datetime
-    from services.cache.api_cache import ApiCacheService
     from services.dependency_container import DependencyContainer
     from core.models.cache_types import PendingAlbumEntry
 
@@ -63,6 +61,7 @@ class MusicUpdater:
             config=deps.app_config,
             analytics=deps.analytics,
             dry_run=deps.dry_run,
+            cpu_executor=deps.cpu_executor,
         )
 
         rename_config_path = self._resolve_artist_rename_config_path(deps)
@@ -81,6 +80,7 @@ class MusicUpdater:
             analytics=deps.analytics,
             config=deps.app_config,
             dry_run=deps.dry_run,
+            cpu_executor=deps.cpu_executor,
         )
 
         self.year_retriever = YearRetriever(
@@ -586,14 +586,11 @@ class MusicUpdater:
                 snapshot_map = {str(t.id): t for t in snapshot_tracks if t.id}
                 api_cache = self.deps.cache_service.api_service
 
-                # Emit cache invalidation for removed tracks
-                self._emit_removed_track_events(delta.removed_ids, snapshot_map, api_cache)
-
                 result = await self.snapshot_manager.merge_smart_delta(snapshot_tracks, delta)
 
-                # Emit cache invalidation for identity changes (artist/album renamed)
-                if result:
-                    self._emit_identity_change_events(delta.updated_ids, snapshot_map, result, api_cache)
+                # Invalidate API cache for removed tracks and identity changes (artist/album renamed) in one batch
+                current_map = {str(t.id): t for t in result if t.id} if result else {}
+                await api_cache.invalidate_for_delta(delta, snapshot_map, current_map)
         except (OSError, RuntimeError, ValueError, KeyError) as smart_delta_error:
             # Broad catch intentional: Smart Delta is an optimization, not critical path.
             # Any failure should gracefully fall back to full batch scan.
@@ -603,49 +600,6 @@ class MusicUpdater:
 
         return result
 
-    def _emit_removed_track_events(
-        self,
-        removed_ids: list[str],
-        snapshot_map: dict[str, TrackDict],
-        api_cache: ApiCacheService,
-    ) -> None:
-        """Emit cache invalidation events for removed tracks."""
-        if not removed_ids:
-            return
-
-        for track_id in removed_ids:
-            if stored := snapshot_map.get(track_id):
-                api_cache.emit_track_removed(track_id, stored.artist or "", stored.album or "")
-
-        self.console_logger.info("Emitted cache invalidation for %d removed tracks", len(removed_ids))
-
-    def _emit_identity_change_events(
-        self,
-        updated_ids: list[str],
-        snapshot_map: dict[str, TrackDict],
-        current_tracks: list[TrackDict],
-        api_cache: ApiCacheService,
-    ) -> None:
-        """Emit cache invalidation for tracks with identity changes (artist/album renamed)."""
-        if not updated_ids:
-            return
-
-        result_map = {str(t.id): t for t in current_tracks if t.id}
-        identity_changed_count = 0
-
-        for track_id in updated_ids:
-            stored = snapshot_map.get(track_id)
-            current = result_map.get(track_id)
-            if stored and current and has_identity_changed(current, stored):
-                api_cache.emit_track_modified(track_id, stored.artist or "", stored.album or "")
-                identity_changed_count += 1
-
-        if identity_changed_count:
-            self.console_logger.info(
-                "Emitted cache invalidation for %d tracks with identity changes",
-                identity_changed_count,
-            )
-
     async def _fetch_tracks_for_pipeline_mode(self, force: bool = False) -> list[TrackDict]:
         """Fetch tracks based on the current mode (test or normal).
 
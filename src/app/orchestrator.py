@@ -5,7 +5,9 @@ This module handles the high-level coordination of all operations.
 
 from __future__ import annotations
 
+import asyncio
 import shutil
+import sqlite3
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar
@@ -15,6 +17,7 @@ import yaml
 from app.features.batch.batch_processor import BatchProcessor
 from app.music_updater import MusicUpdater
 from core.models.metadata_utils import is_music_app_running, reset_cleaning_exceptions_log
+from services.api.musicbrainz_local import DumpEntity, MusicBrainzLocalStore
 from stubs.cryptography.secure_config import SecureConfig, SecurityConfigError
 
 if TYPE_CHECKING:
@@ -33,7 +36,7 @@ class Orchestrator:
 
     """
 
-    COMMANDS_BYPASSING_MUSIC_CHECK: ClassVar[set[str]] = {"rotate_keys", "rotate-keys"}
+    COMMANDS_BYPASSING_MUSIC_CHECK: ClassVar[set[str]] = {"rotate_keys", "rotate-keys", "import_musicbrainz", "mb-import"}
 
     def __init__(self, deps: DependencyContainer) -> None:
         self.deps = deps
@@ -100,6 +103,8 @@ class Orchestrator:
                 await self._run_batch(args)
             case "rotate_keys" | "rotate-keys":
                 self._run_rotate_encryption_keys(args)
+            case "import_musicbrainz" | "mb-import":
+                await self._run_import_musicbrainz(args)
             case _:
                 await self._run_main_workflow(args)
 
@@ -215,6 +220,26 @@ class Orchestrator:
             force=args.force,
         )
 
+    async def _run_import_musicbrainz(self, args: argparse.Namespace) -> None:
+        """Import MusicBrainz dump files into the local lookup store."""
+        store = MusicBrainzLocalStore(MusicBrainzLocalStore.database_path(self.config))
+        entity = DumpEntity(args.entity) if getattr(args, "entity", None) else None
+        try:
+            for file_name in args.files:
+                try:
+                    result = await asyncio.to_thread(store.import_file, Path(file_name), entity)
+                except (OSError, ValueError, sqlite3.Error) as e:
+                    self.error_logger.exception("Failed to import MusicBrainz dump %s: %s", file_name, e)
+                    continue
+                self.console_logger.info("Imported %d %s records from %s", result.imported, result.entity.value, file_name)
+            counts = await asyncio.to_thread(store.counts)
+        finally:
+            store.close()
+
+        self.console_logger.info("Local MusicBrainz store %s now holds %s", store.path, counts)
+        if not self.config.year_retrieval.musicbrainz_local.enabled:
+            self.console_logger.warning("Set year_retrieval.musicbrainz_local.enabled to use the imported data")
+
     def _decrypt_existing_tokens(self, secure_config: SecureConfig, api_auth: dict[str, Any]) -> dict[str, str]:
         """Decrypt existing tokens from configuration.
 
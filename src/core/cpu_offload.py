@@ -0,0 +1,293 @@
+"""CPU-bound work offload and event-loop lag measurement.
+
+Parsing multi-megabyte AppleScript output, computing dominant genres for a
+whole library and scoring albums with hundreds of releases run long enough
+on the event loop thread to stall in-flight HTTP and AppleScript I/O.
+``CpuExecutor`` sends such batches to a worker pool and awaits the result,
+so the loop keeps serving other tasks. Small batches stay inline, where
+pickling would cost more than the work.
+
+Work units are plain module-level functions and bound methods of picklable
+objects (``parse_track_rows``, ``collect_dominant_genres``,
+``ReleaseScorer.score_releases``): they take and return plain data, so they
+run unchanged in a worker process or subinterpreter. Loggers never cross
+the process boundary; the parent logs what the work unit returns.
+
+``EventLoopLagMonitor`` samples how late the loop wakes up from a short
+sleep, which is how long other tasks had to wait for a turn.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import contextlib
+import functools
+import logging
+import multiprocessing
+import statistics
+import sys
+from concurrent.futures import BrokenExecutor, Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from core.logger import LogFormat
+from core.models.metadata_utils import collect_dominant_genres, log_genre_messages, log_malformed_rows, log_parse_input, parse_track_rows
+from core.models.track_models import CpuExecutorConfig, CpuExecutorMode
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+
+    from core.models.track_models import TrackDict
+    from services.api.year_scoring import ReleaseScorer, ScoringContext
+
+__all__ = [
+    "CpuExecutor",
+    "EventLoopLagMonitor",
+    "LoopLagStats",
+]
+
+# Lag samples kept for percentiles (oldest dropped first)
+_MAX_LAG_SAMPLES = 100_000
+_P99_QUANTILES = 100
+
+
+def _free_threaded() -> bool:
+    """Check whether the interpreter runs without the GIL."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+class CpuExecutor:
+    """Runs CPU-bound work units inline or in a worker pool.
+
+    The pool is created on the first offloaded batch. If it breaks (a
+    worker crashed or could not start), the executor logs the error once
+    and runs every later batch inline.
+
+    Args:
+        config: Offload settings (``cpu_executor``)
+        console_logger: Logger for pool lifecycle messages
+        error_logger: Logger for pool failures
+
+    """
+
+    def __init__(
+        self,
+        config: CpuExecutorConfig | None,
+        console_logger: logging.Logger,
+        error_logger: logging.Logger,
+    ) -> None:
+        self.config = config or CpuExecutorConfig()
+        self.console_logger = console_logger
+        self.error_logger = error_logger
+        self._pool: Executor | None = None
+        self._broken = False
+        self.stats = {"offloaded": 0, "inline": 0}
+
+    @property
+    def enabled(self) -> bool:
+        """Whether batches above the thresholds leave the event loop thread."""
+        return self.config.mode is not CpuExecutorMode.INLINE and not self._broken
+
+    def _create_pool(self) -> Executor:
+        """Create the worker pool for the configured mode."""
+        if self.config.mode is CpuExecutorMode.INTERPRETER:
+            if (interpreter_pool := getattr(concurrent.futures, "InterpreterPoolExecutor", None)) is not None:
+                pool: Executor = interpreter_pool(max_workers=self.config.max_workers)
+                self.console_logger.info("%s started a subinterpreter pool", LogFormat.entity("CpuExecutor"))
+                return pool
+            if _free_threaded():
+                self.console_logger.info("%s started a thread pool (free-threaded build)", LogFormat.entity("CpuExecutor"))
+                return ThreadPoolExecutor(max_workers=self.config.max_workers, thread_name_prefix="cpu-executor")
+            self.console_logger.warning("Subinterpreter pools need Python 3.14+; using a process pool instead")
+
+        # Spawned workers re-import the work units instead of inheriting the loop and logging threads
+        self.console_logger.info("%s started a process pool", LogFormat.entity("CpuExecutor"))
+        return ProcessPoolExecutor(max_workers=self.config.max_workers, mp_context=multiprocessing.get_context("spawn"))
+
+    def should_offload(self, size: int, threshold: int) -> bool:
+        """Check whether a batch of ``size`` units is large enough to offload.
+
+        Args:
+            size: Batch size (bytes, artists or releases)
+            threshold: Minimum size from the config
+
+        Returns:
+            True if the batch goes to the worker pool
+
+        """
+        return self.enabled and size >= threshold
+
+    async def run[R](self, func: Callable[..., R], *args: Any, offload: bool = True) -> R:
+        """Run a work unit in the pool, or inline when offloading is off.
+
+        Args:
+            func: Picklable work unit (module-level function or bound method)
+            *args: Picklable positional arguments
+            offload: False forces inline execution (batch below threshold)
+
+        Returns:
+            The work unit's result
+
+        """
+        if not (offload and self.enabled):
+            self.stats["inline"] += 1
+            return func(*args)
+
+        if self._pool is None:
+            self._pool = self._create_pool()
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(self._pool, func, *args)
+        except BrokenExecutor as e:
+            self.error_logger.exception("CPU worker pool failed, running CPU-bound work inline from now on: %s", e)
+            self._broken = True
+            self._shutdown_pool()
+            self.stats["inline"] += 1
+            return func(*args)
+        self.stats["offloaded"] += 1
+        return result
+
+    async def parse_tracks(self, raw_data: str, error_logger: logging.Logger) -> list[TrackDict]:
+        """Parse AppleScript output, in a worker for outputs of at least ``min_parse_bytes``.
+
+        Args:
+            raw_data: Raw string data from AppleScript
+            error_logger: Logger for error output
+
+        Returns:
+            Parsed tracks (same result as ``parse_tracks``)
+
+        """
+        if not log_parse_input(raw_data, error_logger):
+            return []
+        offload = self.should_offload(len(raw_data), self.config.min_parse_bytes)
+        return log_malformed_rows(await self.run(parse_track_rows, raw_data, offload=offload), error_logger)
+
+    async def dominant_genres(self, artist_groups: Mapping[str, Sequence[TrackDict]], error_logger: logging.Logger) -> dict[str, str]:
+        """Determine dominant genres, in a worker for at least ``min_genre_artists`` artists.
+
+        Args:
+            artist_groups: Tracks keyed by artist
+            error_logger: Logger for error output
+
+        Returns:
+            Dominant genre keyed by artist
+
+        """
+        offload = self.should_offload(len(artist_groups), self.config.min_genre_artists)
+        return log_genre_messages(await self.run(collect_dominant_genres, artist_groups, offload=offload), error_logger)
+
+    async def score_releases(
+        self,
+        scorer: ReleaseScorer,
+        releases: Sequence[dict[str, Any]],
+        artist_norm: str,
+        album_norm: str,
+        *,
+        source: str,
+        context: ScoringContext,
+    ) -> list[int]:
+        """Score an album's releases, in a worker for at least ``min_scoring_releases`` releases.
+
+        Args:
+            scorer: Release scorer (pickled with its config for each offloaded batch)
+            releases: Candidate releases of the album
+            artist_norm: Normalized artist name
+            album_norm: Normalized album name
+            source: Default source for releases without a ``source`` field
+            context: Per-album scoring context
+
+        Returns:
+            Scores in the order of ``releases``
+
+        """
+        # Score breakdowns are debug log output, which a worker would drop
+        debug = scorer.console_logger.isEnabledFor(logging.DEBUG)
+        offload = not debug and self.should_offload(len(releases), self.config.min_scoring_releases)
+        work = functools.partial(scorer.score_releases, releases, artist_norm, album_norm, source=source, context=context)
+        return await self.run(work, offload=offload)
+
+    def _shutdown_pool(self) -> None:
+        """Shut the pool down without waiting for running work."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    async def shutdown(self) -> None:
+        """Wait for running work units and stop the workers."""
+        if self._pool is None:
+            return
+        pool, self._pool = self._pool, None
+        await asyncio.to_thread(pool.shutdown, wait=True, cancel_futures=True)
+        self.console_logger.info(
+            "%s stopped (%d batches offloaded, %d inline)",
+            LogFormat.entity("CpuExecutor"),
+            self.stats["offloaded"],
+            self.stats["inline"],
+        )
+
+
+class LoopLagStats(NamedTuple):
+    """Event-loop lag summary in milliseconds."""
+
+    samples: int
+    mean_ms: float
+    p99_ms: float
+    max_ms: float
+
+
+class EventLoopLagMonitor:
+    """Measures how late the event loop resumes a periodically sleeping task.
+
+    Args:
+        interval: Sleep between samples in seconds
+
+    """
+
+    def __init__(self, interval: float = 0.05) -> None:
+        self.interval = interval
+        self._lags: list[float] = []
+        self._task: asyncio.Task[None] | None = None
+        # Loop time the sampling task is due to resume at
+        self._due: float | None = None
+
+    def _record(self, lag: float) -> None:
+        self._lags.append(max(0.0, lag))
+        if len(self._lags) > _MAX_LAG_SAMPLES:
+            del self._lags[: len(self._lags) - _MAX_LAG_SAMPLES]
+
+    async def _sample(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            self._due = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self._record(loop.time() - self._due)
+
+    def start(self) -> None:
+        """Start sampling on the running loop."""
+        if self._task is None:
+            self._due = asyncio.get_running_loop().time()
+            self._task = asyncio.create_task(self._sample(), name="event-loop-lag-monitor")
+
+    async def stop(self) -> LoopLagStats:
+        """Stop sampling and summarize the collected lags.
+
+        A wake-up that is already overdue counts as a final sample, so a
+        stall that lasts until the end of the run is not lost.
+        """
+        if self._task is not None:
+            if self._due is not None and (overdue := asyncio.get_running_loop().time() - self._due) > 0:
+                self._record(overdue)
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+            self._due = None
+        return self.summary()
+
+    def summary(self) -> LoopLagStats:
+        """Summarize the lags collected so far."""
+        if not self._lags:
+            return LoopLagStats(0, 0.0, 0.0, 0.0)
+        p99 = statistics.quantiles(self._lags, n=_P99_QUANTILES, method="inclusive")[-1] if len(self._lags) > 1 else self._lags[0]
+        return LoopLagStats(len(self._lags), statistics.fmean(self._lags) * 1000, p99 * 1000, max(self._lags) * 1000)
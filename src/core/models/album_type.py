@@ -20,12 +20,17 @@ Pattern Configuration:
 
 from __future__ import annotations
 
+import functools
 import re
 from dataclasses import dataclass
 from enum import Enum
 from typing import TYPE_CHECKING, Final
 
+from core.models.keyword_matcher import KeywordMatcher
+from core.models.normalization import memoized_normalizer
+
 if TYPE_CHECKING:
+    from core.models.keyword_matcher import KeywordMatch
     from core.models.track_models import AppConfig
 
 __all__ = [
@@ -230,6 +235,11 @@ def get_patterns() -> AlbumTypePatterns:
     return AlbumTypePatterns.from_defaults()
 
 
+_SEPARATOR_RE = re.compile(r"[-_]")
+_BRACKET_RE = re.compile(r"[()[\]{}]")
+
+
+@memoized_normalizer("album_type._normalize_for_matching")
 def _normalize_for_matching(text: str) -> str:
     """Normalize text for pattern matching.
 
@@ -238,32 +248,36 @@ def _normalize_for_matching(text: str) -> str:
     # Lowercase
     text = text.lower()
     # Replace hyphens and underscores with spaces
-    text = re.sub(r"[-_]", " ", text)
+    text = _SEPARATOR_RE.sub(" ", text)
     # Remove parentheses content markers but keep the text
-    text = re.sub(r"[()[\]{}]", " ", text)
+    text = _BRACKET_RE.sub(" ", text)
     # Normalize whitespace
     return " ".join(text.split())
 
 
-def _find_pattern_match(normalized_text: str, patterns: frozenset[str]) -> str | None:
-    """Find first matching pattern in text.
+@functools.lru_cache(maxsize=16)
+def _build_matcher(special: frozenset[str], compilation: frozenset[str], reissue: frozenset[str]) -> KeywordMatcher:
+    """Build one word-boundary matcher over all pattern categories (once per pattern set)."""
+    # Normalize each pattern the same way as the text (hyphens/underscores to spaces)
+    return KeywordMatcher(special | compilation | reissue, word_boundary=True, normalize=lambda pattern: _SEPARATOR_RE.sub(" ", pattern))
+
+
+def _find_pattern_match(matches: list[KeywordMatch], patterns: frozenset[str]) -> str | None:
+    """Find the most specific matched pattern of a category.
 
     Args:
-        normalized_text: Normalized album name
-        patterns: Set of patterns to match against
+        matches: All pattern matches found in the normalized album name
+        patterns: Set of patterns of the category
 
     Returns:
-        Matched pattern string or None
+        Matched pattern string (longest, then leftmost) or None
+
     """
-    for pattern in patterns:
-        # Normalize the pattern the same way as the text
-        # (convert hyphens/underscores to spaces)
-        normalized_pattern = re.sub(r"[-_]", " ", pattern)
-        # Check if pattern appears as a word boundary match
-        # This prevents "demos" matching "demonstrations"
-        if re.search(rf"\b{re.escape(normalized_pattern)}\b", normalized_text):
-            return pattern  # Return original pattern (not normalized)
-    return None
+    # Word boundary match prevents "demos" matching "demonstrations"
+    in_category = [match for match in matches if match.pattern in patterns]
+    if not in_category:
+        return None
+    return min(in_category, key=lambda match: (match.start - match.end, match.start)).pattern
 
 
 def detect_album_type(album_name: str) -> AlbumTypeInfo:
@@ -298,22 +312,24 @@ def detect_album_type(album_name: str) -> AlbumTypeInfo:
 
     normalized = _normalize_for_matching(album_name)
     patterns = get_patterns()
+    # One scan finds the matches of all categories; category order decides precedence
+    matches = _build_matcher(patterns.special, patterns.compilation, patterns.reissue).find_all(normalized)
 
-    if pattern := _find_pattern_match(normalized, patterns.special):
+    if pattern := _find_pattern_match(matches, patterns.special):
         return AlbumTypeInfo(
             album_type=AlbumType.SPECIAL,
             detected_pattern=pattern,
             strategy=YearHandlingStrategy.MARK_AND_SKIP,
         )
 
-    if pattern := _find_pattern_match(normalized, patterns.compilation):
+    if pattern := _find_pattern_match(matches, patterns.compilation):
         return AlbumTypeInfo(
             album_type=AlbumType.COMPILATION,
             detected_pattern=pattern,
             strategy=YearHandlingStrategy.MARK_AND_SKIP,
         )
 
-    if pattern := _find_pattern_match(normalized, patterns.reissue):
+    if pattern := _find_pattern_match(matches, patterns.reissue):
         return AlbumTypeInfo(
             album_type=AlbumType.REISSUE,
             detected_pattern=pattern,
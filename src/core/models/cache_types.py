@@ -59,6 +59,19 @@ class VerificationReason(StrEnum):
             return cls.NO_YEAR_FOUND
 
 
+# FALLBACK rejections that skip an album until its verification interval elapses
+RECENT_REJECTION_REASONS: frozenset[VerificationReason] = frozenset(
+    {
+        VerificationReason.SUSPICIOUS_YEAR_CHANGE,
+        VerificationReason.IMPLAUSIBLE_EXISTING_YEAR,
+        VerificationReason.ABSURD_YEAR_NO_EXISTING,
+        VerificationReason.SPECIAL_ALBUM_COMPILATION,  # AlbumType.COMPILATION
+        VerificationReason.SPECIAL_ALBUM_SPECIAL,  # AlbumType.SPECIAL (B-Sides, Demo, Vault)
+        VerificationReason.SPECIAL_ALBUM_REISSUE,  # AlbumType.REISSUE (Remastered, Anniversary, Deluxe)
+    }
+)
+
+
 @dataclass(frozen=True, slots=True)
 class PendingAlbumEntry:
     """Immutable entry representing a pending album verification.
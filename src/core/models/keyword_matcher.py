@@ -0,0 +1,200 @@
+"""Multi-pattern keyword matching with an Aho-Corasick automaton.
+
+Album-type detection, soundtrack detection, edition-suffix cleaning and
+reissue detection all ask the same question: which of a configured set of
+keywords occur in a name? Testing every keyword separately costs one scan
+per keyword. ``KeywordMatcher`` builds a single automaton from the keyword
+set once and reports all occurrences in one left-to-right pass over the
+text, independent of how many keywords are configured.
+
+Matching is case-insensitive. With ``word_boundary=True`` a match only
+counts where a regex ``\\b`` would match at both of its ends, so "demos"
+does not match inside "demonstrations".
+"""
+
+from __future__ import annotations
+
+import functools
+from collections import deque
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+__all__ = [
+    "KeywordMatch",
+    "KeywordMatcher",
+    "get_keyword_matcher",
+]
+
+# Distinct keyword sets kept by get_keyword_matcher (one per config list)
+_MATCHER_CACHE_SIZE = 64
+
+
+class KeywordMatch(NamedTuple):
+    """A keyword occurrence in the lowercased text."""
+
+    start: int
+    end: int
+    pattern: str
+
+
+def _is_word_char(char: str) -> bool:
+    """Match the character class of regex ``\\w`` (Unicode alphanumerics and underscore)."""
+    return char.isalnum() or char == "_"
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton over a fixed set of keywords.
+
+    The trie, failure links and merged outputs are built once in the
+    constructor. Transitions that fall back through failure links are
+    cached on first use, so a scan costs one dict lookup per character.
+
+    Args:
+        patterns: Keywords to match; empty keywords are ignored
+        word_boundary: Only report matches delimited by word boundaries
+        normalize: Optional transform applied to each keyword before it
+            is lowercased (the reported pattern is the original keyword)
+
+    """
+
+    def __init__(
+        self,
+        patterns: Iterable[str],
+        *,
+        word_boundary: bool = False,
+        normalize: Callable[[str], str] | None = None,
+    ) -> None:
+        self._patterns: list[str] = []
+        self._lengths: list[int] = []
+        self._word_boundary = word_boundary
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        outputs: list[list[int]] = [[]]
+
+        for pattern in patterns:
+            key = (normalize(pattern) if normalize else pattern).lower()
+            if not key:
+                continue
+            state = 0
+            for char in key:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(len(self._patterns))
+            self._patterns.append(pattern)
+            self._lengths.append(len(key))
+
+        # Breadth-first: failure link of a state is the longest proper suffix in the trie
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                outputs[child].extend(outputs[self._fail[child]])
+
+        self._outputs: list[tuple[int, ...]] = [tuple(ids) for ids in outputs]
+
+    @property
+    def patterns(self) -> tuple[str, ...]:
+        """Keywords the automaton was built from."""
+        return tuple(self._patterns)
+
+    def __len__(self) -> int:
+        """Return the number of keywords."""
+        return len(self._patterns)
+
+    def _transition(self, state: int, char: str) -> int:
+        """Follow failure links for ``char`` and cache the resulting transition."""
+        fallback = state
+        while fallback and char not in self._goto[fallback]:
+            fallback = self._fail[fallback]
+        target = self._goto[fallback].get(char, 0)
+        self._goto[state][char] = target
+        return target
+
+    def _is_bounded(self, text: str, start: int, end: int) -> bool:
+        """Check regex ``\\b`` semantics at both ends of ``text[start:end]``."""
+        before = start > 0 and _is_word_char(text[start - 1])
+        after = end < len(text) and _is_word_char(text[end])
+        return before != _is_word_char(text[start]) and after != _is_word_char(text[end - 1])
+
+    def _scan(self, text: str) -> Iterator[KeywordMatch]:
+        """Yield matches in ``text`` (already lowercased) by end position."""
+        goto = self._goto
+        outputs = self._outputs
+        state = 0
+        for index, char in enumerate(text):
+            next_state = goto[state].get(char)
+            state = self._transition(state, char) if next_state is None else next_state
+            if not outputs[state]:
+                continue
+            end = index + 1
+            for pattern_id in outputs[state]:
+                start = end - self._lengths[pattern_id]
+                if not self._word_boundary or self._is_bounded(text, start, end):
+                    yield KeywordMatch(start, end, self._patterns[pattern_id])
+
+    def find_all(self, text: str) -> list[KeywordMatch]:
+        """Find all keyword occurrences in one pass.
+
+        Args:
+            text: Text to search (matched case-insensitively)
+
+        Returns:
+            Matches ordered by end position; offsets refer to ``text.lower()``
+
+        """
+        if not self._patterns or not text:
+            return []
+        return list(self._scan(text.lower()))
+
+    def contains_any(self, text: str) -> bool:
+        """Check whether any keyword occurs in the text, stopping at the first match."""
+        if not self._patterns or not text:
+            return False
+        return next(self._scan(text.lower()), None) is not None
+
+    def best_match(self, text: str) -> str | None:
+        """Return the most specific keyword found in the text.
+
+        The longest matched keyword wins ("greatest hits" over "hits"),
+        the leftmost occurrence breaks ties.
+
+        Args:
+            text: Text to search (matched case-insensitively)
+
+        Returns:
+            Original keyword or None if nothing matches
+
+        """
+        matches = self.find_all(text)
+        if not matches:
+            return None
+        return min(matches, key=lambda match: (match.start - match.end, match.start)).pattern
+
+
+@functools.lru_cache(maxsize=_MATCHER_CACHE_SIZE)
+def get_keyword_matcher(patterns: tuple[str, ...] | frozenset[str], *, word_boundary: bool = False) -> KeywordMatcher:
+    """Get the shared matcher for a keyword set, building it on first use.
+
+    Args:
+        patterns: Keywords as a hashable collection (config lists converted to tuples)
+        word_boundary: Only report matches delimited by word boundaries
+
+    Returns:
+        KeywordMatcher built once per distinct keyword set
+
+    """
+    return KeywordMatcher(patterns, word_boundary=word_boundary)
@@ -6,8 +6,11 @@ and can be used across different parts of the application.
 
 Functions:
     - parse_tracks: Parses raw AppleScript output into structured track dictionaries.
+    - parse_track_rows: Logger-free parsing work unit for worker processes.
     - group_tracks_by_artist: Groups track dictionaries by artist name.
     - determine_dominant_genre_for_artist: Determines the most likely genre for an artist.
+    - determine_dominant_genres: Batch of the above for many artists.
+    - collect_dominant_genres: Logger-free batch work unit for worker processes.
     - remove_parentheses_with_keywords: Removes specified parenthetical content from strings.
     - clean_names: Applies cleaning rules to track and album names.
     - is_music_app_running: Checks if Music.app is currently running.
@@ -15,23 +18,25 @@ Functions:
 
 from __future__ import annotations
 
+import logging
 import re
 import subprocess  # trunk-ignore(bandit/B404)
 from collections import defaultdict
 from datetime import datetime
 from enum import IntEnum, auto
 from pathlib import Path
-from typing import Any, TYPE_CHECKING
+from typing import Any, NamedTuple, TYPE_CHECKING
 
+from core.models.keyword_matcher import get_keyword_matcher
 from core.models.normalization import normalize_for_matching
 from core.models.track_models import TrackDict
 from core.tracks.track_delta import FIELD_SEPARATOR, LINE_SEPARATOR, split_applescript_rows
 from core.tracks.year_utils import normalize_collaboration_artist
 
 if TYPE_CHECKING:
-    import logging
-    from collections.abc import Sequence
+    from collections.abc import Mapping, Sequence
 
+    from core.models.keyword_matcher import KeywordMatcher
     from core.models.track_models import AppConfig
 
 # Track already-logged cleaning exceptions to avoid duplicate messages
@@ -151,26 +156,60 @@ def _create_track_from_fields(fields: list[str]) -> TrackDict:
     return track
 
 
-def parse_tracks(raw_data: str, error_logger: logging.Logger) -> list[TrackDict]:
-    """Parse raw AppleScript output into a list of track dictionaries.
+class ParsedTracks(NamedTuple):
+    """Result of parsing AppleScript output, free of loggers so it crosses process boundaries."""
+
+    tracks: list[TrackDict]
+    malformed_rows: list[str]
 
-    Uses the Record Separator (U+001E) as the field delimiter and
-    Group Separator (U+001D) as the line delimiter.
+
+def parse_track_rows(raw_data: str) -> ParsedTracks:
+    """Parse raw AppleScript output without logging.
+
+    Picklable work unit behind ``parse_tracks``: takes and returns plain
+    data only, so it can run in a worker process of ``CpuExecutor``.
 
     Args:
         raw_data: Raw string data from AppleScript.
-        error_logger: Logger for error output.
 
     Returns:
-        List of TrackDict instances parsed from the input data.
+        Parsed tracks and the rows skipped for having too few fields.
 
     """
     field_separator = FIELD_SEPARATOR if FIELD_SEPARATOR in raw_data else "\t"
+    tracks: list[TrackDict] = []
+    malformed_rows: list[str] = []
+
+    for row in split_applescript_rows(raw_data.strip(), field_separator):
+        if not row:  # Skip empty rows
+            continue
+
+        fields = row.split(field_separator)
+
+        if len(fields) >= MIN_REQUIRED_FIELDS:
+            tracks.append(_create_track_from_fields(fields))
+        else:
+            malformed_rows.append(row)
+
+    return ParsedTracks(tracks, malformed_rows)
+
 
+def log_parse_input(raw_data: str, error_logger: logging.Logger) -> bool:
+    """Log the parser input at debug level.
+
+    Args:
+        raw_data: Raw string data from AppleScript.
+        error_logger: Logger for error output.
+
+    Returns:
+        False (after logging an error) if there is nothing to parse.
+
+    """
     if not raw_data:
         error_logger.error("No data fetched from AppleScript.")
-        return []
+        return False
 
+    field_separator = FIELD_SEPARATOR if FIELD_SEPARATOR in raw_data else "\t"
     error_logger.debug(
         "parse_tracks: Input raw_data (first 500 chars): %s...",
         raw_data[:500],
@@ -180,24 +219,33 @@ def parse_tracks(raw_data: str, error_logger: logging.Logger) -> list[TrackDict]
         field_separator,
         LINE_SEPARATOR if field_separator == FIELD_SEPARATOR else "newline",
     )
+    return True
 
-    tracks: list[TrackDict] = []
-    stripped = raw_data.strip()
-    rows = split_applescript_rows(stripped, field_separator)
 
-    for row in rows:
-        if not row:  # Skip empty rows
-            continue
+def log_malformed_rows(parsed: ParsedTracks, error_logger: logging.Logger) -> list[TrackDict]:
+    """Log the rows skipped by ``parse_track_rows`` and return the parsed tracks."""
+    for row in parsed.malformed_rows:
+        error_logger.warning("Malformed track data row skipped: %s", row)
+    return parsed.tracks
 
-        fields = row.split(field_separator)
 
-        if len(fields) >= MIN_REQUIRED_FIELDS:
-            track = _create_track_from_fields(fields)
-            tracks.append(track)
-        else:
-            error_logger.warning("Malformed track data row skipped: %s", row)
+def parse_tracks(raw_data: str, error_logger: logging.Logger) -> list[TrackDict]:
+    """Parse raw AppleScript output into a list of track dictionaries.
 
-    return tracks
+    Uses the Record Separator (U+001E) as the field delimiter and
+    Group Separator (U+001D) as the line delimiter.
+
+    Args:
+        raw_data: Raw string data from AppleScript.
+        error_logger: Logger for error output.
+
+    Returns:
+        List of TrackDict instances parsed from the input data.
+
+    """
+    if not log_parse_input(raw_data, error_logger):
+        return []
+    return log_malformed_rows(parse_track_rows(raw_data), error_logger)
 
 
 def group_tracks_by_artist(
@@ -269,6 +317,72 @@ def determine_dominant_genre_for_artist(
         return "Unknown"
 
 
+class DominantGenres(NamedTuple):
+    """Result of ``collect_dominant_genres``, free of loggers so it crosses process boundaries."""
+
+    genres: dict[str, str]
+    messages: list[tuple[int, str]]
+
+
+class _MessageCollector(logging.Handler):
+    """Keeps formatted log messages as (level, text) pairs."""
+
+    def __init__(self) -> None:
+        super().__init__(logging.DEBUG)
+        self.setFormatter(logging.Formatter("%(message)s"))
+        self.messages: list[tuple[int, str]] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append((record.levelno, self.format(record)))
+
+
+def collect_dominant_genres(artist_groups: Mapping[str, Sequence[TrackDict]]) -> DominantGenres:
+    """Determine the dominant genre of every artist without logging.
+
+    Picklable work unit behind ``determine_dominant_genres``: the warnings
+    of the per-artist helpers are returned as plain data instead of being
+    logged, so it can run in a worker process of ``CpuExecutor``.
+
+    Args:
+        artist_groups: Tracks keyed by artist.
+
+    Returns:
+        Dominant genre keyed by artist and the messages to log.
+
+    """
+    # Unregistered logger: nothing outside this call sees its records
+    collector = _MessageCollector()
+    local_logger = logging.Logger("dominant_genres", logging.DEBUG)
+    local_logger.propagate = False
+    local_logger.addHandler(collector)
+    genres = {artist: determine_dominant_genre_for_artist(tracks, local_logger) for artist, tracks in artist_groups.items()}
+    return DominantGenres(genres, collector.messages)
+
+
+def log_genre_messages(result: DominantGenres, error_logger: logging.Logger) -> dict[str, str]:
+    """Log the messages collected by ``collect_dominant_genres`` and return the genres."""
+    for level, message in result.messages:
+        error_logger.log(level, "%s", message)
+    return result.genres
+
+
+def determine_dominant_genres(
+    artist_groups: Mapping[str, Sequence[TrackDict]],
+    error_logger: logging.Logger,
+) -> dict[str, str]:
+    """Determine the dominant genre of every artist in one call.
+
+    Args:
+        artist_groups: Tracks keyed by artist.
+        error_logger: Logger for error output.
+
+    Returns:
+        Dominant genre keyed by artist.
+
+    """
+    return log_genre_messages(collect_dominant_genres(artist_groups), error_logger)
+
+
 def _get_earliest_track_across_albums(
     album_earliest: dict[str, TrackDict],
     error_logger: logging.Logger,
@@ -420,27 +534,26 @@ def _find_matching_parenthesis(text: str, start_pos: int) -> int:
     return position - 1 if count == 0 else -1
 
 
-def _text_contains_keywords(text: str, keywords: list[str]) -> bool:
+def _text_contains_keywords(text: str, matcher: KeywordMatcher) -> bool:
     """Check if text contains any of the keywords (case-insensitive).
 
     Args:
         text: Text to search in
-        keywords: List of keywords to search for
+        matcher: Keyword matcher built from the keywords to search for
 
     Returns:
         True if any keyword is found, False otherwise
 
     """
-    text_lower = text.lower()
-    return any(keyword.lower() in text_lower for keyword in keywords)
+    return matcher.contains_any(text)
 
 
-def _remove_parentheses_segments(text: str, keywords: list[str]) -> str:
+def _remove_parentheses_segments(text: str, matcher: KeywordMatcher) -> str:
     """Remove parentheses segments that contain keywords.
 
     Args:
         text: Text to process
-        keywords: Keywords to search for in parentheses
+        matcher: Keyword matcher for the keywords to search for in parentheses
 
     Returns:
         Text with matching parentheses segments removed
@@ -454,7 +567,7 @@ def _remove_parentheses_segments(text: str, keywords: list[str]) -> str:
             end_pos = _find_matching_parenthesis(cleaned, position)
             if end_pos != -1:
                 content = cleaned[position : end_pos + 1]
-                if _text_contains_keywords(content, keywords):
+                if _text_contains_keywords(content, matcher):
                     cleaned = cleaned[:position] + cleaned[end_pos + 1 :]
                     continue  # Don't increment position, recheck from the same position
         position += 1
@@ -462,12 +575,12 @@ def _remove_parentheses_segments(text: str, keywords: list[str]) -> str:
     return cleaned
 
 
-def _remove_bracket_segments(text: str, keywords: list[str]) -> str:
+def _remove_bracket_segments(text: str, matcher: KeywordMatcher) -> str:
     """Remove bracket segments that contain keywords.
 
     Args:
         text: Text to process
-        keywords: Keywords to search for in brackets
+        matcher: Keyword matcher for the keywords to search for in brackets
 
     Returns:
         Text with matching bracket segments removed
@@ -481,7 +594,7 @@ def _remove_bracket_segments(text: str, keywords: list[str]) -> str:
             end_pos = cleaned.find("]", position)
             if end_pos != -1:
                 content = cleaned[position : end_pos + 1]
-                if _text_contains_keywords(content, keywords):
+                if _text_contains_keywords(content, matcher):
                     cleaned = cleaned[:position] + cleaned[end_pos + 1 :]
                     continue  # Don't increment position, recheck from the same position
         position += 1
@@ -529,12 +642,14 @@ def remove_parentheses_with_keywords(
 
 def _clean_text_segments(name: str, keywords: list[str], console_logger: logging.Logger) -> str:
     cleaned = name
+    # Built once per keyword list, shared by every segment check
+    matcher = get_keyword_matcher(tuple(keywords))
 
     # Remove parentheses segments containing keywords
-    cleaned = _remove_parentheses_segments(cleaned, keywords)
+    cleaned = _remove_parentheses_segments(cleaned, matcher)
 
     # Remove bracket segments containing keywords
-    cleaned = _remove_bracket_segments(cleaned, keywords)
+    cleaned = _remove_bracket_segments(cleaned, matcher)
 
     # Collapse excess whitespace (including all Unicode whitespace) that may be left after removals
     cleaned = " ".join(cleaned.split())
@@ -4,11 +4,79 @@ This module provides a single source of truth for normalizing artist and album n
 when used for matching, comparison, or as dictionary/cache keys.
 
 All code that compares artist or album names for equality should use normalize_for_matching().
+
+The same artist and album names are normalized for every track and every
+candidate release, so the pure normalization functions used across the
+scorer, API clients and album-type detection are wrapped with
+``memoized_normalizer``: a bounded LRU cache per function whose hit rates
+are reported by ``get_normalization_stats()``.
 """
 
 from __future__ import annotations
 
+import functools
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+F = TypeVar("F", bound="Callable[..., Any]")
+
+# Entries kept per memoized normalizer; a 30K-track library has far fewer distinct names
+NORMALIZATION_CACHE_SIZE = 16_384
+
+# Registered normalizers by name (LRU-wrapped functions)
+_memoized_normalizers: dict[str, Any] = {}
+
+
+def memoized_normalizer(name: str, *, maxsize: int = NORMALIZATION_CACHE_SIZE) -> Callable[[F], F]:
+    """Memoize a pure normalization function with a bounded LRU cache.
+
+    Args:
+        name: Name the function is reported under in ``get_normalization_stats()``
+        maxsize: Maximum number of cached results
+
+    Returns:
+        Decorator returning the memoized function
+
+    """
+
+    def decorator(func: F) -> F:
+        cached = functools.lru_cache(maxsize=maxsize)(func)
+        _memoized_normalizers[name] = cached
+        return cast("F", cached)
+
+    return decorator
+
+
+def get_normalization_stats() -> dict[str, dict[str, int | float]]:
+    """Get hit/miss counters of all memoized normalizers.
+
+    Returns:
+        Mapping of normalizer name to hits, misses, hit_rate, size and maxsize
+
+    """
+    stats: dict[str, dict[str, int | float]] = {}
+    for name, cached in sorted(_memoized_normalizers.items()):
+        info = cached.cache_info()
+        calls = info.hits + info.misses
+        stats[name] = {
+            "hits": info.hits,
+            "misses": info.misses,
+            "hit_rate": info.hits / calls if calls else 0.0,
+            "size": info.currsize,
+            "maxsize": info.maxsize,
+        }
+    return stats
+
+
+def clear_normalization_caches() -> None:
+    """Drop all memoized results and reset the hit/miss counters."""
+    for cached in _memoized_normalizers.values():
+        cached.cache_clear()
+
 
+@memoized_normalizer("normalize_for_matching")
 def normalize_for_matching(text: str) -> str:
     """Normalize text for case-insensitive matching and cache keys.
 
@@ -130,6 +130,15 @@ class CacheServiceProtocol(Protocol):
         """
         ...
 
+    async def invalidate_async(self, key_data: CacheableKey) -> None:
+        """Asynchronously invalidate (remove) a specific cache entry.
+
+        Args:
+            key_data: Key of the cache entry to invalidate
+
+        """
+        ...
+
     async def clear(self) -> None:
         """Clear all entries from the cache."""
         ...
@@ -179,6 +188,42 @@ class CacheServiceProtocol(Protocol):
         """
         ...
 
+    async def get_album_year_entries_bulk_from_cache(self, albums: Sequence[tuple[str, str]]) -> dict[tuple[str, str], AlbumCacheEntry]:
+        """Get full album cache entries for many artist/album pairs in one lookup.
+
+        Args:
+            albums: (artist, album) pairs
+
+        Returns:
+            Entries keyed by (artist, album); pairs without an entry are left out
+
+        """
+        ...
+
+    async def find_similar_album_year_entry_from_cache(
+        self,
+        artist: str,
+        album: str,
+        *,
+        min_similarity: float,
+        limit: int = 5,
+    ) -> AlbumCacheEntry | None:
+        """Get the cache entry of the most similar cached album by the same artist.
+
+        Used after an exact miss to resolve near-miss album names locally.
+
+        Args:
+            artist: Artist name
+            album: Album name
+            min_similarity: Minimum trigram similarity (0.0-1.0)
+            limit: Maximum number of candidates checked
+
+        Returns:
+            Most similar AlbumCacheEntry or None if no cached album is similar enough
+
+        """
+        ...
+
     async def store_album_year_in_cache(
         self,
         artist: str,
@@ -547,6 +592,24 @@ class PendingVerificationServiceProtocol(Protocol):
         """
         ...
 
+    def might_be_unresolvable(
+        self,
+        artist: str,
+        album: str,
+    ) -> bool:
+        """Check without I/O whether an album may be a recent FALLBACK rejection.
+
+        Args:
+            artist: Artist name
+            album: Album name
+
+        Returns:
+            False if the album is definitely not a recent rejection; True must be
+            confirmed with get_entry and is_verification_needed.
+
+        """
+        ...
+
     async def get_all_pending_albums(
         self,
     ) -> list[PendingAlbumEntry]:
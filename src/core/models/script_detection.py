@@ -1,8 +1,20 @@
-"""Script detection utilities for text analysis."""
+"""Script detection utilities for text analysis.
+
+The ``has_*`` detectors check one script each. ``detect_primary_script``,
+``get_all_scripts`` and ``is_script_type`` instead classify every character
+once through a code-point range table (bisect over the boundaries of the
+detectors' ranges) and cache the per-string result, so a name is scanned
+once no matter how many scripts are queried.
+"""
 
 from __future__ import annotations
 
+from bisect import bisect_right
+from collections import Counter
 from enum import StrEnum
+from typing import NamedTuple
+
+from core.models.normalization import memoized_normalizer
 
 # Constants for script detection thresholds
 MINIMUM_SCRIPT_RATIO = 0.25  # Minimum ratio for script to be considered significant
@@ -329,6 +341,104 @@ SCRIPT_DETECTORS = {
 }
 
 
+# Inclusive code point ranges per script, identical to the has_* detectors above
+_SCRIPT_RANGES: dict[ScriptType, tuple[tuple[int, int], ...]] = {
+    ScriptType.ARABIC: ((0x0600, 0x06FF), (0x0750, 0x077F)),
+    ScriptType.CHINESE: ((0x4E00, 0x9FFF), (0x3400, 0x4DBF)),
+    ScriptType.CYRILLIC: ((0x0400, 0x04FF), (0x0500, 0x052F), (0x2DE0, 0x2DFF), (0xA640, 0xA69F)),
+    ScriptType.DEVANAGARI: ((0x0900, 0x097F),),
+    ScriptType.GREEK: ((0x0370, 0x03FF),),
+    ScriptType.HEBREW: ((0x0590, 0x05FF),),
+    ScriptType.JAPANESE: ((0x3040, 0x309F), (0x30A0, 0x30FF), (0x4E00, 0x9FFF)),
+    ScriptType.KOREAN: ((0xAC00, 0xD7AF), (0x1100, 0x11FF)),
+    ScriptType.LATIN: ((0x0041, 0x005A), (0x0061, 0x007A), (0x0080, 0x00FF), (0x0100, 0x017F), (0x0180, 0x024F)),
+    ScriptType.THAI: ((0x0E00, 0x0E7F),),
+}
+
+# Hiragana and Katakana, unique to Japanese (Kanji is shared with Chinese)
+_KANA_RANGES: tuple[tuple[int, int], ...] = ((0x3040, 0x309F), (0x30A0, 0x30FF))
+
+
+class _Segment(NamedTuple):
+    """Scripts of a run of code points, in SCRIPT_DETECTORS order."""
+
+    scripts: tuple[ScriptType, ...]
+    is_kana: bool
+
+
+def _build_segment_table() -> tuple[list[int], list[_Segment]]:
+    """Split the code point space at every range boundary.
+
+    Returns:
+        Sorted segment start code points and the segment for each start
+
+    """
+    all_ranges = [*(r for ranges in _SCRIPT_RANGES.values() for r in ranges), *_KANA_RANGES]
+    starts = sorted({0} | {start for start, _ in all_ranges} | {end + 1 for _, end in all_ranges})
+
+    def in_ranges(code_point: int, ranges: tuple[tuple[int, int], ...]) -> bool:
+        return any(start <= code_point <= end for start, end in ranges)
+
+    segments = [
+        _Segment(
+            scripts=tuple(script for script in SCRIPT_DETECTORS if in_ranges(start, _SCRIPT_RANGES[script])),
+            is_kana=in_ranges(start, _KANA_RANGES),
+        )
+        for start in starts
+    ]
+    return starts, segments
+
+
+_SEGMENT_STARTS, _SEGMENTS = _build_segment_table()
+
+
+class _ScriptProfile(NamedTuple):
+    """Result of classifying every character of a string once."""
+
+    present: frozenset[ScriptType]  # Scripts any has_* detector finds in the text
+    counts: tuple[tuple[ScriptType, int], ...]  # Letters per first matching script
+    total_chars: int  # Alphabetic characters
+    has_kana: bool
+
+
+@memoized_normalizer("script_detection._script_profile")
+def _script_profile(text: str) -> _ScriptProfile:
+    """Classify all characters of a text in one pass.
+
+    Args:
+        text: Text to analyze
+
+    Returns:
+        Scripts present, per-script letter counts (in order of first
+        occurrence), number of letters and whether Kana is present
+
+    """
+    present: set[ScriptType] = set()
+    counts: dict[ScriptType, int] = {}
+    total_chars = 0
+    has_kana = False
+
+    for char, occurrences in Counter(text).items():
+        segment = _SEGMENTS[bisect_right(_SEGMENT_STARTS, ord(char)) - 1]
+        is_letter = char.isalpha()
+        if is_letter:
+            total_chars += occurrences
+        if not segment.scripts:
+            continue
+
+        has_kana = has_kana or segment.is_kana
+        if is_letter:
+            present.update(segment.scripts)
+            # Count each letter only for the first matching script
+            first_script = segment.scripts[0]
+            counts[first_script] = counts.get(first_script, 0) + occurrences
+        else:
+            # Latin detection only considers letters; other scripts any code point
+            present.update(script for script in segment.scripts if script is not ScriptType.LATIN)
+
+    return _ScriptProfile(frozenset(present), tuple(counts.items()), total_chars, has_kana)
+
+
 def _handle_cjk_detection(text: str) -> ScriptType | None:
     """Handle special case for CJK script detection.
 
@@ -339,13 +449,13 @@ def _handle_cjk_detection(text: str) -> ScriptType | None:
         ScriptType if CJK case applies, None otherwise
 
     """
-    if not (has_japanese(text) and has_chinese(text)):
+    profile = _script_profile(text)
+    if ScriptType.JAPANESE not in profile.present or ScriptType.CHINESE not in profile.present:
         return None
 
-    # Check for Hiragana or Katakana which are unique to Japanese
-    has_hiragana_katakana = any("\u3040" <= char <= "\u309f" or "\u30a0" <= char <= "\u30ff" for char in text)
-    # If only Kanji (shared), default to Chinese as it's more common
-    return ScriptType.JAPANESE if has_hiragana_katakana else ScriptType.CHINESE
+    # Hiragana or Katakana are unique to Japanese;
+    # if only Kanji (shared), default to Chinese as it's more common
+    return ScriptType.JAPANESE if profile.has_kana else ScriptType.CHINESE
 
 
 def _count_script_characters(text: str) -> tuple[dict[ScriptType, int], int]:
@@ -361,21 +471,8 @@ def _count_script_characters(text: str) -> tuple[dict[ScriptType, int], int]:
         Tuple of (script_counts, total_chars)
 
     """
-    script_counts: dict[ScriptType, int] = {}
-    total_chars = 0
-
-    for char in text:
-        # Skip spaces, punctuation, and common symbols
-        if char.isspace() or not char.isalpha():
-            continue
-
-        total_chars += 1
-        for script_type, detector in SCRIPT_DETECTORS.items():
-            if detector(char):
-                script_counts[script_type] = script_counts.get(script_type, 0) + 1
-                break  # Count character only for the first matching script
-
-    return script_counts, total_chars
+    profile = _script_profile(text)
+    return dict(profile.counts), profile.total_chars
 
 
 def _handle_latin_mixed_case(script_counts: dict[ScriptType, int], total_chars: int) -> ScriptType | None:
@@ -417,7 +514,8 @@ def get_all_scripts(text: str) -> list[ScriptType]:
     """
     if not text:
         return []
-    return [script_type for script_type, detector in SCRIPT_DETECTORS.items() if detector(text)]
+    present = _script_profile(text).present
+    return [script_type for script_type in SCRIPT_DETECTORS if script_type in present]
 
 
 def detect_primary_script(text: str) -> ScriptType:
@@ -491,7 +589,7 @@ def is_script_type(text: str, script_type: ScriptType) -> bool:
     if not text or script_type not in SCRIPT_DETECTORS:
         return False
 
-    return SCRIPT_DETECTORS[script_type](text)
+    return script_type in _script_profile(text).present
 
 
 # Legacy compatibility functions
@@ -516,4 +614,4 @@ def is_primarily_cyrillic(text: str) -> bool:
 
     """
     script = detect_primary_script(text)
-    return script in (ScriptType.CYRILLIC, ScriptType.MIXED) and has_cyrillic(text)
+    return script in (ScriptType.CYRILLIC, ScriptType.MIXED) and is_script_type(text, ScriptType.CYRILLIC)
@@ -15,6 +15,8 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import TYPE_CHECKING, Final
 
+from core.models.keyword_matcher import get_keyword_matcher
+
 if TYPE_CHECKING:
     from core.models.track_models import AppConfig
 
@@ -84,12 +86,11 @@ def _is_soundtrack(album: str, patterns: frozenset[str]) -> str | None:
     Uses simple substring matching (not word-boundary regex) because:
     - Soundtrack patterns are distinctive enough to avoid false positives
     - Simpler matching handles variations like "original-score" naturally
+
+    The longest matched pattern wins, so "Lost Highway Soundtrack" reports
+    "soundtrack" rather than the "ost" inside "Lost".
     """
-    album_lower = album.lower()
-    return next(
-        (pattern for pattern in patterns if pattern.lower() in album_lower),
-        None,
-    )
+    return get_keyword_matcher(patterns).best_match(album)
 
 
 def _is_various_artists(artist: str, patterns: frozenset[str]) -> bool:
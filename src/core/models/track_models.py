@@ -51,6 +51,29 @@ class PreferredApi(StrEnum):
     ITUNES = "itunes"
 
 
+class CassetteMode(StrEnum):
+    """HTTP cassette operating mode for recorded API traffic."""
+
+    OFF = "off"
+    RECORD = "record"
+    REPLAY = "replay"
+
+
+class CpuExecutorMode(StrEnum):
+    """Where CPU-bound parsing and scoring batches run."""
+
+    INLINE = "inline"
+    PROCESS = "process"
+    INTERPRETER = "interpreter"
+
+
+class CacheBackend(StrEnum):
+    """Storage for the album-year and API caches."""
+
+    FILES = "files"
+    SQLITE = "sqlite"
+
+
 class ChangeDisplayMode(StrEnum):
     """Change display mode enumeration."""
 
@@ -106,6 +129,24 @@ class BatchProcessingConfig(BaseModel):
     batch_size: int = Field(default=1000, ge=1)
 
 
+class CpuExecutorConfig(BaseModel):
+    """Offload of CPU-bound batches from the event loop.
+
+    ``inline`` runs everything on the event loop thread. ``process`` sends
+    batches above the thresholds to a process pool; ``interpreter`` uses a
+    pool of subinterpreters (Python 3.14+) or, on free-threaded builds, a
+    thread pool, and falls back to ``process`` otherwise.
+    """
+
+    mode: CpuExecutorMode = CpuExecutorMode.INLINE
+    max_workers: int | None = Field(default=None, ge=1)
+    min_parse_bytes: int = Field(default=1_000_000, ge=0)
+    min_genre_artists: int = Field(default=200, ge=1)
+    min_scoring_releases: int = Field(default=100, ge=1)
+    monitor_loop_lag: bool = False
+    lag_sample_interval_seconds: float = Field(default=0.05, gt=0)
+
+
 class ArtistRenamerConfig(BaseModel):
     """Artist renamer configuration."""
 
@@ -145,6 +186,14 @@ class LibrarySnapshotConfig(BaseModel):
     compress_level: int = Field(default=6, ge=1, le=9)
 
 
+class SharedCacheConfig(BaseModel):
+    """Cache files shared by overlapping processes (daemon and CLI runs)."""
+
+    enabled: bool = False
+    sync_interval_seconds: int = Field(default=120, ge=0)  # 0 = merge only on save
+    lock_timeout_seconds: float = Field(default=30, gt=0)
+
+
 class CleaningConfig(BaseModel):
     """Cleaning configuration."""
 
@@ -392,6 +441,67 @@ class ScriptApiPriority(BaseModel):
     fallback: list[str] = Field(default_factory=list)
 
 
+class PrefetchConfig(BaseModel):
+    """Artist-level discography prefetch settings.
+
+    When enabled, a provider fetches an artist's discography once and matches
+    albums locally, falling back to per-album searches only for misses.
+    """
+
+    musicbrainz: bool = False
+    musicbrainz_max_pages: int = Field(default=5, ge=1)
+    discogs: bool = False
+    discogs_max_pages: int = Field(default=5, ge=1)
+    itunes: bool = False
+
+
+class FuzzyMatchConfig(BaseModel):
+    """Trigram similarity matching of near-miss album names.
+
+    When enabled, an album missing from the album-years cache or from a
+    prefetched discography by exact normalized name is matched against the
+    most similar known album name before any per-album API search.
+    """
+
+    enabled: bool = False
+    min_similarity: float = Field(default=0.85, gt=0, le=1)
+    max_candidates: int = Field(default=5, ge=1)
+
+
+class HedgingConfig(BaseModel):
+    """Speculative fan-out to fallback providers during year searches."""
+
+    enabled: bool = False
+    delay_seconds: float = Field(default=1.0, ge=0)
+    idle_utilization: float = Field(default=0.5, ge=0, le=1)
+
+
+class CircuitBreakerConfig(BaseModel):
+    """Per-provider circuit breaker fed by error rate and latency."""
+
+    enabled: bool = True
+    failure_rate_threshold: float = Field(default=0.5, gt=0, le=1)
+    window_size: int = Field(default=20, ge=1)
+    min_calls: int = Field(default=5, ge=1)
+    slow_call_seconds: float = Field(default=20.0, gt=0)
+    open_seconds: float = Field(default=60.0, ge=0)
+
+
+class MusicBrainzLocalConfig(BaseModel):
+    """Local MusicBrainz store imported from data dumps (see ``import_musicbrainz``)."""
+
+    enabled: bool = False
+    database_path: str = "cache/musicbrainz_local.sqlite3"
+
+
+class HttpCassetteConfig(BaseModel):
+    """Record/replay settings for external API traffic (offline benchmarks)."""
+
+    mode: CassetteMode = CassetteMode.OFF
+    path: str = "cache/http_cassette.jsonl"
+    latency_scale: float = Field(default=1.0, ge=0)
+
+
 class YearRetrievalConfig(BaseModel):
     """Year retrieval configuration."""
 
@@ -405,6 +515,12 @@ class YearRetrievalConfig(BaseModel):
     scoring: ScoringConfig
     script_api_priorities: dict[str, ScriptApiPriority] = Field(default_factory=dict)
     fallback: FallbackConfig = Field(default_factory=FallbackConfig)
+    prefetch: PrefetchConfig = Field(default_factory=PrefetchConfig)
+    fuzzy_match: FuzzyMatchConfig = Field(default_factory=FuzzyMatchConfig)
+    musicbrainz_local: MusicBrainzLocalConfig = Field(default_factory=MusicBrainzLocalConfig)
+    hedging: HedgingConfig = Field(default_factory=HedgingConfig)
+    circuit_breaker: CircuitBreakerConfig = Field(default_factory=CircuitBreakerConfig)
+    cassette: HttpCassetteConfig = Field(default_factory=HttpCassetteConfig)
 
 
 class CachingConfig(BaseModel):
@@ -416,7 +532,12 @@ class CachingConfig(BaseModel):
     cleanup_interval_seconds: int = Field(default=300, ge=0)
     negative_result_ttl: float = Field(default=2592000, ge=0)  # 30 days
     api_result_cache_path: str = "cache/api_results.json"
+    project_api_responses: bool = True
+    backend: CacheBackend = CacheBackend.FILES
+    sqlite_cache_file: str = "cache/caches.sqlite3"
+    lazy_warmup: bool = False
     library_snapshot: LibrarySnapshotConfig = Field(default_factory=LibrarySnapshotConfig)
+    shared: SharedCacheConfig = Field(default_factory=SharedCacheConfig)
 
 
 class ReportingConfig(BaseModel):
@@ -455,6 +576,8 @@ class AppConfig(BaseModel):
     incremental_interval_minutes: int = Field(ge=1)
     cache_ttl_seconds: int = Field(ge=0)
     max_generic_entries: int = Field(default=10000, ge=1)
+    max_generic_bytes: int = Field(default=256 * 1024 * 1024, ge=0)  # 0 = no byte budget
+    cpu_executor: CpuExecutorConfig = Field(default_factory=CpuExecutorConfig)
 
     # Feature toggles and settings
     cleaning: CleaningConfig
@@ -0,0 +1,198 @@
+"""In-memory trigram index for fuzzy album-name lookup.
+
+Cache lookups and prefetched-discography matching compare normalized names
+for equality, so near misses ("Album (Deluxe)" vs "Album", punctuation and
+transliteration variants) fall through to API searches. ``TrigramIndex``
+keeps an inverted index from character trigrams to names and returns the
+most similar names for a query without comparing it to every entry.
+
+Similarity is the Dice coefficient of the trigram sets (1.0 for names that
+normalize identically). Names whose number tokens differ never match, so
+"Album II" or "Live 1995" are not taken for "Album" or "Live 1996".
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import math
+import re
+from collections.abc import Hashable
+from typing import TYPE_CHECKING, NamedTuple
+
+from core.models.metadata_utils import remove_parentheses_with_keywords
+from core.models.normalization import normalize_for_matching
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+__all__ = [
+    "FuzzyMatch",
+    "TrigramIndex",
+    "edition_insensitive_normalizer",
+]
+
+_logger = logging.getLogger(__name__)
+
+_WORD_RE = re.compile(r"\w+")
+# Digits or a roman numeral up to 39 ("ii", "xiv"): tokens that tell sequels and years apart
+_NUMBER_TOKEN_RE = re.compile(r"\d+|x{0,3}(?:ix|iv|v?i{0,3})")
+# Tolerance for the similarity bounds used to prune candidates
+_SLACK = 1e-9
+
+
+class FuzzyMatch[T: Hashable](NamedTuple):
+    """An indexed name similar to the query."""
+
+    name: str
+    similarity: float
+    value: T
+
+
+class _IndexedName(NamedTuple):
+    name: str
+    trigrams: frozenset[str]
+    numbers: frozenset[str]
+
+
+def _profile(normalized: str) -> tuple[frozenset[str], frozenset[str]]:
+    """Get the trigrams and number tokens of a normalized name.
+
+    Each word is padded with two leading spaces and one trailing space, so
+    word starts weigh more than word ends and short words still yield trigrams.
+    """
+    words = _WORD_RE.findall(normalized)
+    trigrams: set[str] = set()
+    for word in words:
+        padded = f"  {word} "
+        trigrams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    numbers = frozenset(word for word in words if _NUMBER_TOKEN_RE.fullmatch(word))
+    return frozenset(trigrams), numbers
+
+
+class TrigramIndex[T: Hashable]:
+    """Inverted trigram index from names to values.
+
+    Args:
+        normalize: Applied to indexed names and queries before trigram
+            extraction (default: ``normalize_for_matching``)
+
+    """
+
+    def __init__(self, normalize: Callable[[str], str] = normalize_for_matching) -> None:
+        self._normalize = normalize
+        self._entries: dict[T, _IndexedName] = {}
+        self._postings: dict[str, set[T]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of indexed values."""
+        return len(self._entries)
+
+    def __contains__(self, value: object) -> bool:
+        """Check whether a value is indexed."""
+        return value in self._entries
+
+    def add(self, name: str, value: T) -> None:
+        """Index a name, replacing the name previously indexed for the value.
+
+        Args:
+            name: Name to index
+            value: Value returned for matches of the name
+
+        """
+        self.discard(value)
+        trigrams, numbers = _profile(self._normalize(name))
+        if not trigrams:
+            return
+        self._entries[value] = _IndexedName(name, trigrams, numbers)
+        for trigram in trigrams:
+            self._postings.setdefault(trigram, set()).add(value)
+
+    def discard(self, value: T) -> None:
+        """Remove a value from the index if present."""
+        entry = self._entries.pop(value, None)
+        if entry is None:
+            return
+        for trigram in entry.trigrams:
+            postings = self._postings[trigram]
+            postings.discard(value)
+            if not postings:
+                del self._postings[trigram]
+
+    def search(self, query: str, *, limit: int = 5, min_similarity: float = 0.0) -> list[FuzzyMatch[T]]:
+        """Find the indexed names most similar to the query.
+
+        A name reaching ``min_similarity`` shares at least a minimum number
+        of the query's trigrams, so it contains one of the rarest trigrams
+        outside that minimum (prefix filtering). Only names from those
+        postings are scored, and names whose trigram count rules out the
+        threshold are skipped before the overlap is computed.
+
+        Args:
+            query: Name to look up
+            limit: Maximum number of matches
+            min_similarity: Minimum Dice similarity (0.0-1.0)
+
+        Returns:
+            Matches ordered by descending similarity
+
+        """
+        trigrams, numbers = _profile(self._normalize(query))
+        if not trigrams or limit <= 0:
+            return []
+
+        query_size = len(trigrams)
+        # Dice >= s needs |A & B| >= s * |A| / (2 - s); the slack keeps float rounding on the safe side
+        min_shared = max(1, math.ceil(min_similarity * query_size / (2 - min_similarity) - _SLACK))
+        min_size = min_similarity * query_size / (2 - min_similarity) - _SLACK
+        max_size = query_size * (2 - min_similarity) / min_similarity + _SLACK if min_similarity > 0 else math.inf
+        rarest = sorted(trigrams, key=lambda trigram: len(self._postings.get(trigram, ())))
+        candidates: set[T] = set()
+        for trigram in rarest[: query_size - min_shared + 1]:
+            candidates.update(self._postings.get(trigram, ()))
+
+        matches: list[FuzzyMatch[T]] = []
+        for value in candidates:
+            entry = self._entries[value]
+            entry_size = len(entry.trigrams)
+            if entry.numbers != numbers or not min_size <= entry_size <= max_size:
+                continue
+            similarity = 2 * len(trigrams & entry.trigrams) / (query_size + entry_size)
+            if similarity >= min_similarity:
+                matches.append(FuzzyMatch(entry.name, similarity, value))
+        return heapq.nlargest(limit, matches, key=lambda match: match.similarity)
+
+    def best_matches(self, query: str, *, min_similarity: float, limit: int = 5) -> list[T]:
+        """Get the values of all names tied for the highest similarity.
+
+        Args:
+            query: Name to look up
+            min_similarity: Minimum Dice similarity (0.0-1.0)
+            limit: Maximum number of candidates considered
+
+        Returns:
+            Values of the best-matching names, or empty list
+
+        """
+        matches = self.search(query, limit=limit, min_similarity=min_similarity)
+        return [match.value for match in matches if match.similarity == matches[0].similarity]
+
+
+def edition_insensitive_normalizer(remaster_keywords: Sequence[str]) -> Callable[[str], str]:
+    """Build a normalizer that drops edition segments before ``normalize_for_matching``.
+
+    "Album (Deluxe Edition)" and "Album" then index identically.
+
+    Args:
+        remaster_keywords: Keywords marking bracketed edition segments (``cleaning.remaster_keywords``)
+
+    Returns:
+        Normalization function for ``TrigramIndex``
+
+    """
+    keywords = list(remaster_keywords)
+
+    def normalize(name: str) -> str:
+        return normalize_for_matching(remove_parentheses_with_keywords(name, keywords, _logger, _logger))
+
+    return normalize
@@ -44,6 +44,7 @@ class BatchTrackFetcher:
         snapshot_loader: Async callback to load tracks from snapshot
         snapshot_persister: Async callback to persist tracks to snapshot
         can_use_snapshot: Callback to check if snapshot can be used
+        track_parser: Async callback parsing AppleScript output (``parse_tracks`` if None)
         dry_run: Whether running in dry-run mode
         analytics: Optional analytics instance for batch mode logging
     """
@@ -61,6 +62,7 @@ class BatchTrackFetcher:
         snapshot_loader: Callable[[], Awaitable[list[TrackDict] | None]],
         snapshot_persister: Callable[[list[TrackDict], list[str] | None], Awaitable[None]],
         can_use_snapshot: Callable[[str | None], bool],
+        track_parser: Callable[[str], Awaitable[list[TrackDict]]] | None = None,
         dry_run: bool = False,
         analytics: AnalyticsProtocol | None = None,
     ) -> None:
@@ -74,6 +76,7 @@ class BatchTrackFetcher:
         self._snapshot_loader = snapshot_loader
         self._snapshot_persister = snapshot_persister
         self._can_use_snapshot = can_use_snapshot
+        self._track_parser = track_parser
         self.dry_run = dry_run
         self.analytics = analytics
 
@@ -287,7 +290,7 @@ class BatchTrackFetcher:
             return None
 
         # Parse the batch
-        batch_tracks = parse_tracks(raw_output, self.error_logger)
+        batch_tracks = await self._track_parser(raw_output) if self._track_parser else parse_tracks(raw_output, self.error_logger)
 
         if not batch_tracks:
             raw_row_count = self._count_raw_track_rows(raw_output)
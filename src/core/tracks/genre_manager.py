@@ -25,6 +25,7 @@ from .track_utils import parse_track_date_added as _parse_track_date_added
 if TYPE_CHECKING:
     import logging
 
+    from core.cpu_offload import CpuExecutor
     from core.models.protocols import AnalyticsProtocol
     from core.models.track_models import AppConfig
 
@@ -41,6 +42,7 @@ class GenreManager(BaseProcessor):
         analytics: Service for performance tracking
         config: Typed application configuration
         dry_run: Whether to run in dry-run mode
+        cpu_executor: Executor for the dominant-genre batch (computed inline if None)
     """
 
     def __init__(
@@ -52,9 +54,11 @@ class GenreManager(BaseProcessor):
         analytics: AnalyticsProtocol,
         config: AppConfig,
         dry_run: bool = False,
+        cpu_executor: CpuExecutor | None = None,
     ) -> None:
         super().__init__(console_logger, error_logger, analytics, config, dry_run)
         self.track_processor = track_processor
+        self.cpu_executor = cpu_executor
 
     @staticmethod
     def is_missing_or_unknown_genre(track: TrackDict) -> bool:
@@ -331,6 +335,8 @@ class GenreManager(BaseProcessor):
         force_update: bool,
         applescript_semaphore: asyncio.Semaphore,
         tracks_to_update: list[TrackDict] | None = None,
+        *,
+        dominant_genre: str | None = None,
     ) -> tuple[list[TrackDict], list[ChangeLogEntry]]:
         """Process all tracks for a single artist with proper concurrency control.
 
@@ -345,16 +351,18 @@ class GenreManager(BaseProcessor):
             applescript_semaphore: Global semaphore for AppleScript concurrency control
                 (shared across all artists to respect Music.app limits)
             tracks_to_update: Specific tracks to update (if None, uses all_artist_tracks)
+            dominant_genre: Dominant genre already determined for the artist
 
         Returns:
             Tuple of (updated_tracks, change_logs)
 
         """
         # Determine dominant genre from ALL tracks (not just the ones being updated)
-        dominant_genre = determine_dominant_genre_for_artist(
-            all_artist_tracks,
-            self.error_logger,
-        )
+        if dominant_genre is None:
+            dominant_genre = determine_dominant_genre_for_artist(
+                all_artist_tracks,
+                self.error_logger,
+            )
 
         if not dominant_genre:
             self.console_logger.warning("Could not determine dominant genre for artist: %s", artist_name)
@@ -447,6 +455,9 @@ class GenreManager(BaseProcessor):
         applescript_concurrency = self.config.apple_script_concurrency
         applescript_semaphore = asyncio.Semaphore(applescript_concurrency)
 
+        # Dominant genres of all artists in one batch (off the event loop for large libraries)
+        dominant_genres = await self._determine_dominant_genres(grouped_tracks)
+
         # Create tasks for all artists via a thin wrapper to reduce complexity here
         artist_tasks: list[Any] = []
         for artist_name, artist_tracks in grouped_tracks.items():
@@ -458,6 +469,7 @@ class GenreManager(BaseProcessor):
                     force=force,
                     artist_semaphore=artist_semaphore,
                     applescript_semaphore=applescript_semaphore,
+                    dominant_genre=dominant_genres.get(artist_name),
                 )
             )
             artist_tasks.append(task)
@@ -479,6 +491,20 @@ class GenreManager(BaseProcessor):
 
         return all_updated_tracks, all_change_logs
 
+    async def _determine_dominant_genres(self, grouped_tracks: dict[str, list[TrackDict]]) -> dict[str, str]:
+        """Determine the dominant genre of every artist.
+
+        Args:
+            grouped_tracks: Tracks keyed by artist
+
+        Returns:
+            Dominant genre keyed by artist
+
+        """
+        if self.cpu_executor is None:
+            return {artist: determine_dominant_genre_for_artist(artist_tracks, self.error_logger) for artist, artist_tracks in grouped_tracks.items()}
+        return await self.cpu_executor.dominant_genres(grouped_tracks, self.error_logger)
+
     async def _process_single_artist_wrapper(
         self,
         artist_name: str,
@@ -488,6 +514,7 @@ class GenreManager(BaseProcessor):
         force: bool,
         artist_semaphore: asyncio.Semaphore,
         applescript_semaphore: asyncio.Semaphore,
+        dominant_genre: str | None = None,
     ) -> tuple[list[TrackDict], list[ChangeLogEntry]]:
         """Select tracks for update and process a single artist under a semaphore.
 
@@ -499,16 +526,17 @@ class GenreManager(BaseProcessor):
             artist_semaphore: Concurrency guard for artist-level processing.
             applescript_semaphore: Global semaphore for AppleScript concurrency control
                 (shared across all artists to respect Music.app limits).
+            dominant_genre: Dominant genre already determined for the artist.
 
         Returns:
             Tuple of (updated_tracks, change_logs) for this artist.
         """
-        dominant = determine_dominant_genre_for_artist(artist_tracks, self.error_logger)
+        dominant = dominant_genre if dominant_genre is not None else determine_dominant_genre_for_artist(artist_tracks, self.error_logger)
         to_update = self._select_tracks_to_update_for_artist(artist_tracks, last_run, force, dominant)
         if not to_update:
             return [], []
         async with artist_semaphore:
-            return await self._process_artist_genres(artist_name, artist_tracks, force, applescript_semaphore, to_update)
+            return await self._process_artist_genres(artist_name, artist_tracks, force, applescript_semaphore, to_update, dominant_genre=dominant)
 
     def _select_tracks_to_update_for_artist(
         self,
@@ -23,6 +23,7 @@ if TYPE_CHECKING:
     from collections.abc import Sequence
     import logging
 
+    from core.cpu_offload import CpuExecutor
     from core.models.protocols import AnalyticsProtocol, AppleScriptClientProtocol, CacheServiceProtocol, LibrarySnapshotServiceProtocol
     from core.models.track_models import AppConfig
     from core.tracks.artist_renamer import ArtistRenamer
@@ -41,6 +42,7 @@ class TrackProcessor:
         analytics: Service for tracking method calls
         dry_run: Whether to run in dry-run mode
         security_validator: Optional security validator for input sanitization
+        cpu_executor: Executor for parsing large AppleScript outputs (parsed inline if None)
     """
 
     def __init__(
@@ -55,6 +57,7 @@ class TrackProcessor:
         analytics: AnalyticsProtocol,
         dry_run: bool = False,
         security_validator: SecurityValidator | None = None,
+        cpu_executor: CpuExecutor | None = None,
     ) -> None:
         self.ap_client = ap_client
         self.cache_service = cache_service
@@ -64,6 +67,7 @@ class TrackProcessor:
         self.config = config
         self.analytics = analytics
         self.dry_run = dry_run
+        self.cpu_executor = cpu_executor
         self._dry_run_actions: list[dict[str, Any]] = []
         # Use the provided validator or create a default one for backward compatibility
         self.security_validator = security_validator or SecurityValidator(error_logger)
@@ -104,6 +108,7 @@ class TrackProcessor:
             snapshot_loader=self._load_tracks_from_snapshot,
             snapshot_persister=self._update_snapshot,
             can_use_snapshot=self._can_use_snapshot,
+            track_parser=self._parse_tracks,
             dry_run=dry_run,
             analytics=analytics,
         )
@@ -123,6 +128,12 @@ class TrackProcessor:
         """Attach artist renamer service for automatic post-fetch processing."""
         self.artist_renamer = renamer
 
+    async def _parse_tracks(self, raw_output: str) -> list[TrackDict]:
+        """Parse AppleScript output, off the event loop for large outputs when configured."""
+        if self.cpu_executor is None:
+            return parse_tracks(raw_output, self.error_logger)
+        return await self.cpu_executor.parse_tracks(raw_output, self.error_logger)
+
     @staticmethod
     def _current_time() -> datetime:
         """Return naive UTC timestamp for cache metadata."""
@@ -391,7 +402,7 @@ class TrackProcessor:
                 return []
 
             # Parse the raw output
-            tracks = parse_tracks(raw_output, self.error_logger)
+            tracks = await self._parse_tracks(raw_output)
 
             # Validate each track for security
             validated_tracks = self._validate_tracks_security(tracks)
@@ -440,7 +451,7 @@ class TrackProcessor:
             if not raw_output:
                 continue
 
-            parsed_tracks = parse_tracks(raw_output, self.error_logger)
+            parsed_tracks = await self._parse_tracks(raw_output)
             validated_tracks = self._validate_tracks_security(parsed_tracks)
             await self._apply_artist_renames(validated_tracks)
             collected.extend(validated_tracks)
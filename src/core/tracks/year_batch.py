@@ -144,6 +144,10 @@ class YearBatchProcessor:
         if total_albums == 0:
             return
 
+        if not force:
+            # One bulk cache read for all skip checks instead of a locked lookup per album
+            await self.year_determinator.prefetch_cache_entries([album_key for album_key, _ in album_items])
+
         concurrency_limit = self._determine_concurrency_limit()
 
         if self._should_use_sequential_processing(adaptive_delay, concurrency_limit):
@@ -11,6 +11,7 @@ from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
 from core.debug_utils import debug
+from core.models.cache_types import RECENT_REJECTION_REASONS
 from core.models.track_status import is_prerelease_status
 from core.models.validators import is_empty_year, is_valid_year
 
@@ -18,7 +19,9 @@ from .year_consistency import YearConsistencyChecker
 
 if TYPE_CHECKING:
     import logging
+    from collections.abc import Sequence
 
+    from core.models.cache_types import AlbumCacheEntry
     from core.models.protocols import (
         CacheServiceProtocol,
         ExternalApiServiceProtocol,
@@ -86,6 +89,24 @@ class YearDeterminator:
         self.future_year_threshold = processing.future_year_threshold
         self.prerelease_recheck_days = processing.prerelease_recheck_days
 
+        # Album cache entries read in bulk before a batch run, consumed by the skip checks:
+        # {(artist, album): entry, or None if not cached}
+        self._prefetched_cache_entries: dict[tuple[str, str], AlbumCacheEntry | None] = {}
+
+    async def prefetch_cache_entries(self, albums: Sequence[tuple[str, str]]) -> None:
+        """Read the album cache entries of a batch run in one bulk lookup.
+
+        ``should_skip_album`` uses each album's prefetched entry once instead
+        of a locked cache lookup per album. An album's own entry only changes
+        when that album is processed, which happens after its skip check.
+
+        Args:
+            albums: (artist, album) pairs about to be processed
+
+        """
+        entries = await self.cache_service.get_album_year_entries_bulk_from_cache(albums)
+        self._prefetched_cache_entries = {album_key: entries.get(album_key) for album_key in albums}
+
     async def _try_local_sources(
         self,
         artist: str,
@@ -113,6 +134,10 @@ class YearDeterminator:
                 )
             return cached_entry.year
 
+        # 2b. Near-miss album name ("Album (Deluxe)" vs "Album") cached with high confidence
+        if cached_entry is None and (near_entry := await self._find_similar_cached_entry(artist, album)):
+            return near_entry.year
+
         # 3. Check for consensus release_year
         if consensus_year := self.consistency_checker.get_consensus_release_year(album_tracks):
             await self.cache_service.store_album_year_in_cache(
@@ -125,6 +150,31 @@ class YearDeterminator:
 
         return None
 
+    async def _find_similar_cached_entry(self, artist: str, album: str) -> AlbumCacheEntry | None:
+        """Find a trusted cache entry for a similarly named album (``year_retrieval.fuzzy_match``)."""
+        fuzzy_match = self.config.year_retrieval.fuzzy_match
+        if not fuzzy_match.enabled:
+            return None
+
+        near_entry = await self.cache_service.find_similar_album_year_entry_from_cache(
+            artist,
+            album,
+            min_similarity=fuzzy_match.min_similarity,
+            limit=fuzzy_match.max_candidates,
+        )
+        if near_entry is None or near_entry.confidence < CACHE_TRUST_THRESHOLD:
+            return None
+
+        self.console_logger.info(
+            "Using cached year %s of similar album '%s' for %s - %s (confidence %d%%)",
+            near_entry.year,
+            near_entry.album,
+            artist,
+            album,
+            near_entry.confidence,
+        )
+        return near_entry
+
     async def _fetch_from_api(
         self,
         artist: str,
@@ -342,7 +392,11 @@ class YearDeterminator:
             Tuple of (should_skip, reason).
 
         """
-        cached_year = await self.cache_service.get_album_year_from_cache(artist, album)
+        if (artist, album) in self._prefetched_cache_entries:
+            prefetched = self._prefetched_cache_entries.pop((artist, album))
+            cached_year = prefetched.year if prefetched else None
+        else:
+            cached_year = await self.cache_service.get_album_year_from_cache(artist, album)
         non_empty_years = [
             str(year_value)
             for track in album_tracks
@@ -469,19 +523,13 @@ class YearDeterminator:
             The reason for rejection if the album was recently rejected, otherwise returns None.
 
         """
-        # Rejection reasons that indicate FALLBACK rejected the year update
-        # These match the actual reasons set in year_fallback.py
-        rejection_reasons = {
-            "suspicious_year_change",
-            "implausible_existing_year",
-            "absurd_year_no_existing",
-            "special_album_compilation",  # AlbumType.COMPILATION
-            "special_album_special",  # AlbumType.SPECIAL (B-Sides, Demo, Vault)
-            "special_album_reissue",  # AlbumType.REISSUE (Remastered, Anniversary, Deluxe)
-        }
+        # The Bloom filter rules out almost every album without touching the pending list;
+        # its rare false positives are settled by the entry lookup below
+        if not self.pending_verification.might_be_unresolvable(artist, album):
+            return None
 
         pending_entry = await self.pending_verification.get_entry(artist, album)
-        if pending_entry and pending_entry.reason.value in rejection_reasons:
+        if pending_entry and pending_entry.reason in RECENT_REJECTION_REASONS:
             verification_needed = await self.pending_verification.is_verification_needed(artist, album)
             if not verification_needed:
                 return pending_entry.reason.value
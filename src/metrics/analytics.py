@@ -20,7 +20,7 @@ from core.logger import get_shared_console
 from metrics.change_reports import save_html_report
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Callable
+    from collections.abc import AsyncIterator, Callable, Mapping
 
     from core.models.track_models import AppConfig
     from rich.console import Console
@@ -279,6 +279,22 @@ class Analytics:
             self._record_function_call(call_info, timing_info)
 
     # Event recording and memory management
+    def record_event(self, func_name: str, event_type: str, *, success: bool = True, duration: float = 0.0) -> None:
+        """Record an event that is not a decorated function call.
+
+        Used for run-level occurrences such as circuit breaker state changes,
+        so they show up in reports alongside timed calls.
+
+        Args:
+            func_name: Name shown in the Function column
+            event_type: Type of event for tracking
+            success: Whether the event is a success (failures are listed individually)
+            duration: Duration of the event in seconds, if any
+
+        """
+        end = time.time()
+        self._record_function_call(CallInfo(func_name, event_type, success), TimingInfo(end - duration, end, duration, 0.0))
+
     def _get_duration_symbol(self, duration: float) -> str:
         """Get the appropriate symbol for a given duration.
 
@@ -537,11 +553,12 @@ class Analytics:
         other.decorator_overhead.clear()
 
     # Reports
-    def generate_reports(self, force_mode: bool = False) -> None:
+    def generate_reports(self, force_mode: bool = False, cache_metrics: Mapping[str, Any] | None = None) -> None:
         """Generate analytics reports.
 
         Args:
             force_mode: Force report generation even if criteria not met
+            cache_metrics: Cache tier summary (``CacheOrchestrator.metrics_summary()``) for the report
 
         Note:
             Garbage collection is triggered after report generation if enabled
@@ -568,6 +585,7 @@ class Analytics:
             error_logger=self.error_logger,
             group_successful_short_calls=True,
             force_mode=force_mode,
+            cache_metrics=cache_metrics,
         )
 
         if len(self.events) > self.GC_COLLECTION_THRESHOLD and self.enable_gc_collect:
@@ -14,6 +14,8 @@ from typing import TYPE_CHECKING, Any
 from core.logger import get_full_log_path
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from core.models.track_models import AppConfig
 
 
@@ -315,6 +317,60 @@ def _generate_detailed_events_table_html(
     return html
 
 
+def _cache_metrics_row(tier: str, content_type: str, summary: Mapping[str, Any], latency: str, persist: str) -> str:
+    """Format one tier or content-type row of the cache metrics table."""
+    miss_reasons = summary.get("miss_reasons", {})
+    return f"""
+        <tr>
+            <td>{tier}</td>
+            <td>{content_type}</td>
+            <td>{summary.get("lookups", 0)}</td>
+            <td>{summary.get("hit_ratio", 0) * 100:.1f}</td>
+            <td>{miss_reasons.get("absent", 0)}</td>
+            <td>{miss_reasons.get("expired", 0)}</td>
+            <td>{miss_reasons.get("collision", 0)}</td>
+            <td>{miss_reasons.get("negative", 0)}</td>
+            <td>{latency}</td>
+            <td>{persist}</td>
+        </tr>"""
+
+
+def generate_cache_metrics_table_html(cache_metrics: Mapping[str, Any] | None) -> str:
+    """Generate HTML table of cache hit ratios, miss reasons and latencies per tier and content type."""
+    if not cache_metrics:
+        return ""
+    html = """
+    <h3>Cache Tiers</h3>
+    <table>
+        <tr>
+            <th>Tier</th>
+            <th>Content Type</th>
+            <th>Lookups</th>
+            <th>Hit Rate (%)</th>
+            <th>Absent</th>
+            <th>Expired</th>
+            <th>Collision</th>
+            <th>Negative</th>
+            <th>Lookup p50 / p99 (ms)</th>
+            <th>Save Mean (ms)</th>
+        </tr>"""
+
+    tiers = {**cache_metrics.get("tiers", {}), "read_through": cache_metrics.get("read_through", {})}
+    for tier, summary in tiers.items():
+        if not summary:
+            continue
+        lookup_latency = summary.get("lookup_latency", {})
+        persist_latency = summary.get("persist_latency", {})
+        latency = f"{lookup_latency.get('p50_ms', 0)} / {lookup_latency.get('p99_ms', 0)}"
+        persist = f"{persist_latency.get('mean_ms', 0)} ({persist_latency.get('count', 0)} saves)"
+        html += _cache_metrics_row(tier, "all", summary, latency, persist)
+        for content_type, content_summary in summary.get("content_types", {}).items():
+            html += _cache_metrics_row("", content_type, content_summary, "", "")
+
+    html += "</table>"
+    return html
+
+
 def generate_summary_table_html(
     call_counts: dict[str, int],
     success_counts: dict[str, int],
@@ -368,8 +424,13 @@ def save_html_report(
     error_logger: logging.Logger | None = None,
     group_successful_short_calls: bool = False,
     force_mode: bool = False,
+    cache_metrics: Mapping[str, Any] | None = None,
 ) -> None:
-    """Generate an HTML report from the provided analytics data."""
+    """Generate an HTML report from the provided analytics data.
+
+    ``cache_metrics`` (``CacheOrchestrator.metrics_summary()``) adds a table of
+    cache hit ratios, miss reasons and latencies per tier.
+    """
     if console_logger is None:
         console_logger = logging.getLogger("console_logger")
     if error_logger is None:
@@ -417,6 +478,7 @@ def save_html_report(
     html_content = _generate_main_html_template(date_str, call_counts, success_counts, events, force_mode)
     html_content += generate_grouped_success_table(grouped_short_success, group_successful_short_calls)
     html_content += _generate_detailed_events_table_html(big_or_fail_events, duration_thresholds, error_logger)
+    html_content += generate_cache_metrics_table_html(cache_metrics)
     html_content += generate_summary_table_html(call_counts, success_counts, decorator_overhead)
 
     # Save the report
@@ -16,12 +16,22 @@ from datetime import UTC
 from datetime import datetime as dt
 from typing import Any, NotRequired, TypedDict, TYPE_CHECKING
 
+from core.models.normalization import memoized_normalizer
+from core.models.trigram_index import TrigramIndex, edition_insensitive_normalizer
+
 if TYPE_CHECKING:
     import logging
+    from collections.abc import Sequence
+
+    from core.models.track_models import FuzzyMatchConfig
 
 # Small time buffer added after rate-limit wait to avoid edge-case rejections
 RATE_LIMIT_BUFFER_SECONDS: float = 0.01
 
+# Name normalization patterns
+_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 class ScoredRelease(TypedDict):
     """Type definition for a scored release with metadata and scoring details."""
@@ -158,18 +168,63 @@ class BaseApiClient:
     Args:
         console_logger: Logger for console output
         error_logger: Logger for error messages
+        fuzzy_match: Near-miss title matching against prefetched artist
+            catalogs (``year_retrieval.fuzzy_match``); disabled when None
+        remaster_keywords: Edition keywords ignored by near-miss matching
 
     """
 
-    def __init__(self, console_logger: logging.Logger, error_logger: logging.Logger) -> None:
+    def __init__(
+        self,
+        console_logger: logging.Logger,
+        error_logger: logging.Logger,
+        *,
+        fuzzy_match: FuzzyMatchConfig | None = None,
+        remaster_keywords: Sequence[str] = (),
+    ) -> None:
         self.console_logger = console_logger
         self.error_logger = error_logger
         self.compilation_pattern = re.compile(
             r"\b(compilation|greatest\s+hits|best\s+of|collection|anthology)\b",
             re.IGNORECASE,
         )
+        self.fuzzy_match = fuzzy_match
+        self._fuzzy_normalize = edition_insensitive_normalizer(remaster_keywords)
+        # Per-artist trigram indexes over prefetched catalog titles (positions in the catalog)
+        self._title_indexes: dict[str, TrigramIndex[int]] = {}
+
+    def _fuzzy_title_matches(self, artist_norm: str, titles: Sequence[str], album_norm: str) -> list[int]:
+        """Find the prefetched titles most similar to an album that matched no title exactly.
+
+        The index is built on first use per artist, so ``titles`` must be the
+        artist's complete, unchanging catalog for the run.
+
+        Args:
+            artist_norm: Normalized artist name the catalog belongs to
+            titles: Titles of the artist's catalog
+            album_norm: Normalized album name
+
+        Returns:
+            Positions in ``titles`` of the best near matches, or empty list
+
+        """
+        if self.fuzzy_match is None or not self.fuzzy_match.enabled:
+            return []
+
+        index = self._title_indexes.get(artist_norm)
+        if index is None:
+            index = TrigramIndex(self._fuzzy_normalize)
+            for position, title in enumerate(titles):
+                index.add(title, position)
+            self._title_indexes[artist_norm] = index
+
+        positions = index.best_matches(album_norm, min_similarity=self.fuzzy_match.min_similarity, limit=self.fuzzy_match.max_candidates)
+        if positions:
+            self.console_logger.debug("Near match for '%s - %s': '%s'", artist_norm, album_norm, titles[positions[0]])
+        return positions
 
     @staticmethod
+    @memoized_normalizer("BaseApiClient._normalize_name")
     def _normalize_name(name: str) -> str:
         """Normalize an artist or album name for case-insensitive matching.
 
@@ -195,10 +250,10 @@ class BaseApiClient:
         normalized = normalized.replace("&", "and")
 
         # Remove punctuation but keep Unicode word chars (\w includes non-ASCII letters)
-        normalized = re.sub(r"[^\w\s]", "", normalized)
+        normalized = _PUNCTUATION_RE.sub("", normalized)
 
         # Normalize whitespace (multiple spaces to single space)
-        normalized = re.sub(r"\s+", " ", normalized)
+        normalized = _WHITESPACE_RE.sub(" ", normalized)
 
         return normalized.strip()
 
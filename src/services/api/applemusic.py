@@ -16,6 +16,7 @@ API Reference: https://developer.apple.com/library/archive/documentation/AudioVi
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import traceback
 from datetime import UTC, datetime
@@ -33,6 +34,10 @@ ITUNES_BASE_URL: str = "https://itunes.apple.com"
 # Constants for data validation
 VALID_YEAR_LENGTH = 4  # Expected length of a year string (e.g., "2025")
 
+# Separators that may follow an album title in iTunes collection names
+# e.g. "Album (Deluxe Edition)", "Album [Remastered]", "Album - Single"
+_COLLECTION_SUFFIX_SEPARATORS = (" (", " [", " - ")
+
 _logger = logging.getLogger(__name__)
 
 
@@ -50,6 +55,8 @@ class AppleMusicClient:
         country_code: Country code for search results (default: US)
         entity: Type of content to search for (default: album)
         limit: Maximum number of results to return (default: 50)
+        catalog_prefetch: Match albums against the artist's cached lookup
+            catalog before running a per-album search
 
     """
 
@@ -63,6 +70,7 @@ class AppleMusicClient:
         country_code: str = "US",
         entity: str = "album",
         limit: int = 50,
+        catalog_prefetch: bool = False,
     ) -> None:
         self.console_logger = console_logger
         self.error_logger = error_logger
@@ -77,6 +85,13 @@ class AppleMusicClient:
         validated_limit = max(1, limit)
         self.limit = min(validated_limit, 200)
 
+        # Per-run artist catalogs from /lookup: artist_norm -> albums (None = artist not found).
+        # Across runs the underlying lookup responses are served from the API request cache.
+        self.catalog_prefetch = catalog_prefetch
+        self._artist_catalogs: dict[str, list[dict[str, Any]] | None] = {}
+        self._catalog_locks: dict[str, asyncio.Lock] = {}
+        self.catalog_stats: dict[str, int] = {"hits": 0, "misses": 0}
+
         self.console_logger.debug(
             "iTunes Search API client initialized (country=%s, entity=%s, limit=%d)",
             self.country_code,
@@ -91,8 +106,9 @@ class AppleMusicClient:
     ) -> list[ScoredRelease]:
         """Get scored releases from iTunes Search API with lookup fallback.
 
-        Uses the search API first. If no results are found, falls back to
-        looking up the artist and fetching all their albums.
+        With catalog prefetch enabled, the artist's cached catalog is matched
+        first. Otherwise (or on a catalog miss) uses the search API, falling
+        back to looking up the artist and fetching all their albums.
 
         Args:
             artist_norm: Normalized artist name
@@ -108,6 +124,9 @@ class AppleMusicClient:
             album_norm,
         )
         try:
+            if self.catalog_prefetch and (catalog_releases := await self._match_from_catalog(artist_norm, album_norm)):
+                return catalog_releases
+
             # Build search query - iTunes Search works best with "artist album" format
             search_term = f"{artist_norm} {album_norm}".strip()
 
@@ -187,15 +206,14 @@ class AppleMusicClient:
             "[itunes] Search returned no results for '%s', trying artist lookup fallback",
             search_term,
         )
-        artist_id = await self._find_artist_id(artist_norm)
-        if not artist_id:
+        results = await self.get_artist_catalog(artist_norm)
+        if results is None:
             self.console_logger.debug(
                 "[itunes] Could not find artist ID for '%s', no fallback possible",
                 artist_norm,
             )
             return []
 
-        results = await self._lookup_artist_albums(artist_id)
         if results:
             self.console_logger.info(
                 "[itunes] Lookup fallback found %d albums for artist '%s'",
@@ -204,11 +222,74 @@ class AppleMusicClient:
             )
         else:
             self.console_logger.debug(
-                "[itunes] Lookup fallback returned no albums for artist ID %s",
-                artist_id,
+                "[itunes] Lookup fallback returned no albums for artist '%s'",
+                artist_norm,
             )
         return results
 
+    async def get_artist_catalog(self, artist_norm: str) -> list[dict[str, Any]] | None:
+        """Get the artist's album catalog, looking it up at most once per run.
+
+        Args:
+            artist_norm: Normalized artist name
+
+        Returns:
+            List of album results, or None if the artist could not be found
+
+        """
+        if artist_norm in self._artist_catalogs:
+            return self._artist_catalogs[artist_norm]
+
+        lock = self._catalog_locks.setdefault(artist_norm, asyncio.Lock())
+        async with lock:
+            if artist_norm not in self._artist_catalogs:
+                artist_id = await self._find_artist_id(artist_norm)
+                self._artist_catalogs[artist_norm] = await self._lookup_artist_albums(artist_id) if artist_id else None
+        return self._artist_catalogs[artist_norm]
+
+    @staticmethod
+    def _is_catalog_match(collection_name: str, album_norm: str) -> bool:
+        """Check whether a catalog collection name refers to the target album.
+
+        Accepts an exact normalized match or the album title followed by an
+        edition/format suffix such as " (Deluxe Edition)" or " - Single".
+
+        Args:
+            collection_name: iTunes collection name
+            album_norm: Normalized album name
+
+        Returns:
+            True if the collection matches the album
+
+        """
+        collection = normalize_for_matching(collection_name)
+        album = normalize_for_matching(album_norm)
+        if not album:
+            return False
+        return collection == album or any(collection.startswith(album + separator) for separator in _COLLECTION_SUFFIX_SEPARATORS)
+
+    async def _match_from_catalog(self, artist_norm: str, album_norm: str) -> list[ScoredRelease]:
+        """Score albums from the artist's cached catalog that match the target album.
+
+        Args:
+            artist_norm: Normalized artist name
+            album_norm: Normalized album name
+
+        Returns:
+            Scored releases, or empty list on a catalog miss
+
+        """
+        catalog = await self.get_artist_catalog(artist_norm) or []
+        matches = [album for album in catalog if self._is_catalog_match(album.get("collectionName", ""), album_norm)]
+        scored = self._process_api_results(matches, artist_norm, album_norm, f"{artist_norm} {album_norm}") if matches else []
+
+        if scored:
+            self.catalog_stats["hits"] += 1
+            self.console_logger.debug("[itunes] Catalog hit for '%s - %s'", artist_norm, album_norm)
+        else:
+            self.catalog_stats["misses"] += 1
+        return scored
+
     def _process_api_results(
         self,
         results: list[dict[str, Any]],
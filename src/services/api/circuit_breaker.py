@@ -0,0 +1,224 @@
+"""Per-provider circuit breaker for external API calls.
+
+When a provider starts timing out or returning server errors, every request
+would otherwise pay the full retry and backoff cost before giving up. The
+breaker tracks recent outcomes per API and, once the failure rate crosses a
+threshold, rejects requests immediately (open). After a cool-down a single
+probe request is let through (half-open); its outcome closes the circuit or
+re-opens it for another cool-down.
+
+Slow responses count as failures, so a provider that answers but takes
+longer than ``slow_call_seconds`` trips the breaker the same way.
+
+A rejected request returns no data, like a request that found nothing. Code
+that needs to tell the two apart wraps the provider call in
+``track_rejections`` and checks which providers were rejected inside it.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from core.models.track_models import CircuitBreakerConfig
+
+# Providers rejected inside the innermost track_rejections block. The set is
+# shared with tasks spawned inside the block, which copy the context.
+_REJECTIONS: ContextVar[set[str] | None] = ContextVar("circuit_rejections", default=None)
+
+
+class CircuitOpenError(Exception):
+    """A provider call returned nothing because its circuit rejected the requests."""
+
+    def __init__(self, api_name: str) -> None:
+        super().__init__(f"{api_name} circuit open")
+        self.api_name = api_name
+
+
+@contextmanager
+def track_rejections() -> Iterator[set[str]]:
+    """Collect the providers whose requests an open circuit rejects inside the block."""
+    rejected: set[str] = set()
+    token = _REJECTIONS.set(rejected)
+    try:
+        yield rejected
+    finally:
+        _REJECTIONS.reset(token)
+
+
+def report_rejection(api_name: str) -> None:
+    """Note a rejected request for the enclosing ``track_rejections`` block, if any."""
+    if (rejected := _REJECTIONS.get()) is not None:
+        rejected.add(api_name)
+
+
+class CircuitState(StrEnum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker fed by call outcomes and latency.
+
+    Args:
+        api_name: Provider the breaker guards (used in state-change callbacks)
+        failure_rate_threshold: Failure ratio in the window that opens the circuit
+        window_size: Number of most recent calls considered
+        min_calls: Calls required in the window before the circuit can open
+        slow_call_seconds: Successful calls slower than this count as failures
+        open_seconds: Cool-down before a half-open probe is allowed
+        on_state_change: Called with ``(api_name, old_state, new_state)``
+        clock: Monotonic time source (injectable for tests)
+
+    Raises:
+        ValueError: If window_size or min_calls are not positive
+
+    """
+
+    def __init__(
+        self,
+        api_name: str,
+        *,
+        failure_rate_threshold: float,
+        window_size: int,
+        min_calls: int,
+        slow_call_seconds: float,
+        open_seconds: float,
+        on_state_change: Callable[[str, CircuitState, CircuitState], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if window_size <= 0 or min_calls <= 0:
+            msg = "window_size and min_calls must be positive integers"
+            raise ValueError(msg)
+
+        self.api_name = api_name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.min_calls = min(min_calls, window_size)
+        self.slow_call_seconds = slow_call_seconds
+        self.open_seconds = open_seconds
+        self.on_state_change = on_state_change
+        self._clock = clock
+
+        self.state = CircuitState.CLOSED
+        self._outcomes: deque[bool] = deque(maxlen=window_size)
+        self._opened_at = 0.0
+        self._probe_started_at = 0.0
+
+        self.rejected = 0
+        self.transitions = 0
+
+    @classmethod
+    def from_config(
+        cls,
+        api_name: str,
+        config: CircuitBreakerConfig,
+        on_state_change: Callable[[str, CircuitState, CircuitState], None] | None = None,
+    ) -> CircuitBreaker:
+        """Create a breaker from the ``year_retrieval.circuit_breaker`` settings."""
+        return cls(
+            api_name,
+            failure_rate_threshold=config.failure_rate_threshold,
+            window_size=config.window_size,
+            min_calls=config.min_calls,
+            slow_call_seconds=config.slow_call_seconds,
+            open_seconds=config.open_seconds,
+            on_state_change=on_state_change,
+        )
+
+    @property
+    def is_open(self) -> bool:
+        """Whether requests are currently rejected without a probe being due."""
+        return self.state is CircuitState.OPEN and self._clock() - self._opened_at < self.open_seconds
+
+    @property
+    def is_rejecting(self) -> bool:
+        """Whether ``allow_request`` would reject a request now (open, or a probe in flight)."""
+        now = self._clock()
+        if self.state is CircuitState.OPEN:
+            return now - self._opened_at < self.open_seconds
+        # One probe at a time; a probe that never reported back is replaced
+        return self.state is CircuitState.HALF_OPEN and now - self._probe_started_at < self.open_seconds
+
+    def allow_request(self) -> bool:
+        """Decide whether a request may be sent, starting a probe when due.
+
+        Returns:
+            True if the request may proceed, False if it should be skipped
+
+        """
+        if self.is_rejecting:
+            self.rejected += 1
+            return False
+        if self.state is not CircuitState.CLOSED:
+            self._transition(CircuitState.HALF_OPEN)
+            self._probe_started_at = self._clock()
+        return True
+
+    def record_success(self, latency: float) -> None:
+        """Record a completed call; slow calls are recorded as failures.
+
+        Args:
+            latency: Request duration in seconds
+
+        """
+        if latency > self.slow_call_seconds:
+            self.record_failure()
+            return
+        if self.state is CircuitState.HALF_OPEN:
+            self._outcomes.clear()
+            self._transition(CircuitState.CLOSED)
+        self._outcomes.append(False)
+
+    def record_failure(self) -> None:
+        """Record a failed call (timeout, connection error, 429 or 5xx)."""
+        if self.state is CircuitState.HALF_OPEN:
+            self._open()
+            return
+        self._outcomes.append(True)
+        if self.state is CircuitState.CLOSED and len(self._outcomes) >= self.min_calls and self.failure_rate >= self.failure_rate_threshold:
+            self._open()
+
+    @property
+    def failure_rate(self) -> float:
+        """Failure ratio over the current window."""
+        return sum(self._outcomes) / len(self._outcomes) if self._outcomes else 0.0
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get current breaker state and counters.
+
+        Returns:
+            Dictionary with state, failure rate, window size, rejected calls
+            and number of state transitions
+
+        """
+        return {
+            "state": self.state.value,
+            "failure_rate": self.failure_rate,
+            "window_calls": len(self._outcomes),
+            "rejected": self.rejected,
+            "transitions": self.transitions,
+        }
+
+    def _open(self) -> None:
+        self._opened_at = self._clock()
+        self._outcomes.clear()
+        self._transition(CircuitState.OPEN)
+
+    def _transition(self, new_state: CircuitState) -> None:
+        old_state = self.state
+        if old_state is new_state:
+            return
+        self.state = new_state
+        self.transitions += 1
+        if self.on_state_change is not None:
+            self.on_state_change(self.api_name, old_state, new_state)
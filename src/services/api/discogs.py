@@ -6,18 +6,20 @@ and scoring music releases from the Discogs database.
 
 from __future__ import annotations
 
+import asyncio
 import re
 import urllib.parse
 from typing import TYPE_CHECKING, Any, TypedDict, cast
 
 from core.analytics_decorator import track_instance_method
-from core.models.normalization import normalize_for_matching
+from core.models.keyword_matcher import get_keyword_matcher
+from core.models.normalization import memoized_normalizer, normalize_for_matching
 
 from .api_base import BaseApiClient, ScoredRelease
 
 if TYPE_CHECKING:
     import logging
-    from collections.abc import Awaitable, Callable
+    from collections.abc import Awaitable, Callable, Iterable
 
     from core.models.protocols import CacheServiceProtocol
     from core.models.track_models import AppConfig, YearRetrievalConfig
@@ -27,6 +29,12 @@ if TYPE_CHECKING:
 # Discogs API v2 base URL
 DISCOGS_BASE_URL: str = "https://api.discogs.com"
 
+# Page size for the artist releases listing (Discogs maximum)
+ARTIST_RELEASES_PAGE_SIZE: int = 100
+
+# Discogs disambiguation suffix on artist names, e.g. "Artist (2)"
+_NUMBERED_SUFFIX_RE = re.compile(r"\s*\(\d+\)\s*$")
+
 
 # Discogs Type Definitions
 class DiscogsFormat(TypedDict, total=False):
@@ -81,6 +89,20 @@ class DiscogsMasterRelease(TypedDict, total=False):
     data_quality: str
 
 
+class DiscogsArtistRelease(TypedDict, total=False):
+    """Type definition for an entry of the Discogs artist releases listing."""
+
+    id: int
+    type: str  # "master" or "release"
+    main_release: int | None
+    title: str
+    year: int | None
+    artist: str
+    role: str
+    format: str | None
+    label: str | None
+
+
 def _get_format_details(formats: list[DiscogsFormat]) -> str:
     """Extract format details from a Discogs format list.
 
@@ -135,7 +157,12 @@ class DiscogsClient(BaseApiClient):
         config: AppConfig,
         cache_ttl_days: int = 30,
     ) -> None:
-        super().__init__(console_logger, error_logger)
+        super().__init__(
+            console_logger,
+            error_logger,
+            fuzzy_match=config.year_retrieval.fuzzy_match,
+            remaster_keywords=config.cleaning.remaster_keywords,
+        )
         self.analytics = analytics
         self.token = token
         self._make_api_request = make_api_request_func
@@ -145,6 +172,15 @@ class DiscogsClient(BaseApiClient):
         self.config = config
         self.cache_ttl_days = cache_ttl_days
 
+        prefetch_config = config.year_retrieval.prefetch
+        self.artist_prefetch = prefetch_config.discogs
+        self.max_artist_release_pages = prefetch_config.discogs_max_pages
+
+        # Per-run artist release lists: artist_norm -> main releases (None = artist not resolved)
+        self._artist_releases: dict[str, list[DiscogsArtistRelease] | None] = {}
+        self._artist_release_locks: dict[str, asyncio.Lock] = {}
+        self.prefetch_stats: dict[str, int] = {"hits": 0, "misses": 0}
+
     @track_instance_method("discogs_release_details")
     async def _fetch_discogs_release_details(self, release_id: int) -> dict[str, Any] | None:
         """Fetch detailed information for a specific Discogs release.
@@ -247,6 +283,7 @@ class DiscogsClient(BaseApiClient):
         return None, None
 
     @staticmethod
+    @memoized_normalizer("discogs._normalize_artist_for_matching")
     def _normalize_artist_for_matching(artist: str) -> str:
         """Normalize artist name for flexible Discogs matching.
 
@@ -271,7 +308,7 @@ class DiscogsClient(BaseApiClient):
             normalized = f"the {normalized[:-5]}"
 
         # Remove trailing numbered suffix like "(2)", "(3)" and return
-        return re.sub(r"\s*\(\d+\)\s*$", "", normalized)
+        return _NUMBERED_SUFFIX_RE.sub("", normalized)
 
     def _is_artist_match(
         self,
@@ -716,7 +753,7 @@ class DiscogsClient(BaseApiClient):
         # Check if this is a reissue
         _, title_album = DiscogsClient._extract_artist_from_title(item.get("title", ""))
         title_lower = (title_album or item.get("title", "")).lower()
-        is_reissue = any(keyword.lower() in title_lower for keyword in reissue_keywords)
+        is_reissue = get_keyword_matcher(tuple(reissue_keywords)).contains_any(title_lower)
 
         # Fetch master release year if available (analogous to MusicBrainz release-group first-release-date)
         master_year: int | None = None
@@ -779,6 +816,216 @@ class DiscogsClient(BaseApiClient):
 
         return scored_releases
 
+    async def _resolve_artist_id(self, artist_norm: str, artist_orig: str | None) -> int | None:
+        """Resolve the Discogs artist ID, accepting only an unambiguous name match.
+
+        Matching ignores Discogs' "(2)"-style disambiguation suffixes, so several
+        artists sharing the name all match; their listings cannot be told apart
+        and the artist is not prefetched.
+
+        Args:
+            artist_norm: Normalized artist name
+            artist_orig: Original artist name (preferred for the query)
+
+        Returns:
+            Discogs artist ID, or None if no result or more than one result matches
+
+        """
+        params = {"q": artist_orig or artist_norm, "type": "artist", "per_page": "5"}
+        data = await self._execute_search(params, "Artist lookup")
+        if not data:
+            return None
+
+        target = self._normalize_artist_for_matching(artist_norm).removeprefix("the ")
+        matches = {
+            artist_id
+            for result in data.get("results", [])
+            if self._normalize_artist_for_matching(str(result.get("title", ""))).removeprefix("the ") == target
+            and (artist_id := self._get_validated_release_id(result)) is not None
+        }
+        if len(matches) > 1:
+            self.console_logger.debug("[discogs] Artist '%s' matches %d Discogs artists; skipping prefetch", artist_norm, len(matches))
+            return None
+        return next(iter(matches), None)
+
+    async def _fetch_artist_releases(self, artist_norm: str, artist_orig: str | None) -> list[DiscogsArtistRelease] | None:
+        """Page through the artist's releases listing and seed the master-year cache.
+
+        Every master entry carries its original year, which is stored under the
+        same cache key used by _fetch_master_release_year, so later per-album
+        lookups skip the /masters request as well.
+
+        Args:
+            artist_norm: Normalized artist name
+            artist_orig: Original artist name
+
+        Returns:
+            Main-role releases of the artist, or None if the artist could not be resolved
+
+        """
+        artist_id = await self._resolve_artist_id(artist_norm, artist_orig)
+        if artist_id is None:
+            return None
+
+        releases_url = f"{DISCOGS_BASE_URL}/artists/{artist_id}/releases"
+        entries: list[DiscogsArtistRelease] = []
+
+        for page in range(1, self.max_artist_release_pages + 1):
+            params = {"per_page": str(ARTIST_RELEASES_PAGE_SIZE), "page": str(page), "sort": "year", "sort_order": "asc"}
+            data = await self._make_api_request("discogs", releases_url, params=params)
+            if not data:
+                if page == 1:
+                    return None
+                break
+
+            entries.extend(cast("list[DiscogsArtistRelease]", data.get("releases") or []))
+            if page >= int((data.get("pagination") or {}).get("pages") or 1):
+                break
+
+        main_entries = [entry for entry in entries if entry.get("role", "Main") == "Main"]
+        await self._cache_master_years(main_entries)
+
+        self.console_logger.debug("[discogs] Prefetched %d releases for '%s' (artist ID %s)", len(main_entries), artist_norm, artist_id)
+        return main_entries
+
+    async def _cache_master_years(self, entries: list[DiscogsArtistRelease]) -> None:
+        """Persist master ID -> year pairs from an artist releases listing."""
+        cache_ttl = self.cache_ttl_days * 86400
+        for entry in entries:
+            year = entry.get("year")
+            if entry.get("type") == "master" and entry.get("id") and year and self._is_valid_year(str(year)):
+                await self.cache_service.set_async(f"discogs_master_{entry['id']}", year, ttl=cache_ttl)
+
+    async def get_artist_releases(self, artist_norm: str, artist_orig: str | None = None) -> list[DiscogsArtistRelease] | None:
+        """Get the artist's main releases, fetching them at most once per run.
+
+        Args:
+            artist_norm: Normalized artist name
+            artist_orig: Original artist name
+
+        Returns:
+            Main-role releases, or None if the artist could not be resolved
+
+        """
+        if artist_norm in self._artist_releases:
+            return self._artist_releases[artist_norm]
+
+        lock = self._artist_release_locks.setdefault(artist_norm, asyncio.Lock())
+        async with lock:
+            if artist_norm not in self._artist_releases:
+                self._artist_releases[artist_norm] = await self._fetch_artist_releases(artist_norm, artist_orig)
+        return self._artist_releases[artist_norm]
+
+    def _match_artist_releases(self, entries: list[DiscogsArtistRelease], album_norm: str) -> list[DiscogsArtistRelease]:
+        """Match an album against the artist's releases by normalized title.
+
+        Args:
+            entries: Main-role releases of the artist
+            album_norm: Normalized album name
+
+        Returns:
+            Matching entries with a valid year, masters first
+
+        """
+        target = self._normalize_name(album_norm)
+        return self._with_valid_year_masters_first(entry for entry in entries if self._normalize_name(str(entry.get("title", ""))) == target)
+
+    def _with_valid_year_masters_first(self, entries: Iterable[DiscogsArtistRelease]) -> list[DiscogsArtistRelease]:
+        """Keep entries with a valid year, masters first."""
+        matches = [entry for entry in entries if self._is_valid_year(str(entry.get("year") or ""))]
+        return sorted(matches, key=lambda entry: entry.get("type") != "master")
+
+    def _score_artist_release_matches(
+        self,
+        matches: list[DiscogsArtistRelease],
+        artist_norm: str,
+        album_norm: str,
+        *,
+        artist_region: str | None,
+        reissue_keywords: list[str],
+    ) -> list[ScoredRelease]:
+        """Score locally matched artist releases without detail or master fetches.
+
+        Args:
+            matches: Matched artist release entries
+            artist_norm: Normalized artist name
+            album_norm: Normalized album name
+            artist_region: Artist's region for scoring
+            reissue_keywords: Keywords to detect reissues
+
+        Returns:
+            List of scored releases
+
+        """
+        scored_releases: list[ScoredRelease] = []
+        for entry in matches:
+            title = str(entry.get("title", ""))
+            year_str = str(entry.get("year"))
+            is_master = entry.get("type") == "master"
+            item: DiscogsRelease = {
+                "id": entry.get("main_release") or entry.get("id", 0),
+                "title": f"{entry.get('artist') or artist_norm} - {title}",
+                "year": year_str,
+                "type": "release",
+                "formats": [{"name": fmt} for fmt in [entry.get("format")] if fmt],
+                "label": [label for label in [entry.get("label")] if label],
+                "master_id": entry.get("id") if is_master else None,
+            }
+            is_reissue = get_keyword_matcher(tuple(reissue_keywords)).contains_any(title)
+            scored = self._create_scored_release(
+                item,
+                artist_norm,
+                album_norm,
+                artist_region=artist_region,
+                year_str=year_str,
+                is_reissue=is_reissue,
+                master_year=int(year_str) if is_master else None,
+            )
+            if scored:
+                scored_releases.append(scored)
+        return scored_releases
+
+    async def _resolve_from_artist_releases(
+        self,
+        artist_norm: str,
+        album_norm: str,
+        *,
+        artist_region: str | None,
+        artist_orig: str | None,
+        reissue_keywords: list[str],
+    ) -> list[ScoredRelease]:
+        """Resolve an album from the prefetched artist release list.
+
+        Args:
+            artist_norm: Normalized artist name
+            album_norm: Normalized album name
+            artist_region: Artist's region for scoring
+            artist_orig: Original artist name
+            reissue_keywords: Keywords to detect reissues
+
+        Returns:
+            Scored releases, or empty list when the album is not in the list
+
+        """
+        entries = await self.get_artist_releases(artist_norm, artist_orig)
+        matches = self._match_artist_releases(entries, album_norm) if entries else []
+        if not matches and entries:
+            positions = self._fuzzy_title_matches(artist_norm, [str(entry.get("title", "")) for entry in entries], album_norm)
+            matches = self._with_valid_year_masters_first(entries[position] for position in positions)
+        if not matches:
+            self.prefetch_stats["misses"] += 1
+            return []
+
+        self.prefetch_stats["hits"] += 1
+        self.console_logger.debug("[discogs] Resolved '%s - %s' from artist release list", artist_norm, album_norm)
+        return self._score_artist_release_matches(
+            matches,
+            artist_norm,
+            album_norm,
+            artist_region=artist_region,
+            reissue_keywords=reissue_keywords,
+        )
+
     @track_instance_method("discogs_release_search")
     async def get_scored_releases(
         self,
@@ -791,6 +1038,10 @@ class DiscogsClient(BaseApiClient):
     ) -> list[ScoredRelease]:
         """Retrieve and score releases from Discogs.
 
+        With artist prefetch enabled, albums found in the artist's release list
+        are resolved locally; the database search and per-item detail fetches
+        are reserved for unresolved albums.
+
         Args:
             artist_norm: Normalized artist name
             album_norm: Normalized album name
@@ -811,6 +1062,21 @@ class DiscogsClient(BaseApiClient):
             return cached_releases
 
         try:
+            # Get reissue keywords
+            reissue_keywords = self._get_reissue_keywords()
+
+            if self.artist_prefetch and (
+                prefetched := await self._resolve_from_artist_releases(
+                    artist_norm,
+                    album_norm,
+                    artist_region=artist_region,
+                    artist_orig=artist_orig,
+                    reissue_keywords=reissue_keywords,
+                )
+            ):
+                await self.cache_service.set_async(cache_key, prefetched, ttl=cache_ttl_seconds)
+                return sorted(prefetched, key=lambda x: x["score"], reverse=True)
+
             # Make search request
             discogs_response = await self._make_discogs_search_request(artist_norm, album_norm, artist_orig, album_orig)
 
@@ -820,9 +1086,6 @@ class DiscogsClient(BaseApiClient):
 
             results = discogs_response.get("results", [])
 
-            # Get reissue keywords
-            reissue_keywords = self._get_reissue_keywords()
-
             # Process results
             scored_releases: list[ScoredRelease] = await self._process_discogs_results(
                 results,
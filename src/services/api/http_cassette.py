@@ -0,0 +1,272 @@
+"""HTTP cassette for recording and replaying external API traffic.
+
+A cassette captures every response the request executor receives from
+MusicBrainz, Discogs and iTunes (normalized URL, params, status, body and
+timing) as compact JSON lines. In replay mode the same responses are served
+from disk with the original or scaled latency, which makes it possible to
+profile and regression-benchmark the year pipeline on an offline machine.
+
+Recording streams records to the file in small batches; only replay holds
+the interactions in memory.
+
+File format (one JSON object per line)::
+
+    {"k": "<key>", "a": "musicbrainz", "u": "https://...", "p": [["query", "..."]], "s": 200, "t": 0.412, "b": {...}}
+
+Files ending in ``.gz`` are transparently gzip-compressed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import logging
+import urllib.parse
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, cast
+
+from core.models.track_models import CassetteMode
+from services.cache.hash_service import UnifiedHashService
+from services.cache.json_utils import dumps_json, loads_json
+
+if TYPE_CHECKING:
+    from core.models.track_models import AppConfig
+
+_logger = logging.getLogger(__name__)
+
+# Number of recorded interactions buffered in memory before appending to disk
+CASSETTE_FLUSH_THRESHOLD = 50
+
+
+@dataclass(slots=True)
+class CassetteInteraction:
+    """Single recorded request/response pair."""
+
+    api_name: str
+    url: str
+    params: list[tuple[str, str]]
+    status: int
+    elapsed: float
+    body: dict[str, Any] | None
+
+    def to_record(self, key: str) -> dict[str, Any]:
+        """Convert the interaction to its compact on-disk representation."""
+        return {
+            "k": key,
+            "a": self.api_name,
+            "u": self.url,
+            "p": [list(pair) for pair in self.params],
+            "s": self.status,
+            "t": round(self.elapsed, 4),
+            "b": self.body,
+        }
+
+    @classmethod
+    def from_record(cls, record: dict[str, Any]) -> CassetteInteraction:
+        """Rebuild an interaction from its on-disk representation."""
+        return cls(
+            api_name=str(record["a"]),
+            url=str(record["u"]),
+            params=[(str(name), str(value)) for name, value in record.get("p", [])],
+            status=int(record["s"]),
+            elapsed=float(record.get("t", 0.0)),
+            body=record.get("b"),
+        )
+
+
+@dataclass(slots=True)
+class CassetteStats:
+    """Counters describing cassette usage during a run."""
+
+    recorded: int = 0
+    replay_hits: int = 0
+    replay_misses: int = 0
+    replayed_latency: float = 0.0
+    misses_by_api: dict[str, int] = field(default_factory=dict)
+
+
+class HttpCassette:
+    """Record/replay store for external API responses.
+
+    Args:
+        path: Cassette file location (``.gz`` suffix enables compression)
+        mode: Record, replay, or off
+        latency_scale: Multiplier applied to recorded latencies on replay
+            (``1.0`` reproduces original timing, ``0`` replays instantly)
+
+    """
+
+    def __init__(self, path: Path, *, mode: CassetteMode, latency_scale: float = 1.0) -> None:
+        self.path = path
+        self.mode = mode
+        self.latency_scale = max(0.0, latency_scale)
+        self.stats = CassetteStats()
+
+        # Replay: interactions loaded from the file. Record: keys written this run and records not yet appended
+        self._interactions: dict[str, CassetteInteraction] = {}
+        self._recorded_keys: set[str] = set()
+        self._pending: list[dict[str, Any]] = []
+        self._loaded = False
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def from_config(cls, config: AppConfig) -> HttpCassette | None:
+        """Create a cassette from configuration, or None when disabled.
+
+        Relative paths are resolved against ``logs_base_dir``.
+        """
+        cassette_cfg = config.year_retrieval.cassette
+        if cassette_cfg.mode == CassetteMode.OFF:
+            return None
+        return cls(
+            Path(config.logs_base_dir) / cassette_cfg.path,
+            mode=cassette_cfg.mode,
+            latency_scale=cassette_cfg.latency_scale,
+        )
+
+    @property
+    def is_recording(self) -> bool:
+        """Whether responses should be written to the cassette."""
+        return self.mode == CassetteMode.RECORD
+
+    @property
+    def is_replaying(self) -> bool:
+        """Whether responses should be served from the cassette."""
+        return self.mode == CassetteMode.REPLAY
+
+    @staticmethod
+    def normalize_request(url: str, params: dict[str, str] | None) -> tuple[str, list[tuple[str, str]]]:
+        """Normalize URL and params so equivalent requests share a key.
+
+        Lowercases scheme and host, drops trailing slashes and fragments, and
+        merges any query string embedded in the URL with the explicit params.
+
+        Args:
+            url: Request URL
+            params: Query parameters
+
+        Returns:
+            Tuple of (normalized_url, sorted_param_pairs)
+
+        """
+        parts = urllib.parse.urlsplit(url)
+        merged = urllib.parse.parse_qsl(parts.query, keep_blank_values=True)
+        merged.extend((str(name), str(value)) for name, value in (params or {}).items())
+        path = parts.path.rstrip("/") or "/"
+        normalized_url = urllib.parse.urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, "", ""))
+        return normalized_url, sorted(merged)
+
+    @classmethod
+    def build_key(cls, api_name: str, url: str, params: dict[str, str] | None) -> str:
+        """Build the stable lookup key for a request."""
+        normalized_url, pairs = cls.normalize_request(url, params)
+        return UnifiedHashService.hash_generic_key({"api": api_name, "url": normalized_url, "params": pairs})
+
+    async def record(
+        self,
+        api_name: str,
+        url: str,
+        params: dict[str, str] | None,
+        *,
+        status: int,
+        elapsed: float,
+        body: dict[str, Any] | None,
+    ) -> None:
+        """Record a response, flushing to disk once the buffer is large enough."""
+        if not self.is_recording:
+            return
+
+        normalized_url, pairs = self.normalize_request(url, params)
+        key = self.build_key(api_name, url, params)
+        interaction = CassetteInteraction(api_name, normalized_url, pairs, status, elapsed, body)
+
+        self._recorded_keys.add(key)
+        self._pending.append(interaction.to_record(key))
+        self.stats.recorded += 1
+
+        if len(self._pending) >= CASSETTE_FLUSH_THRESHOLD:
+            await self.flush()
+
+    async def record_cached(self, api_name: str, url: str, params: dict[str, str] | None, *, body: dict[str, Any]) -> None:
+        """Record a response served from the API cache, once per request.
+
+        The original latency is unknown, so the record replays instantly.
+        """
+        if self.is_recording and self.build_key(api_name, url, params) not in self._recorded_keys:
+            await self.record(api_name, url, params, status=200, elapsed=0.0, body=body)
+
+    async def replay(self, api_name: str, url: str, params: dict[str, str] | None) -> dict[str, Any] | None:
+        """Serve a recorded response, sleeping for the (scaled) recorded latency.
+
+        Returns:
+            Recorded response body, or None when the request was never recorded
+            or the recorded response carried no body
+
+        """
+        await self._ensure_loaded()
+
+        interaction = self._interactions.get(self.build_key(api_name, url, params))
+        if interaction is None:
+            self.stats.replay_misses += 1
+            self.stats.misses_by_api[api_name] = self.stats.misses_by_api.get(api_name, 0) + 1
+            _logger.debug("[%s] Cassette miss for %s %s", api_name, url, params)
+            return None
+
+        self.stats.replay_hits += 1
+        delay = interaction.elapsed * self.latency_scale
+        if delay > 0:
+            self.stats.replayed_latency += delay
+            await asyncio.sleep(delay)
+        return interaction.body
+
+    async def flush(self) -> None:
+        """Append buffered interactions to the cassette file."""
+        if not self._pending:
+            return
+        async with self._lock:
+            records, self._pending = self._pending, []
+            await asyncio.to_thread(self._append_records, records)
+
+    def _append_records(self, records: list[dict[str, Any]]) -> None:
+        """Append records as JSON lines (runs in a worker thread)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._open("ab") as handle:
+            for record in records:
+                handle.write(dumps_json(record))
+                handle.write(b"\n")
+
+    async def _ensure_loaded(self) -> None:
+        """Load the cassette file once, on first replay."""
+        if self._loaded:
+            return
+        async with self._lock:
+            if self._loaded:
+                return
+            self._interactions = await asyncio.to_thread(self._load_interactions)
+            self._loaded = True
+            _logger.info("Loaded %d recorded API interactions from %s", len(self._interactions), self.path)
+
+    def _load_interactions(self) -> dict[str, CassetteInteraction]:
+        """Read all interactions from disk; later records override earlier ones."""
+        interactions: dict[str, CassetteInteraction] = {}
+        if not self.path.exists():
+            _logger.warning("Cassette file %s does not exist; every request will miss", self.path)
+            return interactions
+
+        with self._open("rb") as handle:
+            for line_number, raw_line in enumerate(handle, start=1):
+                if not (line := raw_line.strip()):
+                    continue
+                try:
+                    record = loads_json(line)
+                    interactions[str(record["k"])] = CassetteInteraction.from_record(record)
+                except (ValueError, KeyError, TypeError):
+                    _logger.warning("Skipping malformed cassette record at %s:%d", self.path, line_number)
+        return interactions
+
+    def _open(self, mode: str) -> IO[bytes]:
+        """Open the cassette file, transparently handling gzip compression."""
+        if self.path.suffix == ".gz":
+            return cast(IO[bytes], gzip.open(self.path, mode))
+        return self.path.open(mode)
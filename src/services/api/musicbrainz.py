@@ -7,6 +7,7 @@ and scoring music releases from the MusicBrainz database.
 from __future__ import annotations
 
 import asyncio
+import sqlite3
 import urllib.parse
 from typing import Any, TypedDict, cast, TYPE_CHECKING
 
@@ -17,17 +18,26 @@ from core.models.track_models import MBArtist
 from .api_base import BaseApiClient, ScoredRelease
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
+    from collections.abc import Awaitable, Callable, Iterable, Sequence
     import logging
 
+    from core.models.track_models import FuzzyMatchConfig
     from metrics import Analytics
 
+    from .musicbrainz_local import MusicBrainzLocalStore
+
 # Type alias for MusicBrainz API response data
 MBApiData = dict[str, Any]
 
 # MusicBrainz Web Service v2 base URL
 MUSICBRAINZ_BASE_URL: str = "https://musicbrainz.org/ws/2"
 
+# Maximum page size accepted by the MusicBrainz browse endpoints
+DISCOGRAPHY_PAGE_SIZE: int = 100
+
+# Artist search hits checked for other artists sharing the name before a discography prefetch
+ARTIST_MATCH_CANDIDATES: int = 5
+
 
 # MusicBrainz Type Definitions
 class LifeSpan(TypedDict, total=False):
@@ -193,6 +203,16 @@ class MusicBrainzClient(BaseApiClient):
         make_api_request_func: Function to make API requests with rate limiting
         score_release_func: Function to score releases for originality
         analytics: Analytics instance for performance tracking
+        discography_prefetch: Resolve albums against the artist's prefetched
+            release-group list before falling back to per-album searches
+        max_discography_pages: Maximum browse pages fetched per artist
+        local_store: Imported MusicBrainz dump queried before the web service
+        score_releases_func: Async batch variant of ``score_release_func``
+            scoring all fetched releases of an album at once, possibly in a
+            worker process (scores one by one if None)
+        fuzzy_match: Near-miss title matching against the prefetched
+            discography (``year_retrieval.fuzzy_match``)
+        remaster_keywords: Edition keywords ignored by near-miss matching
 
     """
 
@@ -203,11 +223,29 @@ class MusicBrainzClient(BaseApiClient):
         make_api_request_func: Callable[..., Awaitable[dict[str, Any] | None]],
         score_release_func: Callable[..., float],
         analytics: Analytics,
+        *,
+        discography_prefetch: bool = False,
+        max_discography_pages: int = 5,
+        local_store: MusicBrainzLocalStore | None = None,
+        score_releases_func: Callable[..., Awaitable[list[int]]] | None = None,
+        fuzzy_match: FuzzyMatchConfig | None = None,
+        remaster_keywords: Sequence[str] = (),
     ) -> None:
-        super().__init__(console_logger, error_logger)
+        super().__init__(console_logger, error_logger, fuzzy_match=fuzzy_match, remaster_keywords=remaster_keywords)
         self._make_api_request = make_api_request_func
         self._score_original_release = score_release_func
+        self._score_releases = score_releases_func
         self.analytics = analytics
+        self.discography_prefetch = discography_prefetch
+        self.max_discography_pages = max_discography_pages
+
+        # Per-run discography cache: artist_norm -> release groups (None = artist not resolved)
+        self._discographies: dict[str, list[MBApiData] | None] = {}
+        self._discography_locks: dict[str, asyncio.Lock] = {}
+        self.discography_stats: dict[str, int] = {"hits": 0, "misses": 0}
+
+        self.local_store = local_store
+        self.local_stats: dict[str, int] = {"hits": 0, "misses": 0}
 
     @staticmethod
     def _escape_lucene(term: str) -> str:
@@ -293,13 +331,28 @@ class MusicBrainzClient(BaseApiClient):
         Returns:
             Artist information or None if not found
 
+        """
+        artists = await self._search_artists(artist_norm, limit=1, include_aliases=include_aliases)
+        return artists[0] if artists else None
+
+    async def _search_artists(self, artist_norm: str, *, limit: int, include_aliases: bool = False) -> list[MBApiData]:
+        """Search MusicBrainz artists, best match first.
+
+        Args:
+            artist_norm: Normalized artist name
+            limit: Maximum number of artists returned
+            include_aliases: Whether to include aliases in the response
+
+        Returns:
+            Matching artists (empty if none were found or the request failed)
+
         """
         search_url = f"{MUSICBRAINZ_BASE_URL}/artist/"
         # Non-fielded search matches aliases; see _perform_primary_search for script detection
         params = {
             "query": self._escape_lucene(artist_norm),
             "fmt": "json",
-            "limit": "1",
+            "limit": str(limit),
         }
 
         if include_aliases:
@@ -308,11 +361,11 @@ class MusicBrainzClient(BaseApiClient):
         try:
             response = await self._make_api_request("musicbrainz", search_url, params=params)
             if response and response.get("artists"):
-                return cast(MBApiData, response["artists"][0])
+                return cast(list[MBApiData], response["artists"])
         except (OSError, ValueError, RuntimeError, KeyError, TypeError) as e:
             self.error_logger.exception("Failed to get artist info for '%s': %s", artist_norm, e)
 
-        return None
+        return []
 
     @track_instance_method("musicbrainz_artist_period")
     async def get_artist_activity_period(self, artist_norm: str) -> tuple[str | None, str | None]:
@@ -380,6 +433,155 @@ class MusicBrainzClient(BaseApiClient):
         artist_info = await self.get_artist_info(artist_norm)
         return artist_info.get("name") if artist_info else None
 
+    async def get_artist_discography(self, artist_norm: str) -> list[MBApiData] | None:
+        """Get all release groups of an artist, fetching them at most once per run.
+
+        Concurrent callers for the same artist share a single fetch. Individual
+        browse pages are additionally cached by the request executor, so
+        subsequent runs are served from the API cache.
+
+        Args:
+            artist_norm: Normalized artist name
+
+        Returns:
+            List of release groups, or None if the artist could not be resolved
+
+        """
+        if artist_norm in self._discographies:
+            return self._discographies[artist_norm]
+
+        lock = self._discography_locks.setdefault(artist_norm, asyncio.Lock())
+        async with lock:
+            if artist_norm not in self._discographies:
+                self._discographies[artist_norm] = await self._fetch_artist_discography(artist_norm)
+        return self._discographies[artist_norm]
+
+    async def _resolve_artist_mbid(self, artist_norm: str) -> str | None:
+        """Resolve an artist MBID, accepting only an unambiguous name match.
+
+        The top search hit must carry the name, and no other hit may: artists
+        sharing a name (e.g. several bands called "Nirvana") cannot be told
+        apart here, so their albums go through the per-album search instead.
+
+        Args:
+            artist_norm: Normalized artist name
+
+        Returns:
+            Artist MBID or None if the top search hit is a different artist or
+            several artists share the name
+
+        """
+        artists = await self._search_artists(artist_norm, limit=ARTIST_MATCH_CANDIDATES)
+        if not artists or not artists[0].get("id"):
+            return None
+
+        target = self._normalize_name(artist_norm)
+        matches = [
+            artist
+            for artist in artists
+            if any(name and self._normalize_name(str(name)) == target for name in (artist.get("name"), artist.get("sort-name")))
+        ]
+        if not matches or matches[0] is not artists[0]:
+            self.console_logger.debug(
+                "[musicbrainz] Skipping discography prefetch: '%s' resolved to '%s'",
+                artist_norm,
+                artists[0].get("name"),
+            )
+            return None
+        if len({artist.get("id") for artist in matches}) > 1:
+            self.console_logger.debug("[musicbrainz] Artist '%s' matches %d MusicBrainz artists; skipping prefetch", artist_norm, len(matches))
+            return None
+
+        return str(artists[0]["id"])
+
+    async def _fetch_artist_discography(self, artist_norm: str) -> list[MBApiData] | None:
+        """Page through the artist's release groups via the browse endpoint.
+
+        Args:
+            artist_norm: Normalized artist name
+
+        Returns:
+            List of release groups, or None if the artist could not be resolved
+
+        """
+        artist_id = await self._resolve_artist_mbid(artist_norm)
+        if not artist_id:
+            return None
+
+        browse_url = f"{MUSICBRAINZ_BASE_URL}/release-group"
+        release_groups: list[MBApiData] = []
+
+        for page in range(self.max_discography_pages):
+            params = {
+                "artist": artist_id,
+                "inc": "artist-credits",
+                "fmt": "json",
+                "limit": str(DISCOGRAPHY_PAGE_SIZE),
+                "offset": str(page * DISCOGRAPHY_PAGE_SIZE),
+            }
+            page_data = await self._make_api_request("musicbrainz", browse_url, params=params)
+            if not page_data:
+                if page == 0:
+                    return None
+                break
+
+            page_groups = cast("list[MBApiData]", page_data.get("release-groups") or [])
+            release_groups.extend(page_groups)
+            total = int(page_data.get("release-group-count") or 0)
+            if not page_groups or len(release_groups) >= total:
+                break
+
+        self.console_logger.debug(
+            "[musicbrainz] Prefetched %d release groups for '%s'",
+            len(release_groups),
+            artist_norm,
+        )
+        return release_groups
+
+    def _match_discography(self, discography: list[MBApiData], album_norm: str) -> list[MBApiData]:
+        """Match an album against a prefetched discography by normalized title.
+
+        Args:
+            discography: Release groups of the artist
+            album_norm: Normalized album name
+
+        Returns:
+            Matching release groups, earliest first-release-date first
+
+        """
+        target = self._normalize_name(album_norm)
+        return self._earliest_first(rg for rg in discography if self._normalize_name(str(rg.get("title") or "")) == target)
+
+    @staticmethod
+    def _earliest_first(release_groups: Iterable[MBApiData]) -> list[MBApiData]:
+        """Sort release groups by first-release-date."""
+        # Undated groups sort last so the original release is among the groups fetched
+        return sorted(release_groups, key=lambda rg: rg.get("first-release-date") or "9999")
+
+    async def _search_prefetched_discography(self, artist_norm: str, album_norm: str) -> list[MBApiData]:
+        """Find release groups for an album in the artist's prefetched discography.
+
+        Args:
+            artist_norm: Normalized artist name
+            album_norm: Normalized album name
+
+        Returns:
+            Matching release groups, or empty list on a miss
+
+        """
+        discography = await self.get_artist_discography(artist_norm)
+        matches = self._match_discography(discography, album_norm) if discography else []
+        if not matches and discography:
+            positions = self._fuzzy_title_matches(artist_norm, [str(rg.get("title") or "") for rg in discography], album_norm)
+            matches = self._earliest_first(discography[position] for position in positions)
+
+        if matches:
+            self.discography_stats["hits"] += 1
+            self.console_logger.debug("[musicbrainz] Discography hit for '%s - %s'", artist_norm, album_norm)
+        else:
+            self.discography_stats["misses"] += 1
+        return matches
+
     async def _perform_primary_search(self, artist_norm: str, album_norm: str) -> list[MBApiData]:
         """Perform a precise fielded search for release groups.
 
@@ -560,7 +762,7 @@ class MusicBrainzClient(BaseApiClient):
 
         return processed_results
 
-    def _process_and_score_releases(
+    async def _process_and_score_releases(
         self,
         release_results: list[tuple[MBApiData | None, MBApiData]],
         artist_norm: str,
@@ -579,7 +781,8 @@ class MusicBrainzClient(BaseApiClient):
             List of scored releases
 
         """
-        scored_releases: list[ScoredRelease] = []
+        candidates: list[tuple[MBApiData, MBApiData]] = []
+        releases_to_score: list[MBApiData] = []
         processed_release_ids: set[str] = set()
 
         for result, rg_info in release_results:
@@ -602,21 +805,40 @@ class MusicBrainzClient(BaseApiClient):
 
                 # Combine release and release group info for scoring
                 # Add 'artist' field so scoring function can match artist names
-                release_to_score: MBApiData = {**release, "release_group": rg_info, "artist": artist_name}
+                candidates.append((release, rg_info))
+                releases_to_score.append({**release, "release_group": rg_info, "artist": artist_name})
 
-                score = self._score_original_release(
-                    release_to_score,
-                    artist_norm,
-                    album_norm,
-                    artist_region=artist_region,
-                    source="musicbrainz",
-                )
+        scores = await self._score_release_batch(releases_to_score, artist_norm, album_norm, artist_region)
+        return [
+            self._create_scored_release(release, rg_info, score, artist_norm)
+            for (release, rg_info), score in zip(candidates, scores, strict=True)
+            if score > 0
+        ]
 
-                if score > 0:
-                    release_info = self._create_scored_release(release, rg_info, score, artist_norm)
-                    scored_releases.append(release_info)
+    async def _score_release_batch(
+        self,
+        releases: list[MBApiData],
+        artist_norm: str,
+        album_norm: str,
+        artist_region: str | None,
+    ) -> list[float]:
+        """Score releases with the batch scorer, or one by one without it.
 
-        return scored_releases
+        Args:
+            releases: Releases prepared for scoring
+            artist_norm: Normalized artist name
+            album_norm: Normalized album name
+            artist_region: Artist's region for scoring
+
+        Returns:
+            Scores in the order of ``releases``
+
+        """
+        if self._score_releases is not None:
+            return list(await self._score_releases(releases, artist_norm, album_norm, artist_region=artist_region, source="musicbrainz"))
+        return [
+            self._score_original_release(release, artist_norm, album_norm, artist_region=artist_region, source="musicbrainz") for release in releases
+        ]
 
     @staticmethod
     def _extract_artist_from_credit(data: dict[str, Any]) -> str:
@@ -688,6 +910,68 @@ class MusicBrainzClient(BaseApiClient):
             "source": "musicbrainz",
         }
 
+    async def _score_from_local_store(self, artist_norm: str, album_norm: str, artist_region: str | None) -> list[ScoredRelease]:
+        """Score releases found in the local dump store.
+
+        Args:
+            artist_norm: Normalized artist name
+            album_norm: Normalized album name
+            artist_region: Artist's region for scoring
+
+        Returns:
+            Scored releases, or an empty list when the store has no match
+
+        """
+        if self.local_store is None:
+            return []
+
+        store = self.local_store
+        try:
+            release_groups = await asyncio.to_thread(store.find_release_groups, artist_norm, album_norm)
+            release_results: list[tuple[MBApiData | None, MBApiData]] = [
+                (await asyncio.to_thread(store.get_releases, str(rg_info["id"])), rg_info) for rg_info in release_groups[:3]
+            ]
+        except sqlite3.Error as e:
+            self.error_logger.warning("[musicbrainz] Local store lookup failed for '%s - %s': %s", artist_norm, album_norm, e)
+            return []
+
+        scored_releases = await self._process_and_score_releases(release_results, artist_norm, album_norm, artist_region)
+        if scored_releases:
+            self.local_stats["hits"] += 1
+            self.console_logger.debug("[musicbrainz] Local store hit for '%s - %s'", artist_norm, album_norm)
+        else:
+            self.local_stats["misses"] += 1
+        return scored_releases
+
+    async def _find_release_groups(
+        self,
+        artist_norm: str,
+        album_norm: str,
+        artist_orig: str | None,
+        album_orig: str | None,
+    ) -> list[MBApiData]:
+        """Find candidate release groups for an album.
+
+        Tries the prefetched discography first (when enabled), then the
+        per-album primary search and fallbacks for misses.
+
+        Args:
+            artist_norm: Normalized artist name
+            album_norm: Normalized album name
+            artist_orig: Original artist name
+            album_orig: Original album name
+
+        Returns:
+            List of candidate release groups
+
+        """
+        if self.discography_prefetch and (matches := await self._search_prefetched_discography(artist_norm, album_norm)):
+            return matches
+
+        return await self._perform_primary_search(artist_norm, album_norm) or await self._perform_fallback_searches(
+            artist_norm, album_norm, artist_orig, album_orig
+        )
+
     @track_instance_method("musicbrainz_release_search")
     async def get_scored_releases(
         self,
@@ -700,7 +984,9 @@ class MusicBrainzClient(BaseApiClient):
     ) -> list[ScoredRelease]:
         """Retrieve and score releases from MusicBrainz.
 
-        Uses multiple search strategies with fallbacks if precise queries fail.
+        Answers from the local dump store when one is configured, then uses the
+        prefetched artist discography when enabled, then multiple search
+        strategies with fallbacks if precise queries fail.
 
         Args:
             artist_norm: Normalized artist name
@@ -721,11 +1007,11 @@ class MusicBrainzClient(BaseApiClient):
             album_norm,
         )
 
+        if local_releases := await self._score_from_local_store(artist_norm, album_norm, artist_region):
+            return sorted(local_releases, key=lambda x: x["score"], reverse=True)
+
         try:
-            # Attempt primary search first
-            all_release_groups = await self._perform_primary_search(artist_norm, album_norm) or await self._perform_fallback_searches(
-                artist_norm, album_norm, artist_orig, album_orig
-            )
+            all_release_groups = await self._find_release_groups(artist_norm, album_norm, artist_orig, album_orig)
 
             if not all_release_groups:
                 self.console_logger.warning("[musicbrainz] All search attempts failed for '%s - %s'.", artist_norm, album_norm)
@@ -735,7 +1021,7 @@ class MusicBrainzClient(BaseApiClient):
             release_results = await self._fetch_releases_for_groups(all_release_groups)
 
             # Process and score the releases
-            scored_releases = self._process_and_score_releases(release_results, artist_norm, album_norm, artist_region)
+            scored_releases = await self._process_and_score_releases(release_results, artist_norm, album_norm, artist_region)
 
         except (OSError, ValueError, RuntimeError, KeyError, TypeError, AttributeError, IndexError) as e:
             self.error_logger.exception("Error fetching from MusicBrainz for '%s - %s': %s", artist_norm, album_norm, e)
@@ -0,0 +1,447 @@
+"""Local MusicBrainz store built from data-dump exports.
+
+Imports release-group, release and artist-credit records into an indexed
+SQLite database so that ``MusicBrainzClient`` can answer most album lookups
+without touching the rate-limited web service (1 request/second).
+
+Two input formats are accepted:
+
+* JSON Lines in the shape of the MusicBrainz JSON data dumps / web service
+  (one entity per line, ``artist-credit``, ``release-group``, ``media`` and
+  ``label-info`` nested as in API responses).
+* Tab-separated files with a header row. Column names follow the API field
+  names with ``_`` instead of ``-``::
+
+      artist_credit:       id, name
+      artist_credit_name:  artist_credit, position, name, join_phrase
+      release_group:       id, title, artist_credit, primary_type, first_release_date
+      release:             id, release_group, title, status, country, date,
+                           barcode, disambiguation, format, label, catalog_number
+
+The entity is inferred from the file name (``release-group``, ``release``,
+``artist-credit``, ``artist-credit-name``) unless passed explicitly. Artist
+and title columns are stored alongside their normalized form and indexed, so
+lookups are exact matches on ``BaseApiClient._normalize_name`` output.
+
+An ``artist_credit`` row only holds the full credit phrase ("A feat. B");
+the ``artist_credit_name`` rows index each credited artist's own name, so
+collaborations imported from TSV are found by either artist. JSON dumps
+embed the individual credits and need no separate file.
+"""
+
+from __future__ import annotations
+
+import csv
+import gzip
+import logging
+import sqlite3
+import threading
+from dataclasses import dataclass
+from enum import StrEnum
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, cast
+
+from services.cache.json_utils import loads_json
+
+from .api_base import BaseApiClient
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from core.models.track_models import AppConfig
+
+_logger = logging.getLogger(__name__)
+
+# Rows inserted per transaction while importing
+IMPORT_BATCH_SIZE = 5000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS artist_credit (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    name_norm TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS artist_credit_name (
+    artist_credit_id TEXT NOT NULL,
+    name_norm TEXT NOT NULL,
+    PRIMARY KEY (artist_credit_id, name_norm)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_artist_credit_name_norm ON artist_credit_name (name_norm);
+CREATE TABLE IF NOT EXISTS release_group (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    title_norm TEXT NOT NULL,
+    artist_credit_id TEXT,
+    primary_type TEXT,
+    first_release_date TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_release_group_title_norm ON release_group (title_norm);
+CREATE TABLE IF NOT EXISTS release (
+    id TEXT PRIMARY KEY,
+    release_group_id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    status TEXT,
+    country TEXT,
+    date TEXT,
+    barcode TEXT,
+    disambiguation TEXT,
+    format TEXT,
+    label TEXT,
+    catalog_number TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_release_group_id ON release (release_group_id);
+"""
+
+
+class DumpEntity(StrEnum):
+    """Entity types accepted by the dump importer."""
+
+    ARTIST_CREDIT = "artist-credit"
+    ARTIST_CREDIT_NAME = "artist-credit-name"
+    RELEASE_GROUP = "release-group"
+    RELEASE = "release"
+
+
+@dataclass(slots=True)
+class ImportResult:
+    """Summary of a single imported file."""
+
+    entity: DumpEntity
+    imported: int = 0
+    skipped: int = 0
+
+
+def _normalize(name: str | None) -> str:
+    """Normalize a name the same way the API clients do."""
+    return BaseApiClient._normalize_name(name or "")  # noqa: SLF001
+
+
+def _credit_phrase(credit_list: list[dict[str, Any]]) -> str:
+    """Render an API-style artist-credit list as its display string."""
+    return "".join(f"{credit.get('name') or (credit.get('artist') or {}).get('name', '')}{credit.get('joinphrase', '')}" for credit in credit_list)
+
+
+class MusicBrainzLocalStore:
+    """Indexed local copy of MusicBrainz release data.
+
+    Methods are synchronous and thread-safe; async callers should use
+    ``asyncio.to_thread``.
+
+    Args:
+        path: SQLite database file (created on first import)
+
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+
+    @classmethod
+    def from_config(cls, config: AppConfig) -> MusicBrainzLocalStore | None:
+        """Open the configured store, or None when disabled or not yet imported.
+
+        Relative paths are resolved against ``logs_base_dir``.
+        """
+        local_cfg = config.year_retrieval.musicbrainz_local
+        if not local_cfg.enabled:
+            return None
+        path = Path(config.logs_base_dir) / local_cfg.database_path
+        if not path.exists():
+            _logger.warning("Local MusicBrainz database %s not found; run import_musicbrainz first", path)
+            return None
+        return cls(path)
+
+    @staticmethod
+    def database_path(config: AppConfig) -> Path:
+        """Resolve the configured database path."""
+        return Path(config.logs_base_dir) / config.year_retrieval.musicbrainz_local.database_path
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the connection and ensure the schema exists (caller holds the lock)."""
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.row_factory = sqlite3.Row
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    # ------------------------------------------------------------------
+    # Import
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def infer_entity(path: Path) -> DumpEntity:
+        """Infer the entity type from a dump file name.
+
+        Raises:
+            ValueError: If the file name does not identify an entity
+
+        """
+        stem = path.name.lower().replace("_", "-")
+        # Longer names first: "artist-credit-name" also starts with "artist-credit"
+        for entity in (DumpEntity.ARTIST_CREDIT_NAME, DumpEntity.ARTIST_CREDIT, DumpEntity.RELEASE_GROUP, DumpEntity.RELEASE):
+            if stem.startswith(entity.value):
+                return entity
+        msg = f"Cannot infer MusicBrainz entity from file name: {path.name}"
+        raise ValueError(msg)
+
+    def import_file(self, path: Path, entity: DumpEntity | None = None) -> ImportResult:
+        """Import a JSON Lines or TSV dump file.
+
+        Existing rows with the same ID are replaced, so re-importing a newer
+        dump updates the store in place.
+
+        Args:
+            path: Dump file (``.gz`` files are decompressed transparently)
+            entity: Entity type; inferred from the file name when omitted
+
+        Returns:
+            Import summary for the file
+
+        Raises:
+            ValueError: If the entity cannot be inferred
+
+        """
+        entity = entity or self.infer_entity(path)
+        result = ImportResult(entity)
+        is_tsv = ".tsv" in path.suffixes
+
+        with self._lock:
+            connection = self._connect()
+            batch: list[dict[str, Any]] = []
+            for record in self._read_tsv(path) if is_tsv else self._read_json_lines(path, result):
+                batch.append(record)
+                if len(batch) >= IMPORT_BATCH_SIZE:
+                    self._insert_batch(connection, entity, batch, result, is_tsv=is_tsv)
+                    batch = []
+            if batch:
+                self._insert_batch(connection, entity, batch, result, is_tsv=is_tsv)
+
+        _logger.info("Imported %d %s records from %s (%d skipped)", result.imported, entity.value, path, result.skipped)
+        return result
+
+    @staticmethod
+    def _open(path: Path) -> IO[str]:
+        """Open a dump file as text, handling gzip compression."""
+        if path.suffix == ".gz":
+            return cast(IO[str], gzip.open(path, "rt", encoding="utf-8", newline=""))
+        return path.open(encoding="utf-8", newline="")
+
+    def _read_json_lines(self, path: Path, result: ImportResult) -> Iterator[dict[str, Any]]:
+        """Yield JSON objects from a JSON Lines dump, skipping malformed lines."""
+        with self._open(path) as handle:
+            for line_number, raw_line in enumerate(handle, start=1):
+                if not (line := raw_line.strip()):
+                    continue
+                try:
+                    record = loads_json(line.encode())
+                except ValueError:
+                    _logger.warning("Skipping malformed dump record at %s:%d", path, line_number)
+                    result.skipped += 1
+                    continue
+                if isinstance(record, dict):
+                    yield record
+
+    def _read_tsv(self, path: Path) -> Iterator[dict[str, Any]]:
+        """Yield rows from a header-row TSV dump (``\\N`` is read as NULL)."""
+        with self._open(path) as handle:
+            for row in csv.DictReader(handle, delimiter="\t", quoting=csv.QUOTE_NONE):
+                yield {key: (None if value in {"", "\\N"} else value) for key, value in row.items()}
+
+    def _insert_batch(
+        self,
+        connection: sqlite3.Connection,
+        entity: DumpEntity,
+        records: list[dict[str, Any]],
+        result: ImportResult,
+        *,
+        is_tsv: bool,
+    ) -> None:
+        """Insert a batch of records in one transaction."""
+        # Credited names belong to a credit and have no ID of their own
+        key_field = "artist_credit" if entity is DumpEntity.ARTIST_CREDIT_NAME else "id"
+        with connection:
+            for record in records:
+                if not record.get(key_field):
+                    result.skipped += 1
+                    continue
+                match entity:
+                    case DumpEntity.ARTIST_CREDIT:
+                        self._insert_artist_credit(connection, str(record["id"]), str(record.get("name") or ""), [])
+                    case DumpEntity.ARTIST_CREDIT_NAME:
+                        if not self._insert_credited_name(connection, str(record["artist_credit"]), str(record.get("name") or "")):
+                            result.skipped += 1
+                            continue
+                    case DumpEntity.RELEASE_GROUP:
+                        self._insert_release_group(connection, record, is_tsv=is_tsv)
+                    case DumpEntity.RELEASE:
+                        if not self._insert_release(connection, record, is_tsv=is_tsv):
+                            result.skipped += 1
+                            continue
+                result.imported += 1
+
+    @staticmethod
+    def _insert_artist_credit(connection: sqlite3.Connection, credit_id: str, name: str, artist_names: list[str]) -> None:
+        """Insert an artist credit and index its full and per-artist names."""
+        name_norm = _normalize(name)
+        connection.execute("INSERT OR REPLACE INTO artist_credit VALUES (?, ?, ?)", (credit_id, name, name_norm))
+        connection.executemany(
+            "INSERT OR IGNORE INTO artist_credit_name VALUES (?, ?)",
+            [(credit_id, norm) for norm in {name_norm, *map(_normalize, artist_names)} if norm],
+        )
+
+    @staticmethod
+    def _insert_credited_name(connection: sqlite3.Connection, credit_id: str, name: str) -> bool:
+        """Index one credited artist's name under its artist credit.
+
+        Returns:
+            False if the name is empty after normalization and was skipped
+
+        """
+        if not (name_norm := _normalize(name)):
+            return False
+        connection.execute("INSERT OR IGNORE INTO artist_credit_name VALUES (?, ?)", (credit_id, name_norm))
+        return True
+
+    def _insert_release_group(self, connection: sqlite3.Connection, record: dict[str, Any], *, is_tsv: bool) -> None:
+        """Insert a release group from a TSV row or JSON entity."""
+        if is_tsv:
+            credit_id = record.get("artist_credit")
+            primary_type = record.get("primary_type")
+            first_release_date = record.get("first_release_date")
+        else:
+            credit_list = record.get("artist-credit") or []
+            credit_id = None
+            if phrase := _credit_phrase(credit_list):
+                # JSON dumps embed the credit, so the display string doubles as its ID
+                credit_id = phrase
+                artist_names = [str((credit.get("artist") or {}).get("name") or credit.get("name") or "") for credit in credit_list]
+                self._insert_artist_credit(connection, credit_id, phrase, artist_names)
+            primary_type = record.get("primary-type")
+            first_release_date = record.get("first-release-date")
+
+        title = str(record.get("title") or "")
+        connection.execute(
+            "INSERT OR REPLACE INTO release_group VALUES (?, ?, ?, ?, ?, ?)",
+            (str(record["id"]), title, _normalize(title), credit_id, primary_type, first_release_date or None),
+        )
+
+    @staticmethod
+    def _insert_release(connection: sqlite3.Connection, record: dict[str, Any], *, is_tsv: bool) -> bool:
+        """Insert a release from a TSV row or JSON entity.
+
+        Returns:
+            False if the record has no release group and was skipped
+
+        """
+        if is_tsv:
+            release_group_id = record.get("release_group")
+            release_format, label, catalog_number = record.get("format"), record.get("label"), record.get("catalog_number")
+        else:
+            release_group_id = (record.get("release-group") or {}).get("id")
+            media = record.get("media") or []
+            release_format = next((str(medium["format"]) for medium in media if medium.get("format")), None)
+            label_info = record.get("label-info") or []
+            label = next((str(info["label"]["name"]) for info in label_info if (info.get("label") or {}).get("name")), None)
+            catalog_number = next((str(info["catalog-number"]) for info in label_info if info.get("catalog-number")), None)
+
+        if not release_group_id:
+            return False
+
+        connection.execute(
+            "INSERT OR REPLACE INTO release VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                str(record["id"]),
+                str(release_group_id),
+                str(record.get("title") or ""),
+                record.get("status"),
+                record.get("country"),
+                record.get("date") or None,
+                record.get("barcode") or None,
+                record.get("disambiguation") or None,
+                release_format,
+                label,
+                catalog_number,
+            ),
+        )
+        return True
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def find_release_groups(self, artist_norm: str, album_norm: str) -> list[dict[str, Any]]:
+        """Find release groups whose normalized title and artist match exactly.
+
+        Args:
+            artist_norm: Normalized artist name
+            album_norm: Normalized album title
+
+        Returns:
+            API-shaped release groups, earliest first (undated last)
+
+        """
+        query = """
+            SELECT DISTINCT rg.id, rg.title, rg.primary_type, rg.first_release_date, ac.name AS credit_name
+            FROM release_group rg
+            JOIN artist_credit_name acn ON acn.artist_credit_id = rg.artist_credit_id
+            JOIN artist_credit ac ON ac.id = rg.artist_credit_id
+            WHERE rg.title_norm = ? AND acn.name_norm = ?
+            ORDER BY rg.first_release_date IS NULL, rg.first_release_date
+        """
+        with self._lock:
+            rows = self._connect().execute(query, (_normalize(album_norm), _normalize(artist_norm))).fetchall()
+
+        return [
+            {
+                "id": row["id"],
+                "title": row["title"],
+                "primary-type": row["primary_type"],
+                "first-release-date": row["first_release_date"] or "",
+                "artist-credit": [{"name": row["credit_name"]}],
+            }
+            for row in rows
+        ]
+
+    def get_releases(self, release_group_id: str) -> dict[str, Any]:
+        """Return the releases of a group shaped like the ``/release`` browse response."""
+        with self._lock:
+            rows = (
+                self._connect()
+                .execute("SELECT * FROM release WHERE release_group_id = ? ORDER BY date IS NULL, date", (release_group_id,))
+                .fetchall()
+            )
+
+        releases: list[dict[str, Any]] = []
+        for row in rows:
+            release: dict[str, Any] = {
+                "id": row["id"],
+                "title": row["title"],
+                "status": row["status"],
+                "country": row["country"],
+                "date": row["date"],
+                "barcode": row["barcode"],
+                "disambiguation": row["disambiguation"],
+                "media": [{"format": row["format"]}] if row["format"] else [],
+                "label-info": [{"label": {"name": row["label"]}, "catalog-number": row["catalog_number"]}] if row["label"] else [],
+            }
+            releases.append(release)
+        return {"releases": releases, "release-count": len(releases)}
+
+    def counts(self) -> dict[str, int]:
+        """Return row counts per entity table."""
+        with self._lock:
+            connection = self._connect()
+            return {
+                entity.value: int(connection.execute(f"SELECT COUNT(*) FROM {entity.value.replace('-', '_')}").fetchone()[0])  # noqa: S608
+                for entity in DumpEntity
+            }
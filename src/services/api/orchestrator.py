@@ -22,6 +22,8 @@ import os
 import random
 import re
 import ssl
+from contextvars import ContextVar
+from dataclasses import replace
 from datetime import UTC
 from datetime import datetime as dt
 from typing import TYPE_CHECKING, Any
@@ -31,16 +33,21 @@ import certifi
 
 from core.debug_utils import debug
 from core.logger import LogFormat
+from core.models.normalization import get_normalization_stats
 from core.models.script_detection import ScriptType, detect_primary_script
 from core.models.validators import is_valid_year
 from core.tracks.year_fallback import MAX_VERIFICATION_ATTEMPTS
 from services.api.api_base import ApiRateLimiter, ScoredRelease
 from services.api.applemusic import AppleMusicClient
+from services.api.circuit_breaker import CircuitBreaker, CircuitState
 from services.api.discogs import DiscogsClient
+from services.api.http_cassette import HttpCassette
 from services.api.musicbrainz import MusicBrainzClient
+from services.api.musicbrainz_local import MusicBrainzLocalStore
 from services.api.request_executor import ApiRequestExecutor
+from services.api.response_projection import migrate_cached_responses
 from services.api.year_score_resolver import YearScoreResolver
-from services.api.year_scoring import ArtistPeriodContext, create_release_scorer
+from services.api.year_scoring import ArtistPeriodContext, ScoringContext, create_release_scorer
 from services.api.year_search_coordinator import YearSearchCoordinator
 from stubs.cryptography.secure_config import SecureConfig, SecurityConfigError
 
@@ -48,6 +55,7 @@ if TYPE_CHECKING:
     import logging
     from collections.abc import Coroutine
 
+    from core.cpu_offload import CpuExecutor
     from core.models.track_models import AppConfig
     from metrics import Analytics
     from services.cache.orchestrator import CacheOrchestrator
@@ -116,6 +124,10 @@ DNS_CACHE_TTL_SECONDS: int = 300
 
 SECURE_RANDOM: random.SystemRandom = random.SystemRandom()
 
+# Scoring context of the album handled by the current task. Each album runs in
+# its own task, so concurrent albums never see each other's artist period.
+_SCORING_CONTEXT: ContextVar[ScoringContext | None] = ContextVar("scoring_context", default=None)
+
 
 class ExternalApiOrchestrator:
     """External API service orchestrator.
@@ -135,6 +147,7 @@ class ExternalApiOrchestrator:
         analytics: Analytics service for performance tracking
         cache_service: Service for caching API responses
         pending_verification_service: Service for managing verification queue
+        cpu_executor: Executor for scoring albums with many releases (scored inline if None)
 
     """
 
@@ -175,6 +188,7 @@ class ExternalApiOrchestrator:
         analytics: Analytics,
         cache_service: CacheOrchestrator,
         pending_verification_service: PendingVerificationService,
+        cpu_executor: CpuExecutor | None = None,
     ) -> None:
         self.config = config
         self.console_logger = console_logger
@@ -185,13 +199,11 @@ class ExternalApiOrchestrator:
         # Store injected dependencies
         self.cache_service = cache_service
         self.pending_verification_service = pending_verification_service
+        self.cpu_executor = cpu_executor
 
         # Initialize pending tasks for fire-and-forget async operations
         self._pending_tasks: set[asyncio.Task[Any]] = set()
 
-        # Initialize artist period context for release scoring
-        self.artist_period_context: ArtistPeriodContext | None = None
-
         # Initialize API client references (will be set in _initialize_api_clients)
         self.discogs_client: DiscogsClient
         self.musicbrainz_client: MusicBrainzClient
@@ -209,8 +221,9 @@ class ExternalApiOrchestrator:
         # Extract and validate configuration
         self._extract_configuration()
 
-        # Initialize rate limiters
+        # Initialize rate limiters and circuit breakers
         self._initialize_rate_limiters()
+        self._initialize_circuit_breakers()
 
         # Initialize API request executor (handles HTTP requests with retry/caching)
         self.request_executor = ApiRequestExecutor(
@@ -223,7 +236,17 @@ class ExternalApiOrchestrator:
             cache_ttl_days=self.cache_ttl_days,
             default_max_retries=self.default_api_max_retries,
             default_retry_delay=self.default_api_retry_delay,
+            cassette=HttpCassette.from_config(config),
+            project_responses=config.caching.project_api_responses,
+            circuit_breakers=self.circuit_breakers,
         )
+        if self.request_executor.cassette is not None:
+            self.console_logger.info(
+                "%s %s mode: %s",
+                LogFormat.entity("HttpCassette"),
+                self.request_executor.cassette.mode.value,
+                self.request_executor.cassette.path,
+            )
 
         # Initialize the scoring system first (needed for API client injection)
         self._initialize_scoring_system()
@@ -379,6 +402,32 @@ class ExternalApiOrchestrator:
             ),
         }
 
+    def _initialize_circuit_breakers(self) -> None:
+        """Initialize a circuit breaker for each API provider, if enabled."""
+        breaker_config = self.config.year_retrieval.circuit_breaker
+        self.circuit_breakers: dict[str, CircuitBreaker] = {}
+        if not breaker_config.enabled:
+            return
+        for api_name in self.rate_limiters:
+            self.circuit_breakers[api_name] = CircuitBreaker.from_config(api_name, breaker_config, self._on_circuit_state_change)
+
+    def _on_circuit_state_change(self, api_name: str, old_state: CircuitState, new_state: CircuitState) -> None:
+        """Log a circuit breaker transition and record it in run analytics."""
+        if new_state is CircuitState.OPEN:
+            self.error_logger.warning(
+                "[%s] Circuit %s -> open: skipping provider for %.0fs",
+                api_name,
+                old_state.value,
+                self.config.year_retrieval.circuit_breaker.open_seconds,
+            )
+        else:
+            self.console_logger.info("[%s] Circuit %s -> %s", api_name, old_state.value, new_state.value)
+        self.analytics.record_event(
+            f"circuit_breaker[{api_name}]",
+            f"{old_state.value}->{new_state.value}",
+            success=new_state is not CircuitState.OPEN,
+        )
+
     def _initialize_api_clients(self) -> None:
         """Initialize API client instances with dependency injection."""
 
@@ -413,7 +462,21 @@ class ExternalApiOrchestrator:
             source: str = "unknown",
         ) -> int:
             """Create the release scoring function with an injected scorer."""
-            return int(self.release_scorer.score_original_release(release, artist_norm, album_norm, artist_region=artist_region, source=source))
+            context = self._scoring_context_for(artist_region)
+            return int(self.release_scorer.score_original_release(release, artist_norm, album_norm, source=source, context=context))
+
+        async def score_releases_func(
+            releases: list[dict[str, Any]],
+            artist_norm: str,
+            album_norm: str,
+            artist_region: str | None,
+            source: str = "unknown",
+        ) -> list[int]:
+            """Create the batch release scoring function with an injected scorer."""
+            context = self._scoring_context_for(artist_region)
+            if self.cpu_executor is None:
+                return self.release_scorer.score_releases(releases, artist_norm, album_norm, source=source, context=context)
+            return await self.cpu_executor.score_releases(self.release_scorer, releases, artist_norm, album_norm, source=source, context=context)
 
         # Initialize MusicBrainz client
         self.musicbrainz_client = MusicBrainzClient(
@@ -422,6 +485,12 @@ class ExternalApiOrchestrator:
             make_api_request_func=make_api_request_func,
             score_release_func=score_release_func,
             analytics=self.analytics,
+            discography_prefetch=self.config.year_retrieval.prefetch.musicbrainz,
+            max_discography_pages=self.config.year_retrieval.prefetch.musicbrainz_max_pages,
+            local_store=MusicBrainzLocalStore.from_config(self.config),
+            score_releases_func=score_releases_func,
+            fuzzy_match=self.config.year_retrieval.fuzzy_match,
+            remaster_keywords=self.config.cleaning.remaster_keywords,
         )
 
         # Initialize Discogs client
@@ -443,6 +512,7 @@ class ExternalApiOrchestrator:
             error_logger=self.error_logger,
             make_api_request_func=make_api_request_func,
             score_release_func=score_release_func,
+            catalog_prefetch=self.config.year_retrieval.prefetch.itunes,
         )
 
     def _initialize_scoring_system(self) -> None:
@@ -481,6 +551,9 @@ class ExternalApiOrchestrator:
             discogs_client=self.discogs_client,
             applemusic_client=self.applemusic_client,
             release_scorer=self.release_scorer,
+            year_score_resolver=self.year_score_resolver,
+            rate_limiters=self.rate_limiters,
+            circuit_breakers=self.circuit_breakers,
         )
 
         # Scoring function is now properly injected during API client initialization
@@ -505,6 +578,8 @@ class ExternalApiOrchestrator:
             self.session = self._create_client_session()
             try:
                 self.request_executor.set_session(self.session)
+                # Runs once the generic cache has finished loading (after a lazy warm-up)
+                self.cache_service.generic_service.when_loaded(self._migrate_cached_responses)
                 self._initialize_api_clients()
                 self._initialize_year_search_coordinator()
             except (TypeError, ValueError, AttributeError, RuntimeError):
@@ -586,6 +661,12 @@ class ExternalApiOrchestrator:
 
             self._pending_tasks.clear()
 
+        await self._close_cassette()
+        self._close_local_store()
+        self._log_search_stats()
+        self._log_circuit_stats()
+        self._log_normalization_stats()
+
         if self.session is None or self.session.closed:
             return
 
@@ -621,6 +702,92 @@ class ExternalApiOrchestrator:
         await self.session.close()
         self.console_logger.info("%s session closed", LogFormat.entity("ExternalApiOrchestrator"))
 
+    async def _close_cassette(self) -> None:
+        """Flush the HTTP cassette and log its usage statistics."""
+        cassette = self.request_executor.cassette
+        if cassette is None:
+            return
+        try:
+            await cassette.flush()
+        except OSError as e:
+            self.error_logger.warning("Failed to flush HTTP cassette %s: %s", cassette.path, e)
+        stats = cassette.stats
+        self.console_logger.info(
+            "%s recorded=%d replay_hits=%d replay_misses=%d replayed_latency=%.1fs",
+            LogFormat.entity("HttpCassette"),
+            stats.recorded,
+            stats.replay_hits,
+            stats.replay_misses,
+            stats.replayed_latency,
+        )
+
+    def _log_search_stats(self) -> None:
+        """Log per-album search latency and hedged-search effectiveness."""
+        coordinator: YearSearchCoordinator | None = getattr(self, "year_search_coordinator", None)
+        if coordinator is None or not coordinator.search_latencies:
+            return
+        stats = coordinator.get_search_stats()
+        self.console_logger.info(
+            "%s albums=%d p50=%s p95=%s hedges=%d wins=%d (%.0f%%) early_stops=%d cancelled=%d",
+            LogFormat.entity("YearSearchCoordinator"),
+            stats["albums"],
+            f"{stats['latency_p50']:.2f}s" if stats["latency_p50"] is not None else "n/a",
+            f"{stats['latency_p95']:.2f}s" if stats["latency_p95"] is not None else "n/a",
+            stats["launched"],
+            stats["wins"],
+            stats["hedge_win_rate"] * 100,
+            stats["early_stops"],
+            stats["cancelled"],
+        )
+
+    def _log_circuit_stats(self) -> None:
+        """Log breakers that tripped during the run."""
+        for api_name, breaker in getattr(self, "circuit_breakers", {}).items():
+            stats = breaker.get_stats()
+            if not stats["transitions"]:
+                continue
+            self.console_logger.info(
+                "%s %s state=%s transitions=%d rejected=%d",
+                LogFormat.entity("CircuitBreaker"),
+                api_name,
+                stats["state"],
+                stats["transitions"],
+                stats["rejected"],
+            )
+
+    def _log_normalization_stats(self) -> None:
+        """Log hit rates of the memoized name normalizers."""
+        rates = [
+            f"{name}={stats['hit_rate']:.0%}/{stats['hits'] + stats['misses']}"
+            for name, stats in get_normalization_stats().items()
+            if stats["hits"] + stats["misses"]
+        ]
+        if rates:
+            self.console_logger.info("%s cache hit rate/calls: %s", LogFormat.entity("Normalization"), ", ".join(rates))
+
+    def _migrate_cached_responses(self) -> None:
+        """Project full API responses cached before projection was enabled."""
+        if not self.request_executor.project_responses:
+            return
+        generic_service = self.cache_service.generic_service
+        migrated = migrate_cached_responses(generic_service.cache, generic_service.replace_value)
+        if migrated:
+            self.console_logger.info("Projected %d cached API responses to their consumed fields", migrated)
+
+    def _close_local_store(self) -> None:
+        """Close the local MusicBrainz store and log its hit rate."""
+        client: MusicBrainzClient | None = getattr(self, "musicbrainz_client", None)
+        if client is None or client.local_store is None:
+            return
+        stats = client.local_stats
+        self.console_logger.info(
+            "%s hits=%d misses=%d",
+            LogFormat.entity("MusicBrainzLocalStore"),
+            stats["hits"],
+            stats["misses"],
+        )
+        client.local_store.close()
+
     async def _make_api_request(
         self,
         api_name: str,
@@ -893,7 +1060,7 @@ class ExternalApiOrchestrator:
         except (aiohttp.ClientError, TimeoutError, ValueError, KeyError, RuntimeError):
             return self._handle_year_search_error(log_artist, log_album, current_library_year, earliest_track_added_year)
         finally:
-            self.release_scorer.clear_artist_period_context()
+            _SCORING_CONTEXT.set(None)
 
     async def _initialize_year_search(
         self, artist: str, album: str, current_library_year: str | None
@@ -1070,17 +1237,20 @@ class ExternalApiOrchestrator:
 
             start_year, end_year = self._parse_activity_period(activity_result)
 
-            # Store as ArtistPeriodContext and set in scorer
-            self.artist_period_context = ArtistPeriodContext(start_year=start_year, end_year=end_year)
             self._log_activity_period(start_year, end_year)
-            self.release_scorer.set_artist_period_context(self.artist_period_context)
+
+            # Task-local, immutable context picked up by every scoring call for this album
+            period_context = ScoringContext.from_artist_period(ArtistPeriodContext(start_year=start_year, end_year=end_year))
+            _SCORING_CONTEXT.set(period_context)
 
             # Get the artist's likely region for scoring context (cached)
             artist_region = await self.musicbrainz_client.get_artist_region(artist_norm)
             if artist_region:
                 self.console_logger.info("Artist region context: %s", artist_region.upper())
+            region = str(artist_region) if artist_region else None
+            _SCORING_CONTEXT.set(replace(period_context, artist_region=region))
 
-            return str(artist_region) if artist_region else None
+            return region
 
         except (OSError, ValueError, RuntimeError, KeyError, TypeError, AttributeError) as context_err:
             self.error_logger.warning("Error fetching artist context for '%s': %s", log_artist, context_err)
@@ -1260,7 +1430,16 @@ class ExternalApiOrchestrator:
         source: str = "unknown",
     ) -> float:
         """Public wrapper for release scoring."""
-        return float(self.release_scorer.score_original_release(release, artist_norm, album_norm, artist_region=artist_region, source=source))
+        context = self._scoring_context_for(artist_region)
+        return float(self.release_scorer.score_original_release(release, artist_norm, album_norm, source=source, context=context))
+
+    @staticmethod
+    def _scoring_context_for(artist_region: str | None) -> ScoringContext:
+        """Get the current album's scoring context with the region passed by the API client."""
+        context = _SCORING_CONTEXT.get()
+        if context is None:
+            return ScoringContext(artist_region=artist_region)
+        return context if context.artist_region == artist_region else replace(context, artist_region=artist_region)
 
     async def get_artist_activity_period(
         self,
@@ -1312,6 +1491,7 @@ class ExternalApiOrchestrator:
         cache_key = f"artist_start_year:{artist_norm}"
 
         # 1. Check cache first
+        await self.cache_service.generic_service.wait_for_warmup()
         cached = self.cache_service.generic_service.get(cache_key)
         if cached is not None:
             # -1 is sentinel for "not found" (None can't be cached directly)
@@ -1402,6 +1582,7 @@ def create_external_api_orchestrator(
     analytics: Analytics,
     cache_service: CacheOrchestrator,
     pending_verification_service: PendingVerificationService,
+    cpu_executor: CpuExecutor | None = None,
 ) -> ExternalApiOrchestrator:
     """Create the configured ExternalApiOrchestrator instance.
 
@@ -1412,6 +1593,7 @@ def create_external_api_orchestrator(
         analytics: Analytics service for performance tracking
         cache_service: Service for caching API responses
         pending_verification_service: Service for managing verification queue
+        cpu_executor: Executor for scoring albums with many releases
 
     Returns:
         The configured ExternalApiOrchestrator instance
@@ -1424,4 +1606,5 @@ def create_external_api_orchestrator(
         analytics=analytics,
         cache_service=cache_service,
         pending_verification_service=pending_verification_service,
+        cpu_executor=cpu_executor,
     )
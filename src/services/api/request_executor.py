@@ -16,11 +16,15 @@ from typing import TYPE_CHECKING, Any
 
 import aiohttp
 
+from services.api.circuit_breaker import report_rejection
+from services.api.response_projection import project_response, schema_for_request
 from services.cache.hash_service import UnifiedHashService
 
 if TYPE_CHECKING:
     from core.models.protocols import CacheServiceProtocol
     from services.api.api_base import ApiRateLimiter
+    from services.api.circuit_breaker import CircuitBreaker
+    from services.api.http_cassette import HttpCassette
 
 
 # Constants
@@ -40,6 +44,9 @@ class ApiRequestExecutor:
     - Retry with exponential backoff
     - Response parsing and validation
     - Cache integration
+    - Optional record/replay of responses through an HttpCassette
+    - Optional field projection of responses before they are cached
+    - Optional per-API circuit breakers that skip failing providers
 
     Important:
         Session lifecycle is managed by ExternalApiOrchestrator, NOT here.
@@ -57,6 +64,11 @@ class ApiRequestExecutor:
         cache_ttl_days: How long to cache API responses (days)
         default_max_retries: Default retry count for failed requests
         default_retry_delay: Base delay between retries (seconds)
+        cassette: Optional cassette for recording or replaying responses
+        project_responses: Strip responses down to the fields the clients
+            consume before caching and returning them
+        circuit_breakers: Dict mapping API names to circuit breakers; requests
+            to an API whose circuit is open are skipped without retries
 
     """
 
@@ -72,6 +84,9 @@ class ApiRequestExecutor:
         cache_ttl_days: int,
         default_max_retries: int,
         default_retry_delay: float,
+        cassette: HttpCassette | None = None,
+        project_responses: bool = False,
+        circuit_breakers: dict[str, CircuitBreaker] | None = None,
     ) -> None:
         self.cache_service = cache_service
         self.rate_limiters = rate_limiters
@@ -82,6 +97,9 @@ class ApiRequestExecutor:
         self.cache_ttl_days = cache_ttl_days
         self.default_max_retries = default_max_retries
         self.default_retry_delay = default_retry_delay
+        self.cassette = cassette
+        self.project_responses = project_responses
+        self.circuit_breakers = circuit_breakers or {}
 
         # Session managed externally, set via set_session()
         self.session: aiohttp.ClientSession | None = None
@@ -136,14 +154,30 @@ class ApiRequestExecutor:
                 params,
             )
 
+        # Replay mode serves recorded responses without touching the network or the
+        # persistent cache: replays stay deterministic and misses never reach live runs
+        if self.cassette is not None and self.cassette.is_replaying:
+            return self._project(api_name, url, await self.cassette.replay(api_name, url, params))
+
         # Build cache key and check cache first
         cache_key = self._build_cache_key(api_name, url, params)
         cached_result = await self._check_cache(cache_key, api_name, url)
         if cached_result is not None:
             if api_name == "itunes":
                 self.console_logger.debug("[%s] Using cached result", api_name)
+            # Record cache hits too, so a cassette recorded over a warm cache has no gaps
+            if self.cassette is not None and self.cassette.is_recording and cached_result:
+                await self.cassette.record_cached(api_name, url, params, body=cached_result)
             return cached_result
 
+        # Skip providers whose circuit is open; the result is not cached, and the
+        # rejection is reported so the year search can tell it from "no result"
+        breaker = self.circuit_breakers.get(api_name)
+        if breaker is not None and not breaker.allow_request():
+            self.console_logger.debug("[%s] Circuit open, skipping request to %s", api_name, url)
+            report_rejection(api_name)
+            return None
+
         # Prepare request components
         prepared = self._prepare_request(api_name, url, headers_override, timeout_override)
         if prepared is None:
@@ -175,9 +209,17 @@ class ApiRequestExecutor:
             )
 
         # Cache the result
+        result = self._project(api_name, url, result)
         await self._cache_result(cache_key, result)
         return result
 
+    def _project(self, api_name: str, url: str, result: dict[str, Any] | None) -> dict[str, Any] | None:
+        """Apply the endpoint's projection schema to a response, if enabled."""
+        if not self.project_responses or not result:
+            return result
+        schema = schema_for_request(api_name, url)
+        return project_response(result, schema) if schema is not None else result
+
     @staticmethod
     def _build_cache_key(
         api_name: str,
@@ -240,7 +282,7 @@ class ApiRequestExecutor:
             url,
             type(cached_response).__name__,
         )
-        self.cache_service.invalidate(cache_key)
+        await self.cache_service.invalidate_async(cache_key)
         return None
 
     async def _cache_result(
@@ -326,6 +368,9 @@ class ApiRequestExecutor:
         log_url = self._build_log_url(url, params)
 
         for attempt in range(max_retries + 1):
+            if attempt > 0 and self._is_circuit_open(api_name):
+                self.console_logger.debug("[%s] Circuit opened, abandoning retries for %s", api_name, log_url)
+                break
             result = await self._attempt_request(
                 api_name,
                 url,
@@ -449,6 +494,7 @@ class ApiRequestExecutor:
                 request_url = url
                 request_params = params
 
+            request_start = time.monotonic()
             async with self.session.get(
                 request_url,
                 params=request_params,
@@ -458,7 +504,7 @@ class ApiRequestExecutor:
                 elapsed = time.monotonic() - start_time
                 self.api_call_durations[api_name].append(elapsed)
 
-                return await self._process_response(
+                result = await self._process_response(
                     response,
                     api_name=api_name,
                     url=url,
@@ -466,11 +512,40 @@ class ApiRequestExecutor:
                     log_url=log_url,
                     elapsed=elapsed,
                 )
+                self._record_call_success(api_name, time.monotonic() - request_start)
+                if self.cassette is not None and self.cassette.is_recording:
+                    await self.cassette.record(api_name, url, params, status=response.status, elapsed=elapsed, body=result)
+                return result
 
         finally:
             if acquired:
                 limiter.release()
 
+    def _is_circuit_open(self, api_name: str) -> bool:
+        """Whether the API's circuit breaker is currently rejecting requests."""
+        breaker = self.circuit_breakers.get(api_name)
+        return breaker is not None and breaker.is_open
+
+    def _record_call_success(self, api_name: str, latency: float) -> None:
+        """Feed a completed request into the API's circuit breaker."""
+        if breaker := self.circuit_breakers.get(api_name):
+            breaker.record_success(latency)
+
+    def _record_call_failure(self, api_name: str, exception: TimeoutError | aiohttp.ClientError) -> None:
+        """Feed a failed request into the API's circuit breaker.
+
+        Client errors (4xx other than 429) mean the provider answered, so they
+        count as healthy calls; timeouts, connection errors, 429 and 5xx count
+        as failures.
+        """
+        breaker = self.circuit_breakers.get(api_name)
+        if breaker is None:
+            return
+        if isinstance(exception, aiohttp.ClientResponseError) and exception.status < HTTP_SERVER_ERROR and exception.status != HTTP_TOO_MANY_REQUESTS:
+            breaker.record_success(0.0)
+        else:
+            breaker.record_failure()
+
     def _ensure_session(self) -> None:
         """Ensure session is available, raise if not."""
         if self.session is None or self.session.closed:
@@ -676,6 +751,7 @@ class ApiRequestExecutor:
         """Handle client timeout and connection errors."""
         # Track elapsed time for failed requests
         self.api_call_durations[api_name].append(0.0)
+        self._record_call_failure(api_name, exception)
 
         retryable_errors = (
             aiohttp.ClientConnectorError,
@@ -683,7 +759,7 @@ class ApiRequestExecutor:
             asyncio.TimeoutError,
         )
 
-        if attempt >= max_retries or not isinstance(exception, retryable_errors):
+        if attempt >= max_retries or not isinstance(exception, retryable_errors) or self._is_circuit_open(api_name):
             self.error_logger.exception(
                 "[%s] Request failed after %d attempts",
                 api_name,
@@ -0,0 +1,275 @@
+"""Field projection of external API responses before caching.
+
+MusicBrainz release lists (``inc=media+artist-credits``, up to 100 releases),
+Discogs release details (tracklists, images, credits, notes) and iTunes
+results carry far more data than the year pipeline reads. Projection keeps
+only the fields consumed by the API clients and ``ReleaseScorer``, so cached
+responses are a fraction of their original size and faster to load.
+
+A schema is a nested mapping: ``True`` keeps a field as-is, a nested mapping
+projects a dict (or every dict in a list) recursively. Fields absent from
+the schema are dropped; responses without a matching schema pass through.
+"""
+
+from __future__ import annotations
+
+import re
+import urllib.parse
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+ProjectionSchema = dict[str, Any]
+
+_MB_ARTIST_CREDIT: ProjectionSchema = {
+    "name": True,
+    "joinphrase": True,
+    "artist": {
+        "id": True,
+        "name": True,
+        "sort-name": True,
+        "aliases": {"name": True, "sort-name": True},
+    },
+}
+
+MB_RELEASE_GROUP_LIST: ProjectionSchema = {
+    "count": True,
+    "offset": True,
+    "release-group-count": True,
+    "release-group-offset": True,
+    "release-groups": {
+        "id": True,
+        "score": True,
+        "title": True,
+        "primary-type": True,
+        "secondary-types": True,
+        "first-release-date": True,
+        "disambiguation": True,
+        "artist-credit": _MB_ARTIST_CREDIT,
+    },
+}
+
+MB_RELEASE_LIST: ProjectionSchema = {
+    "release-count": True,
+    "release-offset": True,
+    "releases": {
+        "id": True,
+        "title": True,
+        "status": True,
+        "country": True,
+        "date": True,
+        "barcode": True,
+        "disambiguation": True,
+        "media": {"format": True},
+        "label-info": {"catalog-number": True, "label": {"name": True}},
+        "artist-credit": _MB_ARTIST_CREDIT,
+    },
+}
+
+MB_ARTIST_SEARCH: ProjectionSchema = {
+    "count": True,
+    "offset": True,
+    "artists": {
+        "id": True,
+        "score": True,
+        "name": True,
+        "sort-name": True,
+        "type": True,
+        "country": True,
+        "area": {"name": True},
+        "begin-area": {"name": True},
+        "end-area": {"name": True},
+        "life-span": True,
+        "aliases": {"name": True, "sort-name": True},
+    },
+}
+
+DISCOGS_SEARCH: ProjectionSchema = {
+    "message": True,
+    "pagination": {"page": True, "pages": True, "items": True},
+    "results": {
+        "id": True,
+        "type": True,
+        "title": True,
+        "year": True,
+        "released": True,
+        "country": True,
+        "format": True,
+        "formats": {"name": True, "descriptions": True},
+        "label": True,
+        "genre": True,
+        "style": True,
+        "master_id": True,
+    },
+}
+
+DISCOGS_RELEASE: ProjectionSchema = {
+    "message": True,
+    "id": True,
+    "title": True,
+    "year": True,
+    "released": True,
+    "country": True,
+    "master_id": True,
+    "formats": {"name": True, "descriptions": True},
+    "labels": {"name": True, "catno": True},
+    "artists": {"name": True},
+}
+
+DISCOGS_MASTER: ProjectionSchema = {
+    "message": True,
+    "id": True,
+    "title": True,
+    "year": True,
+    "main_release": True,
+}
+
+DISCOGS_ARTIST_RELEASES: ProjectionSchema = {
+    "message": True,
+    "pagination": {"page": True, "pages": True, "items": True},
+    "releases": {
+        "id": True,
+        "type": True,
+        "main_release": True,
+        "title": True,
+        "year": True,
+        "artist": True,
+        "role": True,
+        "format": True,
+        "label": True,
+    },
+}
+
+ITUNES_RESULTS: ProjectionSchema = {
+    "resultCount": True,
+    "results": {
+        "wrapperType": True,
+        "collectionType": True,
+        "artistId": True,
+        "collectionId": True,
+        "artistName": True,
+        "collectionName": True,
+        "collectionCensoredName": True,
+        "releaseDate": True,
+        "copyright": True,
+        "country": True,
+        "primaryGenreName": True,
+    },
+}
+
+# Endpoint path patterns per API, matched against the request URL path
+_ENDPOINT_SCHEMAS: dict[str, list[tuple[re.Pattern[str], ProjectionSchema]]] = {
+    "musicbrainz": [
+        (re.compile(r"/ws/2/release/?$"), MB_RELEASE_LIST),
+        (re.compile(r"/ws/2/release-group/?$"), MB_RELEASE_GROUP_LIST),
+        (re.compile(r"/ws/2/artist/?$"), MB_ARTIST_SEARCH),
+    ],
+    "discogs": [
+        (re.compile(r"/database/search/?$"), DISCOGS_SEARCH),
+        (re.compile(r"/releases/\d+/?$"), DISCOGS_RELEASE),
+        (re.compile(r"/masters/\d+/?$"), DISCOGS_MASTER),
+        (re.compile(r"/artists/\d+/releases/?$"), DISCOGS_ARTIST_RELEASES),
+    ],
+    "itunes": [
+        (re.compile(r"/(search|lookup)/?$"), ITUNES_RESULTS),
+    ],
+}
+
+
+def schema_for_request(api_name: str, url: str) -> ProjectionSchema | None:
+    """Select the projection schema for a request.
+
+    Args:
+        api_name: API name (musicbrainz, discogs, itunes)
+        url: Request URL
+
+    Returns:
+        Matching schema, or None when responses should be cached unchanged
+
+    """
+    path = urllib.parse.urlsplit(url).path
+    for pattern, schema in _ENDPOINT_SCHEMAS.get(api_name, []):
+        if pattern.search(path):
+            return schema
+    return None
+
+
+def project_response(data: Any, schema: ProjectionSchema) -> Any:
+    """Project a response (or nested value) onto a schema.
+
+    Args:
+        data: Response value; dicts are filtered, lists are projected element-wise
+        schema: Projection schema
+
+    Returns:
+        Projected copy of the value (scalars are returned unchanged)
+
+    """
+    if isinstance(data, list):
+        return [project_response(item, schema) for item in data]
+    if not isinstance(data, dict):
+        return data
+
+    projected: dict[str, Any] = {}
+    for field, rule in schema.items():
+        if field not in data:
+            continue
+        projected[field] = data[field] if rule is True else project_response(data[field], rule)
+    return projected
+
+
+def schema_for_cached_response(value: Any) -> ProjectionSchema | None:
+    """Infer the schema of a cached response from its shape.
+
+    Cache keys are hashed, so existing entries can only be recognised by
+    their top-level structure.
+
+    Args:
+        value: Cached value
+
+    Returns:
+        Matching schema, or None if the value is not a recognised API response
+
+    """
+    if not isinstance(value, dict) or not value:
+        return None
+
+    schema: ProjectionSchema | None = None
+    if "release-groups" in value:
+        schema = MB_RELEASE_GROUP_LIST
+    elif "releases" in value:
+        schema = DISCOGS_ARTIST_RELEASES if "pagination" in value else MB_RELEASE_LIST if "release-count" in value else None
+    elif "artists" in value and "count" in value:
+        schema = MB_ARTIST_SEARCH
+    elif "results" in value:
+        schema = ITUNES_RESULTS if "resultCount" in value else DISCOGS_SEARCH if "pagination" in value else None
+    elif "tracklist" in value:
+        schema = DISCOGS_MASTER if "main_release" in value else DISCOGS_RELEASE
+    return schema
+
+
+def migrate_cached_responses(cache: Mapping[str, tuple[Any, float]], replace: Callable[[str, Any], object]) -> int:
+    """Project existing cache entries that hold full API responses.
+
+    Values that are already projected, or that are not recognised API
+    responses, are left untouched.
+
+    Args:
+        cache: Generic cache storage mapping keys to ``(value, expires_at)``
+        replace: Stores the projected value of a key, keeping its expiry
+            (``GenericCacheService.replace_value``)
+
+    Returns:
+        Number of entries rewritten
+
+    """
+    migrated = 0
+    for key, (value, _) in list(cache.items()):
+        if (schema := schema_for_cached_response(value)) is None:
+            continue
+        projected = project_response(value, schema)
+        if projected != value:
+            replace(key, projected)
+            migrated += 1
+    return migrated
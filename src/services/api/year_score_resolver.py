@@ -142,6 +142,35 @@ class YearScoreResolver:
 
         return best_year, is_definitive, best_score
 
+    def is_definitive(self, all_releases: list[ScoredRelease]) -> bool:
+        """Check whether releases already settle the year, without logging.
+
+        A lightweight version of ``select_best_year`` used to stop outstanding
+        API requests early: the top year must be in the past, meet the
+        definitive threshold, and either be very high scoring or lead the
+        runner-up by ``definitive_score_diff``. Single-year results must also
+        pass the suspicious-old-year check.
+
+        Args:
+            all_releases: Scored releases collected so far
+
+        Returns:
+            True if further results are unlikely to change the outcome
+
+        """
+        sorted_years = self._sort_years_by_score(self._compute_final_year_scores(self.aggregate_year_scores(all_releases)))
+        if not sorted_years:
+            return False
+
+        best_year, best_score = sorted_years[0]
+        if int(best_year) > self.current_year or best_score < self.definitive_score_threshold:
+            return False
+
+        if len(sorted_years) == 1:
+            return self.current_year - int(best_year) <= MAX_SUSPICIOUS_YEAR_DIFFERENCE or best_score >= MIN_CONFIDENT_SCORE_THRESHOLD
+
+        return best_score >= VERY_HIGH_SCORE_THRESHOLD or best_score - sorted_years[1][1] >= self.definitive_score_diff
+
     @staticmethod
     def _compute_final_year_scores(year_scores: defaultdict[str, list[int]]) -> dict[str, int]:
         """Get the maximum score for each year."""
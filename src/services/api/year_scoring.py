@@ -13,18 +13,34 @@ from __future__ import annotations
 
 import logging
 import re
+from dataclasses import dataclass
 from datetime import UTC
 from datetime import datetime as dt
-from typing import Any, ClassVar, TypedDict
+from typing import TYPE_CHECKING, Any, ClassVar, TypedDict
 
 from core.models.metadata_utils import remove_parentheses_with_keywords
-from core.models.normalization import normalize_for_matching
+from core.models.normalization import memoized_normalizer, normalize_for_matching
 from core.models.script_detection import ScriptType, detect_primary_script
 
 from core.models.track_models import ScoringConfig
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; batch scoring falls back to pure Python
+    np = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 # Module-level constant for name normalization
 _NON_ALPHANUM_PATTERN = r"[^\w\s]"
+_NON_ALPHANUM_RE = re.compile(_NON_ALPHANUM_PATTERN)
+_WHITESPACE_RE = re.compile(r"\s+")
+# Bracketed suffix such as "(Deluxe)" or "[Live]" left after a common prefix
+_BRACKETED_SUFFIX_RE = re.compile(r"^[([^)\]]+[)\]]$")
+
+# Smaller batches are cheaper to finish in pure Python than to convert to arrays
+_NUMPY_MIN_BATCH_SIZE = 16
 
 
 def _normalize_for_comparison(text: str) -> str:
@@ -37,7 +53,7 @@ def _normalize_for_comparison(text: str) -> str:
         Normalized text suitable for comparison
 
     """
-    return re.sub(_NON_ALPHANUM_PATTERN, "", text.lower()).strip()
+    return _NON_ALPHANUM_RE.sub("", text.lower()).strip()
 
 
 def _is_album_substring_match(album1: str, album2: str) -> bool:
@@ -60,6 +76,12 @@ def _is_album_substring_match(album1: str, album2: str) -> bool:
     return comp1 in comp2 or comp2 in comp1
 
 
+@memoized_normalizer("ReleaseScorer._strip_edition_suffix")
+def _strip_keyword_segments(album_name: str, keywords: tuple[str, ...], logger: logging.Logger) -> str:
+    """Remove bracketed segments containing keywords (memoized per keyword set)."""
+    return remove_parentheses_with_keywords(album_name, list(keywords), logger, logger)
+
+
 # Type definitions for scoring context
 class ArtistPeriodContext(TypedDict, total=False):
     """Context about an artist's active period."""
@@ -68,6 +90,45 @@ class ArtistPeriodContext(TypedDict, total=False):
     end_year: int | None
 
 
+@dataclass(frozen=True, slots=True)
+class ScoringContext:
+    """Immutable per-album inputs to release scoring.
+
+    Passed with every scoring call instead of being stored on the scorer, so
+    a single ReleaseScorer can score albums of different artists concurrently
+    (or in worker processes) without locks.
+
+    Attributes:
+        artist_region: Artist's region/country for the country bonus
+        start_year: First year of the artist's activity period
+        end_year: Last year of the artist's activity period
+        album_orig: Original album name with parentheses for edition stripping
+
+    """
+
+    artist_region: str | None = None
+    start_year: int | None = None
+    end_year: int | None = None
+    album_orig: str | None = None
+
+    @classmethod
+    def from_artist_period(
+        cls,
+        period: ArtistPeriodContext | None,
+        *,
+        artist_region: str | None = None,
+        album_orig: str | None = None,
+    ) -> ScoringContext:
+        """Build a context from an artist activity period mapping."""
+        period = period or {}
+        return cls(
+            artist_region=artist_region,
+            start_year=period.get("start_year"),
+            end_year=period.get("end_year"),
+            album_orig=album_orig,
+        )
+
+
 class ReleaseScorer:
     """Release scoring system for evaluating music metadata quality.
 
@@ -76,6 +137,10 @@ class ReleaseScorer:
     The algorithm considers multiple factors and applies configuration-driven
     scoring rules to ensure consistent and accurate results.
 
+    The scorer holds configuration only; per-album inputs (artist region,
+    activity period, original album name) arrive with each call as a
+    ScoringContext, so one instance is safe to share across concurrent albums.
+
     Args:
         scoring_config: Typed scoring parameters (uses defaults if None)
         min_valid_year: Minimum valid year for releases
@@ -129,7 +194,6 @@ class ReleaseScorer:
         self.min_valid_year = min_valid_year
         self.current_year = dt.now(UTC).year
         self.definitive_score_threshold = definitive_score_threshold
-        self.artist_period_context: ArtistPeriodContext | None = None
         self.console_logger = console_logger or logging.getLogger(__name__)
         self.remaster_keywords = remaster_keywords or []
         self.major_market_codes = major_market_codes or self._DEFAULT_MARKET_CODES
@@ -137,23 +201,22 @@ class ReleaseScorer:
         # Constants from the original implementation
         self.YEAR_LENGTH = 4
 
-    def set_artist_period_context(self, context: ArtistPeriodContext | None) -> None:
-        """Set the artist activity period context for scoring.
-
-        Args:
-            context: Dictionary with start_year and end_year information
-
-        """
-        self.artist_period_context = context
+    def __getstate__(self) -> dict[str, Any]:
+        """Drop the logger when pickled for a ``CpuExecutor`` worker."""
+        state = self.__dict__.copy()
+        del state["console_logger"]
+        return state
 
-    def clear_artist_period_context(self) -> None:
-        """Clear the artist activity period context."""
-        self.artist_period_context = None
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore a pickled scorer with the module logger."""
+        self.__dict__.update(state)
+        self.console_logger = logging.getLogger(__name__)
 
     # _get_default_scoring_config() removed — defaults live in
     # ScoringConfig Pydantic model (track_models.py) and constructor above
 
     @staticmethod
+    @memoized_normalizer("ReleaseScorer._normalize_name")
     def _normalize_name(name: str) -> str:
         """Normalize an artist or album name for matching.
 
@@ -177,10 +240,10 @@ class ReleaseScorer:
         normalized = normalized.replace("&", "and")
 
         # Remove common punctuation and special characters
-        normalized = re.sub(_NON_ALPHANUM_PATTERN, "", normalized)
+        normalized = _NON_ALPHANUM_RE.sub("", normalized)
 
         # Normalize whitespace (multiple spaces to single space)
-        normalized = re.sub(r"\s+", " ", normalized)
+        normalized = _WHITESPACE_RE.sub(" ", normalized)
 
         # Strip leading/trailing whitespace
         return normalized.strip()
@@ -249,6 +312,22 @@ class ReleaseScorer:
             score_components.append(f"Year Invalid: {year} (system rejected): score=0")
             return None, False
 
+    def _score_release_recency(self, year: int, score_components: list[str]) -> int:
+        """Score penalties for current and future year releases."""
+        cfg = self.scoring_config
+        if year > self.current_year:
+            # Future years are suspicious (likely incorrect data)
+            future_penalty = cfg.future_year_penalty
+            score_components.append(f"Future Year ({year}): {future_penalty}")
+            return future_penalty
+        if year == self.current_year:
+            # Current year: small penalty to prefer earlier releases when ambiguous
+            current_year_penalty = cfg.current_year_penalty
+            if current_year_penalty != 0:
+                score_components.append(f"Current Year ({year}): {current_year_penalty}")
+            return current_year_penalty
+        return 0
+
     def _calculate_match_score(
         self,
         release_artist_norm: str,
@@ -496,12 +575,7 @@ class ReleaseScorer:
         if not self.remaster_keywords or not album_name:
             return album_name
 
-        return remove_parentheses_with_keywords(
-            album_name,
-            self.remaster_keywords,
-            self.console_logger,
-            self.console_logger,  # Use same logger for errors
-        )
+        return _strip_keyword_segments(album_name, tuple(self.remaster_keywords), self.console_logger)
 
     def _calculate_album_match(
         self,
@@ -559,7 +633,7 @@ class ReleaseScorer:
     @staticmethod
     def _is_album_variation(title1: str, title2: str) -> bool:
         """Check if title1 is a variation of title2 (e.g., with suffix in parentheses)."""
-        return title1.startswith(title2) and bool(re.match(r"^[([^)\]]+[)\]]$", title1[len(title2) :].strip()))
+        return title1.startswith(title2) and bool(_BRACKETED_SUFFIX_RE.match(title1[len(title2) :].strip()))
 
     def _calculate_release_characteristics_score(
         self,
@@ -661,23 +735,27 @@ class ReleaseScorer:
             return penalty
         return 0
 
-    def _calculate_contextual_score(self, year: int, rg_first_year: int | None, score_components: list[str]) -> int:
+    def _calculate_contextual_score(
+        self,
+        year: int,
+        rg_first_year: int | None,
+        context: ScoringContext,
+        score_components: list[str],
+    ) -> int:
         """Calculate contextual factors score (artist period, year differences).
 
         Args:
             year: Validated release year
             rg_first_year: Release group first year (if available)
+            context: Per-album scoring context
             score_components: List to append score messages to
 
         Returns:
             Contextual score adjustment
 
         """
-        contextual_score = 0
-
         # Apply Artist Activity Period Context
-        if self.artist_period_context:
-            contextual_score += self._score_artist_period(year, score_components)
+        contextual_score = self._score_artist_period(year, context, score_components)
 
         # Penalty based on difference from RG First Year
         if rg_first_year and year > rg_first_year + 1:
@@ -685,14 +763,12 @@ class ReleaseScorer:
 
         return contextual_score
 
-    def _score_artist_period(self, year: int, score_components: list[str]) -> int:
+    def _score_artist_period(self, year: int, context: ScoringContext, score_components: list[str]) -> int:
         """Score based on artist activity period context."""
-        if self.artist_period_context is None:
-            return 0
         cfg = self.scoring_config
         period_score = 0
-        start_year: int | None = self.artist_period_context.get("start_year")
-        end_year: int | None = self.artist_period_context.get("end_year")
+        start_year = context.start_year
+        end_year = context.end_year
 
         # Penalty if the year is before the artist's start (allow 1-year grace)
         # Config values are expected to be negative (per schema Field(le=0))
@@ -798,9 +874,10 @@ class ReleaseScorer:
         artist_norm: str,
         album_norm: str,
         *,
-        artist_region: str | None,
+        artist_region: str | None = None,
         source: str = "unknown",
         album_orig: str | None = None,
+        context: ScoringContext | None = None,
     ) -> int:
         """REVISED scoring function prioritizing original release indicators (v3).
 
@@ -820,11 +897,16 @@ class ReleaseScorer:
             artist_region: Artist's region/country for bonus scoring
             source: Source of the release data (musicbrainz, discogs, itunes)
             album_orig: Original album name with parentheses for edition stripping
+            context: Per-album scoring context; when given it supplies the
+                artist region, activity period and original album name
+                instead of ``artist_region`` and ``album_orig``
 
         Returns:
             Integer score (0-100+) indicating release quality/originality
 
         """
+        if context is None:
+            context = ScoringContext(artist_region=artist_region, album_orig=album_orig)
         cfg = self.scoring_config
         score: int = cfg.base_score
         score_components: list[str] = []
@@ -841,8 +923,8 @@ class ReleaseScorer:
         release_artist_norm = self._normalize_name(release_artist_orig)
 
         # If original album name provided, strip editions from it too
-        if album_orig:
-            album_stripped = self._strip_edition_suffix(album_orig)
+        if context.album_orig:
+            album_stripped = self._strip_edition_suffix(context.album_orig)
             album_norm = self._normalize_name(album_stripped)
 
         # Validate year first (early return if invalid)
@@ -854,17 +936,7 @@ class ReleaseScorer:
         year: int = validated_year
 
         # Apply penalties for current and future year releases
-        if year > self.current_year:
-            # Future years are suspicious (likely incorrect data)
-            future_penalty = cfg.future_year_penalty
-            score += future_penalty
-            score_components.append(f"Future Year ({year}): {future_penalty}")
-        elif year == self.current_year:
-            # Current year: small penalty to prefer earlier releases when ambiguous
-            current_year_penalty = cfg.current_year_penalty
-            score += current_year_penalty
-            if current_year_penalty != 0:
-                score_components.append(f"Current Year ({year}): {current_year_penalty}")
+        score += self._score_release_recency(year, score_components)
 
         # Calculate score components
         score += self._calculate_match_score(
@@ -888,8 +960,8 @@ class ReleaseScorer:
         char_score, rg_first_year = self._calculate_release_characteristics_score(release, year_str, source, score_components)
         score += char_score
 
-        score += self._calculate_contextual_score(year, rg_first_year, score_components)
-        score += self._calculate_country_score(release, artist_region, score_components)
+        score += self._calculate_contextual_score(year, rg_first_year, context, score_components)
+        score += self._calculate_country_score(release, context.artist_region, score_components)
         score += self._calculate_source_score(source, score_components)
 
         final_score = max(0, score)
@@ -903,6 +975,153 @@ class ReleaseScorer:
 
         return final_score
 
+    def score_releases(
+        self,
+        releases: Sequence[dict[str, Any]],
+        artist_norm: str,
+        album_norm: str,
+        *,
+        source: str = "unknown",
+        context: ScoringContext | None = None,
+    ) -> list[int]:
+        """Score all candidate releases of one album in a single pass.
+
+        Returns exactly what ``score_original_release`` returns for each
+        release, but normalizes the target names once, normalizes each
+        distinct release title and artist once, and evaluates the
+        year-dependent components (recency, artist period, year difference
+        from the release group) for the whole batch at once - as NumPy array
+        operations when NumPy is installed.
+
+        Per-release score breakdowns are only logged by the scalar path, so
+        with debug logging enabled the releases are scored one by one.
+
+        Args:
+            releases: Candidate releases of the album
+            artist_norm: Normalized artist name for matching
+            album_norm: Normalized album name for matching
+            source: Default source for releases without a ``source`` field
+            context: Per-album scoring context
+
+        Returns:
+            Scores in the order of ``releases``
+
+        """
+        context = context or ScoringContext()
+        if self.console_logger.isEnabledFor(logging.DEBUG):
+            return [self.score_original_release(release, artist_norm, album_norm, source=source, context=context) for release in releases]
+
+        if context.album_orig:
+            album_norm = self._normalize_name(self._strip_edition_suffix(context.album_orig))
+        target_artist_norm = self._normalize_name(artist_norm)
+        target_album_norm = self._normalize_name(album_norm)
+        is_soundtrack_target = self._is_soundtrack_artist(artist_norm)
+
+        title_norms: dict[str, str] = {}
+        artist_norms: dict[str, str] = {}
+        match_scores: dict[tuple[str, str], int] = {}
+        # Score explanations are discarded in the batch path
+        discarded: list[str] = []
+
+        # Year 0 marks an invalid year (such releases score 0), rg year 0 a missing one
+        years: list[int] = []
+        rg_first_years: list[int] = []
+        partial_scores: list[int] = []
+        for release in releases:
+            year_str = release.get("year", "") or ""
+            year, is_valid = self._validate_year(year_str, discarded)
+            if not is_valid or year is None:
+                years.append(0)
+                rg_first_years.append(0)
+                partial_scores.append(0)
+                continue
+
+            release_source = release.get("source", source)
+            title_orig = release.get("title", "") or ""
+            artist_orig = release.get("artist", "") or ""
+            if (release_title_norm := title_norms.get(title_orig)) is None:
+                release_title_norm = title_norms[title_orig] = self._normalize_name(self._strip_edition_suffix(title_orig))
+            if (release_artist_norm := artist_norms.get(artist_orig)) is None:
+                release_artist_norm = artist_norms[artist_orig] = self._normalize_name(artist_orig)
+
+            match_key = (release_artist_norm, release_title_norm)
+            if (match_score := match_scores.get(match_key)) is None:
+                artist_match_bonus, artist_score = self._calculate_artist_match(release_artist_norm, target_artist_norm, discarded)
+                album_score = self._calculate_album_match(release_title_norm, target_album_norm, artist_match_bonus, discarded)
+                match_score = match_scores[match_key] = artist_score + album_score
+
+            partial_score = self.scoring_config.base_score + match_score
+            if is_soundtrack_target:
+                partial_score += self._calculate_soundtrack_compensation(
+                    target_artist_norm=artist_norm,
+                    release_title_norm=release_title_norm,
+                    target_album_norm=album_norm,
+                    release_genre=release.get("genre", ""),
+                    score_components=discarded,
+                )
+            char_score, rg_first_year = self._calculate_release_characteristics_score(release, year_str, release_source, discarded)
+            partial_score += char_score
+            partial_score += self._calculate_country_score(release, context.artist_region, discarded)
+            partial_score += self._calculate_source_score(release_source, discarded)
+
+            years.append(year)
+            rg_first_years.append(rg_first_year or 0)
+            partial_scores.append(partial_score)
+            discarded.clear()
+
+        return self._add_year_components(years, rg_first_years, partial_scores, context)
+
+    def _add_year_components(
+        self,
+        years: list[int],
+        rg_first_years: list[int],
+        partial_scores: list[int],
+        context: ScoringContext,
+    ) -> list[int]:
+        """Add the year-dependent score components and clamp final scores.
+
+        Args:
+            years: Validated release years (0 for invalid years)
+            rg_first_years: Release group first years (0 when unknown)
+            partial_scores: Scores of all year-independent components
+            context: Per-album scoring context
+
+        Returns:
+            Final scores; releases with invalid years score 0
+
+        """
+        if np is None or len(years) < _NUMPY_MIN_BATCH_SIZE:
+            discarded: list[str] = []
+            return [
+                max(0, partial + self._score_release_recency(year, discarded) + self._calculate_contextual_score(year, rg_year, context, discarded))
+                if year
+                else 0
+                for year, rg_year, partial in zip(years, rg_first_years, partial_scores, strict=True)
+            ]
+
+        cfg = self.scoring_config
+        year_arr = np.asarray(years, dtype=np.int64)
+        rg_arr = np.asarray(rg_first_years, dtype=np.int64)
+        scores = np.asarray(partial_scores, dtype=np.int64)
+
+        scores += np.where(
+            year_arr > self.current_year,
+            cfg.future_year_penalty,
+            np.where(year_arr == self.current_year, cfg.current_year_penalty, 0),
+        )
+        if start_year := context.start_year:
+            scores += np.where(year_arr < start_year - 1, cfg.year_before_start_penalty, 0)
+            since_start = year_arr - start_year
+            scores += np.where((since_start >= 0) & (since_start <= 1), cfg.year_near_start_bonus, 0)
+        if end_year := context.end_year:
+            scores += np.where(year_arr > end_year + 3, cfg.year_after_end_penalty, 0)
+
+        year_diff_penalty = np.maximum(cfg.year_diff_max_penalty, (year_arr - rg_arr - 1) * cfg.year_diff_penalty_scale)
+        scores += np.where((rg_arr != 0) & (year_arr > rg_arr + 1), year_diff_penalty, 0)
+
+        final_scores: list[int] = np.where(year_arr != 0, np.maximum(scores, 0), 0).tolist()
+        return final_scores
+
 
 # Factory function for easy usage
 def create_release_scorer(
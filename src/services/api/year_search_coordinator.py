@@ -7,23 +7,35 @@ information from multiple providers (MusicBrainz, Discogs, Apple Music).
 from __future__ import annotations
 
 import asyncio
+import statistics
+import time
+from collections import deque
 from typing import TYPE_CHECKING, Any, Protocol, cast
 
 from core.debug_utils import debug
 from core.models.script_detection import ScriptType, detect_primary_script
 from core.models.search_strategy import SearchStrategy, detect_search_strategy
+from services.api.circuit_breaker import CircuitOpenError, track_rejections
 
 if TYPE_CHECKING:
     import logging
-    from collections.abc import Coroutine
+    from collections.abc import Coroutine, Iterable
 
     from core.models.track_models import AppConfig
-    from services.api.api_base import ScoredRelease
+    from services.api.api_base import ApiRateLimiter, ScoredRelease
     from services.api.applemusic import AppleMusicClient
+    from services.api.circuit_breaker import CircuitBreaker
     from services.api.discogs import DiscogsClient
     from services.api.musicbrainz import MusicBrainzClient
+    from services.api.year_score_resolver import YearScoreResolver
     from services.api.year_scoring import ReleaseScorer
 
+# Minimum number of per-album latency samples before a p95 is reported
+MIN_LATENCY_SAMPLES_FOR_P95 = 20
+
+# Most recent per-album latency samples kept for the p50/p95 summary
+MAX_LATENCY_SAMPLES = 1000
+
 
 class _RegionAwareApi(Protocol):
     """Protocol for APIs that accept artist_region parameter."""
@@ -48,6 +60,10 @@ class YearSearchCoordinator:
     - Script-optimized search (Cyrillic, CJK, etc.)
     - Concurrent API queries across multiple providers
     - API priority ordering based on configuration
+    - Skipping providers whose circuit breaker is open
+    - Optional hedged fan-out (``year_retrieval.hedging``): primary providers
+      are queried together, fallback providers start after a delay, or immediately when their rate budget is idle, and
+      outstanding calls are cancelled once the scores are definitive
 
     Args:
         console_logger: Logger for console output
@@ -60,6 +76,10 @@ class YearSearchCoordinator:
         release_scorer: Release scoring service
         max_concurrent_api_calls: Maximum concurrent API requests (default 50).
             Prevents socket exhaustion on large libraries.
+        year_score_resolver: Resolver used to stop hedged searches early
+        rate_limiters: Per-API rate limiters used to detect idle budgets
+        circuit_breakers: Per-API circuit breakers; providers are skipped
+            while their circuit is open or another album's probe is in flight
 
     """
 
@@ -75,6 +95,9 @@ class YearSearchCoordinator:
         applemusic_client: AppleMusicClient,
         release_scorer: ReleaseScorer,
         max_concurrent_api_calls: int = 50,
+        year_score_resolver: YearScoreResolver | None = None,
+        rate_limiters: dict[str, ApiRateLimiter] | None = None,
+        circuit_breakers: dict[str, CircuitBreaker] | None = None,
     ) -> None:
         self.console_logger = console_logger
         self.error_logger = error_logger
@@ -85,6 +108,15 @@ class YearSearchCoordinator:
         self.applemusic_client = applemusic_client
         self.release_scorer = release_scorer
         self._api_semaphore = asyncio.Semaphore(max_concurrent_api_calls)
+        self.year_score_resolver = year_score_resolver
+        self.rate_limiters = rate_limiters or {}
+        self.circuit_breakers = circuit_breakers or {}
+        self.hedging = config.year_retrieval.hedging
+
+        # Recent per-album search latency samples and hedged-search counters
+        self.search_latencies: deque[float] = deque(maxlen=MAX_LATENCY_SAMPLES)
+        self.searched_albums = 0
+        self.hedge_stats: dict[str, int] = {"searches": 0, "launched": 0, "wins": 0, "cancelled": 0, "early_stops": 0}
 
     async def fetch_all_api_results(
         self,
@@ -95,6 +127,22 @@ class YearSearchCoordinator:
         log_album: str,
     ) -> list[ScoredRelease]:
         """Fetch scored releases from all API providers with script-aware logic."""
+        start_time = time.perf_counter()
+        try:
+            return await self._fetch_all_api_results(artist_norm, album_norm, artist_region, log_artist, log_album)
+        finally:
+            self.searched_albums += 1
+            self.search_latencies.append(time.perf_counter() - start_time)
+
+    async def _fetch_all_api_results(
+        self,
+        artist_norm: str,
+        album_norm: str,
+        artist_region: str | None,
+        log_artist: str,
+        log_album: str,
+    ) -> list[ScoredRelease]:
+        """Run script-optimized, standard and alternative searches in turn."""
         self._log_api_search_start(artist_norm, album_norm, artist_region, log_artist, log_album)
 
         # Try script-optimized search first
@@ -148,6 +196,16 @@ class YearSearchCoordinator:
 
         api_lists = self._get_script_api_priorities(script_type)
 
+        if self.hedging.enabled:
+            return await self._hedged_search(
+                api_lists["primary"],
+                api_lists["fallback"],
+                artist_norm=artist_norm,
+                album_norm=album_norm,
+                artist_region=artist_region,
+                script_type=script_type,
+            )
+
         # Try primary APIs first
         results = await self._try_api_list(
             api_lists["primary"],
@@ -250,7 +308,7 @@ class YearSearchCoordinator:
     ) -> list[ScoredRelease] | None:
         """Try a single API and return results if successful."""
         try:
-            api_client = self._get_api_client(api_name)
+            api_client = self._get_available_client(api_name)
             if not api_client:
                 if debug.api and not is_fallback:
                     self.console_logger.debug("%s client not available, skipping", api_name)
@@ -272,6 +330,9 @@ class YearSearchCoordinator:
                     )
                 return results
 
+        except CircuitOpenError:
+            if debug.api:
+                self.console_logger.debug("%s circuit open, skipped", api_name)
         except (OSError, ValueError, RuntimeError, KeyError, TypeError, AttributeError) as e:
             if debug.api:
                 self.console_logger.warning("%s failed for %s: %s", api_name, script_type.value, e)
@@ -292,13 +353,23 @@ class YearSearchCoordinator:
         AppleMusic doesn't accept artist_region parameter.
 
         Uses semaphore to limit concurrent API requests.
+
+        Raises:
+            CircuitOpenError: If nothing was found because the provider's
+                circuit breaker rejected its requests
+
         """
         async with self._api_semaphore:
-            if api_name in {"musicbrainz", "discogs"}:
-                # Cast to protocol that accepts artist_region
-                return await cast(_RegionAwareApi, api_client).get_scored_releases(artist_norm, album_norm, artist_region)
-            # Cast to protocol that doesn't accept artist_region
-            return await cast(_SimpleApi, api_client).get_scored_releases(artist_norm, album_norm)
+            with track_rejections() as rejected:
+                if api_name in {"musicbrainz", "discogs"}:
+                    # Cast to protocol that accepts artist_region
+                    results = await cast(_RegionAwareApi, api_client).get_scored_releases(artist_norm, album_norm, artist_region)
+                else:
+                    # Cast to protocol that doesn't accept artist_region
+                    results = await cast(_SimpleApi, api_client).get_scored_releases(artist_norm, album_norm)
+        if not results and rejected:
+            raise CircuitOpenError(api_name)
+        return results
 
     def _get_api_client(self, api_name: str) -> MusicBrainzClient | DiscogsClient | AppleMusicClient | None:
         """Get API client by name."""
@@ -310,6 +381,19 @@ class YearSearchCoordinator:
         }
         return api_mapping.get(api_name)
 
+    def _get_available_client(self, api_name: str) -> MusicBrainzClient | DiscogsClient | AppleMusicClient | None:
+        """Get API client by name unless its circuit breaker would reject the request.
+
+        A circuit whose half-open probe is in flight rejects requests too, so
+        only the album that started the probe queries the provider.
+        """
+        breaker = self.circuit_breakers.get("itunes" if api_name == "applemusic" else api_name)
+        if breaker is not None and breaker.is_rejecting:
+            if debug.api:
+                self.console_logger.debug("%s circuit open, skipping", api_name)
+            return None
+        return self._get_api_client(api_name)
+
     async def _execute_standard_api_search(
         self,
         artist_norm: str,
@@ -325,18 +409,189 @@ class YearSearchCoordinator:
         active_api_names: list[str] = []
         api_tasks: list[Coroutine[Any, Any, list[ScoredRelease]]] = []
         for api_name in api_order:
-            if api_client := self._get_api_client(api_name):
+            if api_client := self._get_available_client(api_name):
                 active_api_names.append(api_name)
                 api_tasks.append(
                     self._call_api_with_proper_params(api_client, api_name, artist_norm, album_norm, artist_region),
                 )
 
         # Execute all API calls concurrently
-        results = list(await asyncio.gather(*api_tasks, return_exceptions=True))
+        if self.hedging.enabled:
+            results = await self._gather_until_definitive(api_tasks)
+        else:
+            results = list(await asyncio.gather(*api_tasks, return_exceptions=True))
 
         # Process results (active_api_names matches results 1:1)
         return self._process_api_task_results(results, active_api_names, log_artist, log_album)
 
+    async def _hedged_search(
+        self,
+        primary: list[str],
+        fallback: list[str],
+        *,
+        artist_norm: str,
+        album_norm: str,
+        artist_region: str | None,
+        script_type: ScriptType,
+    ) -> list[ScoredRelease] | None:
+        """Query the primary providers concurrently and hedge with the fallbacks.
+
+        All available primaries start immediately (the first fallback does when
+        no primary is available). Each fallback then starts, in priority order,
+        when the hedge delay elapses, when its rate budget is idle, or when
+        every running provider has returned nothing. Once any provider returns
+        results no new providers are started; calls still running are awaited
+        until the collected scores are definitive, then cancelled.
+
+        Args:
+            primary: Primary providers in priority order
+            fallback: Fallback providers in priority order
+            artist_norm: Normalized artist name
+            album_norm: Normalized album name
+            artist_region: Artist's region for scoring
+            script_type: Detected script of the names (for logging)
+
+        Returns:
+            Releases collected from all completed providers, or None
+
+        """
+        primary_names = [name for name in dict.fromkeys(map(self._normalize_api_name, primary)) if self._get_available_client(name)]
+        fallback_names = [
+            name for name in dict.fromkeys(map(self._normalize_api_name, fallback)) if name not in primary_names and self._get_available_client(name)
+        ]
+        candidates = primary_names + fallback_names
+        if not candidates:
+            return None
+
+        self.hedge_stats["searches"] += 1
+        running: dict[asyncio.Task[list[ScoredRelease] | None], int] = {}
+        speculative: set[int] = set()
+        collected: list[ScoredRelease] = []
+        winner: int | None = None
+        next_index = 0
+
+        def launch() -> None:
+            nonlocal next_index
+            if running and next_index >= len(primary_names):
+                speculative.add(next_index)
+                self.hedge_stats["launched"] += 1
+            task = asyncio.create_task(
+                self._try_single_api(
+                    candidates[next_index],
+                    artist_norm=artist_norm,
+                    album_norm=album_norm,
+                    artist_region=artist_region,
+                    script_type=script_type,
+                    is_fallback=next_index >= len(primary_names),
+                )
+            )
+            running[task] = next_index
+            next_index += 1
+
+        for _ in range(max(len(primary_names), 1)):
+            launch()
+        try:
+            while running:
+                while not collected and next_index < len(candidates) and self._has_idle_budget(candidates[next_index]):
+                    launch()
+
+                can_launch = not collected and next_index < len(candidates)
+                done, _ = await asyncio.wait(running, timeout=self.hedging.delay_seconds if can_launch else None, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    launch()
+                    continue
+
+                for task in done:
+                    index = running.pop(task)
+                    if results := task.result():
+                        collected.extend(results)
+                        winner = index if winner is None else winner
+
+                if collected and running and self._is_definitive(collected):
+                    self.hedge_stats["early_stops"] += 1
+                    break
+                if not running and not collected and next_index < len(candidates):
+                    launch()
+        finally:
+            await self._cancel_tasks(running)
+
+        if winner is not None and winner in speculative:
+            self.hedge_stats["wins"] += 1
+            if debug.api:
+                self.console_logger.info("Hedged %s won for %s text", candidates[winner], script_type.value)
+
+        return collected or None
+
+    async def _gather_until_definitive(
+        self,
+        api_tasks: list[Coroutine[Any, Any, list[ScoredRelease]]],
+    ) -> list[list[ScoredRelease] | BaseException]:
+        """Run API calls concurrently, cancelling the rest once scores are definitive.
+
+        Args:
+            api_tasks: API call coroutines
+
+        Returns:
+            Results aligned with ``api_tasks``; cancelled calls yield empty lists
+
+        """
+        tasks = [asyncio.create_task(coro) for coro in api_tasks]
+        collected: list[ScoredRelease] = []
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if not task.cancelled() and task.exception() is None:
+                        collected.extend(task.result())
+                if collected and pending and self._is_definitive(collected):
+                    self.hedge_stats["early_stops"] += 1
+                    break
+        finally:
+            await self._cancel_tasks(pending)
+
+        return [[] if task.cancelled() else task.exception() or task.result() for task in tasks]
+
+    async def _cancel_tasks(self, tasks: Iterable[asyncio.Task[Any]]) -> None:
+        """Cancel outstanding API calls and wait for them to unwind."""
+        outstanding = [task for task in tasks if not task.done()]
+        for task in outstanding:
+            task.cancel()
+        if outstanding:
+            self.hedge_stats["cancelled"] += len(outstanding)
+            await asyncio.gather(*outstanding, return_exceptions=True)
+
+    def _is_definitive(self, releases: list[ScoredRelease]) -> bool:
+        """Whether collected releases already settle the year."""
+        return self.year_score_resolver is not None and self.year_score_resolver.is_definitive(releases)
+
+    def _has_idle_budget(self, api_name: str) -> bool:
+        """Whether a provider's rate-limit window is below the idle utilization."""
+        limiter = self.rate_limiters.get("itunes" if api_name == "applemusic" else api_name)
+        if limiter is None:
+            return False
+        return float(limiter.get_stats()["window_utilization"]) < self.hedging.idle_utilization
+
+    def get_search_stats(self) -> dict[str, Any]:
+        """Summarize per-album search latency and hedging effectiveness.
+
+        Returns:
+            Album count, p50/p95 latency in seconds over the last
+            MAX_LATENCY_SAMPLES albums (p95 is None with fewer than
+            MIN_LATENCY_SAMPLES_FOR_P95 samples), hedge counters and win rate
+
+        """
+        latencies = self.search_latencies
+        p95 = statistics.quantiles(latencies, n=20)[-1] if len(latencies) >= MIN_LATENCY_SAMPLES_FOR_P95 else None
+        launched = self.hedge_stats["launched"]
+        return {
+            "albums": self.searched_albums,
+            "latency_p50": statistics.median(latencies) if latencies else None,
+            "latency_p95": p95,
+            **self.hedge_stats,
+            "hedge_win_rate": self.hedge_stats["wins"] / launched if launched else 0.0,
+        }
+
     async def _try_alternative_search(
         self,
         album_norm: str,
@@ -384,7 +639,9 @@ class YearSearchCoordinator:
         all_releases: list[ScoredRelease] = []
 
         for api_name, result in zip(api_order, results, strict=True):
-            if isinstance(result, BaseException):
+            if isinstance(result, CircuitOpenError):
+                self.console_logger.debug("[%s] Circuit open, skipped '%s - %s'", api_name, log_artist, log_album)
+            elif isinstance(result, BaseException):
                 self._log_api_error(api_name, log_artist, log_album, result)
             elif result:
                 all_releases.extend(result)
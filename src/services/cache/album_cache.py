@@ -1,4 +1,4 @@
-"""Album cache service with TTL-aware entries and CSV persistence."""
+"""Album cache service with TTL-aware entries and CSV or SQLite persistence."""
 
 from __future__ import annotations
 
@@ -7,6 +7,7 @@ import contextlib
 import csv
 import logging
 import os
+import sqlite3
 import tempfile
 import time
 from pathlib import Path
@@ -14,26 +15,40 @@ from typing import TYPE_CHECKING, Any
 
 from core.logger import LogFormat, ensure_directory, get_full_log_path
 from core.models.cache_types import AlbumCacheEntry
-from core.models.normalization import are_names_equal
+from core.models.normalization import are_names_equal, normalize_for_matching
+from core.models.trigram_index import TrigramIndex, edition_insensitive_normalizer
 from services.cache.cache_config import CacheContentType, SmartCacheConfig
+from services.cache.file_lock import CacheFileLock
 from services.cache.hash_service import UnifiedHashService
+from services.cache.instrumentation import CacheTierMetrics, MissReason
+from services.cache.warmup import CacheWarmup
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Sequence
 
     from core.models.track_models import AppConfig
+    from services.cache.sqlite_store import SqliteCacheStore
+
+_CONTENT_TYPE = CacheContentType.ALBUM_YEAR.value
+# Near-match lookups are counted apart from exact lookups (they follow an exact miss)
+_NEAR_MATCH_CONTENT_TYPE = f"{_CONTENT_TYPE}:near_match"
 
 
 class AlbumCacheService:
     """Specialized cache service for album release years with CSV persistence.
 
+    With a SQLite store, ``album_years_cache`` holds only the entries read or
+    changed during the run: lookups fall back to the store by key, and saves
+    write the entries changed since the previous save in one transaction.
+
     Args:
         config: Typed application configuration
         logger: Optional logger instance
+        store: Optional SQLite store replacing the CSV file
 
     """
 
-    def __init__(self, config: AppConfig, logger: logging.Logger | None = None) -> None:
+    def __init__(self, config: AppConfig, logger: logging.Logger | None = None, store: SqliteCacheStore | None = None) -> None:
         self.config = config
         self.logger = logger or logging.getLogger(__name__)
         self.cache_config = SmartCacheConfig(config)
@@ -42,18 +57,122 @@ class AlbumCacheService:
         # Album years cache: {hash_key: AlbumCacheEntry}
         self.album_years_cache: dict[str, AlbumCacheEntry] = {}
 
+        # Per-artist trigram indexes of cached album names: {normalized_artist: index of hash keys}.
+        # Built on the first near-match lookup, then kept in sync with stores and invalidations.
+        self._album_indexes: dict[str, TrigramIndex[str]] | None = None
+
         # Lock for thread-safe cache operations
         self._cache_lock = asyncio.Lock()
 
         # Cache file paths - use get_full_log_path to ensure proper logs_base_dir integration
         self.album_years_cache_file = Path(get_full_log_path(config, "album_years_cache_file", "cache/album_years.csv"))
 
-    async def initialize(self) -> None:
-        """Initialize album cache by loading data from disk."""
+        # Shared CSV (caching.shared): saves merge with what other processes wrote under a file lock
+        shared = config.caching.shared
+        self._file_lock = CacheFileLock(self.album_years_cache_file, shared.lock_timeout_seconds) if shared.enabled and store is None else None
+
+        # SQLite backend or shared CSV: changes not yet written ({hash_key: entry, or None if removed}),
+        # whether the table/file is cleared on the next save, and whether every stored entry is in memory
+        self._store = store
+        self._track_changes = store is not None or self._file_lock is not None
+        self._pending: dict[str, AlbumCacheEntry | None] = {}
+        self._clear_pending = False
+        self._fully_loaded = store is None
+        # The batch a store save is writing (reads of its keys would see the old rows until it commits)
+        self._saving: dict[str, AlbumCacheEntry | None] = {}
+        self._saving_clear = False
+        self._save_lock = asyncio.Lock()
+
+        # Background load of the CSV (or CSV import into the store) with lazy warm-up
+        self._warmup: CacheWarmup[dict[str, AlbumCacheEntry]] = CacheWarmup("AlbumCacheService", self.logger)
+
+        # Lookup outcomes and lookup/save latencies
+        self.metrics = CacheTierMetrics("album")
+
+    async def initialize(self, *, lazy: bool = False) -> None:
+        """Initialize album cache by loading data from disk.
+
+        Args:
+            lazy: Load in a background thread and return immediately; operations
+                wait for the load on first use
+
+        """
         self.logger.info("Initializing %s...", LogFormat.entity("AlbumCacheService"))
+        if lazy:
+            self._warmup.start(self._load_blocking, self._apply_loaded)
+            self.logger.info("%s warming up in the background", LogFormat.entity("AlbumCacheService"))
+            return
+        if self._store is not None:
+            stored = await self._import_csv_into_store(self._store)
+            self.logger.info("%s initialized with %d albums in [cyan]%s[/cyan]", LogFormat.entity("AlbumCacheService"), stored, self._store.path.name)
+            return
         await self._load_album_years_cache()
         self.logger.info("%s initialized with %d albums", LogFormat.entity("AlbumCacheService"), len(self.album_years_cache))
 
+    async def _import_csv_into_store(self, store: SqliteCacheStore) -> int:
+        """Import the CSV cache into an empty store (one-shot migration).
+
+        Returns:
+            Number of entries in the store
+
+        """
+        stored = await asyncio.to_thread(store.album_count)
+        if stored or not self.album_years_cache_file.exists():
+            return stored
+        loaded = await asyncio.get_running_loop().run_in_executor(None, self._read_csv_file)
+        await asyncio.to_thread(store.write_album_entries, loaded)
+        self.logger.info("Imported %d album entries from [cyan]%s[/cyan] into SQLite", len(loaded), self.album_years_cache_file.name)
+        return len(loaded)
+
+    def _load_blocking(self) -> dict[str, AlbumCacheEntry]:
+        """Read the CSV, or import it into an empty store (runs in the warm-up thread)."""
+        if self._store is None:
+            return self._read_csv_file() if self.album_years_cache_file.exists() else {}
+        if not self._store.album_count() and self.album_years_cache_file.exists():
+            loaded = self._read_csv_file()
+            self._store.write_album_entries(loaded)
+            self.logger.info("Imported %d album entries from [cyan]%s[/cyan] into SQLite", len(loaded), self.album_years_cache_file.name)
+        return {}
+
+    def _apply_loaded(self, loaded: dict[str, AlbumCacheEntry]) -> None:
+        """Install entries loaded by the warm-up (on the event loop thread)."""
+        self.album_years_cache.update(loaded)
+        self._album_indexes = None
+
+    async def wait_for_warmup(self) -> None:
+        """Wait until a background warm-up started by ``initialize(lazy=True)`` is applied."""
+        await self._warmup.wait()
+
+    def _store_is_stale(self, key: str) -> bool:
+        """Whether the store's row for a key is outdated by a change not yet committed."""
+        return self._clear_pending or self._saving_clear or key in self._pending or key in self._saving
+
+    def _lookup(self, key: str) -> AlbumCacheEntry | None:
+        """Get an entry from memory, reading it from the store on first access."""
+        entry = self.album_years_cache.get(key)
+        if entry is None and not self._fully_loaded and self._store is not None and not self._store_is_stale(key):
+            entry = self._store.get_album_entry(key)
+            if entry is not None:
+                self.album_years_cache[key] = entry
+        return entry
+
+    def _remove(self, key: str) -> None:
+        """Drop an entry from memory and, with a store or shared CSV, from disk on the next save."""
+        self.album_years_cache.pop(key, None)
+        if self._track_changes:
+            self._pending[key] = None
+
+    async def _load_all_from_store(self) -> None:
+        """Read every stored entry into memory (for lookups that scan all albums)."""
+        if self._fully_loaded or self._store is None:
+            return
+        stored = await asyncio.to_thread(self._store.album_entries)
+        for key, entry in stored.items():
+            # Unsaved changes are newer than the store
+            if not self._store_is_stale(key):
+                self.album_years_cache.setdefault(key, entry)
+        self._fully_loaded = True
+
     async def get_album_year(self, artist: str, album: str) -> str | None:
         """Get album release year from cache.
 
@@ -64,15 +183,17 @@ class AlbumCacheService:
         Returns:
             Album release year if found, None otherwise
         """
+        await self._warmup.wait()
+        started = time.perf_counter()
         async with self._cache_lock:
             key = UnifiedHashService.hash_album_key(artist, album)
 
-            if key not in self.album_years_cache:
+            entry = self._lookup(key)
+            if entry is None:
                 self.logger.debug("Album year cache miss: %s - %s", artist, album)
+                self.metrics.record_miss(_CONTENT_TYPE, MissReason.ABSENT, started)
                 return None
 
-            entry = self.album_years_cache[key]
-
             # Validate cache entry consistency (detect true hash collision)
             artist_mismatch = not are_names_equal(entry.artist, artist)
             album_mismatch = not are_names_equal(entry.album, album)
@@ -85,14 +206,17 @@ class AlbumCacheService:
                     entry.album,
                 )
                 # Don't delete - keep the original entry, just miss for this request
+                self.metrics.record_miss(_CONTENT_TYPE, MissReason.COLLISION, started)
                 return None
 
             if self._is_entry_expired(entry):
                 self.logger.debug("Album year cache expired: %s - %s", artist, album)
-                del self.album_years_cache[key]
+                self._remove(key)
+                self.metrics.record_miss(_CONTENT_TYPE, MissReason.EXPIRED, started)
                 return None
 
             self.logger.debug("Album year cache hit: %s - %s = %s", artist, album, entry.year)
+            self.metrics.record_hit(_CONTENT_TYPE, started)
             return entry.year
 
     async def get_album_year_entry(self, artist: str, album: str) -> AlbumCacheEntry | None:
@@ -107,15 +231,17 @@ class AlbumCacheService:
         Returns:
             Full AlbumCacheEntry if found and not expired, None otherwise
         """
+        await self._warmup.wait()
+        started = time.perf_counter()
         async with self._cache_lock:
             key = UnifiedHashService.hash_album_key(artist, album)
 
-            if key not in self.album_years_cache:
+            entry = self._lookup(key)
+            if entry is None:
                 self.logger.debug("Album year cache miss: %s - %s", artist, album)
+                self.metrics.record_miss(_CONTENT_TYPE, MissReason.ABSENT, started)
                 return None
 
-            entry = self.album_years_cache[key]
-
             # Validate cache entry consistency (detect true hash collision)
             artist_mismatch = not are_names_equal(entry.artist, artist)
             album_mismatch = not are_names_equal(entry.album, album)
@@ -127,11 +253,13 @@ class AlbumCacheService:
                     entry.artist,
                     entry.album,
                 )
+                self.metrics.record_miss(_CONTENT_TYPE, MissReason.COLLISION, started)
                 return None
 
             if self._is_entry_expired(entry):
                 self.logger.debug("Album year cache expired: %s - %s", artist, album)
-                del self.album_years_cache[key]
+                self._remove(key)
+                self.metrics.record_miss(_CONTENT_TYPE, MissReason.EXPIRED, started)
                 return None
 
             self.logger.debug(
@@ -141,8 +269,128 @@ class AlbumCacheService:
                 entry.year,
                 entry.confidence,
             )
+            self.metrics.record_hit(_CONTENT_TYPE, started)
             return entry
 
+    async def get_album_year_entries_bulk(self, albums: Iterable[tuple[str, str]]) -> dict[tuple[str, str], AlbumCacheEntry]:
+        """Get full album cache entries for many albums under one lock acquisition.
+
+        Keys are hashed before taking the lock, SQLite store reads are batched
+        into one query, and expired entries are removed together.
+
+        Args:
+            albums: (artist, album) pairs
+
+        Returns:
+            Non-expired entries keyed by requested (artist, album) pair; misses
+            and hash collisions are left out
+        """
+        await self._warmup.wait()
+        started = time.perf_counter()
+        keys = {album_key: UnifiedHashService.hash_album_key(*album_key) for album_key in albums}
+        entries: dict[tuple[str, str], AlbumCacheEntry] = {}
+        expired: list[str] = []
+        collisions = 0
+
+        async with self._cache_lock:
+            if self._store is not None and not self._fully_loaded:
+                unread = [key for key in keys.values() if key not in self.album_years_cache and not self._store_is_stale(key)]
+                if unread:
+                    self.album_years_cache.update(await asyncio.to_thread(self._store.get_album_entries, unread))
+
+            for (artist, album), key in keys.items():
+                entry = self.album_years_cache.get(key)
+                if entry is None:
+                    continue
+                # Skip true hash collisions
+                if not (are_names_equal(entry.artist, artist) and are_names_equal(entry.album, album)):
+                    collisions += 1
+                    continue
+                if self._is_entry_expired(entry):
+                    expired.append(key)
+                    continue
+                entries[artist, album] = entry
+
+            for key in expired:
+                self._remove(key)
+
+        absent = len(keys) - len(entries) - len(expired) - collisions
+        misses = {MissReason.ABSENT: absent, MissReason.EXPIRED: len(expired), MissReason.COLLISION: collisions}
+        self.metrics.record_batch(_CONTENT_TYPE, started, len(entries), misses)
+        self.logger.debug("Album year bulk lookup: %d of %d cached, %d expired", len(entries), len(keys), len(expired))
+        return entries
+
+    async def find_similar_album_year_entry(
+        self,
+        artist: str,
+        album: str,
+        *,
+        min_similarity: float,
+        limit: int = 5,
+    ) -> AlbumCacheEntry | None:
+        """Get the cache entry of the most similar cached album by the same artist.
+
+        Resolves near-miss names ("Album (Deluxe Edition)" vs "Album",
+        punctuation variants) that an exact lookup misses. Edition segments
+        are ignored and album names with different numbers never match.
+
+        Args:
+            artist: Artist name
+            album: Album name
+            min_similarity: Minimum trigram similarity (0.0-1.0)
+            limit: Maximum number of candidates checked
+
+        Returns:
+            Most similar non-expired AlbumCacheEntry, or None
+
+        """
+        await self._warmup.wait()
+        started = time.perf_counter()
+        async with self._cache_lock:
+            if self._album_indexes is None:
+                await self._load_all_from_store()
+                self._album_indexes = self._build_album_indexes()
+
+            index = self._album_indexes.get(normalize_for_matching(artist))
+            if index is None:
+                self.metrics.record_miss(_NEAR_MATCH_CONTENT_TYPE, MissReason.ABSENT, started)
+                return None
+
+            for match in index.search(album, limit=limit, min_similarity=min_similarity):
+                entry = self.album_years_cache.get(match.value)
+                # Index may still hold keys removed on expiry
+                if entry is None or self._is_entry_expired(entry):
+                    continue
+                self.logger.debug(
+                    "Album year near match: %s - %s ~ %s = %s (similarity %.2f)",
+                    artist,
+                    album,
+                    entry.album,
+                    entry.year,
+                    match.similarity,
+                )
+                self.metrics.record_hit(_NEAR_MATCH_CONTENT_TYPE, started)
+                return entry
+            self.metrics.record_miss(_NEAR_MATCH_CONTENT_TYPE, MissReason.ABSENT, started)
+            return None
+
+    def _build_album_indexes(self) -> dict[str, TrigramIndex[str]]:
+        """Index all cached album names per normalized artist."""
+        self._album_indexes = {}
+        for key, entry in self.album_years_cache.items():
+            self._index_album(key, entry)
+        return self._album_indexes
+
+    def _index_album(self, key: str, entry: AlbumCacheEntry) -> None:
+        """Add an entry to its artist's album index once the indexes are built."""
+        if self._album_indexes is None:
+            return
+        artist_norm = normalize_for_matching(entry.artist)
+        if artist_norm not in self._album_indexes:
+            # Edition segments ("(Deluxe Edition)") are dropped from names and queries
+            self._album_indexes[artist_norm] = TrigramIndex(edition_insensitive_normalizer(self.config.cleaning.remaster_keywords))
+        self._album_indexes[artist_norm].add(entry.album, key)
+
     async def store_album_year(self, artist: str, album: str, year: str, confidence: int = 0) -> None:
         """Store album release year in cache.
 
@@ -152,6 +400,7 @@ class AlbumCacheService:
             year: Album release year
             confidence: Confidence score 0-100 (higher = more trustworthy)
         """
+        await self._warmup.wait()
         async with self._cache_lock:
             key = UnifiedHashService.hash_album_key(artist, album)
 
@@ -160,13 +409,17 @@ class AlbumCacheService:
             normalized_album = album.strip()
             normalized_year = year.strip()
 
-            self.album_years_cache[key] = AlbumCacheEntry(
+            entry = AlbumCacheEntry(
                 artist=normalized_artist,
                 album=normalized_album,
                 year=normalized_year,
                 timestamp=time.time(),
                 confidence=confidence,
             )
+            self.album_years_cache[key] = entry
+            if self._track_changes:
+                self._pending[key] = entry
+            self._index_album(key, entry)
             self.logger.debug(
                 "Stored album year: %s - %s = %s (confidence %d%%)",
                 normalized_artist,
@@ -182,22 +435,46 @@ class AlbumCacheService:
             artist: Artist name
             album: Album name
         """
+        await self._warmup.wait()
         async with self._cache_lock:
             key = UnifiedHashService.hash_album_key(artist, album)
 
-            if key in self.album_years_cache:
-                del self.album_years_cache[key]
+            if self._lookup(key) is not None:
+                self._remove(key)
+                if self._album_indexes is not None and (index := self._album_indexes.get(normalize_for_matching(artist))):
+                    index.discard(key)
                 self.logger.info("Invalidated album cache: %s - %s", artist, album)
+            elif self._file_lock is not None:
+                # Another process may have saved it since this one last merged
+                self._pending[key] = None
 
     async def invalidate_all(self) -> None:
         """Clear all album cache entries."""
+        await self._warmup.wait()
         async with self._cache_lock:
-            count = len(self.album_years_cache)
+            count = len(self.album_years_cache) if self._store is None else await asyncio.to_thread(self._store.album_count)
             self.album_years_cache.clear()
+            self._album_indexes = None
+            if self._track_changes:
+                # Nothing left to read from the store; it (or the shared CSV) is emptied on the next save
+                self._pending.clear()
+                self._clear_pending = True
+                self._fully_loaded = True
             self.logger.info("Cleared all album cache entries (%d items)", count)
 
     async def save_to_disk(self) -> None:
-        """Save album cache to CSV file."""
+        """Save album cache to CSV file (or the changed entries to the SQLite store)."""
+        await self._warmup.wait()
+        started = time.perf_counter()
+        if self._store is not None:
+            await self._save_to_store(self._store)
+            self.metrics.record_persist(started)
+            return
+        if self._file_lock is not None:
+            await self._save_shared(self._file_lock)
+            self.metrics.record_persist(started)
+            return
+
         if not self.album_years_cache:
             self.logger.debug("Album cache is empty, skipping save")
             return
@@ -221,6 +498,86 @@ class AlbumCacheService:
 
         # Run in thread executor to avoid blocking
         await asyncio.get_running_loop().run_in_executor(None, blocking_save)
+        self.metrics.record_persist(started)
+
+    async def _save_to_store(self, store: SqliteCacheStore) -> None:
+        """Write entries changed since the last save in one transaction."""
+        async with self._save_lock:
+            if not self._pending and not self._clear_pending:
+                return
+            pending, clear = self._pending, self._clear_pending
+            self._pending, self._clear_pending = {}, False
+            self._saving, self._saving_clear = pending, clear
+            upserts = {key: entry for key, entry in pending.items() if entry is not None}
+            deletes = [key for key, entry in pending.items() if entry is None]
+            try:
+                await asyncio.to_thread(store.write_album_entries, upserts, deletes, clear=clear)
+            except sqlite3.Error as e:
+                # Keep the batch for the next save; changes made meanwhile are newer
+                self._pending = pending | self._pending
+                self._clear_pending = self._clear_pending or clear
+                self.logger.exception("Failed to save album cache to %s: %s", store.path, e)
+                raise
+            finally:
+                self._saving, self._saving_clear = {}, False
+        self.logger.info("Album cache saved to [cyan]%s[/cyan] (%d stored, %d removed)", store.path.name, len(upserts), len(deletes))
+
+    async def _save_shared(self, file_lock: CacheFileLock) -> None:
+        """Merge the changes since the last save into the CSV other processes also write.
+
+        Under the file lock: re-read the CSV, apply this process's stores and
+        removals on top (the newer entry wins when both processes stored an
+        album), adopt the result in memory and write it back.
+        """
+        loop = asyncio.get_running_loop()
+        async with file_lock:
+            try:
+                on_disk = await loop.run_in_executor(None, self._read_csv_for_merge)
+            except (OSError, UnicodeDecodeError, csv.Error, ValueError) as e:
+                # Unreadable CSV: keep this process's view rather than dropping entries
+                self.logger.warning("Could not read album cache %s for merging, overwriting it: %s", self.album_years_cache_file, e)
+                on_disk = dict(self.album_years_cache)
+
+            pending, clear = self._pending, self._clear_pending
+            self._pending, self._clear_pending = {}, False
+            merged = {} if clear else on_disk
+            for key, entry in pending.items():
+                if entry is None:
+                    merged.pop(key, None)
+                elif (stored := merged.get(key)) is None or entry.timestamp >= stored.timestamp:
+                    merged[key] = entry
+            adopted = len(merged.keys() - self.album_years_cache.keys())
+            self.album_years_cache.clear()
+            self.album_years_cache.update(merged)
+            self._album_indexes = None
+            items = list(merged.values())
+            if not pending and not clear:
+                # Nothing to write: only adopted what other runs saved
+                return
+
+            def blocking_save() -> None:
+                ensure_directory(str(self.album_years_cache_file.parent))
+                self._write_csv_data(str(self.album_years_cache_file), items)
+
+            try:
+                await loop.run_in_executor(None, blocking_save)
+            except (OSError, UnicodeError) as e:
+                # Keep the batch for the next save; changes made meanwhile are newer
+                self._pending = pending | self._pending
+                self._clear_pending = self._clear_pending or clear
+                self.logger.exception("Failed to save album cache: %s", e)
+                raise
+        self.logger.info(
+            "Album cache merged into [cyan]%s[/cyan] (%d entries, %d changed here, %d adopted from other runs)",
+            self.album_years_cache_file.name,
+            len(items),
+            len(pending),
+            adopted,
+        )
+
+    def _read_csv_for_merge(self) -> dict[str, AlbumCacheEntry]:
+        """Read the CSV for a shared save, raising on read errors (blocking)."""
+        return self._read_csv_file(strict=True) if self.album_years_cache_file.exists() else {}
 
     async def _load_album_years_cache(self) -> None:
         """Load album years cache from CSV file."""
@@ -235,10 +592,14 @@ class AlbumCacheService:
         # Run in thread executor to avoid blocking
         loaded_cache = await asyncio.get_running_loop().run_in_executor(None, blocking_load)
         self.album_years_cache.update(loaded_cache)
+        self._album_indexes = None
 
-    def _read_csv_file(self) -> dict[str, AlbumCacheEntry]:
+    def _read_csv_file(self, *, strict: bool = False) -> dict[str, AlbumCacheEntry]:
         """Read and parse CSV file containing album years data.
 
+        Args:
+            strict: Raise read errors instead of logging them and returning no entries
+
         Returns:
             Dictionary mapping hash keys to (artist, album, year) tuples
         """
@@ -258,6 +619,8 @@ class AlbumCacheService:
             self.logger.info("Loaded %d album entries from [cyan]%s[/cyan]", len(album_data), self.album_years_cache_file.name)
 
         except (OSError, UnicodeDecodeError, csv.Error) as e:
+            if strict:
+                raise
             self.logger.exception("Error reading album cache file %s: %s", self.album_years_cache_file, e)
 
         return album_data
@@ -392,16 +755,22 @@ class AlbumCacheService:
         """Get album cache statistics.
 
         Returns:
-            Dictionary containing cache statistics
+            Dictionary containing cache statistics; while a lazy warm-up is
+            still loading, ``warming_up`` is True and the counts cover only
+            the data applied so far
         """
+        warming_up = self._warmup.poll()
         ttl_seconds = self.policy.ttl_seconds
+        cache_file = self.album_years_cache_file if self._store is None else self._store.path
         return {
-            "total_albums": len(self.album_years_cache),
-            "cache_file": str(self.album_years_cache_file),
-            "cache_file_exists": self.album_years_cache_file.exists(),
+            "total_albums": len(self.album_years_cache) if self._store is None else self._store.album_count(),
+            "cache_file": str(cache_file),
+            "cache_file_exists": cache_file.exists(),
             "content_type": CacheContentType.ALBUM_YEAR.value,
             "ttl_policy": ttl_seconds,
             "persistent": ttl_seconds >= self.cache_config.INFINITE_TTL,
+            "metrics": self.metrics.summary(),
+            "warming_up": warming_up,
         }
 
     def _is_entry_expired(self, entry: AlbumCacheEntry) -> bool:
@@ -4,10 +4,12 @@ This module provides a dedicated cache service for storing and retrieving
 external API responses (Spotify, Last.fm, etc.) with JSON persistence.
 
 Key Features:
-- JSON-based persistence for API response data
+- JSON-based persistence for API response data (or an optional SQLite store)
 - Content-aware TTL management (eternal for successful responses, retry TTL for failures)
 - Integration with SmartCacheConfig for intelligent caching policies
 - Automatic cache invalidation when tracks are removed from library
+- Normalized (artist, album) index for per-album and per-delta invalidation
+- Expiry index of results with a finite TTL, so cleanup only touches expired results
 """
 
 from __future__ import annotations
@@ -15,30 +17,46 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import sqlite3
+import time
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from core.logger import LogFormat, ensure_directory, get_full_log_path
-from core.models.normalization import are_names_equal
+from core.models.normalization import normalize_for_matching
 from core.models.track_models import CachedApiResult
+from core.tracks.track_delta import has_identity_changed
 from services.cache.cache_config import CacheContentType, CacheEvent, CacheEventType, EventDrivenCacheManager, SmartCacheConfig
+from services.cache.expiry import ExpiryIndex
+from services.cache.file_lock import CacheFileLock
 from services.cache.hash_service import UnifiedHashService
+from services.cache.instrumentation import CacheTierMetrics, MissReason
+from services.cache.warmup import CacheWarmup
 
 if TYPE_CHECKING:
-    from core.models.track_models import AppConfig
+    from collections.abc import Iterable, Mapping
+
+    from core.models.track_models import AppConfig, TrackDict
+    from core.tracks.track_delta import TrackDelta
+    from services.cache.sqlite_store import SqliteCacheStore
 
 
 class ApiCacheService:
     """Specialized cache service for external API responses with JSON persistence.
 
+    With a SQLite store, ``api_cache`` holds only the results read or changed
+    during the run: lookups fall back to the store by key, and saves write
+    the results changed since the previous save in one transaction.
+
     Args:
         config: Typed application configuration
         logger: Optional logger instance
+        store: Optional SQLite store replacing the JSON file
 
     """
 
-    def __init__(self, config: AppConfig, logger: logging.Logger | None = None) -> None:
+    def __init__(self, config: AppConfig, logger: logging.Logger | None = None, store: SqliteCacheStore | None = None) -> None:
         self.config = config
         self.logger = logger or logging.getLogger(__name__)
         self.cache_config = SmartCacheConfig(config)
@@ -47,6 +65,14 @@ class ApiCacheService:
         # API cache: {hash_key: CachedApiResult}
         self.api_cache: dict[str, CachedApiResult] = {}
 
+        # Normalized (artist, album) -> hash keys of that album's results in api_cache
+        self._album_keys: dict[tuple[str, str], set[str]] = {}
+
+        # Expiry times of results with a finite TTL (failed lookups), and the number
+        # of successful results in api_cache, both kept up to date by _put/_unindex
+        self._expiry = ExpiryIndex()
+        self._successful_count = 0
+
         # Background tasks to prevent garbage collection
         self._background_tasks: set[asyncio.Task[Any]] = set()
         self._max_background_tasks = 100
@@ -58,6 +84,27 @@ class ApiCacheService:
         # Cache file path
         self.api_cache_file = Path(get_full_log_path(config, "api_cache_file", "cache/cache.json"))
 
+        # Shared JSON (caching.shared): saves merge with what other processes wrote under a file lock
+        shared = config.caching.shared
+        self._file_lock = CacheFileLock(self.api_cache_file, shared.lock_timeout_seconds) if shared.enabled and store is None else None
+
+        # SQLite backend or shared JSON: changes not yet written ({hash_key: result, or None if removed})
+        # and whether the table/file is cleared on the next save
+        self._store = store
+        self._track_changes = store is not None or self._file_lock is not None
+        self._pending: dict[str, CachedApiResult | None] = {}
+        self._clear_pending = False
+        # The batch a store save is writing (reads of its keys would see the old rows until it commits)
+        self._saving: dict[str, CachedApiResult | None] = {}
+        self._saving_clear = False
+        self._save_lock = asyncio.Lock()
+
+        # Background load of the JSON file (or JSON import into the store) with lazy warm-up
+        self._warmup: CacheWarmup[dict[str, CachedApiResult]] = CacheWarmup("ApiCacheService", self.logger)
+
+        # Lookup outcomes and lookup/save latencies
+        self.metrics = CacheTierMetrics("api")
+
         # Register for cache events
         self._register_event_handlers()
 
@@ -136,13 +183,128 @@ class ApiCacheService:
                     f"Track {event.track_id} identity changed, invalidating cache for: {artist} - {album}",
                 )
 
-    async def initialize(self) -> None:
-        """Initialize API cache by loading data from disk."""
+    async def initialize(self, *, lazy: bool = False) -> None:
+        """Initialize API cache by loading data from disk.
+
+        Args:
+            lazy: Load in a background thread and return immediately; operations
+                wait for the load on first use and expired entries are cleaned up
+                in the background afterwards
+
+        """
         self.logger.info("Initializing %s...", LogFormat.entity("ApiCacheService"))
+        if lazy:
+            self._warmup.start(self._load_blocking, self._apply_loaded)
+            task = asyncio.create_task(self._cleanup_after_warmup())
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+            self.logger.info("%s warming up in the background", LogFormat.entity("ApiCacheService"))
+            return
+        if self._store is not None:
+            await self._import_json_into_store(self._store)
+            await self.cleanup_expired()
+            total, _ = await asyncio.to_thread(self._store.api_counts)
+            self.logger.info("%s initialized with %d entries in [cyan]%s[/cyan]", LogFormat.entity("ApiCacheService"), total, self._store.path.name)
+            return
         await self._load_api_cache()
         await self.cleanup_expired()
         self.logger.info("%s initialized with %d entries (after cleanup)", LogFormat.entity("ApiCacheService"), len(self.api_cache))
 
+    async def _import_json_into_store(self, store: SqliteCacheStore) -> None:
+        """Import the JSON cache into an empty store (one-shot migration)."""
+        total, _ = await asyncio.to_thread(store.api_counts)
+        if total or not self.api_cache_file.exists():
+            return
+        await self._load_api_cache()
+        loaded, self.api_cache = self.api_cache, {}
+        self._clear_indexes()
+        await asyncio.to_thread(store.write_api_results, loaded)
+        self.logger.info("Imported %d API cache entries from %s into SQLite", len(loaded), self.api_cache_file)
+
+    def _load_blocking(self) -> dict[str, CachedApiResult]:
+        """Read the JSON file, or import it into an empty store (runs in the warm-up thread)."""
+        if not self.api_cache_file.exists():
+            return {}
+        if self._store is None:
+            return self._read_json_file()
+        if not self._store.api_counts()[0]:
+            loaded = self._read_json_file()
+            self._store.write_api_results(loaded)
+            self.logger.info("Imported %d API cache entries from %s into SQLite", len(loaded), self.api_cache_file)
+        return {}
+
+    def _apply_loaded(self, loaded: dict[str, CachedApiResult]) -> None:
+        """Install results loaded by the warm-up (on the event loop thread)."""
+        for key, cached_result in loaded.items():
+            self._put(key, cached_result)
+
+    async def _cleanup_after_warmup(self) -> None:
+        """Remove expired entries once the background warm-up is applied."""
+        try:
+            await self._warmup.wait()
+            await self.cleanup_expired()
+        except (OSError, ValueError, sqlite3.Error) as e:
+            self.logger.warning("Background API cache cleanup failed: %s", e)
+
+    async def wait_for_warmup(self) -> None:
+        """Wait until a background warm-up started by ``initialize(lazy=True)`` is applied."""
+        await self._warmup.wait()
+
+    def _store_is_stale(self, key: str) -> bool:
+        """Whether the store's row for a key is outdated by a change not yet committed."""
+        return self._clear_pending or self._saving_clear or key in self._pending or key in self._saving
+
+    def _lookup(self, key: str) -> CachedApiResult | None:
+        """Get a result from memory, reading it from the store on first access."""
+        cached_result = self.api_cache.get(key)
+        if cached_result is None and self._store is not None and not self._store_is_stale(key):
+            cached_result = self._store.get_api_result(key)
+            if cached_result is not None:
+                self._put(key, cached_result)
+        return cached_result
+
+    @staticmethod
+    def _album_key(artist: str, album: str) -> tuple[str, str]:
+        """Index key of an album (names compared like ``are_names_equal``)."""
+        return normalize_for_matching(artist), normalize_for_matching(album)
+
+    def _put(self, key: str, cached_result: CachedApiResult) -> None:
+        """Put a result in memory and in the album and expiry indexes."""
+        if (previous := self.api_cache.get(key)) is not None:
+            self._unindex(key, previous)
+        self.api_cache[key] = cached_result
+        self._album_keys.setdefault(self._album_key(cached_result.artist, cached_result.album), set()).add(key)
+        content_type = self._content_type(cached_result)
+        ttl_seconds = self.cache_config.get_policy(content_type).ttl_seconds
+        if ttl_seconds < self.cache_config.INFINITE_TTL:
+            self._expiry.schedule(key, cached_result.timestamp + ttl_seconds)
+        if content_type is CacheContentType.SUCCESSFUL_API_METADATA:
+            self._successful_count += 1
+
+    def _unindex(self, key: str, cached_result: CachedApiResult) -> None:
+        """Drop a result's key from the album and expiry indexes."""
+        album_key = self._album_key(cached_result.artist, cached_result.album)
+        if (keys := self._album_keys.get(album_key)) is not None:
+            keys.discard(key)
+            if not keys:
+                del self._album_keys[album_key]
+        self._expiry.discard(key)
+        if self._content_type(cached_result) is CacheContentType.SUCCESSFUL_API_METADATA:
+            self._successful_count -= 1
+
+    def _clear_indexes(self) -> None:
+        """Empty the album and expiry indexes (after emptying api_cache)."""
+        self._album_keys.clear()
+        self._expiry.clear()
+        self._successful_count = 0
+
+    def _remove(self, key: str) -> None:
+        """Drop a result from memory and, with a store or shared JSON, from disk on the next save."""
+        if (cached_result := self.api_cache.pop(key, None)) is not None:
+            self._unindex(key, cached_result)
+        if self._track_changes:
+            self._pending[key] = None
+
     async def get_cached_result(self, artist: str, album: str, source: str) -> CachedApiResult | None:
         """Get cached API result.
 
@@ -154,24 +316,38 @@ class ApiCacheService:
         Returns:
             Cached API result if found and valid, None otherwise
         """
+        await self._warmup.wait()
+        started = time.perf_counter()
         async with self._cache_lock:
             key = UnifiedHashService.hash_api_key(artist, album, source)
 
-            if key not in self.api_cache:
+            cached_result = self._lookup(key)
+            if cached_result is None:
                 self.logger.debug("API cache miss: %s - %s (%s)", artist, album, source)
+                self.metrics.record_miss(source, MissReason.ABSENT, started)
                 return None
 
-            cached_result = self.api_cache[key]
-
             # Check TTL based on content type
             if self._is_cache_expired(cached_result):
                 self.logger.debug("API cache expired: %s - %s (%s)", artist, album, source)
-                del self.api_cache[key]
+                self._remove(key)
+                self.metrics.record_miss(source, MissReason.EXPIRED, started)
                 return None
 
             self.logger.debug("API cache hit: %s - %s (%s)", artist, album, source)
+            if self._content_type(cached_result) is CacheContentType.FAILED_API_LOOKUP:
+                # A cached failure still spares the request, but yields no year
+                self.metrics.record_miss(source, MissReason.NEGATIVE, started)
+            else:
+                self.metrics.record_hit(source, started)
             return cached_result
 
+    @staticmethod
+    def _content_type(cached_result: CachedApiResult) -> CacheContentType:
+        """Content type of a cached result: successful if it has a year."""
+        has_year = cached_result.year is not None and cached_result.year.strip()
+        return CacheContentType.SUCCESSFUL_API_METADATA if has_year else CacheContentType.FAILED_API_LOOKUP
+
     def _is_cache_expired(self, cached_result: CachedApiResult) -> bool:
         """Check if cached result is expired based on content type.
 
@@ -182,11 +358,7 @@ class ApiCacheService:
             True if expired, False otherwise
         """
         # Successful results are eternal (immutable data like release years)
-        # Determine success by checking if we have a year
-        has_year = cached_result.year is not None and cached_result.year.strip()
-        content_type = CacheContentType.SUCCESSFUL_API_METADATA if has_year else CacheContentType.FAILED_API_LOOKUP
-
-        policy = self.cache_config.get_policy(content_type)
+        policy = self.cache_config.get_policy(self._content_type(cached_result))
 
         # Infinite TTL for successful API metadata
         if policy.ttl_seconds >= self.cache_config.INFINITE_TTL:
@@ -217,6 +389,7 @@ class ApiCacheService:
             data: API response data (if successful).
             metadata: Additional metadata to store.
         """
+        await self._warmup.wait()
         key = UnifiedHashService.hash_api_key(artist, album, source)
 
         # Extract year from data if available (explicit None check to handle falsy values like 0 or empty string)
@@ -241,7 +414,9 @@ class ApiCacheService:
         )
 
         async with self._cache_lock:
-            self.api_cache[key] = cached_result
+            self._put(key, cached_result)
+            if self._track_changes:
+                self._pending[key] = cached_result
 
         self.logger.debug("Stored API result: %s - %s (%s) success=%s", artist, album, source, success)
 
@@ -252,50 +427,123 @@ class ApiCacheService:
             artist: The artist name for cache key generation.
             album: The album name for cache key generation.
         """
-        async with self._cache_lock:
-            # Find all keys for this artist/album across all sources
-            keys_to_remove: list[str] = []
+        removed = await self.invalidate_for_albums([(artist, album)])
+        if removed:
+            self.logger.info("Invalidated %d API cache entries for %s - %s", removed, artist, album)
 
-            keys_to_remove.extend(
-                key
-                for key, cached_result in self.api_cache.items()
-                if are_names_equal(cached_result.artist, artist) and are_names_equal(cached_result.album, album)
-            )
-            # Remove found entries
+    async def invalidate_for_albums(self, albums: Iterable[tuple[str, str]]) -> int:
+        """Invalidate all sources' entries for many albums under one lock.
+
+        Args:
+            albums: (artist, album) pairs; names are compared normalized
+
+        Returns:
+            Number of removed entries
+        """
+        await self._warmup.wait()
+        album_keys = {self._album_key(artist, album) for artist, album in albums}
+        if not album_keys:
+            return 0
+
+        async with self._cache_lock:
+            keys_to_remove = {key for album_key in album_keys for key in self._album_keys.get(album_key, ())}
+            if self._store is not None and not self._clear_pending:
+                stored_keys = await asyncio.to_thread(self._store.api_keys_for_albums, album_keys)
+                keys_to_remove.update(key for key in stored_keys if not self._store_is_stale(key))
             for key in keys_to_remove:
-                del self.api_cache[key]
+                self._remove(key)
+        return len(keys_to_remove)
+
+    async def invalidate_for_delta(self, delta: TrackDelta, previous_tracks: Mapping[str, TrackDict], current_tracks: Mapping[str, TrackDict]) -> int:
+        """Invalidate entries of albums a library delta removed tracks from or renamed.
+
+        Covers what ``emit_track_removed`` and ``emit_track_modified`` do per
+        track, as one batch: the old (artist, album) of every removed track
+        and of every updated track whose artist or album changed.
 
-        if keys_to_remove:
-            self.logger.info("Invalidated %d API cache entries for %s - %s", len(keys_to_remove), artist, album)
+        Args:
+            delta: Library delta
+            previous_tracks: Tracks before the delta (snapshot), keyed by ID
+            current_tracks: Tracks after the delta, keyed by ID (empty to only handle removals)
+
+        Returns:
+            Number of removed entries
+        """
+        albums: set[tuple[str, str]] = set()
+        for track_id in delta.removed_ids:
+            if (stored := previous_tracks.get(track_id)) and stored.artist and stored.album:
+                albums.add((stored.artist, stored.album))
+        for track_id in delta.updated_ids:
+            stored, current = previous_tracks.get(track_id), current_tracks.get(track_id)
+            if stored and current and stored.artist and stored.album and has_identity_changed(current, stored):
+                albums.add((stored.artist, stored.album))
+
+        removed = await self.invalidate_for_albums(albums)
+        if albums:
+            self.logger.info("Invalidated %d API cache entries for %d albums changed in the library", removed, len(albums))
+        return removed
 
     async def invalidate_all(self) -> None:
         """Clear all API cache entries."""
+        await self._warmup.wait()
         async with self._cache_lock:
-            count = len(self.api_cache)
+            count = len(self.api_cache) if self._store is None else (await asyncio.to_thread(self._store.api_counts))[0]
             self.api_cache.clear()
+            self._clear_indexes()
+            if self._track_changes:
+                # Nothing left to read from the store; it (or the shared JSON) is emptied on the next save
+                self._pending.clear()
+                self._clear_pending = True
         self.logger.info("Cleared all API cache entries (%d items)", count)
 
     async def cleanup_expired(self) -> int:
         """Remove expired entries from API cache.
 
+        Pops due keys from the expiry index instead of scanning every result.
+
         Returns:
             Number of entries removed
         """
+        await self._warmup.wait()
         async with self._cache_lock:
-            expired_keys: list[str] = []
-
-            expired_keys.extend(key for key, cached_result in self.api_cache.items() if self._is_cache_expired(cached_result))
+            expired_keys = self._expiry.pop_expired(time.time())
             # Remove expired entries
             for key in expired_keys:
-                del self.api_cache[key]
+                self._remove(key)
+            removed = len(expired_keys)
+            if self._store is not None and not self._clear_pending:
+                successful_cutoff, failed_cutoff = self._expiry_cutoffs()
+                removed += await asyncio.to_thread(
+                    self._store.delete_expired_api_results, successful_cutoff=successful_cutoff, failed_cutoff=failed_cutoff
+                )
 
-        if expired_keys:
-            self.logger.info("Cleaned up %d expired API cache entries", len(expired_keys))
+        if removed:
+            self.logger.info("Cleaned up %d expired API cache entries", removed)
 
-        return len(expired_keys)
+        return removed
+
+    def _expiry_cutoffs(self) -> tuple[float | None, float | None]:
+        """Timestamps before which successful and failed results expire (None = never)."""
+        now = time.time()
+        cutoffs: list[float | None] = []
+        for content_type in (CacheContentType.SUCCESSFUL_API_METADATA, CacheContentType.FAILED_API_LOOKUP):
+            ttl_seconds = self.cache_config.get_policy(content_type).ttl_seconds
+            cutoffs.append(None if ttl_seconds >= self.cache_config.INFINITE_TTL else now - ttl_seconds)
+        return cutoffs[0], cutoffs[1]
 
     async def save_to_disk(self) -> None:
-        """Save API cache to JSON file."""
+        """Save API cache to JSON file (or the changed results to the SQLite store)."""
+        await self._warmup.wait()
+        started = time.perf_counter()
+        if self._store is not None:
+            await self._save_to_store(self._store)
+            self.metrics.record_persist(started)
+            return
+        if self._file_lock is not None:
+            await self._save_shared(self._file_lock)
+            self.metrics.record_persist(started)
+            return
+
         if not self.api_cache:
             self.logger.debug("API cache is empty, deleting cache file if exists")
             # Delete cache file to prevent loading stale data on next initialization
@@ -307,37 +555,116 @@ class ApiCacheService:
         def blocking_save() -> None:
             """Synchronous save operation for thread executor."""
             try:
-                # Ensure directory exists
-                ensure_directory(str(self.api_cache_file.parent))
-
-                # Serialize cache data
-                def serialize_model(model: CachedApiResult) -> dict[str, Any]:
-                    """Convert CachedApiResult to JSON-serializable dict."""
-                    return {
-                        "artist": model.artist,
-                        "album": model.album,
-                        "year": model.year,
-                        "source": model.source,
-                        "timestamp": model.timestamp,
-                        "ttl": model.ttl,
-                        "metadata": model.metadata,
-                        "api_response": model.api_response,
-                    }
-
-                cache_data = {key: serialize_model(result) for key, result in self.api_cache.items()}
-
-                # Write JSON file
-                with self.api_cache_file.open("w", encoding="utf-8") as file:
-                    json.dump(cache_data, file, indent=2, ensure_ascii=False)
-
-                self.logger.info("API cache saved to %s (%d entries)", self.api_cache_file, len(cache_data))
-
+                self._write_json_file(self.api_cache)
             except (OSError, TypeError, ValueError) as e:
                 self.logger.exception("Failed to save API cache: %s", e)
                 raise
 
         # Run in thread to avoid blocking
         await asyncio.to_thread(blocking_save)
+        self.metrics.record_persist(started)
+
+    def _write_json_file(self, results: Mapping[str, CachedApiResult]) -> None:
+        """Write results to the JSON cache file (blocking)."""
+        # Ensure directory exists
+        ensure_directory(str(self.api_cache_file.parent))
+
+        # Serialize cache data
+        def serialize_model(model: CachedApiResult) -> dict[str, Any]:
+            """Convert CachedApiResult to JSON-serializable dict."""
+            return {
+                "artist": model.artist,
+                "album": model.album,
+                "year": model.year,
+                "source": model.source,
+                "timestamp": model.timestamp,
+                "ttl": model.ttl,
+                "metadata": model.metadata,
+                "api_response": model.api_response,
+            }
+
+        cache_data = {key: serialize_model(result) for key, result in results.items()}
+
+        # Write JSON file
+        with self.api_cache_file.open("w", encoding="utf-8") as file:
+            json.dump(cache_data, file, indent=2, ensure_ascii=False)
+
+        self.logger.info("API cache saved to %s (%d entries)", self.api_cache_file, len(cache_data))
+
+    async def _save_shared(self, file_lock: CacheFileLock) -> None:
+        """Merge the changes since the last save into the JSON file other processes also write.
+
+        Under the file lock: re-read the file, apply this process's results and
+        removals on top (the newer result wins when both processes stored a
+        key), adopt the result in memory and write it back, so a lookup made by
+        one run is never repeated by the other.
+        """
+        async with file_lock:
+            try:
+                on_disk = await asyncio.to_thread(self._read_json_for_merge)
+            except (OSError, ValueError) as e:
+                # Unreadable file: keep this process's view rather than dropping results
+                self.logger.warning("Could not read API cache %s for merging, overwriting it: %s", self.api_cache_file, e)
+                on_disk = dict(self.api_cache)
+
+            pending, clear = self._pending, self._clear_pending
+            self._pending, self._clear_pending = {}, False
+            merged = {} if clear else on_disk
+            for key, result in pending.items():
+                if result is None:
+                    merged.pop(key, None)
+                elif (stored := merged.get(key)) is None or result.timestamp >= stored.timestamp:
+                    merged[key] = result
+            adopted = len(merged.keys() - self.api_cache.keys())
+            self.api_cache.clear()
+            self._clear_indexes()
+            for key, result in merged.items():
+                self._put(key, result)
+            if not pending and not clear:
+                # Nothing to write: only adopted what other runs saved
+                return
+
+            def blocking_save() -> None:
+                if merged:
+                    self._write_json_file(merged)
+                elif self.api_cache_file.exists():
+                    self.api_cache_file.unlink()
+
+            try:
+                await asyncio.to_thread(blocking_save)
+            except (OSError, TypeError, ValueError) as e:
+                # Keep the batch for the next save; changes made meanwhile are newer
+                self._pending = pending | self._pending
+                self._clear_pending = self._clear_pending or clear
+                self.logger.exception("Failed to save API cache: %s", e)
+                raise
+        self.logger.info("API cache merged (%d changed here, %d adopted from other runs)", len(pending), adopted)
+
+    def _read_json_for_merge(self) -> dict[str, CachedApiResult]:
+        """Read the JSON file for a shared save, raising on read errors (blocking)."""
+        return self._read_json_file(strict=True) if self.api_cache_file.exists() else {}
+
+    async def _save_to_store(self, store: SqliteCacheStore) -> None:
+        """Write results changed since the last save in one transaction."""
+        async with self._save_lock:
+            if not self._pending and not self._clear_pending:
+                return
+            pending, clear = self._pending, self._clear_pending
+            self._pending, self._clear_pending = {}, False
+            self._saving, self._saving_clear = pending, clear
+            upserts = {key: result for key, result in pending.items() if result is not None}
+            deletes = [key for key, result in pending.items() if result is None]
+            try:
+                await asyncio.to_thread(store.write_api_results, upserts, deletes, clear=clear)
+            except (sqlite3.Error, TypeError, ValueError) as e:
+                # Keep the batch for the next save; changes made meanwhile are newer
+                self._pending = pending | self._pending
+                self._clear_pending = self._clear_pending or clear
+                self.logger.exception("Failed to save API cache to %s: %s", store.path, e)
+                raise
+            finally:
+                self._saving, self._saving_clear = {}, False
+        self.logger.info("API cache saved to %s (%d stored, %d removed)", store.path, len(upserts), len(deletes))
 
     async def _load_api_cache(self) -> None:
         """Load API cache from JSON file."""
@@ -345,43 +672,50 @@ class ApiCacheService:
             self.logger.info("API cache file does not exist, starting with empty cache")
             return
 
-        def blocking_load() -> dict[str, CachedApiResult]:
-            """Synchronous load operation for thread executor."""
-            try:
-                with self.api_cache_file.open(encoding="utf-8") as file:
-                    cache_data = json.load(file)
-
-                cache_entries: dict[str, CachedApiResult] = {}
-
-                for key, item in cache_data.items():
-                    try:
-                        # Create CachedApiResult object with proper fields
-                        cached_result = CachedApiResult(
-                            artist=item["artist"],
-                            album=item["album"],
-                            year=item.get("year"),
-                            source=item["source"],
-                            timestamp=item.get("timestamp", 0.0),
-                            ttl=item.get("ttl"),
-                            metadata=item.get("metadata", {}),
-                            api_response=item.get("api_response"),
-                        )
-
-                        cache_entries[key] = cached_result
-
-                    except (KeyError, ValueError, TypeError) as e:
-                        self.logger.warning("Skipping invalid API cache entry %s: %s", key, e)
-
-                self.logger.info("Loaded %d API cache entries from %s", len(cache_entries), self.api_cache_file)
-                return cache_entries
+        # Run in thread to avoid blocking
+        loaded_cache = await asyncio.to_thread(self._read_json_file)
+        for key, cached_result in loaded_cache.items():
+            self._put(key, cached_result)
 
-            except (OSError, ValueError) as e:
-                self.logger.exception("Error loading API cache file %s: %s", self.api_cache_file, e)
-                return {}
+    def _read_json_file(self, *, strict: bool = False) -> dict[str, CachedApiResult]:
+        """Read and parse the JSON cache file (blocking).
 
-        # Run in thread to avoid blocking
-        loaded_cache = await asyncio.to_thread(blocking_load)
-        self.api_cache.update(loaded_cache)
+        Args:
+            strict: Raise read errors instead of logging them and returning no results
+        """
+        try:
+            with self.api_cache_file.open(encoding="utf-8") as file:
+                cache_data = json.load(file)
+
+            cache_entries: dict[str, CachedApiResult] = {}
+
+            for key, item in cache_data.items():
+                try:
+                    # Create CachedApiResult object with proper fields
+                    cached_result = CachedApiResult(
+                        artist=item["artist"],
+                        album=item["album"],
+                        year=item.get("year"),
+                        source=item["source"],
+                        timestamp=item.get("timestamp", 0.0),
+                        ttl=item.get("ttl"),
+                        metadata=item.get("metadata", {}),
+                        api_response=item.get("api_response"),
+                    )
+
+                    cache_entries[key] = cached_result
+
+                except (KeyError, ValueError, TypeError) as e:
+                    self.logger.warning("Skipping invalid API cache entry %s: %s", key, e)
+
+            self.logger.info("Loaded %d API cache entries from %s", len(cache_entries), self.api_cache_file)
+            return cache_entries
+
+        except (OSError, ValueError) as e:
+            if strict:
+                raise
+            self.logger.exception("Error loading API cache file %s: %s", self.api_cache_file, e)
+            return {}
 
     def emit_track_removed(self, track_id: str, artist: str, album: str) -> None:
         """Emit track removed event for cache invalidation.
@@ -436,19 +770,28 @@ class ApiCacheService:
         """Get API cache statistics.
 
         Returns:
-            Dictionary containing cache statistics
+            Dictionary containing cache statistics; while a lazy warm-up is
+            still loading, ``warming_up`` is True and the counts cover only
+            the data applied so far
         """
-        successful_results = [result for result in self.api_cache.values() if result.year is not None and result.year.strip()]
-        successful_count = len(successful_results)
-        failed_count = len(self.api_cache) - successful_count
+        warming_up = self._warmup.poll()
+        if self._store is not None:
+            total_count, successful_count = self._store.api_counts()
+        else:
+            total_count = len(self.api_cache)
+            successful_count = self._successful_count
+        failed_count = total_count - successful_count
+        cache_file = self.api_cache_file if self._store is None else self._store.path
 
         return {
-            "total_entries": len(self.api_cache),
+            "total_entries": total_count,
             "successful_responses": successful_count,
             "failed_lookups": failed_count,
-            "cache_file": str(self.api_cache_file),
-            "cache_file_exists": self.api_cache_file.exists(),
+            "cache_file": str(cache_file),
+            "cache_file_exists": cache_file.exists(),
             "successful_policy": self.cache_config.get_policy(CacheContentType.SUCCESSFUL_API_METADATA).ttl_seconds,
             "failed_policy": self.cache_config.get_policy(CacheContentType.FAILED_API_LOOKUP).ttl_seconds,
             "persistent": self.cache_config.is_persistent_cache(CacheContentType.SUCCESSFUL_API_METADATA),
+            "metrics": self.metrics.summary(),
+            "warming_up": warming_up,
         }
@@ -0,0 +1,118 @@
+"""Compact Bloom filter for fast negative membership checks.
+
+A ``BloomFilter`` answers "definitely not present" or "maybe present" for
+string keys. It never yields false negatives, so callers use it to rule out
+most keys before an expensive lookup and confirm the rare "maybe" against
+the real data. The filter cannot remove keys: owners rebuild it from their
+source of truth instead.
+
+The bit array is sized for the expected number of keys and the target
+false-positive rate. Bit positions come from one BLAKE2b digest split into
+two 64-bit halves (Kirsch-Mitzenmacher double hashing), and the filter
+round-trips through ``to_bytes``/``from_bytes`` for persistence.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import struct
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+__all__ = ["BloomFilter"]
+
+_MAGIC = b"BLM1"
+# Magic, hash count, bit count, key count
+_HEADER = struct.Struct("!4sBQQ")
+_MIN_BITS = 64
+
+
+class BloomFilter:
+    """Probabilistic set of strings with no false negatives.
+
+    Use ``for_capacity`` or ``from_keys`` to size a new filter.
+
+    Args:
+        num_bits: Size of the bit array
+        num_hashes: Bit positions set per key
+        bits: Existing bit array (restored filters)
+        count: Number of keys already in ``bits``
+
+    """
+
+    def __init__(self, num_bits: int, num_hashes: int, bits: bytes | None = None, count: int = 0) -> None:
+        self._num_bits = num_bits
+        self._num_hashes = num_hashes
+        self._bits = bytearray(bits) if bits is not None else bytearray((num_bits + 7) // 8)
+        self._count = count
+
+    @classmethod
+    def for_capacity(cls, capacity: int, error_rate: float = 0.01) -> BloomFilter:
+        """Create an empty filter sized for ``capacity`` keys at the given false-positive rate.
+
+        Raises:
+            ValueError: If ``error_rate`` is not between 0 and 1.
+
+        """
+        if not 0 < error_rate < 1:
+            msg = f"error_rate must be between 0 and 1, got {error_rate}"
+            raise ValueError(msg)
+        num_bits = max(_MIN_BITS, math.ceil(-max(capacity, 1) * math.log(error_rate) / math.log(2) ** 2))
+        # Optimal for a full filter; small filters get the extra bits as headroom rather than more hashes
+        return cls(num_bits, max(1, round(-math.log2(error_rate))))
+
+    @classmethod
+    def from_keys(cls, keys: Iterable[str], error_rate: float = 0.01) -> BloomFilter:
+        """Build a filter sized for exactly the given keys."""
+        keys = list(keys)
+        bloom = cls.for_capacity(len(keys), error_rate)
+        for key in keys:
+            bloom.add(key)
+        return bloom
+
+    def _positions(self, key: str) -> list[int]:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8])
+        second = int.from_bytes(digest[8:]) | 1
+        return [(first + i * second) % self._num_bits for i in range(self._num_hashes)]
+
+    def add(self, key: str) -> None:
+        """Add a key to the filter."""
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self._count += 1
+
+    def __contains__(self, key: object) -> bool:
+        """Whether the key may have been added (False is always exact)."""
+        if not isinstance(key, str):
+            return False
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+    def __len__(self) -> int:
+        """Number of keys added."""
+        return self._count
+
+    def to_bytes(self) -> bytes:
+        """Serialize the filter for persistence."""
+        return _HEADER.pack(_MAGIC, self._num_hashes, self._num_bits, self._count) + bytes(self._bits)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> BloomFilter:
+        """Restore a filter written by ``to_bytes``.
+
+        Raises:
+            ValueError: If the data is not a serialized filter.
+
+        """
+        if len(data) < _HEADER.size:
+            msg = "Bloom filter data is truncated"
+            raise ValueError(msg)
+        magic, num_hashes, num_bits, count = _HEADER.unpack_from(data)
+        bits = data[_HEADER.size :]
+        if magic != _MAGIC or num_hashes < 1 or num_bits < 1 or len(bits) != (num_bits + 7) // 8:
+            msg = "Bloom filter data is malformed"
+            raise ValueError(msg)
+        return cls(num_bits, num_hashes, bits, count)
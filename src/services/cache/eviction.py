@@ -0,0 +1,218 @@
+"""Size-aware eviction for the generic cache (Greedy-Dual-Size-Frequency).
+
+Generic cache values range from a few bytes (a year) to hundreds of
+kilobytes (a raw release list), so an entry count says little about memory
+use. ``GdsfEviction`` tracks the approximate size of every entry and picks
+eviction victims by GDSF priority::
+
+    priority = inflation + hits / size
+
+Small, frequently read entries are kept longest. ``inflation`` rises to the
+priority of each evicted entry, so entries that stop being read age out
+even when they are small (the recency part of the policy).
+
+Priorities live in a min-heap with lazy deletion: hits push a new heap item
+and superseded items are skipped when popped. Sizes and evictions are also
+summed per content type (the key namespace, e.g. ``tracks`` or
+``api_request:musicbrainz``) for cache statistics.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+from collections import Counter
+from typing import Any
+
+from pydantic import BaseModel
+
+__all__ = ["GdsfEviction", "content_type_of", "estimate_size"]
+
+# Items sized per long sequence; the rest are extrapolated from the sample
+_SIZE_SAMPLE = 32
+# Heap items per live entry (beyond a minimum) before superseded items are dropped
+_HEAP_SLACK = 2
+_MIN_HEAP_ITEMS = 64
+
+# Key prefixes of the generic cache's users, most specific first
+_KEY_NAMESPACES = ("api_request", "artist_start_year", "discogs_master", "discogs", "tracks")
+_OTHER_CONTENT = "other"
+
+
+def content_type_of(key_data: Any) -> str:
+    """Content type of a generic cache key, derived from its namespace prefix.
+
+    Args:
+        key_data: Key passed to the generic cache (before hashing)
+
+    Returns:
+        Namespace such as ``tracks`` or ``api_request:musicbrainz``, or ``other``
+
+    """
+    key = str(key_data)
+    for namespace in _KEY_NAMESPACES:
+        if key.startswith(namespace) and key[len(namespace) : len(namespace) + 1] in {"", "_", ":"}:
+            if namespace == "api_request" and (api := key[len(namespace) + 1 :].split("_", 1)[0]):
+                return f"{namespace}:{api}"
+            return namespace
+    return _OTHER_CONTENT
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate JSON-encoded size of a cached value in bytes.
+
+    Sequences longer than ``_SIZE_SAMPLE`` items are sized from an evenly
+    spaced sample, so sizing a full-library track list costs about as much
+    as sizing a few dozen tracks.
+
+    Args:
+        value: Cached value (JSON-like data or pydantic models)
+
+    Returns:
+        Estimated size in bytes (at least 1)
+
+    """
+    if value is None or isinstance(value, bool):
+        return 5
+    if isinstance(value, str):
+        return len(value) + 2
+    if isinstance(value, (int, float)):
+        return len(repr(value))
+    if isinstance(value, BaseModel):
+        value = value.__dict__
+    if isinstance(value, dict):
+        return 2 + sum(estimate_size(key) + estimate_size(item) + 2 for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        count = len(value)
+        if count <= _SIZE_SAMPLE:
+            return 2 + count + sum(estimate_size(item) for item in value)
+        step = count / _SIZE_SAMPLE
+        sampled = sum(estimate_size(value[int(i * step)]) for i in range(_SIZE_SAMPLE))
+        return 2 + count + sampled * count // _SIZE_SAMPLE
+    return max(1, len(str(value)))
+
+
+class GdsfEviction:
+    """GDSF priorities, entry sizes and per-content-type byte counts.
+
+    The owner keeps the entries themselves; this class only decides which
+    key to evict next and reports what was held and evicted.
+    """
+
+    def __init__(self) -> None:
+        self._sizes: dict[str, int] = {}
+        self._content_types: dict[str, str] = {}
+        self._hits: dict[str, int] = {}
+        self._priorities: dict[str, float] = {}
+        self._heap: list[tuple[float, int, str]] = []
+        self._sequence = itertools.count()
+        self._inflation = 0.0
+        self.bytes_held = 0
+        self._held_bytes: Counter[str] = Counter()
+        self._held_entries: Counter[str] = Counter()
+        self._evicted_bytes: Counter[str] = Counter()
+        self._evicted_entries: Counter[str] = Counter()
+
+    def content_type(self, key: str) -> str:
+        """Content type recorded for a key (``other`` if unknown)."""
+        return self._content_types.get(key, _OTHER_CONTENT)
+
+    def admit(self, key: str, size: int, content_type: str) -> None:
+        """Account a stored entry; re-storing a key counts as a hit.
+
+        Args:
+            key: Hashed cache key
+            size: Entry size in bytes (see ``estimate_size``)
+            content_type: Content type of the key (see ``content_type_of``)
+
+        """
+        hits = self._hits.get(key, 0) + 1
+        self._forget(key)
+        self._sizes[key] = size
+        self._content_types[key] = content_type
+        self._hits[key] = hits
+        self.bytes_held += size
+        self._held_bytes[content_type] += size
+        self._held_entries[content_type] += 1
+        self._prioritize(key)
+
+    def touch(self, key: str) -> None:
+        """Count a cache hit on a key."""
+        if key in self._sizes:
+            self._hits[key] += 1
+            self._prioritize(key)
+
+    def discard(self, key: str, *, evicted: bool = False) -> None:
+        """Stop accounting a removed key.
+
+        Args:
+            key: Hashed cache key
+            evicted: Whether the entry was evicted (counted in the eviction stats)
+
+        """
+        if evicted and key in self._sizes:
+            content_type = self._content_types[key]
+            self._evicted_bytes[content_type] += self._sizes[key]
+            self._evicted_entries[content_type] += 1
+        self._forget(key)
+        self._hits.pop(key, None)
+
+    def clear(self) -> None:
+        """Forget every entry (eviction totals are kept)."""
+        self._sizes.clear()
+        self._content_types.clear()
+        self._hits.clear()
+        self._priorities.clear()
+        self._heap.clear()
+        self.bytes_held = 0
+        self._held_bytes.clear()
+        self._held_entries.clear()
+
+    def pop_victim(self) -> str | None:
+        """Remove and return the key with the lowest priority (counted as evicted)."""
+        while self._heap:
+            priority, _, key = heapq.heappop(self._heap)
+            if self._priorities.get(key) != priority:
+                continue  # Superseded by a later hit or removed
+            self._inflation = priority
+            self.discard(key, evicted=True)
+            return key
+        return None
+
+    def stats_by_content_type(self) -> dict[str, dict[str, int]]:
+        """Entries and bytes held and evicted, per content type."""
+        content_types = sorted(set(self._held_entries) | set(self._evicted_entries))
+        return {
+            content_type: {
+                "entries": self._held_entries[content_type],
+                "bytes": self._held_bytes[content_type],
+                "evicted_entries": self._evicted_entries[content_type],
+                "evicted_bytes": self._evicted_bytes[content_type],
+            }
+            for content_type in content_types
+        }
+
+    @property
+    def evicted_bytes(self) -> int:
+        """Bytes evicted so far across content types."""
+        return sum(self._evicted_bytes.values())
+
+    def _prioritize(self, key: str) -> None:
+        priority = self._inflation + self._hits[key] / self._sizes[key]
+        self._priorities[key] = priority
+        heapq.heappush(self._heap, (priority, next(self._sequence), key))
+        if len(self._heap) > _HEAP_SLACK * len(self._priorities) + _MIN_HEAP_ITEMS:
+            self._heap = [(priority, sequence, key) for priority, sequence, key in self._heap if self._priorities.get(key) == priority]
+            heapq.heapify(self._heap)
+
+    def _forget(self, key: str) -> None:
+        size = self._sizes.pop(key, None)
+        if size is None:
+            return
+        content_type = self._content_types.pop(key)
+        self.bytes_held -= size
+        self._held_bytes[content_type] -= size
+        self._held_entries[content_type] -= 1
+        if not self._held_entries[content_type]:
+            del self._held_entries[content_type], self._held_bytes[content_type]
+        del self._priorities[key]
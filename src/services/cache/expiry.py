@@ -0,0 +1,92 @@
+"""Expiry index for cache entries with a TTL.
+
+Periodic cleanup used to scan every entry for an expired timestamp. An
+``ExpiryIndex`` keeps entries in a min-heap ordered by ``expires_at``, so
+cleanup pops only the entries that actually expired and counting expired
+entries visits only heap nodes that are already due: both cost stays flat
+as the cache grows.
+
+Rescheduled and discarded keys are not searched for in the heap; their old
+heap nodes go stale (lazy deletion) and are skipped when they surface. The
+heap is rebuilt from the live keys once stale nodes outnumber them.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+
+__all__ = ["ExpiryIndex"]
+
+# Rebuild the heap once it holds this many nodes per live key...
+_STALE_RATIO = 2
+# ...and at least this many nodes
+_MIN_REBUILD_SIZE = 1024
+
+
+class ExpiryIndex:
+    """Keys ordered by expiry time (Unix timestamp) in a lazily pruned min-heap."""
+
+    def __init__(self) -> None:
+        # (expires_at, sequence, key); the sequence number tells live nodes from stale ones
+        self._heap: list[tuple[float, int, str]] = []
+        # key -> (expires_at, sequence) of its live heap node
+        self._live: dict[str, tuple[float, int]] = {}
+        self._sequence = itertools.count()
+
+    def __len__(self) -> int:
+        """Number of scheduled keys."""
+        return len(self._live)
+
+    def __contains__(self, key: object) -> bool:
+        """Whether the key is scheduled."""
+        return key in self._live
+
+    def schedule(self, key: str, expires_at: float) -> None:
+        """Schedule a key to expire at ``expires_at``, replacing any previous time."""
+        sequence = next(self._sequence)
+        self._live[key] = (expires_at, sequence)
+        heapq.heappush(self._heap, (expires_at, sequence, key))
+        self._rebuild_if_stale()
+
+    def discard(self, key: str) -> None:
+        """Unschedule a key (no-op if it is not scheduled)."""
+        if self._live.pop(key, None) is not None:
+            self._rebuild_if_stale()
+
+    def clear(self) -> None:
+        """Unschedule all keys."""
+        self._heap.clear()
+        self._live.clear()
+
+    def pop_expired(self, now: float) -> list[str]:
+        """Unschedule and return the keys expiring at or before ``now``."""
+        expired: list[str] = []
+        while self._heap and self._heap[0][0] <= now:
+            expires_at, sequence, key = heapq.heappop(self._heap)
+            if self._live.get(key) == (expires_at, sequence):
+                del self._live[key]
+                expired.append(key)
+        return expired
+
+    def count_expired(self, now: float) -> int:
+        """Count scheduled keys expiring at or before ``now`` without removing them."""
+        heap = self._heap
+        count = 0
+        # Children never expire before their parent: descend only into due nodes
+        pending = [0] if heap else []
+        while pending:
+            index = pending.pop()
+            expires_at, sequence, key = heap[index]
+            if expires_at > now:
+                continue
+            if self._live.get(key) == (expires_at, sequence):
+                count += 1
+            pending.extend(child for child in (2 * index + 1, 2 * index + 2) if child < len(heap))
+        return count
+
+    def _rebuild_if_stale(self) -> None:
+        """Drop stale nodes once they dominate the heap."""
+        if len(self._heap) > max(_MIN_REBUILD_SIZE, _STALE_RATIO * len(self._live)):
+            self._heap = [(expires_at, sequence, key) for key, (expires_at, sequence) in self._live.items()]
+            heapq.heapify(self._heap)
@@ -0,0 +1,101 @@
+"""Advisory file lock for cache files shared between processes.
+
+With ``caching.shared.enabled`` the launchd daemon and manual CLI runs may
+use the same cache files at once. Each save takes an exclusive ``flock`` on
+a ``<file>.lock`` sidecar, re-reads what other processes wrote and writes
+the merge, so neither process loses the other's results.
+
+The lock is advisory: only processes that take it are serialized. It is
+released by the OS when its holder exits, so a crashed run never leaves a
+stale lock behind.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import fcntl
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import TextIO
+
+__all__ = ["CacheFileLock"]
+
+# Delay between attempts to take a lock held by another process
+_POLL_INTERVAL_SECONDS = 0.05
+
+
+class CacheFileLock:
+    """Exclusive cross-process lock guarding one cache file.
+
+    Use as ``async with lock:``; the lock is taken in a worker thread, so
+    waiting for another process never blocks the event loop. Holders in the
+    same process are serialized by an asyncio lock first.
+
+    Args:
+        path: Cache file the lock guards (the lock file is ``<path>.lock``)
+        timeout: Seconds to wait for another process before giving up
+
+    """
+
+    def __init__(self, path: Path, timeout: float) -> None:
+        self.path = path.with_name(f"{path.name}.lock")
+        self.timeout = timeout
+        self._local_lock = asyncio.Lock()
+        self._handle: TextIO | None = None
+
+    def acquire(self) -> None:
+        """Take the lock, waiting up to ``timeout`` seconds (blocking).
+
+        Raises:
+            TimeoutError: If another process holds the lock for longer.
+            OSError: If the lock file cannot be opened.
+
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        handle = self.path.open("a")
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    handle.close()
+                    msg = f"Timed out after {self.timeout:g}s waiting for cache lock {self.path}"
+                    raise TimeoutError(msg) from None
+                time.sleep(_POLL_INTERVAL_SECONDS)
+            else:
+                self._handle = handle
+                return
+
+    def release(self) -> None:
+        """Release the lock (no-op if not held)."""
+        if self._handle is not None:
+            handle, self._handle = self._handle, None
+            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+            handle.close()
+
+    async def __aenter__(self) -> None:
+        """Take the lock without blocking the event loop."""
+        await self._local_lock.acquire()
+        acquiring = asyncio.ensure_future(asyncio.to_thread(self.acquire))
+        try:
+            await asyncio.shield(acquiring)
+        except BaseException:
+            # A cancelled wait leaves the thread running: release what it ends up holding
+            acquiring.add_done_callback(self._release_when_acquired)
+            self._local_lock.release()
+            raise
+
+    def _release_when_acquired(self, acquiring: asyncio.Future[None]) -> None:
+        if not acquiring.cancelled() and acquiring.exception() is None:
+            self.release()
+
+    async def __aexit__(self, _exc_type: type[BaseException] | None, _exc: BaseException | None, _tb: object) -> None:
+        """Release the lock."""
+        try:
+            self.release()
+        finally:
+            self._local_lock.release()
@@ -1,4 +1,25 @@
-"""General-purpose generic cache with TTL and disk persistence."""
+"""General-purpose generic cache with TTL and disk persistence.
+
+Entries persist to an append-only JSON-lines log next to ``cache_file``:
+each save appends one compact record per key set or removed since the
+previous save, so persisting a run that touched a few keys of a large
+cache writes kilobytes. Records:
+
+    {"k": key, "v": value, "e": expires_at}   set
+    {"k": key, "d": 1}                        removed (invalidated or evicted)
+
+Expiry needs no record; loads drop set records whose ``expires_at`` has
+passed. Once the log holds more than ``_COMPACTION_RATIO`` records per live
+entry (or after ``invalidate_all``), a save rewrites it with one record per
+live entry. Loads stream the log line by line. A legacy JSON snapshot at
+``cache_file`` is read when no log exists and replaced by the first save.
+
+With ``caching.shared.enabled`` several processes append to the same log.
+Each save takes a file lock and first applies the records other processes
+wrote since this one last read the log (or replays it in full after another
+process compacted it), so the appended or compacted log keeps both sets of
+results.
+"""
 
 from __future__ import annotations
 
@@ -15,16 +36,34 @@ from typing import TYPE_CHECKING, Any, Self
 from pydantic import BaseModel
 
 from services.cache.cache_config import CacheContentType, SmartCacheConfig
+from services.cache.eviction import GdsfEviction, content_type_of, estimate_size
+from services.cache.expiry import ExpiryIndex
+from services.cache.file_lock import CacheFileLock
 from services.cache.hash_service import UnifiedHashService
+from services.cache.instrumentation import CacheTierMetrics, MissReason
+from services.cache.warmup import CacheWarmup
 from core.logger import LogFormat, ensure_directory, get_full_log_path
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
     from core.models.protocols import CacheableKey, CacheableValue
     from core.models.track_models import AppConfig
 else:  # pragma: no cover - runtime-only aliasing for type hints
     CacheableKey = Any
     CacheableValue = Any
 
+# Log records per live entry before a save compacts the log
+_COMPACTION_RATIO = 2
+# Logs shorter than this are never compacted for their ratio alone
+_MIN_COMPACTION_RECORDS = 1000
+_LOG_SUFFIX = ".jsonl"
+
+# Entries in LRU order, their content types, records read and whether the log is intact
+type _LoadedLog = tuple[OrderedDict[str, tuple[CacheableValue, float]], dict[str, str], int, bool]
+# Records appended to the log by another process: key -> (value, expires_at, content type), or None if removed
+type _LogTail = dict[str, tuple[CacheableValue, float, str] | None]
+
 
 class GenericCacheService:
     """Generic in-memory cache service with TTL support and automatic cleanup.
@@ -47,6 +86,14 @@ class GenericCacheService:
         # Max cache size for LRU eviction (evicts on set() when exceeded)
         self.max_size: int = config.max_generic_entries
 
+        # Byte budget (0 = none) enforced by size-aware GDSF eviction, which also
+        # tracks entry sizes and bytes held/evicted per content type
+        self.max_bytes: int = config.max_generic_bytes
+        self._eviction = GdsfEviction()
+
+        # Keys by expiry time: cleanup and stats touch only entries that are due
+        self._expiry = ExpiryIndex()
+
         # Cleanup task reference
         self._cleanup_task: asyncio.Task[None] | None = None
 
@@ -54,11 +101,50 @@ class GenericCacheService:
         self.default_ttl = self._resolve_default_ttl()
         self.cache_file = Path(get_full_log_path(config, "generic_cache_file", "cache/generic_cache.json"))
 
-    async def initialize(self) -> None:
-        """Initialize generic cache service and start cleanup task."""
+        # Append-log state: keys set or removed since the last save (True = set),
+        # records in the log file, and whether the next save rewrites the log
+        self._dirty_keys: dict[str, bool] = {}
+        self._log_records = 0
+        self._compaction_pending = True
+
+        # Shared log (caching.shared): saves merge other processes' records under a file lock.
+        # (inode, size) of the log as of this process's last read or write (None = replay it in full)
+        # and whether invalidate_all discarded everything since the last save
+        shared = config.caching.shared
+        self._file_lock = CacheFileLock(self.log_file, shared.lock_timeout_seconds) if shared.enabled else None
+        self._log_state: tuple[int, int] | None = None
+        self._cleared = False
+
+        # Background replay of the log with lazy warm-up
+        self._warmup: CacheWarmup[_LoadedLog] = CacheWarmup("GenericCacheService", self.logger)
+
+        # Lookup outcomes and lookup/save latencies
+        self.metrics = CacheTierMetrics("generic")
+
+    @property
+    def log_file(self) -> Path:
+        """Append-only log the cache persists to (next to ``cache_file``)."""
+        return self.cache_file.with_suffix(_LOG_SUFFIX)
+
+    def _mark_dirty(self, key: str, *, present: bool) -> None:
+        """Record that a key was set or removed since the last save."""
+        self._dirty_keys.pop(key, None)
+        self._dirty_keys[key] = present
+
+    async def initialize(self, *, lazy: bool = False) -> None:
+        """Initialize generic cache service and start cleanup task.
+
+        Args:
+            lazy: Replay the log in a background thread and return immediately;
+                operations wait for the replay on first use
+
+        """
         self.logger.info("Initializing %s...", LogFormat.entity("GenericCacheService"))
 
-        await self._load_from_disk()
+        if lazy:
+            self._warmup.start(self._load_blocking, self._apply_loaded)
+        else:
+            await self._load_from_disk()
         # Start periodic cleanup task
         self._start_cleanup_task()
 
@@ -110,6 +196,7 @@ class GenericCacheService:
             while True:
                 try:
                     await asyncio.sleep(cleanup_interval)
+                    await self._warmup.wait()
                     self._run_cleanup_iteration()
                 except asyncio.CancelledError:
                     self.logger.debug("Cleanup task cancelled")
@@ -141,24 +228,33 @@ class GenericCacheService:
         Returns:
             Cached value if found and valid, None otherwise
         """
+        self._warmup.wait_blocking()
+        started = time.perf_counter()
         key = UnifiedHashService.hash_generic_key(key_data)
 
         if key not in self.cache:
             self.logger.debug("Generic cache miss: %s", key[:16])
+            self.metrics.record_miss(content_type_of(key_data), MissReason.ABSENT, started)
             return None
 
         value, timestamp = self.cache[key]
+        content_type = self._eviction.content_type(key)
 
         # Check if expired
         if GenericCacheService._is_expired(timestamp):
             self.logger.debug("Generic cache expired: %s", key[:16])
             del self.cache[key]
+            self._eviction.discard(key)
+            self._expiry.discard(key)
+            self.metrics.record_miss(content_type, MissReason.EXPIRED, started)
             return None
 
         # Move to end to mark as recently used (LRU update)
         self.cache.move_to_end(key)
+        self._eviction.touch(key)
 
         self.logger.debug("Generic cache hit: %s", key[:16])
+        self.metrics.record_hit(content_type, started)
         return value
 
     def set(self, key_data: CacheableKey, value: CacheableValue, ttl: int | None = None) -> None:
@@ -172,12 +268,16 @@ class GenericCacheService:
             value: Value to cache
             ttl: Time to live in seconds (uses default if not specified)
         """
+        self._warmup.wait_blocking()
         key = UnifiedHashService.hash_generic_key(key_data)
 
         # Evict LRU entry if at capacity and this is a new key
         if len(self.cache) >= self.max_size and key not in self.cache:
             # Remove oldest entry (first item in OrderedDict = LRU)
             evicted_key, _ = self.cache.popitem(last=False)
+            self._mark_dirty(evicted_key, present=False)
+            self._eviction.discard(evicted_key, evicted=True)
+            self._expiry.discard(evicted_key)
             self.logger.debug("LRU eviction: removed %s to make room", evicted_key[:16])
 
         # Use provided TTL or default
@@ -188,9 +288,35 @@ class GenericCacheService:
 
         # Move to end to mark as recently used (handles both new and updated keys)
         self.cache.move_to_end(key)
+        self._mark_dirty(key, present=True)
+        self._eviction.admit(key, estimate_size(value), content_type_of(key_data))
+        self._expiry.schedule(key, expires_at)
+        self._enforce_byte_budget()
 
         self.logger.debug("Stored in generic cache: %s (TTL: %ds)", key[:16], actual_ttl)
 
+    def replace_value(self, key: str, value: CacheableValue) -> bool:
+        """Replace the value of a stored entry, keeping its expiry and LRU position.
+
+        The entry is persisted on the next save and its size re-accounted
+        against the byte budget.
+
+        Args:
+            key: Hashed cache key (a key of ``cache``)
+            value: New value
+
+        Returns:
+            True if the entry was found and replaced, False otherwise
+        """
+        self._warmup.wait_blocking()
+        if (entry := self.cache.get(key)) is None:
+            return False
+        self.cache[key] = (value, entry[1])
+        self._mark_dirty(key, present=True)
+        self._eviction.admit(key, estimate_size(value), self._eviction.content_type(key))
+        self._enforce_byte_budget()
+        return True
+
     def invalidate(self, key_data: CacheableKey) -> bool:
         """Invalidate specific cache entry.
 
@@ -200,10 +326,14 @@ class GenericCacheService:
         Returns:
             True if entry was found and removed, False otherwise
         """
+        self._warmup.wait_blocking()
         key = UnifiedHashService.hash_generic_key(key_data)
 
         if key in self.cache:
             del self.cache[key]
+            self._mark_dirty(key, present=False)
+            self._eviction.discard(key)
+            self._expiry.discard(key)
             self.logger.debug("Invalidated generic cache entry: %s", key[:16])
             return True
 
@@ -211,22 +341,31 @@ class GenericCacheService:
 
     def invalidate_all(self) -> None:
         """Clear all generic cache entries."""
+        self._warmup.wait_blocking()
         count = len(self.cache)
         self.cache.clear()
+        self._eviction.clear()
+        self._expiry.clear()
+        self._dirty_keys.clear()
+        self._compaction_pending = True
+        self._cleared = True
         self.logger.info("Cleared all generic cache entries (%d items)", count)
 
     def cleanup_expired(self) -> int:
         """Remove expired entries from cache.
 
+        Pops due keys from the expiry index instead of scanning every entry.
+
         Returns:
             Number of entries removed
         """
-        current_time = time.time()
-        expired_keys = [key for key, (_, timestamp) in self.cache.items() if timestamp <= current_time]
+        self._warmup.wait_blocking()
+        expired_keys = self._expiry.pop_expired(time.time())
 
         # Remove expired entries
         for key in expired_keys:
-            del self.cache[key]
+            self.cache.pop(key, None)
+            self._eviction.discard(key)
 
         if expired_keys:
             self.logger.debug("Cleaned up %d expired generic cache entries", len(expired_keys))
@@ -248,24 +387,47 @@ class GenericCacheService:
     def enforce_size_limits(self) -> int:
         """Enforce cache size limits by removing LRU (least recently used) entries.
 
-        Uses OrderedDict iteration order where first = oldest (LRU).
+        Uses OrderedDict iteration order where first = oldest (LRU) for the
+        entry limit, then GDSF priority for the byte budget.
 
         Returns:
             Number of entries removed
         """
+        self._warmup.wait_blocking()
         if len(self.cache) <= self.max_size:
-            return 0
+            return self._enforce_byte_budget()
 
         entries_to_remove = len(self.cache) - self.max_size
         removed_count = 0
 
         for _ in range(entries_to_remove):
-            self.cache.popitem(last=False)  # Remove LRU (oldest in OrderedDict)
+            evicted_key, _ = self.cache.popitem(last=False)  # Remove LRU (oldest in OrderedDict)
+            self._mark_dirty(evicted_key, present=False)
+            self._eviction.discard(evicted_key, evicted=True)
+            self._expiry.discard(evicted_key)
             removed_count += 1
 
         if removed_count > 0:
             self.logger.info("Enforced size limit: removed %d LRU entries", removed_count)
 
+        return removed_count + self._enforce_byte_budget()
+
+    def _enforce_byte_budget(self) -> int:
+        """Evict entries by GDSF priority until the cache fits its byte budget.
+
+        Returns:
+            Number of entries removed
+        """
+        if not self.max_bytes:
+            return 0
+        removed_count = 0
+        while self._eviction.bytes_held > self.max_bytes and (evicted_key := self._eviction.pop_victim()) is not None:
+            if self.cache.pop(evicted_key, None) is not None:
+                self._mark_dirty(evicted_key, present=False)
+                self._expiry.discard(evicted_key)
+                removed_count += 1
+        if removed_count:
+            self.logger.debug("Byte budget eviction: removed %d entries (%d bytes held)", removed_count, self._eviction.bytes_held)
         return removed_count
 
     async def stop_cleanup_task(self) -> None:
@@ -289,17 +451,13 @@ class GenericCacheService:
         """Get generic cache statistics.
 
         Returns:
-            Dictionary containing cache statistics
+            Dictionary containing cache statistics; while a lazy warm-up is
+            still loading, ``warming_up`` is True and the counts cover only
+            the data applied so far
         """
-        current_time = time.time()
-        valid_entries = 0
-        expired_entries = 0
-
-        for _, timestamp in self.cache.values():
-            if timestamp > current_time:
-                valid_entries += 1
-            else:
-                expired_entries += 1
+        warming_up = self._warmup.poll()
+        expired_entries = self._expiry.count_expired(time.time())
+        valid_entries = len(self.cache) - expired_entries
 
         policy = self.cache_config.get_policy(CacheContentType.GENERIC)
 
@@ -312,73 +470,312 @@ class GenericCacheService:
             "ttl_policy": policy.ttl_seconds,
             "invalidation_strategy": policy.invalidation_strategy.value,
             "max_entries": self.max_size,
+            "max_bytes": self.max_bytes,
+            "bytes_held": self._eviction.bytes_held,
+            "bytes_evicted": self._eviction.evicted_bytes,
+            "content_types": self._eviction.stats_by_content_type(),
             "cleanup_running": self._cleanup_task is not None and not self._cleanup_task.done(),
+            "log_records": self._log_records,
+            "unsaved_changes": len(self._dirty_keys),
+            "metrics": self.metrics.summary(),
+            "warming_up": warming_up,
         }
 
-    async def save_to_disk(self) -> None:
-        """Persist cache contents to disk."""
-        if not self.cache:
-            if self.cache_file.exists():
+    def _needs_compaction(self) -> bool:
+        """Check whether the next save rewrites the log instead of appending."""
+        pending_records = self._log_records + len(self._dirty_keys)
+        return self._compaction_pending or pending_records > max(_MIN_COMPACTION_RECORDS, _COMPACTION_RATIO * len(self.cache))
+
+    def _set_record(self, key: str, value: CacheableValue, expires_at: float, content_type: str) -> str:
+        """Serialize a set record as one compact JSON line."""
+        record = {"k": key, "v": self._prepare_value_for_disk(value), "e": expires_at, "t": content_type}
+        return json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+    @staticmethod
+    def _delete_record(key: str) -> str:
+        """Serialize a removal record as one compact JSON line."""
+        return json.dumps({"k": key, "d": 1}, separators=(",", ":")) + "\n"
+
+    def _remove_files(self) -> None:
+        """Delete the log and any legacy snapshot (nothing left to persist)."""
+        for path in (self.log_file, self.cache_file):
+            if path.exists():
                 try:
-                    self.cache_file.unlink()
-                    self.logger.info("Deleted empty generic cache file: [cyan]%s[/cyan]", self.cache_file.name)
+                    path.unlink()
+                    self.logger.info("Deleted empty generic cache file: [cyan]%s[/cyan]", path.name)
                 except OSError as e:
-                    self.logger.warning("Failed to remove generic cache file %s: %s", self.cache_file, e)
+                    self.logger.warning("Failed to remove generic cache file %s: %s", path, e)
+
+    async def save_to_disk(self) -> None:
+        """Persist changes since the last save to the append-only log.
+
+        Appends one record per key set or removed since the last save, or
+        rewrites the log with the live entries when compaction is due. A
+        shared log first takes in what other processes saved meanwhile.
+        """
+        await self._warmup.wait()
+        if self._file_lock is None:
+            await self._write_log()
+            return
+        async with self._file_lock:
+            try:
+                await self._merge_shared_log()
+            except (OSError, UnicodeDecodeError) as e:
+                # Unreadable log: rewrite it from this process's entries
+                self.logger.warning("Could not read generic cache log %s for merging: %s", self.log_file, e)
+                self._compaction_pending = True
+            self._cleared = False
+            await self._write_log()
+            self._log_state = await asyncio.to_thread(self._stat_log)
+
+    def _stat_log(self) -> tuple[int, int] | None:
+        """Return the log's (inode, size), or None if there is no log (blocking)."""
+        try:
+            stat = self.log_file.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_size
+
+    async def _merge_shared_log(self) -> None:
+        """Apply what other processes saved since this one last read or wrote the log.
+
+        Keys changed here since the last save keep this process's version.
+        After ``invalidate_all`` nothing is taken in: the save rewrites the log.
+        """
+        if self._cleared:
             return
+        state = await asyncio.to_thread(self._stat_log)
+        if state is None or state == self._log_state:
+            return
+        now = time.time()
+        if self._log_state is not None and state[0] == self._log_state[0] and state[1] > self._log_state[1]:
+            # Same file, grown: only the records appended since
+            tail, records = await asyncio.to_thread(self._read_log_tail, self._log_state[1], now)
+            self._log_records += records
+            for key, entry in tail.items():
+                if key in self._dirty_keys:
+                    continue
+                if entry is None:
+                    self._drop_entry(key)
+                else:
+                    self._adopt_entry(key, *entry)
+        else:
+            # Compacted (replaced) by another process, or never read: replay it in full
+            restored, content_types, records, intact = await asyncio.to_thread(self._replay_log, now)
+            self._log_records = records
+            self._compaction_pending = self._compaction_pending or not intact
+            for key in [key for key in self.cache if key not in restored and key not in self._dirty_keys]:
+                self._drop_entry(key)
+            for key, (value, expires_at) in restored.items():
+                if key not in self._dirty_keys:
+                    self._adopt_entry(key, value, expires_at, content_types.get(key, "other"))
+        self.enforce_size_limits()
+
+    def _adopt_entry(self, key: str, value: CacheableValue, expires_at: float, content_type: str) -> None:
+        """Install an entry saved by another process."""
+        self.cache[key] = (value, expires_at)
+        self._eviction.admit(key, estimate_size(value), content_type)
+        self._expiry.schedule(key, expires_at)
+
+    def _drop_entry(self, key: str) -> None:
+        """Remove an entry another process removed."""
+        if self.cache.pop(key, None) is not None:
+            self._eviction.discard(key)
+            self._expiry.discard(key)
+
+    def _read_log_tail(self, offset: int, now: float) -> tuple[_LogTail, int]:
+        """Read the records appended to the log after ``offset`` (blocking).
+
+        Args:
+            offset: Log size as of this process's last read or write
+            now: Current timestamp; set records expired by then count as removals
+
+        Returns:
+            Tuple of (last record per key, records read)
+
+        """
+        with self.log_file.open("rb") as handle:
+            handle.seek(offset)
+            data = handle.read()
+        tail: _LogTail = {}
+        records = 0
+        # A final line without a newline is a torn write; skip it
+        for line in data.split(b"\n")[:-1]:
+            try:
+                record = json.loads(line)
+                key = record["k"]
+            except (json.JSONDecodeError, UnicodeDecodeError, KeyError, TypeError):
+                continue
+            records += 1
+            expires_at = record.get("e")
+            if not record.get("d") and isinstance(expires_at, (int, float)) and expires_at > now:
+                tail[key] = (self._restore_value_from_disk(record.get("v")), float(expires_at), str(record.get("t", "other")))
+            else:
+                tail[key] = None
+        return tail, records
 
-        def blocking_save() -> None:
-            """Write current cache entries to disk within a worker thread."""
-            ensure_directory(str(self.cache_file.parent))
-            payload = {
-                key: {"value": self._prepare_value_for_disk(value), "expires_at": expires_at} for key, (value, expires_at) in self.cache.items()
-            }
-            with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=str(self.cache_file.parent), delete=False) as tmp_file:
-                json.dump(payload, tmp_file, ensure_ascii=False, indent=2)
+    async def _write_log(self) -> None:
+        """Append the changes since the last save, or compact the log."""
+        if not self.cache:
+            self._remove_files()
+            self._dirty_keys.clear()
+            self._log_records = 0
+            self._compaction_pending = True
+            return
+
+        compact = self._needs_compaction()
+        if not compact and not self._dirty_keys:
+            return
+
+        # Snapshot on the event loop thread; serialize and write in a worker thread
+        started = time.perf_counter()
+        now = time.time()
+        if compact:
+            entries = [
+                (key, value, expires_at, self._eviction.content_type(key)) for key, (value, expires_at) in self.cache.items() if expires_at > now
+            ]
+            changes: list[tuple[str, bool]] = []
+        else:
+            entries = []
+            changes = list(self._dirty_keys.items())
+        snapshot = {key: (*self.cache[key], self._eviction.content_type(key)) for key, present in changes if present and key in self.cache}
+        self._dirty_keys.clear()
+
+        def write_lines(lines: Iterable[str], mode: str, path: Path) -> None:
+            with path.open(mode, encoding="utf-8") as handle:
+                handle.writelines(lines)
+
+        def blocking_compact() -> int:
+            """Rewrite the log with one record per live entry."""
+            ensure_directory(str(self.log_file.parent))
+            with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=str(self.log_file.parent), delete=False, suffix=_LOG_SUFFIX) as tmp_file:
                 temp_path = Path(tmp_file.name)
-            temp_path.replace(self.cache_file)
+            write_lines((self._set_record(*entry) for entry in entries), "w", temp_path)
+            temp_path.replace(self.log_file)
+            self.cache_file.unlink(missing_ok=True)  # Legacy JSON snapshot superseded by the log
+            return len(entries)
+
+        def blocking_append() -> int:
+            """Append records for the keys changed since the last save."""
+            ensure_directory(str(self.log_file.parent))
+            lines = [self._set_record(key, *snapshot[key]) if key in snapshot else self._delete_record(key) for key, _ in changes]
+            write_lines(lines, "a", self.log_file)
+            return len(lines)
 
         try:
-            await asyncio.to_thread(blocking_save)
-            self.logger.info("Generic cache saved to [cyan]%s[/cyan] (%d entries)", self.cache_file.name, len(self.cache))
+            if compact:
+                self._log_records = await asyncio.to_thread(blocking_compact)
+                self._compaction_pending = False
+                self.logger.info("Generic cache compacted to [cyan]%s[/cyan] (%d entries)", self.log_file.name, self._log_records)
+            else:
+                appended = await asyncio.to_thread(blocking_append)
+                self._log_records += appended
+                self.logger.info("Generic cache saved to [cyan]%s[/cyan] (%d records appended)", self.log_file.name, appended)
+            self.metrics.record_persist(started)
         except OSError as e:
-            self.logger.exception("Failed to save generic cache to %s: %s", self.cache_file, e)
+            # The log may now be partial; rewrite it in full next time
+            self._compaction_pending = True
+            self.logger.exception("Failed to save generic cache to %s: %s", self.log_file, e)
 
-    async def _load_from_disk(self) -> None:
-        """Load cache contents from disk if available."""
-        if not self.cache_file.exists():
-            self.logger.debug("Generic cache file %s not found; starting fresh", self.cache_file)
-            return
+    def _replay_log(self, now: float) -> _LoadedLog:
+        """Stream the log into an ordered mapping of live entries.
 
-        def blocking_load() -> OrderedDict[str, tuple[CacheableValue, float]]:
-            """Load cache entries from disk within a worker thread."""
-            try:
-                with self.cache_file.open(encoding="utf-8") as file_handle:
-                    data = json.load(file_handle)
-            except (json.JSONDecodeError, OSError) as e:
-                self.logger.warning("Failed to load generic cache file %s: %s", self.cache_file, e)
-                return OrderedDict()
-
-            now = time.time()
-            restored: OrderedDict[str, tuple[CacheableValue, float]] = OrderedDict()
-            for key, entry in data.items():
-                if not isinstance(entry, dict):
-                    continue
-                value = entry.get("value")
-                expires_at = entry.get("expires_at")
-                if not isinstance(expires_at, (int, float)):
-                    continue
-                expires_at_float = float(expires_at)
-                if expires_at_float <= now:
+        Args:
+            now: Current timestamp; set records expired by then are dropped
+
+        Returns:
+            Tuple of (entries in LRU order, content types of set records, records read,
+            whether the log is intact)
+
+        """
+        restored: OrderedDict[str, tuple[CacheableValue, float]] = OrderedDict()
+        content_types: dict[str, str] = {}
+        records = 0
+        intact = True
+        with self.log_file.open(encoding="utf-8") as handle:
+            for line in handle:
+                if not line.endswith("\n"):
+                    intact = False  # Torn final write
+                try:
+                    record = json.loads(line)
+                    key = record["k"]
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    intact = False
                     continue
-                restored[key] = (self._restore_value_from_disk(value), expires_at_float)
-            return restored
+                records += 1
+                expires_at = record.get("e")
+                restored.pop(key, None)
+                if not record.get("d") and isinstance(expires_at, (int, float)) and expires_at > now:
+                    restored[key] = (self._restore_value_from_disk(record.get("v")), float(expires_at))
+                    content_types[key] = str(record.get("t", "other"))
+        return restored, content_types, records, intact
+
+    def _load_legacy_snapshot(self, now: float) -> OrderedDict[str, tuple[CacheableValue, float]]:
+        """Load the pre-log JSON snapshot at ``cache_file``."""
+        try:
+            with self.cache_file.open(encoding="utf-8") as file_handle:
+                data = json.load(file_handle)
+        except (json.JSONDecodeError, OSError) as e:
+            self.logger.warning("Failed to load generic cache file %s: %s", self.cache_file, e)
+            return OrderedDict()
+
+        restored: OrderedDict[str, tuple[CacheableValue, float]] = OrderedDict()
+        for key, entry in data.items():
+            if not isinstance(entry, dict):
+                continue
+            value = entry.get("value")
+            expires_at = entry.get("expires_at")
+            if not isinstance(expires_at, (int, float)):
+                continue
+            expires_at_float = float(expires_at)
+            if expires_at_float <= now:
+                continue
+            restored[key] = (self._restore_value_from_disk(value), expires_at_float)
+        return restored
+
+    def _load_blocking(self) -> _LoadedLog:
+        """Load cache entries from the log (or a legacy snapshot) within a worker thread."""
+        now = time.time()
+        if self.log_file.exists():
+            try:
+                return self._replay_log(now)
+            except (OSError, UnicodeDecodeError) as e:
+                self.logger.warning("Failed to load generic cache log %s: %s", self.log_file, e)
+                return OrderedDict(), {}, 0, False
+        if self.cache_file.exists():
+            return self._load_legacy_snapshot(now), {}, 0, False
+        self.logger.debug("Generic cache file %s not found; starting fresh", self.log_file)
+        # No log to append to yet: the first save writes it in full
+        return OrderedDict(), {}, 0, False
 
-        restored_cache = await asyncio.to_thread(blocking_load)
+    async def _load_from_disk(self) -> None:
+        """Load cache contents from the log (or a legacy snapshot) if available."""
+        self._apply_loaded(await asyncio.to_thread(self._load_blocking))
+
+    def _apply_loaded(self, loaded: _LoadedLog) -> None:
+        """Install entries loaded from disk (on the event loop thread)."""
+        restored_cache, content_types, records, intact = loaded
+        self._log_records = records
+        # A legacy snapshot, a damaged log or a log dominated by stale records is rewritten on the next save
+        self._compaction_pending = not intact or records > max(_MIN_COMPACTION_RECORDS, _COMPACTION_RATIO * len(restored_cache))
+        if not intact and records:
+            self.logger.warning("Generic cache log %s has damaged records; it will be rewritten on the next save", self.log_file.name)
         if restored_cache:
             self.cache.update(restored_cache)
+            for key, (value, expires_at) in restored_cache.items():
+                self._eviction.admit(key, estimate_size(value), content_types.get(key, "other"))
+                self._expiry.schedule(key, expires_at)
             self.cleanup_expired()
             self.enforce_size_limits()
-            self.logger.info("Loaded %d generic cache entries from [cyan]%s[/cyan]", len(restored_cache), self.cache_file.name)
+            self.logger.info("Loaded %d generic cache entries from [cyan]%s[/cyan]", len(restored_cache), self.log_file.name)
+
+    def when_loaded(self, callback: Callable[[], None]) -> None:
+        """Call ``callback`` once the persisted entries are in ``cache`` (immediately if they are)."""
+        self._warmup.when_loaded(callback)
+
+    async def wait_for_warmup(self) -> None:
+        """Wait until a background warm-up started by ``initialize(lazy=True)`` is applied."""
+        await self._warmup.wait()
 
     @staticmethod
     def _prepare_value_for_disk(value: CacheableValue) -> CacheableValue:
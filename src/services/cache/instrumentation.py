@@ -0,0 +1,158 @@
+"""Hit, miss and latency counters for the cache tiers.
+
+Each cache service owns a ``CacheTierMetrics`` and records the outcome and
+duration of every lookup and save. Misses carry a reason:
+
+- ``absent``: no entry for the key
+- ``expired``: the entry outlived its TTL and was dropped
+- ``collision``: the key's entry belongs to another artist/album
+- ``negative``: the entry is a cached failed lookup (no usable value)
+
+Outcomes are counted per content type, so the summary shows which kinds of
+content are worth caching: the ``CacheContentType`` of album-year entries,
+the key namespace of generic entries, and the source of API results (a miss
+has no entry to take a type from; cached failures count as negative
+misses). Latencies go into fixed logarithmic buckets:
+memory stays constant for any number of lookups, and percentiles are
+reported as the upper bound of the bucket they fall in.
+"""
+
+from __future__ import annotations
+
+import bisect
+import time
+from collections import Counter
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+__all__ = ["CacheTierMetrics", "LatencyHistogram", "MissReason"]
+
+# Bucket upper bounds in milliseconds (last bucket is unbounded)
+_BUCKET_BOUNDS_MS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0)
+_HIT = "hit"
+
+
+class MissReason(StrEnum):
+    """Why a cache lookup returned nothing usable."""
+
+    ABSENT = "absent"
+    EXPIRED = "expired"
+    COLLISION = "collision"
+    NEGATIVE = "negative"
+
+
+class LatencyHistogram:
+    """Durations counted in logarithmic millisecond buckets."""
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(_BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, duration_ms: float, count: int = 1) -> None:
+        """Add ``count`` observations of ``duration_ms``."""
+        self.counts[bisect.bisect_left(_BUCKET_BOUNDS_MS, duration_ms)] += count
+        self.count += count
+        self.total_ms += duration_ms * count
+        self.max_ms = max(self.max_ms, duration_ms)
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound (ms) of the bucket holding the given fraction of observations."""
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for bucket, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                return _BUCKET_BOUNDS_MS[bucket] if bucket < len(_BUCKET_BOUNDS_MS) else self.max_ms
+        return self.max_ms
+
+    def summary(self) -> dict[str, float]:
+        """Count, mean, p50, p99 and max in milliseconds."""
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 4) if self.count else 0.0,
+            "p50_ms": self.percentile(0.5),
+            "p99_ms": self.percentile(0.99),
+            "max_ms": round(self.max_ms, 4),
+        }
+
+
+class CacheTierMetrics:
+    """Lookup outcomes and lookup/save latencies of one cache tier.
+
+    Durations are measured from a ``time.perf_counter()`` value the caller
+    takes when the operation starts.
+
+    Args:
+        tier: Tier name in summaries (``album``, ``api``, ``generic``)
+
+    """
+
+    def __init__(self, tier: str) -> None:
+        self.tier = tier
+        # {content_type: {"hit" or miss reason: count}}
+        self._outcomes: dict[str, Counter[str]] = {}
+        self.lookup_latency = LatencyHistogram()
+        self.persist_latency = LatencyHistogram()
+
+    def record_hit(self, content_type: str, started: float) -> None:
+        """Count a hit of a lookup that started at ``started``."""
+        self._record(content_type, _HIT, started)
+
+    def record_miss(self, content_type: str, reason: MissReason, started: float) -> None:
+        """Count a miss of a lookup that started at ``started``."""
+        self._record(content_type, reason.value, started)
+
+    def record_batch(self, content_type: str, started: float, hits: int, misses: Mapping[MissReason, int]) -> None:
+        """Count the outcomes of a lookup of many keys; its duration is spread over the keys.
+
+        Args:
+            content_type: Content type of the looked-up entries
+            started: ``time.perf_counter()`` value when the lookup started
+            hits: Number of keys found
+            misses: Number of keys missed per reason
+
+        """
+        outcomes = self._outcomes.setdefault(content_type, Counter())
+        outcomes[_HIT] += hits
+        outcomes.update({reason.value: count for reason, count in misses.items()})
+        if keys := hits + sum(misses.values()):
+            self.lookup_latency.record((time.perf_counter() - started) * 1000 / keys, keys)
+
+    def record_persist(self, started: float) -> None:
+        """Record the duration of a save that started at ``started``."""
+        self.persist_latency.record((time.perf_counter() - started) * 1000)
+
+    def _record(self, content_type: str, outcome: str, started: float) -> None:
+        self._outcomes.setdefault(content_type, Counter())[outcome] += 1
+        self.lookup_latency.record((time.perf_counter() - started) * 1000)
+
+    @staticmethod
+    def _outcome_summary(outcomes: Counter[str]) -> dict[str, Any]:
+        hits = outcomes[_HIT]
+        lookups = outcomes.total()
+        return {
+            "lookups": lookups,
+            "hits": hits,
+            "misses": lookups - hits,
+            "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+            "miss_reasons": {reason.value: outcomes[reason.value] for reason in MissReason if outcomes[reason.value]},
+        }
+
+    def summary(self) -> dict[str, Any]:
+        """Tier totals, per-content-type outcomes and latency summaries."""
+        total: Counter[str] = Counter()
+        for outcomes in self._outcomes.values():
+            total.update(outcomes)
+        return {
+            **self._outcome_summary(total),
+            "content_types": {content_type: self._outcome_summary(outcomes) for content_type, outcomes in sorted(self._outcomes.items())},
+            "lookup_latency": self.lookup_latency.summary(),
+            "persist_latency": self.persist_latency.summary(),
+        }
@@ -13,21 +13,28 @@ Key Features:
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
+import time
 from datetime import UTC, datetime
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal, TypeVar, overload
 
-from core.logger import LogFormat
+from core.logger import LogFormat, get_full_log_path
 from core.models.protocols import CacheableKey, CacheableValue, CacheServiceProtocol
+from core.models.track_models import CacheBackend
 from core.run_tracking import IncrementalRunTracker
 from services.cache.album_cache import AlbumCacheService
 from services.cache.api_cache import ApiCacheService
 from services.cache.cache_config import CacheEvent, CacheEventType
+from services.cache.eviction import content_type_of
 from services.cache.generic_cache import GenericCacheService
 from services.cache.hash_service import UnifiedHashService
+from services.cache.instrumentation import CacheTierMetrics, MissReason
+from services.cache.sqlite_store import SqliteCacheStore
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
+    from collections.abc import Awaitable, Callable, Sequence
 
     from core.models.cache_types import AlbumCacheEntry
     from core.models.track_models import AppConfig, CachedApiResult, TrackDict
@@ -49,9 +56,17 @@ class CacheOrchestrator(CacheServiceProtocol):
         # Initialize configuration manager later when needed
         self.config_manager = None
 
+        # Album-year and API caches share one database with the SQLite backend
+        self.sqlite_store: SqliteCacheStore | None = None
+        if config.caching.backend is CacheBackend.SQLITE:
+            self.sqlite_store = SqliteCacheStore(
+                Path(get_full_log_path(config, "sqlite_cache_file", config.caching.sqlite_cache_file)),
+                timeout=config.caching.shared.lock_timeout_seconds,
+            )
+
         # Initialize specialized services
-        self.album_service = AlbumCacheService(config, logger)
-        self.api_service = ApiCacheService(config, logger)
+        self.album_service = AlbumCacheService(config, logger, store=self.sqlite_store)
+        self.api_service = ApiCacheService(config, logger, store=self.sqlite_store)
         self.generic_service = GenericCacheService(config, logger)
 
         # Service mapping for routing
@@ -61,14 +76,30 @@ class CacheOrchestrator(CacheServiceProtocol):
             "generic": self.generic_service,
         }
 
+        # Read-through lookups (get_async with a compute function; miss latency
+        # includes computing the value) and whole-cache saves
+        self.metrics = CacheTierMetrics("read_through")
+
+        # Periodic merge-save of shared caches (caching.shared), stopped on shutdown
+        self._sync_task: asyncio.Task[None] | None = None
+        self._sync_stopped = asyncio.Event()
+
     async def initialize(self) -> None:
-        """Initialize all cache services."""
+        """Initialize all cache services.
+
+        With ``caching.lazy_warmup`` the services load their data in background
+        threads and this returns without waiting; each service waits for its
+        own load on first use.
+        """
         self.logger.info("Initializing %s...", LogFormat.entity("CacheOrchestrator"))
 
+        lazy = self.config.caching.lazy_warmup
+        # Lazy warm-ups load one after another in this order: cheapest first,
+        # the large API cache last
         service_tasks: list[tuple[str, Awaitable[Any]]] = [
-            ("AlbumCacheService", self.album_service.initialize()),
-            ("ApiCacheService", self.api_service.initialize()),
-            ("GenericCacheService", self.generic_service.initialize()),
+            ("GenericCacheService", self.generic_service.initialize(lazy=lazy)),
+            ("AlbumCacheService", self.album_service.initialize(lazy=lazy)),
+            ("ApiCacheService", self.api_service.initialize(lazy=lazy)),
         ]
 
         results = await asyncio.gather(*(task for _, task in service_tasks), return_exceptions=True)
@@ -84,8 +115,38 @@ class CacheOrchestrator(CacheServiceProtocol):
             msg = f"Cache service initialization failed for: {failed_list}"
             raise RuntimeError(msg)
 
+        self._start_sync_task()
         self.logger.info("%s initialized successfully", LogFormat.entity("CacheOrchestrator"))
 
+    def _start_sync_task(self) -> None:
+        """Periodically merge-save shared caches so overlapping runs see each other's results.
+
+        Each save takes in what other processes saved and publishes this
+        process's new entries, so an API lookup made by one run is found in
+        the cache by the other instead of being repeated.
+        """
+        shared = self.config.caching.shared
+        if not shared.enabled or shared.sync_interval_seconds <= 0 or self._sync_task is not None:
+            return
+
+        async def sync_loop() -> None:
+            """Save every interval until stopped; a save in progress finishes first."""
+            while not self._sync_stopped.is_set():
+                try:
+                    await asyncio.wait_for(self._sync_stopped.wait(), timeout=shared.sync_interval_seconds)
+                except TimeoutError:
+                    await self.save_all_to_disk()
+
+        self._sync_task = asyncio.create_task(sync_loop())
+        self.logger.debug("Started shared cache sync every %ds", shared.sync_interval_seconds)
+
+    async def _stop_sync_task(self) -> None:
+        """Stop the periodic shared cache sync, letting a save in progress finish."""
+        if self._sync_task is not None:
+            self._sync_stopped.set()
+            await self._sync_task
+            self._sync_task = None
+
     # Album Cache API
 
     async def get_album_year(self, artist: str, album: str) -> str | None:
@@ -141,18 +202,22 @@ class CacheOrchestrator(CacheServiceProtocol):
         Returns:
             Cached or computed value
         """
+        await self.generic_service.wait_for_warmup()
         if compute_func:
+            started = time.perf_counter()
             result = self.generic_service.get(key_data)
             if result is None:
                 future = compute_func()
                 computed = await future
                 self.generic_service.set(key_data, computed)
+                self.metrics.record_miss(content_type_of(key_data), MissReason.ABSENT, started)
                 return computed
+            self.metrics.record_hit(content_type_of(key_data), started)
             return result
         return self.generic_service.get(key_data)
 
     def set(self, key_data: CacheableKey, value: CacheableValue, ttl: int | None = None) -> None:
-        """Set value in generic cache.
+        """Set value in generic cache (for synchronous callers; coroutines use set_async).
 
         Args:
             key_data: Cache key
@@ -169,10 +234,11 @@ class CacheOrchestrator(CacheServiceProtocol):
             value: Value to cache
             ttl: Optional TTL in seconds
         """
+        await self.generic_service.wait_for_warmup()
         self.generic_service.set(key_data, value, ttl)
 
     def get(self, key_data: CacheableKey) -> CacheableValue | None:
-        """Get value from generic cache.
+        """Get value from generic cache (for synchronous callers; coroutines use get_async).
 
         Args:
             key_data: Cache key
@@ -198,6 +264,7 @@ class CacheOrchestrator(CacheServiceProtocol):
         track_id = str(track_payload.get("id", "") or "").strip()
 
         # Invalidate generic caches (full snapshot + per artist variants)
+        await self.generic_service.wait_for_warmup()
         self.generic_service.invalidate("tracks_all")
 
         artist_candidates = {candidate for candidate in (artist, original_artist) if candidate}
@@ -220,6 +287,7 @@ class CacheOrchestrator(CacheServiceProtocol):
     async def save_all_to_disk(self) -> None:
         """Save all persistent caches to disk."""
         self.logger.info("Saving all caches to disk...")
+        started = time.perf_counter()
 
         # Save services that have disk persistence
         save_tasks: list[tuple[str, Awaitable[Any]]] = [
@@ -234,10 +302,11 @@ class CacheOrchestrator(CacheServiceProtocol):
             if isinstance(result, Exception):
                 self.logger.error("Failed to save %s to disk: %s", LogFormat.entity(service_name), result, exc_info=result)
 
+        self.metrics.record_persist(started)
         self.logger.info("All caches saved to disk")
 
     def invalidate(self, key_data: CacheableKey) -> None:
-        """Invalidate specific cache entry.
+        """Invalidate specific cache entry (for synchronous callers; coroutines use invalidate_async).
 
         Args:
             key_data: Cache key to invalidate
@@ -245,6 +314,16 @@ class CacheOrchestrator(CacheServiceProtocol):
         """
         self.generic_service.invalidate(key_data)
 
+    async def invalidate_async(self, key_data: CacheableKey) -> None:
+        """Invalidate specific cache entry, waiting for a lazy warm-up without blocking the loop.
+
+        Args:
+            key_data: Cache key to invalidate
+
+        """
+        await self.generic_service.wait_for_warmup()
+        self.generic_service.invalidate(key_data)
+
     async def invalidate_all(self) -> None:
         """Clear all cache entries across all services."""
         self.logger.info("Invalidating all cache entries...")
@@ -252,10 +331,51 @@ class CacheOrchestrator(CacheServiceProtocol):
         # Album and API services have async invalidate_all methods
         await self.album_service.invalidate_all()
         await self.api_service.invalidate_all()
+        await self.generic_service.wait_for_warmup()
         self.generic_service.invalidate_all()
 
         self.logger.info("All cache entries invalidated")
 
+    # Instrumentation
+
+    def metrics_summary(self) -> dict[str, Any]:
+        """Hit/miss counts and latencies of every cache tier and of read-through lookups.
+
+        Returns:
+            JSON-serializable summary: ``tiers`` keyed by tier name (``album``,
+            ``api``, ``generic``) and ``read_through`` for ``get_async`` lookups
+
+        """
+        tiers = (self.album_service.metrics, self.api_service.metrics, self.generic_service.metrics)
+        return {
+            "generated_at": datetime.now(UTC).isoformat(timespec="seconds"),
+            "tiers": {metrics.tier: metrics.summary() for metrics in tiers},
+            "read_through": self.metrics.summary(),
+        }
+
+    async def write_metrics_summary(self) -> Path:
+        """Log a line per tier and write the metrics summary as JSON (end-of-run report).
+
+        Returns:
+            Path of the written summary (``cache_metrics_file`` under the logs directory)
+
+        """
+        summary = self.metrics_summary()
+        for tier, tier_summary in summary["tiers"].items():
+            lookup_latency = tier_summary["lookup_latency"]
+            self.logger.info(
+                "%s cache: %d lookups, %.1f%% hits, misses %s, lookup p99 %.2f ms",
+                tier.capitalize(),
+                tier_summary["lookups"],
+                tier_summary["hit_ratio"] * 100,
+                tier_summary["miss_reasons"] or "none",
+                lookup_latency["p99_ms"],
+            )
+        path = Path(get_full_log_path(self.config, "cache_metrics_file", "analytics/cache_metrics.json"))
+        await asyncio.to_thread(path.write_text, json.dumps(summary, indent=2), encoding="utf-8")
+        self.logger.debug("Cache metrics written to [cyan]%s[/cyan]", path.name)
+        return path
+
     # Backward Compatibility
 
     @property
@@ -277,8 +397,8 @@ class CacheOrchestrator(CacheServiceProtocol):
 
     async def load_cache(self) -> None:
         """Load persistent cache data from disk."""
-        # Services handle their own loading during initialization
-        # This is a no-op for now but maintains protocol compatibility
+        # Services load during initialization; this only waits for a lazy warm-up to finish
+        await asyncio.gather(self.album_service.wait_for_warmup(), self.api_service.wait_for_warmup(), self.generic_service.wait_for_warmup())
 
     async def save_cache(self) -> None:
         """Save cache data to disk for persistence."""
@@ -303,6 +423,21 @@ class CacheOrchestrator(CacheServiceProtocol):
         """Get full album cache entry for an artist/album pair."""
         return await self.album_service.get_album_year_entry(artist, album)
 
+    async def get_album_year_entries_bulk_from_cache(self, albums: Sequence[tuple[str, str]]) -> dict[tuple[str, str], AlbumCacheEntry]:
+        """Get full album cache entries for many artist/album pairs in one lookup."""
+        return await self.album_service.get_album_year_entries_bulk(albums)
+
+    async def find_similar_album_year_entry_from_cache(
+        self,
+        artist: str,
+        album: str,
+        *,
+        min_similarity: float,
+        limit: int = 5,
+    ) -> AlbumCacheEntry | None:
+        """Get the cache entry of the most similar cached album by the same artist."""
+        return await self.album_service.find_similar_album_year_entry(artist, album, min_similarity=min_similarity, limit=limit)
+
     async def store_album_year_in_cache(self, artist: str, album: str, year: str, confidence: int = 0) -> None:
         """Store album year in persistent cache."""
         await self.store_album_year(artist, album, year, confidence)
@@ -354,6 +489,7 @@ class CacheOrchestrator(CacheServiceProtocol):
 
     async def clear(self) -> None:
         """Clear all entries from all caches (generic, album, and API caches)."""
+        await self.generic_service.wait_for_warmup()
         self.generic_service.invalidate_all()
         await self.album_service.invalidate_all()
         await self.api_service.invalidate_all()
@@ -364,6 +500,12 @@ class CacheOrchestrator(CacheServiceProtocol):
         Shuts down:
         1. ApiCacheService background tasks (cache invalidation, etc.)
         2. GenericCacheService cleanup task
+        3. SQLite store connection (SQLite backend)
+
+        The periodic shared cache sync is stopped first.
         """
+        await self._stop_sync_task()
         await self.api_service.shutdown()
         await self.generic_service.stop_cleanup_task()
+        if self.sqlite_store is not None:
+            await asyncio.to_thread(self.sqlite_store.close)
@@ -0,0 +1,295 @@
+"""Embedded SQLite store for the album-year and API caches.
+
+With ``caching.backend: sqlite`` both caches live in one database instead of
+``album_years.csv`` and ``cache.json``. The services read entries by hash key
+on demand instead of loading whole files at startup, and each save writes the
+entries changed since the previous save in one transaction instead of
+rewriting the files.
+
+The database runs in WAL mode, so readers never wait for a writer. Both
+tables are keyed by the services' hash keys and carry a secondary index on
+normalized (artist, album) for per-album invalidation.
+
+Calls are synchronous. Point reads by key are served from SQLite's page
+cache and run on the calling thread; services run batch writes and full
+scans in a worker thread. Writes share one connection behind a lock; each
+thread reads through its own read-only connection, so a read on the event
+loop never waits for a write transaction (this process's or another's).
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from typing import TYPE_CHECKING, Any
+
+from core.models.cache_types import AlbumCacheEntry
+from core.models.normalization import normalize_for_matching
+from core.models.track_models import CachedApiResult
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+    from pathlib import Path
+
+__all__ = ["SqliteCacheStore"]
+
+_SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS album_years (
+    key TEXT PRIMARY KEY,
+    artist TEXT NOT NULL,
+    album TEXT NOT NULL,
+    artist_norm TEXT NOT NULL,
+    album_norm TEXT NOT NULL,
+    year TEXT NOT NULL,
+    timestamp REAL NOT NULL,
+    confidence INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS album_years_artist_album ON album_years (artist_norm, album_norm);
+CREATE TABLE IF NOT EXISTS api_results (
+    key TEXT PRIMARY KEY,
+    artist TEXT NOT NULL,
+    album TEXT NOT NULL,
+    artist_norm TEXT NOT NULL,
+    album_norm TEXT NOT NULL,
+    source TEXT NOT NULL,
+    year TEXT,
+    timestamp REAL NOT NULL,
+    ttl INTEGER,
+    metadata TEXT NOT NULL,
+    api_response TEXT
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS api_results_artist_album ON api_results (artist_norm, album_norm);
+"""
+
+# Keys per IN (...) query, well below SQLite's bound-parameter limit
+_MAX_QUERY_PARAMETERS = 500
+
+_ALBUM_COLUMNS = "artist, album, year, timestamp, confidence"
+_API_COLUMNS = "artist, album, year, source, timestamp, ttl, metadata, api_response"
+# Rows with a non-empty year are successful lookups (same rule as ApiCacheService)
+_API_SUCCESSFUL = "year IS NOT NULL AND trim(year) != ''"
+
+
+def _album_entry(row: tuple[Any, ...]) -> AlbumCacheEntry:
+    artist, album, year, timestamp, confidence = row
+    return AlbumCacheEntry(artist=artist, album=album, year=year, timestamp=timestamp, confidence=confidence)
+
+
+def _api_result(row: tuple[Any, ...]) -> CachedApiResult:
+    artist, album, year, source, timestamp, ttl, metadata, api_response = row
+    return CachedApiResult(
+        artist=artist,
+        album=album,
+        year=year,
+        source=source,
+        timestamp=timestamp,
+        ttl=ttl,
+        metadata=json.loads(metadata),
+        api_response=json.loads(api_response) if api_response is not None else None,
+    )
+
+
+class SqliteCacheStore:
+    """Album-year and API cache tables in one WAL-mode SQLite database.
+
+    Args:
+        path: Database file (created with its schema on first open)
+        timeout: Seconds a write waits for another process's transaction before failing
+
+    """
+
+    def __init__(self, path: Path, timeout: float = 5.0) -> None:
+        self.path = path
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+        # Read-only connections by thread id, never used under the write lock
+        self._readers_lock = threading.Lock()
+        self._readers: dict[int, sqlite3.Connection] = {}
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use and create the schema."""
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Transactions are explicit (BEGIN in _write); used from worker threads under the lock
+            connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+            connection.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
+            self._connection = connection
+        return self._connection
+
+    def _reader(self) -> sqlite3.Connection:
+        """Return the calling thread's read-only connection, opening it on first use."""
+        thread_id = threading.get_ident()
+        with self._readers_lock:
+            reader = self._readers.get(thread_id)
+        if reader is not None:
+            return reader
+        if self._connection is None:
+            with self._lock:
+                self._connect()  # Creates the database and schema
+        reader = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None, check_same_thread=False)
+        reader.execute("PRAGMA query_only=ON")
+        with self._readers_lock:
+            self._readers[thread_id] = reader
+        return reader
+
+    def close(self) -> None:
+        """Close the read connections, then checkpoint the WAL and close the write connection."""
+        with self._readers_lock:
+            readers, self._readers = list(self._readers.values()), {}
+        for reader in readers:
+            reader.close()
+        with self._lock:
+            if self._connection is not None:
+                self._connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                self._connection.close()
+                self._connection = None
+
+    def _fetchone(self, sql: str, params: tuple[Any, ...] = ()) -> tuple[Any, ...] | None:
+        row: tuple[Any, ...] | None = self._reader().execute(sql, params).fetchone()
+        return row
+
+    def _fetchall(self, sql: str, params: tuple[Any, ...] = ()) -> list[tuple[Any, ...]]:
+        return self._reader().execute(sql, params).fetchall()
+
+    def _write(self, table: str, upsert_sql: str, rows: list[tuple[Any, ...]], deletes: Iterable[str], *, clear: bool) -> None:
+        """Apply a batch of deletes and upserts in one transaction."""
+        with self._lock:
+            connection = self._connect()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                if clear:
+                    connection.execute(f"DELETE FROM {table}")  # noqa: S608 - table names are constants
+                connection.executemany(f"DELETE FROM {table} WHERE key = ?", ((key,) for key in deletes))  # noqa: S608
+                connection.executemany(upsert_sql, rows)
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+
+    # Album years
+
+    def get_album_entry(self, key: str) -> AlbumCacheEntry | None:
+        """Read one album-year entry by hash key."""
+        row = self._fetchone(f"SELECT {_ALBUM_COLUMNS} FROM album_years WHERE key = ?", (key,))  # noqa: S608
+        return _album_entry(row) if row is not None else None
+
+    def get_album_entries(self, keys: Sequence[str]) -> dict[str, AlbumCacheEntry]:
+        """Read the album-year entries of many hash keys (missing keys are left out)."""
+        entries: dict[str, AlbumCacheEntry] = {}
+        connection = self._reader()
+        for start in range(0, len(keys), _MAX_QUERY_PARAMETERS):
+            chunk = keys[start : start + _MAX_QUERY_PARAMETERS]
+            placeholders = ", ".join("?" * len(chunk))
+            rows = connection.execute(f"SELECT key, {_ALBUM_COLUMNS} FROM album_years WHERE key IN ({placeholders})", chunk)  # noqa: S608
+            entries.update((row[0], _album_entry(row[1:])) for row in rows)
+        return entries
+
+    def album_entries(self) -> dict[str, AlbumCacheEntry]:
+        """Read all album-year entries keyed by hash key."""
+        return {row[0]: _album_entry(row[1:]) for row in self._fetchall(f"SELECT key, {_ALBUM_COLUMNS} FROM album_years")}  # noqa: S608
+
+    def album_count(self) -> int:
+        """Count stored album-year entries."""
+        row = self._fetchone("SELECT count(*) FROM album_years")
+        return int(row[0]) if row else 0
+
+    def write_album_entries(self, upserts: Mapping[str, AlbumCacheEntry], deletes: Iterable[str] = (), *, clear: bool = False) -> None:
+        """Store and delete album-year entries in one transaction.
+
+        Args:
+            upserts: Entries to insert or replace, keyed by hash key
+            deletes: Hash keys to delete
+            clear: Delete every entry before applying the batch
+
+        """
+        rows = [
+            (key, e.artist, e.album, normalize_for_matching(e.artist), normalize_for_matching(e.album), e.year, e.timestamp, e.confidence)
+            for key, e in upserts.items()
+        ]
+        self._write("album_years", "INSERT OR REPLACE INTO album_years VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows, deletes, clear=clear)
+
+    # API results
+
+    def get_api_result(self, key: str) -> CachedApiResult | None:
+        """Read one API result by hash key."""
+        row = self._fetchone(f"SELECT {_API_COLUMNS} FROM api_results WHERE key = ?", (key,))  # noqa: S608
+        return _api_result(row) if row is not None else None
+
+    def api_results(self) -> dict[str, CachedApiResult]:
+        """Read all API results keyed by hash key."""
+        return {row[0]: _api_result(row[1:]) for row in self._fetchall(f"SELECT key, {_API_COLUMNS} FROM api_results")}  # noqa: S608
+
+    def api_keys_for_albums(self, album_keys: Iterable[tuple[str, str]]) -> list[str]:
+        """Hash keys of all sources' results for albums.
+
+        Args:
+            album_keys: (artist, album) pairs normalized with ``normalize_for_matching``
+
+        Returns:
+            Hash keys of the stored results of those albums
+
+        """
+        connection = self._reader()
+        return [
+            row[0]
+            for album_key in album_keys
+            for row in connection.execute("SELECT key FROM api_results WHERE artist_norm = ? AND album_norm = ?", album_key)
+        ]
+
+    def api_counts(self) -> tuple[int, int]:
+        """Count stored API results as (total, successful)."""
+        row = self._fetchone(f"SELECT count(*), coalesce(sum({_API_SUCCESSFUL}), 0) FROM api_results")  # noqa: S608
+        return (int(row[0]), int(row[1])) if row else (0, 0)
+
+    def write_api_results(self, upserts: Mapping[str, CachedApiResult], deletes: Iterable[str] = (), *, clear: bool = False) -> None:
+        """Store and delete API results in one transaction.
+
+        Args:
+            upserts: Results to insert or replace, keyed by hash key
+            deletes: Hash keys to delete
+            clear: Delete every result before applying the batch
+
+        """
+        rows = [
+            (
+                key,
+                r.artist,
+                r.album,
+                normalize_for_matching(r.artist),
+                normalize_for_matching(r.album),
+                r.source,
+                r.year,
+                r.timestamp,
+                r.ttl,
+                json.dumps(r.metadata, ensure_ascii=False),
+                json.dumps(r.api_response, ensure_ascii=False) if r.api_response is not None else None,
+            )
+            for key, r in upserts.items()
+        ]
+        self._write("api_results", "INSERT OR REPLACE INTO api_results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows, deletes, clear=clear)
+
+    def delete_expired_api_results(self, successful_cutoff: float | None, failed_cutoff: float | None) -> int:
+        """Delete API results stored before their content type's cutoff.
+
+        Args:
+            successful_cutoff: Timestamp before which successful results expire (None = never)
+            failed_cutoff: Timestamp before which failed lookups expire (None = never)
+
+        Returns:
+            Number of deleted results
+
+        """
+        with self._lock:
+            connection = self._connect()
+            cursor = connection.execute(
+                f"DELETE FROM api_results WHERE timestamp < (CASE WHEN {_API_SUCCESSFUL} THEN ? ELSE ? END)",  # noqa: S608
+                (successful_cutoff, failed_cutoff),
+            )
+            return cursor.rowcount
@@ -0,0 +1,130 @@
+"""Background loading of a cache service's persisted data.
+
+With ``caching.lazy_warmup`` each cache service starts reading its files in
+a background thread and returns from ``initialize`` right away. The service
+waits for its own load before the first operation that touches its data, so
+a lookup waits only for the cache it reads from instead of every cache
+being parsed before startup continues.
+
+Loads run one at a time on a shared background thread in the order they
+were started: parsing is CPU-bound, so parallel loads would only compete for
+the GIL and delay the cache needed first. The parsed data is applied to the
+service on the event loop thread by the first operation that waits for it,
+never from the loading thread. Coroutines wait with ``wait`` so the event
+loop keeps running; ``wait_blocking`` is only for synchronous callers and
+raises instead of freezing an event loop while the load is still running.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import logging
+    from collections.abc import Callable
+
+__all__ = ["CacheWarmup"]
+
+_loader = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="cache-warmup")
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    """Event loop running in the current thread, if any."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+class CacheWarmup[T]:
+    """Load of one cache service's data on the background loading thread.
+
+    Until ``start`` is called there is nothing to wait for, so services that
+    loaded during ``initialize`` pass every ``wait`` immediately.
+
+    Args:
+        name: Service name for log messages
+        logger: Logger for the load summary
+
+    """
+
+    def __init__(self, name: str, logger: logging.Logger) -> None:
+        self.name = name
+        self.logger = logger
+        self._future: concurrent.futures.Future[T] | None = None
+        self._apply: Callable[[T], None] | None = None
+        self._callbacks: list[Callable[[], None]] = []
+        self._started_at = 0.0
+
+    @property
+    def loading(self) -> bool:
+        """Whether a started load has not been applied yet."""
+        return self._future is not None
+
+    def start(self, load: Callable[[], T], apply: Callable[[T], None]) -> None:
+        """Queue ``load`` on the background thread; ``apply`` its result on first wait.
+
+        Args:
+            load: Blocking function reading the persisted data (runs off the event loop)
+            apply: Function installing the loaded data into the service
+
+        """
+        self._future, self._apply = _loader.submit(load), apply
+        self._started_at = time.perf_counter()
+
+    def when_loaded(self, callback: Callable[[], None]) -> None:
+        """Call ``callback`` once the data is applied (immediately if it already is)."""
+        if self._future is None:
+            callback()
+        else:
+            self._callbacks.append(callback)
+
+    async def wait(self) -> None:
+        """Wait without blocking the event loop until the data is loaded and applied."""
+        if self._future is not None:
+            await asyncio.wrap_future(self._future)
+            self._finish()
+
+    def poll(self) -> bool:
+        """Apply the data if the load has finished, without waiting for it.
+
+        Returns:
+            True while the load is still running
+
+        """
+        if self._future is not None and self._future.done():
+            self._finish()
+        return self._future is not None
+
+    def wait_blocking(self) -> None:
+        """Block until the data is loaded and applied (for synchronous cache access).
+
+        Raises:
+            RuntimeError: If the load is still running and this thread runs an
+                event loop, which would freeze; coroutines must ``await wait()``
+
+        """
+        if self._future is None:
+            return
+        if not self._future.done() and _running_loop() is not None:
+            msg = f"{self.name} is still warming up; await its async wait before synchronous access from the event loop"
+            raise RuntimeError(msg)
+        self._future.result()
+        self._finish()
+
+    def _finish(self) -> None:
+        """Apply the loaded data once; a failed load is re-raised to every waiter."""
+        future, apply = self._future, self._apply
+        if future is None or apply is None:
+            return  # Applied by another waiter
+        # Raises the load's exception and leaves the warm-up pending, so nothing is saved over the files
+        loaded = future.result()
+        self._future = self._apply = None
+        apply(loaded)
+        self.logger.debug("%s warm-up finished after %.0f ms", self.name, (time.perf_counter() - self._started_at) * 1000)
+        callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
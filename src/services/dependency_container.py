@@ -18,6 +18,7 @@ from typing import TYPE_CHECKING, Any, Protocol, TypeVar
 import yaml
 
 from core.core_config import load_config, validate_api_auth
+from core.cpu_offload import CpuExecutor, EventLoopLagMonitor
 from core.dry_run import DryRunAppleScriptClient
 from core.logger import LogFormat, shorten_path
 from core.models.album_type import configure_patterns as configure_album_patterns
@@ -98,6 +99,8 @@ class DependencyContainer:
         self._library_snapshot_service: LibrarySnapshotService | None = None
         self._pending_verification_service: PendingVerificationService | None = None
         self._api_orchestrator: ExternalApiOrchestrator | None = None
+        self._cpu_executor: CpuExecutor | None = None
+        self._loop_lag_monitor: EventLoopLagMonitor | None = None
         self._retry_handler: DatabaseRetryHandler | None = None
         self._dry_run = dry_run
         self._skip_api_validation = skip_api_validation
@@ -168,6 +171,14 @@ class DependencyContainer:
             raise RuntimeError(msg)
         return self._api_orchestrator
 
+    @property
+    def cpu_executor(self) -> CpuExecutor:
+        """Executor for CPU-bound batches; raises if not yet initialized."""
+        if self._cpu_executor is None:
+            msg = "CPU executor not initialized"
+            raise RuntimeError(msg)
+        return self._cpu_executor
+
     @property
     def retry_handler(self) -> DatabaseRetryHandler:
         """Initialized retry handler; raises if not yet initialized."""
@@ -307,6 +318,12 @@ class DependencyContainer:
         configure_album_patterns(self.app_config)
 
         # Construct missing service instances
+        cpu_config = self.app_config.cpu_executor
+        if self._cpu_executor is None:
+            self._cpu_executor = CpuExecutor(cpu_config, self._console_logger, self._error_logger)
+        if cpu_config.monitor_loop_lag and self._loop_lag_monitor is None:
+            self._loop_lag_monitor = EventLoopLagMonitor(cpu_config.lag_sample_interval_seconds)
+            self._loop_lag_monitor.start()
         analytics = self._analytics
         if analytics is None:
             loggers = LoggerContainer(
@@ -337,6 +354,7 @@ class DependencyContainer:
                 analytics=analytics,
                 cache_service=cache_service,
                 pending_verification_service=pending_verification,
+                cpu_executor=self._cpu_executor,
             )
 
         # Initialize retry handler from typed config
@@ -427,11 +445,30 @@ class DependencyContainer:
             except (OSError, TypeError, ValueError, RuntimeError) as e:
                 self._console_logger.warning("Failed to save cache: %s", e)
             finally:
+                try:
+                    await self._cache_service.write_metrics_summary()
+                except (OSError, TypeError, ValueError) as e:
+                    self._console_logger.warning("Failed to write cache metrics: %s", e)
                 try:
                     await self._cache_service.shutdown()
                 except (OSError, RuntimeError, asyncio.CancelledError) as e:
                     self._console_logger.warning("Failed to shutdown cache services: %s", e)
 
+        # 3. Stop CPU workers and report how responsive the event loop stayed
+        if self._cpu_executor is not None:
+            await self._cpu_executor.shutdown()
+        if self._loop_lag_monitor is not None:
+            lag = await self._loop_lag_monitor.stop()
+            self._loop_lag_monitor = None
+            self._console_logger.info(
+                "%s lag: mean %.1f ms, p99 %.1f ms, max %.1f ms (%d samples)",
+                LogFormat.entity("EventLoop"),
+                lag.mean_ms,
+                lag.p99_ms,
+                lag.max_ms,
+                lag.samples,
+            )
+
         self._console_logger.debug("%s closed.", LogFormat.entity("DependencyContainer"))
 
     def shutdown(self) -> None:
@@ -23,6 +23,10 @@ Usage:
         # Perform verification
         pass
 
+    # Rule out recent FALLBACK rejections without I/O (Bloom filter, may give false positives)
+    if not service.might_be_unresolvable("Pink Floyd", "The Dark Side of the Moon"):
+        pass
+
     # Get all pending albums (now an async method)
     pending_list = await service.get_all_pending_albums()
 
@@ -37,18 +41,21 @@ import asyncio
 import csv
 import json
 import os
+import struct
 from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from core.logger import LogFormat, get_full_log_path
-from core.models.cache_types import PendingAlbumEntry, VerificationReason
+from core.models.cache_types import RECENT_REJECTION_REASONS, PendingAlbumEntry, VerificationReason
 from core.models.metadata_utils import clean_names
+from services.cache.bloom_filter import BloomFilter
 from services.cache.hash_service import UnifiedHashService
 
 if TYPE_CHECKING:
     import logging
+    from collections.abc import Iterable
 
     from core.models.track_models import AppConfig
 
@@ -56,6 +63,12 @@ if TYPE_CHECKING:
 PENDING_LAST_VERIFY_SUFFIX: str = "_last_verify.txt"
 
 
+# Suffix of the persisted Bloom filter of recently rejected albums
+PENDING_FILTER_SUFFIX: str = ".bloom"
+# CSV size and modification time the persisted filter was built from
+_FILTER_STAMP = struct.Struct("!QQ")
+
+
 # Type alias for error callback used in blocking I/O operations
 ErrorCallback = Callable[[str], None]
 
@@ -99,6 +112,11 @@ class PendingVerificationService:
         # In-memory cache: key -> PendingAlbumEntry
         self.pending_albums: dict[str, PendingAlbumEntry] = {}
 
+        # Keys of albums FALLBACK rejected within their verification interval,
+        # rebuilt from pending_albums on every save and persisted next to the CSV
+        self.unresolvable_filter_path = str(Path(self.pending_file_path).with_suffix(PENDING_FILTER_SUFFIX))
+        self._unresolvable_filter = BloomFilter.for_capacity(0)
+
         # asyncio.Lock for thread-safe access to pending_albums cache
         self._lock = asyncio.Lock()
 
@@ -303,27 +321,65 @@ class PendingVerificationService:
         self.console_logger.debug("Reading pending verification file: %s", self.pending_file_path)
         return self._read_csv_data()
 
+    def _csv_stamp(self) -> bytes:
+        """Size and modification time of the pending CSV, binding the persisted filter to it."""
+        stat = Path(self.pending_file_path).stat()
+        return _FILTER_STAMP.pack(stat.st_size, stat.st_mtime_ns)
+
+    def _blocking_load_unresolvable_filter(self) -> BloomFilter | None:
+        """Read the persisted filter if it was built from the current CSV. Run in executor.
+
+        Returns:
+            The persisted filter, or None if it is missing, stale or unreadable.
+        """
+        try:
+            data = Path(self.unresolvable_filter_path).read_bytes()
+            if data[: _FILTER_STAMP.size] != self._csv_stamp():
+                return None
+            return BloomFilter.from_bytes(data[_FILTER_STAMP.size :])
+        except (OSError, ValueError):
+            return None
+
+    def _blocking_save_unresolvable_filter(self, unresolvable_filter: BloomFilter) -> None:
+        """Persist the filter stamped with the CSV it was built from. Run in executor after the CSV save.
+
+        A failed write is only logged: the filter is rebuilt from the CSV on the next load.
+        """
+        temp_file = f"{self.unresolvable_filter_path}.tmp"
+        try:
+            Path(temp_file).write_bytes(self._csv_stamp() + unresolvable_filter.to_bytes())
+            Path(temp_file).replace(self.unresolvable_filter_path)
+        except OSError as save_error:
+            self._error_callback(f"WARNING: Could not save unresolvable album filter {self.unresolvable_filter_path}: {save_error}")
+            Path(temp_file).unlink(missing_ok=True)
+
     async def _load_pending_albums(self) -> None:
         """Load the list of pending albums from the CSV file into memory asynchronously.
 
-        Uses loop.run_in_executor for blocking file operations.
+        Uses loop.run_in_executor for blocking file operations. The persisted
+        unresolvable album filter is reused when it matches the CSV and rebuilt otherwise.
         """
         loop = asyncio.get_running_loop()
 
         async with self._lock:
             self.pending_albums = await loop.run_in_executor(None, self._blocking_load)
+            persisted_filter = await loop.run_in_executor(None, self._blocking_load_unresolvable_filter)
+            if persisted_filter is None:
+                persisted_filter = self._build_unresolvable_filter(self.pending_albums.items())
+            self._unresolvable_filter = persisted_filter
 
         if self.pending_albums:
             self.console_logger.info("Loaded %d pending albums for verification", len(self.pending_albums))
         else:
             self.console_logger.info("No pending albums loaded (file not found or empty).")
 
-    def _blocking_save(self, entries: list[PendingAlbumEntry]) -> None:
+    def _blocking_save(self, entries: list[PendingAlbumEntry], unresolvable_filter: BloomFilter | None = None) -> None:
         """Blocking save operation to write pending albums to CSV.
         Run in executor.
 
         Args:
             entries: List of PendingAlbumEntry objects to save
+            unresolvable_filter: Filter built from the entries, persisted after the CSV
 
         Raises:
             OSError: If writing or renaming the pending verification file fails.
@@ -354,6 +410,9 @@ class PendingVerificationService:
             # Atomic rename
             Path(temp_file).replace(self.pending_file_path)
 
+            if unresolvable_filter is not None:
+                self._blocking_save_unresolvable_filter(unresolvable_filter)
+
         except (OSError, csv.Error) as save_error:
             self._error_callback(f"ERROR during blocking save of pending verification file: {save_error}")
             if Path(temp_file).exists():
@@ -369,9 +428,12 @@ class PendingVerificationService:
 
         async with self._lock:
             entries = list(self.pending_albums.values())
+            # Rebuilding drops removed albums and elapsed rejections, which a Bloom filter cannot delete
+            unresolvable_filter = self._build_unresolvable_filter(self.pending_albums.items())
+            self._unresolvable_filter = unresolvable_filter
 
         try:
-            await loop.run_in_executor(None, self._blocking_save, entries)
+            await loop.run_in_executor(None, self._blocking_save, entries, unresolvable_filter)
             self.console_logger.info("Saved %d pending albums for verification", len(entries))
         except (OSError, csv.Error) as e:
             self.error_logger.exception("Error saving pending verification file: %s", e)
@@ -488,6 +550,40 @@ class PendingVerificationService:
             entry = self.pending_albums.get(album_key)
             return entry.attempt_count if entry else 0
 
+    def _interval_days(self, entry: PendingAlbumEntry) -> int:
+        """Days after which a pending entry is due for verification."""
+        if entry.reason == VerificationReason.PRERELEASE:
+            override = self._normalize_recheck_days(self._parse_metadata(entry.metadata).get("recheck_days"))
+            return override if override is not None else self.prerelease_recheck_days
+        return self.verification_interval_days
+
+    def _build_unresolvable_filter(self, items: Iterable[tuple[str, PendingAlbumEntry]]) -> BloomFilter:
+        """Build the filter of albums FALLBACK rejected within their verification interval."""
+        now = datetime.now(UTC)
+        return BloomFilter.from_keys(
+            key
+            for key, entry in items
+            if entry.reason in RECENT_REJECTION_REASONS and now < entry.timestamp + timedelta(days=self._interval_days(entry))
+        )
+
+    def might_be_unresolvable(self, artist: str, album: str) -> bool:
+        """Check the Bloom filter for a recent FALLBACK rejection of an album.
+
+        Synchronous and lock-free. False means the album is not a recent
+        rejection; True may be a false positive (or a rejection that has since
+        become due), so callers confirm it with ``get_entry`` and
+        ``is_verification_needed``.
+
+        Args:
+            artist: Artist name
+            album: Album name
+
+        Returns:
+            False if the album is definitely not a recent rejection, True otherwise.
+
+        """
+        return self._generate_album_key(artist, album) in self._unresolvable_filter
+
     # is_verification_needed is now an async method because it acquires the lock
     async def is_verification_needed(self, artist: str, album: str) -> bool:
         """Check if an album needs verification now.
@@ -513,14 +609,7 @@ class PendingVerificationService:
 
             # Get the entry
             entry = self.pending_albums[key_hash]
-            metadata = self._parse_metadata(entry.metadata)
-            interval_days = self.verification_interval_days
-
-            if entry.reason == VerificationReason.PRERELEASE:
-                override = self._normalize_recheck_days(metadata.get("recheck_days"))
-                interval_days = override if override is not None else self.prerelease_recheck_days
-
-            verification_time = entry.timestamp + timedelta(days=interval_days)
+            verification_time = entry.timestamp + timedelta(days=self._interval_days(entry))
 
             if datetime.now(UTC) >= verification_time:
                 # Verification period has elapsed
@@ -21,6 +21,8 @@ class MockDependencyContainer:
             setattr(self, key, value)
         if not hasattr(self, "library_snapshot_service"):
             self.library_snapshot_service = None
+        if not hasattr(self, "cpu_executor"):
+            self.cpu_executor = None
 
 
 class DummyAppleScriptClient:
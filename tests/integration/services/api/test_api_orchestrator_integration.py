@@ -22,7 +22,7 @@ import pytest
 
 from services.api.orchestrator import normalize_name
 from services.api.api_base import ApiRateLimiter, ScoredRelease
-from services.api.year_scoring import create_release_scorer, ArtistPeriodContext
+from services.api.year_scoring import ArtistPeriodContext, ScoringContext, create_release_scorer
 from services.cache.orchestrator import CacheOrchestrator
 from services.pending_verification import PendingVerificationService
 from tests.mocks.csv_mock import MockLogger  # sourcery skip: dont-import-test-modules
@@ -378,8 +378,8 @@ class TestApiOrchestratorArtistActivityPeriod:
             console_logger=MockLogger(),
         )
 
-        # Set the artist period context
-        scorer.set_artist_period_context(period_context)
+        # Per-call scoring context carrying the artist period
+        scoring_context = ScoringContext.from_artist_period(period_context)
 
         # Release from within activity period
         release_1985 = {"title": "Classic Album", "artist": "80s Band", "year": "1985"}
@@ -391,16 +391,16 @@ class TestApiOrchestratorArtistActivityPeriod:
             release=release_1985,
             artist_norm="80s band",
             album_norm="classic album",
-            artist_region=None,
             source="musicbrainz",
+            context=scoring_context,
         )
 
         score_2020 = scorer.score_original_release(
             release=release_2020,
             artist_norm="80s band",
             album_norm="classic album",
-            artist_region=None,
             source="musicbrainz",
+            context=scoring_context,
         )
 
         # Both should produce valid scores (non-negative)
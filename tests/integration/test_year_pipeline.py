@@ -53,6 +53,7 @@ class TestYearPipelineIntegration:
             mock_cache_service.set_async = AsyncMock()
             mock_cache_service.get_album_year_from_cache = AsyncMock(return_value=None)
             mock_cache_service.get_album_year_entry_from_cache = AsyncMock(return_value=None)
+            mock_cache_service.get_album_year_entries_bulk_from_cache = AsyncMock(return_value={})
             mock_cache_service.cache_album_year = AsyncMock()
             mock_cache_service.store_album_year_in_cache = AsyncMock()
 
@@ -8,12 +8,14 @@ from __future__ import annotations
 import contextlib
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any, Literal, overload
+from unittest.mock import AsyncMock, MagicMock
 
 from core.models.track_models import CachedApiResult, TrackDict
 from core.models.cache_types import AlbumCacheEntry, PendingAlbumEntry, VerificationReason
+from core.models.trigram_index import TrigramIndex
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
+    from collections.abc import Awaitable, Callable, Sequence
 
     from core.models.protocols import (
         AppleScriptClientProtocol,
@@ -234,6 +236,14 @@ class MockCacheService:
         if key_str in self.storage:
             del self.storage[key_str]
 
+    async def invalidate_async(self, key_data: CacheableKey) -> None:
+        """Asynchronously invalidate (remove) a specific cache entry.
+
+        Args:
+            key_data: Key of the cache entry to invalidate
+        """
+        self.invalidate(key_data)
+
     async def clear(self) -> None:
         """Clear all entries from the cache."""
         self.storage.clear()
@@ -283,6 +293,44 @@ class MockCacheService:
         key = self.generate_album_key(artist, album)
         return self.album_cache.get(key)
 
+    async def get_album_year_entries_bulk_from_cache(self, albums: Sequence[tuple[str, str]]) -> dict[tuple[str, str], AlbumCacheEntry]:
+        """Get full album cache entries for many artist/album pairs.
+
+        Args:
+            albums: (artist, album) pairs
+
+        Returns:
+            Entries keyed by (artist, album); pairs without an entry are left out
+        """
+        entries = {album_key: self.album_cache.get(self.generate_album_key(*album_key)) for album_key in albums}
+        return {album_key: entry for album_key, entry in entries.items() if entry is not None}
+
+    async def find_similar_album_year_entry_from_cache(
+        self,
+        artist: str,
+        album: str,
+        *,
+        min_similarity: float,
+        limit: int = 5,
+    ) -> AlbumCacheEntry | None:
+        """Get the cache entry of the most similar cached album by the same artist.
+
+        Args:
+            artist: Artist name
+            album: Album name
+            min_similarity: Minimum trigram similarity
+            limit: Maximum number of candidates
+
+        Returns:
+            Most similar AlbumCacheEntry or None
+        """
+        index: TrigramIndex[str] = TrigramIndex()
+        for key, entry in self.album_cache.items():
+            if entry.artist.lower() == artist.lower():
+                index.add(entry.album, key)
+        matches = index.search(album, limit=limit, min_similarity=min_similarity)
+        return self.album_cache[matches[0].value] if matches else None
+
     async def store_album_year_in_cache(
         self,
         artist: str,
@@ -569,6 +617,20 @@ class MockPendingVerificationService:
         # In tests, assume all pending albums are due for verification
         return any(entry.artist == artist and entry.album == album for entry in self.pending_albums)
 
+    def might_be_unresolvable(self, artist: str, album: str) -> bool:
+        """Check whether an album may be a recent rejection.
+
+        For testing, any pending album may be one (no false negatives).
+
+        Args:
+            artist: Artist name
+            album: Album name
+
+        Returns:
+            True if the album is pending
+        """
+        return any(entry.artist == artist and entry.album == album for entry in self.pending_albums)
+
     async def get_entry(self, artist: str, album: str) -> PendingAlbumEntry | None:
         """Get pending entry for artist/album if exists.
 
@@ -650,6 +712,24 @@ class MockPendingVerificationService:
         return False
 
 
+def create_pending_verification_mock(*, might_be_unresolvable: bool = False) -> AsyncMock:
+    """Create an AsyncMock pending verification service with its synchronous members mocked synchronously.
+
+    ``might_be_unresolvable`` is a plain method; left to AsyncMock it would
+    return a (truthy) coroutine that is never awaited.
+
+    Args:
+        might_be_unresolvable: Answer of the Bloom filter pre-check
+
+    Returns:
+        Mock whose coroutine methods are AsyncMocks
+
+    """
+    service = AsyncMock()
+    service.might_be_unresolvable = MagicMock(return_value=might_be_unresolvable)
+    return service
+
+
 if TYPE_CHECKING:
     # Type checking to ensure mock implementations conform to protocols
     from typing import cast
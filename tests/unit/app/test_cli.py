@@ -364,6 +364,27 @@ class TestRotateKeysCommand:
         args = cli.parse_args(["rotate_keys", "--new-password", TEST_PASSWORD])
         assert args.new_password == TEST_PASSWORD
 
+
+class TestImportMusicBrainzCommand:
+    """Tests for import_musicbrainz command."""
+
+    def test_files_parsed(self, cli: CLI) -> None:
+        """Should collect all dump file paths."""
+        args = cli.parse_args(["import_musicbrainz", "release-group.jsonl", "release.jsonl"])
+        assert args.files == ["release-group.jsonl", "release.jsonl"]
+        assert args.entity is None
+
+    def test_alias_and_entity(self, cli: CLI) -> None:
+        """Should accept the mb-import alias and an explicit entity."""
+        args = cli.parse_args(["mb-import", "dump.tsv", "--entity", "release"])
+        assert args.command == "mb-import"
+        assert args.entity == "release"
+
+    def test_files_required(self, cli: CLI) -> None:
+        """Should require at least one file."""
+        with pytest.raises(SystemExit):
+            cli.parse_args(["import_musicbrainz"])
+
     def test_no_backup_flag(self, cli: CLI) -> None:
         """Should parse --no-backup flag."""
         args = cli.parse_args(["rotate_keys", "--no-backup"])
@@ -84,6 +84,8 @@ class TestOrchestratorAllure:
             ("batch", True),
             ("rotate_keys", False),
             ("rotate-keys", False),
+            ("import_musicbrainz", False),
+            ("mb-import", False),
             (None, True),  # Default command
         ],
     )
@@ -329,6 +331,21 @@ class TestOrchestratorAllure:
         console_exception_mock = cast(Mock, orchestrator.console_logger.exception)
         console_exception_mock.assert_called_once_with("❌ Key rotation failed")
 
+    @pytest.mark.asyncio
+    async def test_import_musicbrainz_command(self, tmp_path: Path) -> None:
+        """Dump files are imported into the configured local store; bad files are reported."""
+        deps = self.create_mock_deps()
+        deps.app_config = create_test_app_config(logs_base_dir=str(tmp_path))
+        orchestrator = Orchestrator(deps)
+        dump = tmp_path / "release-group.jsonl"
+        dump.write_text('{"id": "rg-1", "title": "Album", "artist-credit": [{"name": "Artist"}]}\n', encoding="utf-8")
+
+        args = self.create_mock_args(command="import_musicbrainz", files=[str(dump), str(tmp_path / "unknown.jsonl")], entity=None)
+        await orchestrator.run_command(args)
+
+        assert (tmp_path / "cache" / "musicbrainz_local.sqlite3").exists()
+        cast(Mock, orchestrator.error_logger.exception).assert_called_once()
+
     @pytest.mark.asyncio
     async def test_test_mode_execution(self) -> None:
         """Test execution in test mode."""
@@ -424,3 +424,13 @@ class TestAlbumTypeDetectionEdgeCases:
         info = detect_album_type("Demonstrations Album")
         assert info.album_type == AlbumType.NORMAL
         assert info.detected_pattern is None
+
+    def test_most_specific_pattern_reported(self) -> None:
+        """The longest matching pattern of a category is reported, independent of set order."""
+        info = detect_album_type("The Greatest Hits")
+        assert info.album_type == AlbumType.COMPILATION
+        assert info.detected_pattern == "greatest hits"
+
+        info = detect_album_type("Live Sessions and Demos")
+        assert info.album_type == AlbumType.SPECIAL
+        assert info.detected_pattern == "live-sessions"
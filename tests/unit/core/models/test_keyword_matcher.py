@@ -0,0 +1,82 @@
+"""Tests for the Aho-Corasick keyword matcher."""
+
+from __future__ import annotations
+
+import random
+import re
+
+import pytest
+
+from core.models.keyword_matcher import KeywordMatch, KeywordMatcher, get_keyword_matcher
+
+KEYWORDS = ["remaster", "remastered", "deluxe edition", "edition", "hits", "greatest hits", "ost", "b-sides", "live"]
+
+
+def _random_text(rng: random.Random) -> str:
+    """Build a name from keyword fragments, near-misses and filler words."""
+    words = [*KEYWORDS, "demonstrations", "lost", "alive", "hitsville", "Remastered", "DELUXE", "b sides", "(2011)", "[live]", "x_live"]
+    return " ".join(rng.choice(words) for _ in range(rng.randint(0, 6)))
+
+
+class TestKeywordMatcher:
+    """Tests for KeywordMatcher."""
+
+    def test_find_all_reports_overlapping_matches(self) -> None:
+        """Nested and overlapping keywords are all reported with offsets."""
+        matcher = KeywordMatcher(["he", "she", "his", "hers"])
+        assert matcher.find_all("ushers") == [
+            KeywordMatch(1, 4, "she"),
+            KeywordMatch(2, 4, "he"),
+            KeywordMatch(2, 6, "hers"),
+        ]
+
+    def test_matching_is_case_insensitive(self) -> None:
+        """Keywords and text are compared lowercased; the original keyword is reported."""
+        matcher = KeywordMatcher(["OST"])
+        assert matcher.best_match("Interstellar ost") == "OST"
+        assert matcher.contains_any("INTERSTELLAR OST")
+
+    def test_word_boundary(self) -> None:
+        """Word-boundary matching does not match inside longer words."""
+        matcher = KeywordMatcher(["demo", "b sides"], word_boundary=True)
+        assert matcher.find_all("demonstrations") == []
+        assert matcher.best_match("the demo vault") == "demo"
+        assert matcher.best_match("b sides and rarities") == "b sides"
+
+    def test_normalize_applies_to_keywords(self) -> None:
+        """The normalize callable transforms keywords before matching."""
+        matcher = KeywordMatcher(["b-sides"], normalize=lambda keyword: keyword.replace("-", " "))
+        assert matcher.best_match("the b sides") == "b-sides"
+
+    def test_best_match_prefers_longest(self) -> None:
+        """The longest keyword wins over shorter keywords it contains."""
+        matcher = KeywordMatcher(["hits", "greatest hits"])
+        assert matcher.best_match("The Greatest Hits") == "greatest hits"
+
+    def test_empty_inputs(self) -> None:
+        """Empty keywords are ignored and empty text never matches."""
+        matcher = KeywordMatcher(["", "live"])
+        assert len(matcher) == 1
+        assert matcher.find_all("") == []
+        assert not KeywordMatcher([]).contains_any("anything")
+
+    def test_get_keyword_matcher_is_shared(self) -> None:
+        """The same keyword set returns the same matcher instance."""
+        assert get_keyword_matcher(("a", "b")) is get_keyword_matcher(("a", "b"))
+        assert get_keyword_matcher(("a", "b")) is not get_keyword_matcher(("a", "b"), word_boundary=True)
+
+    @pytest.mark.parametrize("word_boundary", [False, True])
+    def test_matches_per_keyword_search(self, word_boundary: bool) -> None:
+        """One scan finds exactly what a separate search per keyword finds."""
+        rng = random.Random(38)  # noqa: S311
+        matcher = KeywordMatcher(KEYWORDS, word_boundary=word_boundary)
+        for _ in range(2000):
+            text = _random_text(rng)
+            lowered = text.lower()
+            expected = set()
+            for keyword in KEYWORDS:
+                needle = re.escape(keyword)
+                pattern = rf"(?=(\b{needle}\b))" if word_boundary else rf"(?=({needle}))"
+                expected.update((match.start(1), match.end(1), keyword) for match in re.finditer(pattern, lowered))
+            assert set(matcher.find_all(text)) == expected, text
+            assert matcher.contains_any(text) == bool(expected)
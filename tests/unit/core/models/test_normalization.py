@@ -2,8 +2,17 @@
 
 from __future__ import annotations
 
+import importlib
 
-from core.models.normalization import are_names_equal, normalize_for_matching
+import pytest
+
+from core.models.normalization import (
+    are_names_equal,
+    clear_normalization_caches,
+    get_normalization_stats,
+    memoized_normalizer,
+    normalize_for_matching,
+)
 
 
 class TestNormalizeForMatching:
@@ -68,3 +77,64 @@ class TestAreNamesEqual:
         # Japanese doesn't trigger RUF001 ambiguous character warnings
         assert are_names_equal("東京事変", "東京事変") is True
         assert are_names_equal("BJÖRK", "björk") is True
+
+
+class TestMemoizedNormalizer:
+    """Tests for the bounded, instrumented normalization memoization."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_caches(self) -> None:
+        clear_normalization_caches()
+
+    def test_counts_hits_and_misses(self) -> None:
+        """Repeated inputs are served from the cache and counted per function."""
+        calls: list[str] = []
+
+        @memoized_normalizer("test.upper")
+        def upper(text: str) -> str:
+            calls.append(text)
+            return text.upper()
+
+        assert [upper("a"), upper("b"), upper("a"), upper("a")] == ["A", "B", "A", "A"]
+
+        assert calls == ["a", "b"]
+        stats = get_normalization_stats()["test.upper"]
+        assert (stats["hits"], stats["misses"], stats["size"]) == (2, 2, 2)
+        assert stats["hit_rate"] == 0.5
+
+    def test_cache_is_bounded(self) -> None:
+        """Least recently used results are evicted beyond maxsize."""
+
+        @memoized_normalizer("test.bounded", maxsize=2)
+        def identity(text: str) -> str:
+            return text
+
+        for text in ("a", "b", "c", "a"):
+            identity(text)
+
+        stats = get_normalization_stats()["test.bounded"]
+        assert stats["size"] == 2
+        assert stats["misses"] == 4
+
+    def test_clear_resets_counters(self) -> None:
+        """Clearing drops cached results and counters."""
+        normalize_for_matching("  Kino  ")
+        normalize_for_matching("  Kino  ")
+
+        clear_normalization_caches()
+
+        assert get_normalization_stats()["normalize_for_matching"]["hits"] == 0
+
+    def test_shared_normalizers_are_registered(self) -> None:
+        """Scorer, client and album-type normalizers report their hit rates."""
+        for module in ("core.models.album_type", "services.api.discogs", "services.api.year_scoring"):
+            importlib.import_module(module)
+
+        assert {
+            "normalize_for_matching",
+            "album_type._normalize_for_matching",
+            "BaseApiClient._normalize_name",
+            "ReleaseScorer._normalize_name",
+            "ReleaseScorer._strip_edition_suffix",
+            "discogs._normalize_artist_for_matching",
+        } <= set(get_normalization_stats())
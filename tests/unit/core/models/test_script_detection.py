@@ -1,7 +1,17 @@
 """Tests for script detection utilities."""
 
+import random
+
+import pytest
+
+from core.models.normalization import get_normalization_stats
 from core.models.script_detection import (
+    MINIMUM_SCRIPT_COUNT,
+    MINIMUM_SCRIPT_RATIO,
+    SCRIPT_DETECTORS,
     ScriptType,
+    _count_script_characters,
+    _SCRIPT_RANGES,
     detect_primary_script,
     get_all_scripts,
     has_arabic,
@@ -453,3 +463,93 @@ class TestEdgeCases:
         assert has_greek("\u03b1") is True  # Greek alpha (U+03B1)
         assert has_greek("β") is True
         assert has_greek("π") is True
+
+
+def _reference_count(text: str) -> tuple[dict[ScriptType, int], int]:
+    """Per-character detector chain used before the range table."""
+    counts: dict[ScriptType, int] = {}
+    total = 0
+    for char in text:
+        if char.isspace() or not char.isalpha():
+            continue
+        total += 1
+        for script_type, detector in SCRIPT_DETECTORS.items():
+            if detector(char):
+                counts[script_type] = counts.get(script_type, 0) + 1
+                break
+    return counts, total
+
+
+def _reference_primary(text: str) -> ScriptType:
+    """Primary script detection built on the has_* detectors only."""
+    if not text:
+        return ScriptType.UNKNOWN
+    if has_japanese(text) and has_chinese(text):
+        kana = any("\u3040" <= char <= "\u309f" or "\u30a0" <= char <= "\u30ff" for char in text)
+        return ScriptType.JAPANESE if kana else ScriptType.CHINESE
+    counts, total = _reference_count(text)
+    if total == 0 or not counts:
+        return ScriptType.UNKNOWN
+    if len(counts) == MINIMUM_SCRIPT_COUNT and ScriptType.LATIN in counts:
+        non_latin = next(script for script in counts if script != ScriptType.LATIN)
+        if counts[ScriptType.LATIN] / total < MINIMUM_SCRIPT_RATIO:
+            return non_latin
+        if counts[non_latin] / total < MINIMUM_SCRIPT_RATIO:
+            return ScriptType.LATIN
+        return ScriptType.MIXED
+    max_count = max(counts.values())
+    dominant = [script for script, count in counts.items() if count == max_count]
+    return dominant[0] if len(dominant) == 1 else ScriptType.MIXED
+
+
+def _random_corpus(size: int, seed: int) -> list[str]:
+    """Random strings weighted towards script range boundaries."""
+    rng = random.Random(seed)  # noqa: S311
+    boundary_points = {
+        point + offset for ranges in _SCRIPT_RANGES.values() for start, end in ranges for point in (start, end) for offset in (-1, 0, 1)
+    }
+    alphabet = [chr(point) for point in sorted(boundary_points)]
+    alphabet += [" ", "-", "!", "1", "(", "\u060c", "\u30fb", "\u0531", "\u1200", "\U00020000", "\U0001f3b5"]
+    alphabet += [chr(rng.randrange(0x20, 0xFFFF)) for _ in range(400)]
+    words = ["Pink Floyd", "МУР", "音楽", "ひらがな", "周杰伦", "한국", "Μουσική", "מוזיקה", "เพลง", "हिन्दी", "محمد"]  # noqa: RUF001
+    corpus: list[str] = []
+    for _ in range(size):
+        parts = [rng.choice(words) if rng.random() < 0.3 else "".join(rng.choices(alphabet, k=rng.randint(0, 6))) for _ in range(rng.randint(1, 4))]
+        corpus.append(" ".join(parts))
+    return corpus
+
+
+@pytest.fixture(scope="module")
+def corpus() -> list[str]:
+    """Large randomized corpus of mixed-script strings."""
+    return _random_corpus(20_000, seed=37)
+
+
+class TestTableDrivenClassifier:
+    """The range-table classifier reproduces the per-detector implementation."""
+
+    def test_primary_script_matches_reference(self, corpus: list[str]) -> None:
+        """detect_primary_script agrees with the detector-chain implementation."""
+        mismatches = [text for text in corpus if detect_primary_script(text) != _reference_primary(text)]
+        assert mismatches == []
+
+    def test_counts_match_reference(self, corpus: list[str]) -> None:
+        """Per-script letter counts and totals are unchanged."""
+        assert all(_count_script_characters(text) == _reference_count(text) for text in corpus)
+
+    def test_all_scripts_match_detectors(self, corpus: list[str]) -> None:
+        """get_all_scripts and is_script_type agree with every has_* detector."""
+        for text in corpus:
+            expected = [script for script, detector in SCRIPT_DETECTORS.items() if detector(text)]
+            assert get_all_scripts(text) == expected, text
+            assert [script for script in SCRIPT_DETECTORS if is_script_type(text, script)] == expected
+
+    def test_results_are_cached_per_string(self) -> None:
+        """Repeated lookups of the same string reuse one classification."""
+        before = get_normalization_stats()["script_detection._script_profile"]["hits"]
+
+        detect_primary_script("Океан Ельзи unique cache probe")
+        get_all_scripts("Океан Ельзи unique cache probe")
+        is_primarily_cyrillic("Океан Ельзи unique cache probe")
+
+        assert get_normalization_stats()["script_detection._script_profile"]["hits"] - before >= 2
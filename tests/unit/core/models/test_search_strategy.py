@@ -82,6 +82,13 @@ class TestDetectSearchStrategy:
         info = detect_search_strategy("Various", "Interstellar OST", config)
         assert info.strategy == SearchStrategy.SOUNDTRACK
 
+    def test_longest_soundtrack_pattern_wins(self, config: AppConfig) -> None:
+        """A longer pattern wins over "OST" matched inside a word."""
+        info = detect_search_strategy("David Lynch", "Lost Highway Soundtrack", config)
+        assert info.strategy == SearchStrategy.SOUNDTRACK
+        assert info.detected_pattern == "soundtrack"
+        assert info.modified_artist == "Lost Highway"
+
     def test_various_artists_detected(self, config: AppConfig) -> None:
         """Various Artists should be detected."""
         info = detect_search_strategy("Various Artists", "Metal Hammer Presents", config)
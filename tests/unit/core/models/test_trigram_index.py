@@ -0,0 +1,92 @@
+"""Tests for the trigram fuzzy-match index."""
+
+from __future__ import annotations
+
+import random
+
+from core.models.trigram_index import TrigramIndex, edition_insensitive_normalizer
+
+ALBUMS = ["OK Computer", "Kid A", "Amnesiac", "Hail to the Thief", "In Rainbows", "The Bends", "Pablo Honey", "A Moon Shaped Pool"]
+
+
+def _index() -> TrigramIndex[int]:
+    index: TrigramIndex[int] = TrigramIndex()
+    for position, album in enumerate(ALBUMS):
+        index.add(album, position)
+    return index
+
+
+class TestTrigramIndex:
+    """Tests for TrigramIndex."""
+
+    def test_identical_after_normalization(self) -> None:
+        """Names that normalize identically have similarity 1.0."""
+        matches = _index().search("ok computer!")
+        assert matches[0].name == "OK Computer"
+        assert matches[0].similarity == 1.0
+
+    def test_near_miss_ranked_first(self) -> None:
+        """Spelling and article variants rank the intended album first."""
+        index = _index()
+        assert index.search("Hail To Thief", limit=1)[0].name == "Hail to the Thief"
+        assert index.search("In Rainbow", limit=1)[0].name == "In Rainbows"
+        assert index.search("Amnesiak", limit=1)[0].name == "Amnesiac"
+
+    def test_min_similarity_and_limit(self) -> None:
+        """Matches below the threshold are dropped and at most ``limit`` are returned."""
+        index = _index()
+        assert index.search("Amnesiak", min_similarity=0.9) == []
+        assert len(index.search("the", limit=2)) == 2
+        assert index.search("zzzz") == []
+
+    def test_numbers_must_agree(self) -> None:
+        """Sequels, volumes and years are never near matches of each other."""
+        index: TrigramIndex[str] = TrigramIndex()
+        index.add("Live 1995", "live-1995")
+        index.add("Greatest Hits", "hits")
+        assert index.search("Live 1996") == []
+        assert index.search("Greatest Hits II") == []
+        assert index.search("Greatest Hits")[0].value == "hits"
+
+    def test_add_replaces_and_discard_removes(self) -> None:
+        """Re-adding a value replaces its name; discarded values are no longer found."""
+        index = _index()
+        index.add("Kid B", 1)
+        assert index.search("Kid A", min_similarity=1.0) == []
+        index.discard(1)
+        assert 1 not in index
+        assert len(index) == len(ALBUMS) - 1
+        assert all(match.value != 1 for match in index.search("Kid B"))
+
+    def test_best_matches_returns_ties(self) -> None:
+        """All values tied for the best similarity are returned."""
+        index: TrigramIndex[str] = TrigramIndex()
+        index.add("Kill 'Em All", "original")
+        index.add("Kill Em All", "remaster")
+        index.add("Ride the Lightning", "other")
+        assert sorted(index.best_matches("kill em all", min_similarity=0.8)) == ["original", "remaster"]
+
+    def test_edition_insensitive_normalizer(self) -> None:
+        """Edition segments are ignored by the normalizer."""
+        index: TrigramIndex[int] = TrigramIndex(edition_insensitive_normalizer(["deluxe", "remaster"]))
+        index.add("The Bends", 0)
+        assert index.search("The Bends (Deluxe Edition)")[0].similarity == 1.0
+        assert index.search("The Bends [2009 Remaster]")[0].similarity == 1.0
+
+    def test_matches_exhaustive_scan(self) -> None:
+        """Candidate retrieval through the postings finds what a full scan finds."""
+        rng = random.Random(39)  # noqa: S311
+        words = ["black", "night", "river", "echo", "glass", "ghost", "iron", "velvet"]
+        names = [" ".join(rng.sample(words, rng.randint(1, 3))) for _ in range(300)]
+        index: TrigramIndex[int] = TrigramIndex()
+        for position, name in enumerate(names):
+            index.add(name, position)
+
+        for query in rng.sample(names, 20):
+            top = index.search(query, limit=len(names), min_similarity=0.3)
+            scanned = []
+            for position in range(len(names)):
+                single: TrigramIndex[int] = TrigramIndex()
+                single.add(names[position], position)
+                scanned.extend(single.search(query, min_similarity=0.3))
+            assert {match.value for match in top} == {match.value for match in scanned}
@@ -0,0 +1,228 @@
+"""Tests for CPU-bound work offload and event-loop lag measurement."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import pickle
+import time
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from core.cpu_offload import CpuExecutor, EventLoopLagMonitor
+from core.models.metadata_utils import determine_dominant_genre_for_artist, parse_tracks
+from core.models.track_models import CpuExecutorConfig, CpuExecutorMode, TrackDict
+from core.tracks.track_delta import FIELD_SEPARATOR, LINE_SEPARATOR
+from services.api.year_scoring import ScoringContext, create_release_scorer
+
+LOGGER = logging.getLogger("test.cpu_offload")
+
+
+def _raw_output(count: int) -> str:
+    """Build AppleScript output with ``count`` tracks and one malformed row."""
+    rows = [
+        FIELD_SEPARATOR.join(
+            [str(i), f"Song {i}", f"Artist {i % 7}", "", f"Album {i % 11}", "Rock", f"2020-01-{i % 28 + 1:02d} 10:00:00", "", "", "1999", "", ""]
+        )
+        for i in range(count)
+    ]
+    rows.append("broken-row")
+    return LINE_SEPARATOR.join(rows)
+
+
+def _executor(mode: CpuExecutorMode, **overrides: Any) -> CpuExecutor:
+    return CpuExecutor(CpuExecutorConfig(mode=mode, **overrides), LOGGER, LOGGER)
+
+
+class _BrokenPool(ThreadPoolExecutor):
+    """Pool whose workers died."""
+
+    def submit(self, *_args: Any, **_kwargs: Any) -> Any:
+        raise BrokenExecutor
+
+
+class TestCpuExecutor:
+    """Tests for CpuExecutor."""
+
+    @pytest.mark.asyncio
+    async def test_inline_mode_never_creates_pool(self) -> None:
+        """The default mode runs work units on the calling thread."""
+        executor = _executor(CpuExecutorMode.INLINE, min_parse_bytes=0)
+
+        tracks = await executor.parse_tracks(_raw_output(5), LOGGER)
+
+        assert len(tracks) == 5
+        assert executor._pool is None
+        assert executor.stats == {"offloaded": 0, "inline": 1}
+
+    @pytest.mark.asyncio
+    async def test_small_batches_stay_inline(self) -> None:
+        """Batches below the threshold are not sent to the pool."""
+        executor = _executor(CpuExecutorMode.PROCESS, min_parse_bytes=10_000_000)
+
+        await executor.parse_tracks(_raw_output(5), LOGGER)
+
+        assert executor._pool is None
+        assert executor.stats["inline"] == 1
+
+    @pytest.mark.asyncio
+    async def test_process_pool_parses_like_parse_tracks(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Parsing in a worker process returns the same tracks and logs skipped rows in the parent."""
+        raw = _raw_output(300)
+        executor = _executor(CpuExecutorMode.PROCESS, max_workers=1, min_parse_bytes=0, min_genre_artists=1)
+        try:
+            with caplog.at_level(logging.WARNING, logger=LOGGER.name):
+                tracks = await executor.parse_tracks(raw, LOGGER)
+            genres = await executor.dominant_genres({"artist": tracks[:10]}, LOGGER)
+        finally:
+            await executor.shutdown()
+
+        assert tracks == parse_tracks(raw, LOGGER)
+        assert "Malformed track data row skipped: broken-row" in caplog.text
+        assert genres == {"artist": determine_dominant_genre_for_artist(tracks[:10], LOGGER)}
+        assert executor.stats["offloaded"] == 2
+
+    @pytest.mark.asyncio
+    async def test_broken_pool_falls_back_to_inline(self) -> None:
+        """A failed pool is dropped and the work unit runs inline from then on."""
+        executor = _executor(CpuExecutorMode.PROCESS, min_genre_artists=1)
+        tracks = [TrackDict(id="1", name="a", artist="b", album="c", genre="Jazz", date_added="2020-01-01 00:00:00")]
+
+        with patch.object(executor, "_create_pool", return_value=_BrokenPool()):
+            genres = await executor.dominant_genres({"b": tracks}, LOGGER)
+
+        assert genres == {"b": "Jazz"}
+        assert not executor.enabled
+        assert executor._pool is None
+
+    def test_interpreter_mode_without_support_uses_process_pool(self) -> None:
+        """Builds without subinterpreter pools or free threading fall back to processes."""
+        executor = _executor(CpuExecutorMode.INTERPRETER)
+
+        with patch("core.cpu_offload.concurrent.futures", spec=[]), patch("core.cpu_offload._free_threaded", return_value=False):
+            pool = executor._create_pool()
+        pool.shutdown()
+
+        assert isinstance(pool, ProcessPoolExecutor)
+
+    def test_interpreter_mode_on_free_threaded_build_uses_threads(self) -> None:
+        """Free-threaded builds without subinterpreter pools run work units on threads."""
+        executor = _executor(CpuExecutorMode.INTERPRETER)
+
+        with patch("core.cpu_offload.concurrent.futures", spec=[]), patch("core.cpu_offload._free_threaded", return_value=True):
+            pool = executor._create_pool()
+        pool.shutdown()
+
+        assert isinstance(pool, ThreadPoolExecutor)
+
+    @pytest.mark.asyncio
+    async def test_score_releases_work_unit_is_picklable(self) -> None:
+        """The scoring work unit survives pickling and scores like the scorer."""
+        scorer = create_release_scorer(remaster_keywords=["remaster"])
+        releases = [
+            {"title": "Master of Puppets", "artist": "Metallica", "year": "1986", "country": "US", "status": "Official"},
+            {"title": "Master of Puppets (Remastered)", "artist": "Metallica", "year": "2017", "country": "US", "status": "Official"},
+        ]
+        context = ScoringContext(start_year=1981)
+        expected = scorer.score_releases(releases, "metallica", "master of puppets", source="musicbrainz", context=context)
+        executor = _executor(CpuExecutorMode.PROCESS, min_scoring_releases=1)
+        submitted: list[Any] = []
+
+        async def run(func: Any, *args: Any, offload: bool = True) -> Any:
+            submitted.append((func, offload))
+            return pickle.loads(pickle.dumps(func))(*args)  # noqa: S301
+
+        with patch.object(executor, "run", side_effect=run):
+            scores = await executor.score_releases(scorer, releases, "metallica", "master of puppets", source="musicbrainz", context=context)
+
+        assert scores == expected
+        assert isinstance(submitted[0][0], functools.partial)
+        assert submitted[0][1] is True
+
+    def test_pickled_scorer_leaves_its_logger_behind(self) -> None:
+        """A scorer sent to a worker carries no logger and gets the module logger back."""
+        scorer = create_release_scorer(console_logger=LOGGER)
+
+        assert "console_logger" not in scorer.__getstate__()
+        restored = pickle.loads(pickle.dumps(scorer))  # noqa: S301
+        assert restored.console_logger is logging.getLogger("services.api.year_scoring")
+
+    @pytest.mark.asyncio
+    async def test_debug_scoring_stays_inline(self) -> None:
+        """Score breakdowns are only logged in the parent, so debug scoring is not offloaded."""
+        debug_logger = logging.getLogger("test.cpu_offload.debug_scorer")
+        debug_logger.setLevel(logging.DEBUG)
+        scorer = create_release_scorer(console_logger=debug_logger)
+        executor = _executor(CpuExecutorMode.PROCESS, min_scoring_releases=1)
+
+        scores = await executor.score_releases(
+            scorer, [{"title": "A", "artist": "B", "year": "1990"}], "b", "a", source="musicbrainz", context=ScoringContext()
+        )
+
+        assert len(scores) == 1
+        assert executor._pool is None
+        assert executor.stats == {"offloaded": 0, "inline": 1}
+
+    @pytest.mark.asyncio
+    async def test_genre_warnings_are_logged_in_parent(self, caplog: pytest.LogCaptureFixture) -> None:
+        """The genre work unit takes no logger; its warnings come back as data and are logged by the parent."""
+        executor = _executor(CpuExecutorMode.PROCESS, min_genre_artists=1)
+        tracks = [
+            TrackDict(id="1", name="a", artist="b", album="c", genre="Jazz", date_added="2020-01-01 00:00:00"),
+            TrackDict(id="2", name="d", artist="b", album="e", genre="Rock", date_added="not a date"),
+        ]
+        submitted: list[tuple[Any, ...]] = []
+
+        async def run(func: Any, *args: Any, offload: bool = True) -> Any:
+            submitted.append(args)
+            return pickle.loads(pickle.dumps(func(*pickle.loads(pickle.dumps(args)))))  # noqa: S301
+
+        with patch.object(executor, "run", side_effect=run), caplog.at_level(logging.WARNING, logger=LOGGER.name):
+            genres = await executor.dominant_genres({"b": tracks}, LOGGER)
+
+        assert genres == {"b": "Jazz"}
+        assert not any(isinstance(arg, logging.Logger) for args in submitted for arg in args)
+        assert "Invalid date format 'not a date'" in caplog.text
+
+
+class TestEventLoopLagMonitor:
+    """Tests for EventLoopLagMonitor."""
+
+    @pytest.mark.asyncio
+    async def test_blocking_call_shows_up_as_lag(self) -> None:
+        """A synchronous stall on the loop is reported as lag."""
+        monitor = EventLoopLagMonitor(interval=0.01)
+        monitor.start()
+        await asyncio.sleep(0.05)
+        time.sleep(0.1)  # Blocks the loop like an inline parse of a large output
+        await asyncio.sleep(0.05)
+
+        stats = await monitor.stop()
+
+        assert stats.samples >= 2
+        assert stats.max_ms >= 50
+        assert stats.p99_ms <= stats.max_ms
+
+    @pytest.mark.asyncio
+    async def test_stall_until_stop_is_counted(self) -> None:
+        """A stall that never yields back before stop() still produces a sample."""
+        monitor = EventLoopLagMonitor(interval=0.01)
+        monitor.start()
+        time.sleep(0.05)
+
+        stats = await monitor.stop()
+
+        assert stats.samples == 1
+        assert stats.max_ms >= 40
+
+    @pytest.mark.asyncio
+    async def test_summary_without_samples(self) -> None:
+        """Stopping before the first sample reports zeros."""
+        stats = await EventLoopLagMonitor(interval=10).stop()
+
+        assert stats.samples == 0
+        assert stats.max_ms == 0.0
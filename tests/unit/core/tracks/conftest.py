@@ -80,6 +80,7 @@ def create_year_determinator_mock() -> MagicMock:
     """Build a MagicMock year-determinator with all async stubs."""
     determinator = MagicMock()
     determinator.should_skip_album = AsyncMock(return_value=(False, None))
+    determinator.prefetch_cache_entries = AsyncMock()
     determinator.determine_album_year = AsyncMock(return_value="2020")
     determinator.check_prerelease_status = AsyncMock(return_value=False)
     determinator.check_suspicious_album = AsyncMock(return_value=False)
@@ -510,6 +510,26 @@ class TestGenreManager:
                 assert len(updated_tracks) == 2
                 assert len(change_logs) == 2
 
+    @pytest.mark.asyncio
+    async def test_update_genres_uses_cpu_executor_batch(self) -> None:
+        """With a CPU executor, dominant genres come from one batch instead of per-artist calls."""
+        mock_processor = MagicMock()
+        mock_processor.update_track_async = AsyncMock(return_value=True)
+        manager = TestGenreManager.create_manager(mock_processor)
+        manager.cpu_executor = MagicMock()
+        manager.cpu_executor.dominant_genres = AsyncMock(return_value={"Artist1": "Rock"})
+        tracks = [DummyTrackData.create(track_id="1", artist="Artist1", genre="")]
+
+        with (
+            patch("core.tracks.genre_manager.group_tracks_by_artist", return_value={"Artist1": tracks}),
+            patch("core.tracks.genre_manager.determine_dominant_genre_for_artist") as mock_determine,
+        ):
+            updated_tracks, _ = await manager.update_genres_by_artist_async(tracks)
+
+        manager.cpu_executor.dominant_genres.assert_awaited_once()
+        mock_determine.assert_not_called()
+        assert len(updated_tracks) == 1
+
     @pytest.mark.asyncio
     async def test_process_single_artist_wrapper(self) -> None:
         """Test single artist wrapper processing."""
@@ -195,6 +195,10 @@ class _MockCacheService:
         if key_str in self.storage:
             del self.storage[key_str]
 
+    async def invalidate_async(self, key_data: CacheableKey) -> None:
+        """Asynchronously invalidate a cache entry."""
+        self.invalidate(key_data)
+
     async def clear(self) -> None:
         """Clear all cache entries."""
         self.storage.clear()
@@ -26,6 +26,7 @@ from core.tracks.year_determination import (
 )
 from core.tracks.year_fallback import YearFallbackHandler
 from core.models.cache_types import AlbumCacheEntry
+from core.models.track_models import FuzzyMatchConfig
 from tests.factories import create_test_app_config
 
 if TYPE_CHECKING:
@@ -239,6 +240,45 @@ class TestTryLocalSources:
         # Cache should NOT be checked if dominant year exists
         cache_service.get_album_year_entry_from_cache.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_uses_similar_cached_album_when_fuzzy_match_enabled(self) -> None:
+        """A trusted cache entry of a near-miss album name is used after an exact miss."""
+        cache_service = _create_mock_cache_service()
+        near_entry = AlbumCacheEntry(artist="Artist", album="Album", year="2018", timestamp=0.0, confidence=CACHE_TRUST_THRESHOLD)
+        cache_service.find_similar_album_year_entry_from_cache = AsyncMock(return_value=near_entry)
+        config = create_test_app_config()
+        config.year_retrieval.fuzzy_match = FuzzyMatchConfig(enabled=True, min_similarity=0.9, max_candidates=3)
+
+        determinator = _create_year_determinator(cache_service=cache_service, config=config)
+        result = await determinator._try_local_sources("Artist", "Album (Deluxe)", [_create_track()])
+
+        assert result == "2018"
+        cache_service.find_similar_album_year_entry_from_cache.assert_awaited_once_with("Artist", "Album (Deluxe)", min_similarity=0.9, limit=3)
+
+    @pytest.mark.asyncio
+    async def test_ignores_similar_cached_album_with_low_confidence(self) -> None:
+        """Near matches need the same confidence as exact cache hits."""
+        cache_service = _create_mock_cache_service()
+        near_entry = AlbumCacheEntry(artist="Artist", album="Album", year="2018", timestamp=0.0, confidence=CACHE_TRUST_THRESHOLD - 1)
+        cache_service.find_similar_album_year_entry_from_cache = AsyncMock(return_value=near_entry)
+        config = create_test_app_config()
+        config.year_retrieval.fuzzy_match = FuzzyMatchConfig(enabled=True)
+
+        determinator = _create_year_determinator(cache_service=cache_service, config=config)
+
+        assert await determinator._try_local_sources("Artist", "Album (Deluxe)", [_create_track()]) is None
+
+    @pytest.mark.asyncio
+    async def test_similar_cached_album_not_checked_when_disabled(self) -> None:
+        """Fuzzy matching is off by default."""
+        cache_service = _create_mock_cache_service()
+        cache_service.find_similar_album_year_entry_from_cache = AsyncMock()
+
+        determinator = _create_year_determinator(cache_service=cache_service)
+        await determinator._try_local_sources("Artist", "Album", [_create_track()])
+
+        cache_service.find_similar_album_year_entry_from_cache.assert_not_called()
+
 
 @pytest.mark.unit
 class TestFetchFromApi:
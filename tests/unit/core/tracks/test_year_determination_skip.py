@@ -28,7 +28,7 @@ from core.models.protocols import (
 from core.tracks.year_consistency import YearConsistencyChecker
 from core.tracks.year_determination import YearDeterminator
 from core.tracks.year_fallback import YearFallbackHandler
-from core.models.cache_types import PendingAlbumEntry, VerificationReason
+from core.models.cache_types import AlbumCacheEntry, PendingAlbumEntry, VerificationReason
 
 if TYPE_CHECKING:
     from core.models.track_models import AppConfig
@@ -55,6 +55,7 @@ def _create_mock_pending_verification() -> MagicMock:
     """Create a mock pending verification service."""
     service = MagicMock()
     service.mark_for_verification = AsyncMock()
+    service.might_be_unresolvable = MagicMock(return_value=True)
     service.get_entry = AsyncMock(return_value=None)
     service.is_verification_needed = AsyncMock(return_value=False)
     return service
@@ -238,6 +239,26 @@ class TestShouldSkipAlbumCacheInteraction:
 
         cache_service.get_album_year_from_cache.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_prefetched_entry_replaces_cache_query(self) -> None:
+        """Should use the entry from the bulk pre-pass instead of a per-album lookup."""
+        cache_service = _create_mock_cache_service()
+        cache_service.get_album_year_entries_bulk_from_cache = AsyncMock(
+            return_value={("Artist", "Album"): AlbumCacheEntry(artist="Artist", album="Album", year="2018", timestamp=0.0)}
+        )
+        determinator = _create_year_determinator(cache_service=cache_service)
+        tracks = [create_test_track(year="2018", year_set_by_mgu="2020")]
+
+        await determinator.prefetch_cache_entries([("Artist", "Album"), ("Artist", "Other")])
+        await determinator.should_skip_album(tracks, "Artist", "Album")
+
+        cache_service.get_album_year_entries_bulk_from_cache.assert_awaited_once()
+        cache_service.get_album_year_from_cache.assert_not_called()
+
+        # The prefetched entry is used once; later checks query the cache again
+        await determinator.should_skip_album(tracks, "Artist", "Album")
+        cache_service.get_album_year_from_cache.assert_called_once()
+
 
 @pytest.mark.unit
 class TestShouldSkipAlbumMultipleTracks:
@@ -394,6 +415,21 @@ class TestShouldSkipAlbumRecentRejection:
         # Should NOT be skipped due to rejection (may be skipped for other reasons)
         assert not reason.startswith("recently_rejected:")
 
+    @pytest.mark.asyncio
+    async def test_filter_miss_skips_pending_lookups(self) -> None:
+        """Albums the unresolvable filter rules out never reach the pending list."""
+        pending_service = _create_mock_pending_verification()
+        pending_service.might_be_unresolvable = MagicMock(return_value=False)
+
+        determinator = _create_year_determinator(pending_verification=pending_service)
+
+        _should_skip, reason = await determinator.should_skip_album([create_test_track(year="2020")], "Artist", "Album")
+
+        assert not reason.startswith("recently_rejected:")
+        pending_service.might_be_unresolvable.assert_called_once_with("Artist", "Album")
+        pending_service.get_entry.assert_not_awaited()
+        pending_service.is_verification_needed.assert_not_awaited()
+
 
 @pytest.mark.unit
 class TestShouldSkipAlbumConsistentYear:
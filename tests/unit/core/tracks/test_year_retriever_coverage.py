@@ -12,6 +12,7 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from core import debug_utils
+from core.models.cache_types import PendingAlbumEntry, VerificationReason
 from core.models.track_models import ChangeLogEntry, TrackDict
 from core.retry_handler import DatabaseRetryHandler, RetryPolicy
 from core.tracks.year_batch import YearBatchProcessor
@@ -22,6 +23,7 @@ from core.tracks.year_consistency import (
 )
 from core.tracks.year_retriever import YearRetriever
 from tests.factories import create_test_app_config  # sourcery skip: dont-import-test-modules
+from tests.mocks.protocol_mocks import create_pending_verification_mock  # sourcery skip: dont-import-test-modules
 
 if TYPE_CHECKING:
     from core.models.track_models import AppConfig
@@ -46,6 +48,7 @@ def mock_cache_service() -> AsyncMock:
     mock = AsyncMock()
     # Default: no cached entry (triggers API call)
     mock.get_album_year_entry_from_cache = AsyncMock(return_value=None)
+    mock.get_album_year_entries_bulk_from_cache = AsyncMock(return_value={})
     return mock
 
 
@@ -60,7 +63,7 @@ def mock_external_api() -> AsyncMock:
 @pytest.fixture
 def mock_pending_verification() -> AsyncMock:
     """Create mock pending verification service."""
-    service = AsyncMock()
+    service = create_pending_verification_mock()
     service.mark_for_verification = AsyncMock()
     return service
 
@@ -625,6 +628,24 @@ class TestShouldSkipAlbumDueToExistingYears:
         should_skip, _ = await year_retriever._year_determinator.should_skip_album(tracks, "Artist", "Album")
         assert should_skip is False
 
+    @pytest.mark.asyncio
+    async def test_skips_recent_rejection_flagged_by_filter(self, year_retriever: YearRetriever, mock_pending_verification: AsyncMock) -> None:
+        """Test skips an album the unresolvable filter flags and the pending list confirms as recently rejected."""
+        tracks = [TrackDict(id="1", name="T1", artist="A", album="Al", genre="R", year="")]
+        mock_pending_verification.might_be_unresolvable = MagicMock(return_value=True)
+        mock_pending_verification.get_entry = AsyncMock(
+            return_value=PendingAlbumEntry(
+                timestamp=datetime.now(UTC), artist="Artist", album="Album", reason=VerificationReason.SUSPICIOUS_YEAR_CHANGE
+            )
+        )
+        mock_pending_verification.is_verification_needed = AsyncMock(return_value=False)
+
+        should_skip, reason = await year_retriever._year_determinator.should_skip_album(tracks, "Artist", "Album")
+
+        assert should_skip is True
+        assert reason == f"recently_rejected:{VerificationReason.SUSPICIOUS_YEAR_CHANGE.value}"
+        mock_pending_verification.might_be_unresolvable.assert_called_once_with("Artist", "Album")
+
 
 class TestProcessBatchesSequentially:
     """Tests for _process_batches_sequentially method."""
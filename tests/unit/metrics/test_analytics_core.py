@@ -342,6 +342,25 @@ class TestStandaloneNullLogger:
         assert len(logger2.handlers) == handler_count
 
 
+class TestRecordEvent:
+    """Tests for recording events outside decorated calls."""
+
+    def test_record_event_is_stored(self, analytics: Analytics) -> None:
+        """Recorded events are counted and listed like function calls."""
+        analytics.record_event("circuit_breaker[discogs]", "closed->open", success=False)
+
+        assert analytics.call_counts["circuit_breaker[discogs]"] == 1
+        assert analytics.success_counts.get("circuit_breaker[discogs]", 0) == 0
+        event = analytics.events[-1]
+        assert event["Event Type"] == "closed->open"
+        assert event["Success"] is False
+
+    def test_record_event_disabled(self, disabled_analytics: Analytics) -> None:
+        """Nothing is recorded when analytics is disabled."""
+        disabled_analytics.record_event("circuit_breaker[discogs]", "closed->open")
+        assert disabled_analytics.events == []
+
+
 class TestGetStats:
     """Tests for get_stats method."""
 
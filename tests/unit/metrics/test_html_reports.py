@@ -12,6 +12,7 @@ import pytest
 from metrics.html_reports import (
     DURATION_FIELD,
     determine_event_row_class,
+    generate_cache_metrics_table_html,
     format_event_table_row,
     generate_empty_html_template,
     generate_grouped_success_table,
@@ -357,6 +358,35 @@ class TestGenerateSummaryTableHtml:
         assert "0.00" in result
 
 
+class TestGenerateCacheMetricsTableHtml:
+    """Tests for generate_cache_metrics_table_html function."""
+
+    def test_generates_tier_and_content_type_rows(self) -> None:
+        """Should show each tier's totals followed by its content types."""
+        tier = {
+            "lookups": 4,
+            "hit_ratio": 0.75,
+            "miss_reasons": {"expired": 1},
+            "content_types": {"album_year": {"lookups": 4, "hit_ratio": 0.75, "miss_reasons": {"expired": 1}}},
+            "lookup_latency": {"p50_ms": 0.05, "p99_ms": 2.5},
+            "persist_latency": {"mean_ms": 12.0, "count": 2},
+        }
+
+        result = generate_cache_metrics_table_html({"tiers": {"album": tier}, "read_through": {}})
+
+        assert "<h3>Cache Tiers</h3>" in result
+        assert "<td>album</td>" in result
+        assert "<td>album_year</td>" in result
+        assert "<td>75.0</td>" in result
+        assert "<td>0.05 / 2.5</td>" in result
+        assert "<td>12.0 (2 saves)</td>" in result
+        assert "read_through" not in result
+
+    def test_omitted_without_metrics(self) -> None:
+        """Should add nothing when no cache metrics are passed."""
+        assert generate_cache_metrics_table_html(None) == ""
+
+
 class TestGenerateEmptyHtmlTemplate:
     """Tests for generate_empty_html_template function."""
 
@@ -1085,3 +1085,93 @@ class TestProcessApiResultsUnexpectedError:
         mock_error_logger.exception.assert_called_once()
         log_msg = mock_error_logger.exception.call_args[0][0]
         assert "Unexpected error" in log_msg
+
+
+class TestArtistCatalogReuse:
+    """Tests for matching albums against the cached artist catalog."""
+
+    ARTIST_ID = 487143
+
+    @staticmethod
+    def _album(name: str, release_date: str) -> dict[str, Any]:
+        return {
+            "wrapperType": "collection",
+            "artistName": "Pink Floyd",
+            "collectionName": name,
+            "releaseDate": release_date,
+            "collectionType": "Album",
+        }
+
+    def _make_api(self, albums: list[dict[str, Any]]) -> AsyncMock:
+        async def api(*, api_name: str, url: str, params: dict[str, str], **_kwargs: Any) -> dict[str, Any] | None:
+            _ = api_name
+            if params.get("entity") == "musicArtist":
+                return {"results": [{"artistName": "Pink Floyd", "artistId": self.ARTIST_ID}]}
+            if url.endswith("/lookup"):
+                return {"results": [{"wrapperType": "artist", "artistId": self.ARTIST_ID}, *albums]}
+            return {"results": []}
+
+        return AsyncMock(side_effect=api)
+
+    @staticmethod
+    def _client(api: AsyncMock, console_logger: logging.Logger, error_logger: logging.Logger) -> AppleMusicClient:
+        return AppleMusicClient(
+            console_logger=console_logger,
+            error_logger=error_logger,
+            make_api_request_func=api,
+            score_release_func=MagicMock(return_value=85.0),
+            catalog_prefetch=True,
+        )
+
+    @pytest.mark.asyncio
+    async def test_albums_resolved_from_single_catalog_lookup(self, console_logger: logging.Logger, error_logger: logging.Logger) -> None:
+        """Several albums of one artist share one lookup and skip the search."""
+        api = self._make_api([self._album("The Wall", "1979-11-30T08:00:00Z"), self._album("Animals (Remastered)", "1977-01-23T08:00:00Z")])
+        client = self._client(api, console_logger, error_logger)
+
+        wall = await client.get_scored_releases("pink floyd", "the wall")
+        animals = await client.get_scored_releases("pink floyd", "animals")
+
+        assert [r["year"] for r in wall] == ["1979"]
+        assert [r["year"] for r in animals] == ["1977"]
+        entities = [call.kwargs["params"].get("entity") for call in api.await_args_list]
+        assert entities == ["musicArtist", "album"]  # one artist search + one lookup, no album search
+        assert client.catalog_stats == {"hits": 2, "misses": 0}
+
+    @pytest.mark.asyncio
+    async def test_catalog_miss_falls_back_to_search(self, console_logger: logging.Logger, error_logger: logging.Logger) -> None:
+        """Albums absent from the catalog still use the per-album search."""
+        api = self._make_api([self._album("The Wall", "1979-11-30T08:00:00Z")])
+        client = self._client(api, console_logger, error_logger)
+
+        await client.get_scored_releases("pink floyd", "meddle")
+
+        assert any(call.kwargs["params"].get("term") == "pink floyd meddle" for call in api.await_args_list)
+        assert client.catalog_stats == {"hits": 0, "misses": 1}
+
+    @pytest.mark.asyncio
+    async def test_lookup_fallback_reuses_catalog(self, console_logger: logging.Logger, error_logger: logging.Logger) -> None:
+        """The search lookup fallback reuses an already fetched catalog."""
+        api = self._make_api([self._album("The Wall", "1979-11-30T08:00:00Z")])
+        client = self._client(api, console_logger, error_logger)
+        client.catalog_prefetch = False
+
+        await client.get_artist_catalog("pink floyd")
+        await client._try_lookup_fallback("pink floyd", "pink floyd the wall")
+
+        assert sum(1 for call in api.await_args_list if call.kwargs["url"].endswith("/lookup")) == 1
+
+    @pytest.mark.parametrize(
+        ("collection", "expected"),
+        [
+            ("The Wall", True),
+            ("The Wall (Deluxe Edition)", True),
+            ("The Wall - Single", True),
+            ("The Wall [Remastered]", True),
+            ("The Wall Live", False),
+            ("Another Brick in the Wall", False),
+        ],
+    )
+    def test_is_catalog_match(self, collection: str, expected: bool) -> None:
+        """Edition suffixes match; different titles do not."""
+        assert AppleMusicClient._is_catalog_match(collection, "the wall") is expected
@@ -0,0 +1,365 @@
+"""Tests for per-provider circuit breakers and their integration."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, cast
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiohttp
+import pytest
+
+from services.api.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState, report_rejection, track_rejections
+from services.api.orchestrator import ExternalApiOrchestrator
+from services.api.request_executor import ApiRequestExecutor
+from services.api.year_search_coordinator import YearSearchCoordinator
+from tests.factories import create_test_app_config
+from tests.mocks.csv_mock import MockAnalytics, MockLogger  # sourcery skip: dont-import-test-modules
+
+if TYPE_CHECKING:
+    from core.models.protocols import CacheServiceProtocol
+    from services.api.api_base import ApiRateLimiter
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _breaker(clock: FakeClock, on_state_change: MagicMock | None = None) -> CircuitBreaker:
+    return CircuitBreaker(
+        "discogs",
+        failure_rate_threshold=0.5,
+        window_size=4,
+        min_calls=2,
+        slow_call_seconds=5.0,
+        open_seconds=30.0,
+        on_state_change=on_state_change,
+        clock=clock,
+    )
+
+
+class TestCircuitBreaker:
+    """Tests for the breaker state machine."""
+
+    def test_opens_when_failure_rate_reached(self) -> None:
+        """The circuit opens once enough calls in the window failed."""
+        changes = MagicMock()
+        breaker = _breaker(FakeClock(), changes)
+
+        breaker.record_success(0.1)
+        assert breaker.state is CircuitState.CLOSED  # below min_calls
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+        assert breaker.is_open
+        assert not breaker.allow_request()
+        changes.assert_called_once_with("discogs", CircuitState.CLOSED, CircuitState.OPEN)
+
+    def test_slow_calls_count_as_failures(self) -> None:
+        """Responses slower than slow_call_seconds trip the breaker."""
+        breaker = _breaker(FakeClock())
+
+        breaker.record_success(6.0)
+        breaker.record_success(6.0)
+
+        assert breaker.state is CircuitState.OPEN
+
+    def test_healthy_calls_keep_circuit_closed(self) -> None:
+        """Occasional failures below the threshold do not open the circuit."""
+        breaker = _breaker(FakeClock())
+        for _ in range(3):
+            breaker.record_success(0.1)
+        breaker.record_failure()
+
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.failure_rate == 0.25
+
+    def test_half_open_probe_closes_on_success(self) -> None:
+        """After the cool-down one probe is allowed; success closes the circuit."""
+        clock = FakeClock()
+        breaker = _breaker(clock)
+        breaker.record_failure()
+        breaker.record_failure()
+
+        clock.now += 30.0
+        assert not breaker.is_open
+        assert breaker.allow_request()
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert not breaker.allow_request()  # one probe at a time
+
+        breaker.record_success(0.2)
+
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.allow_request()
+        assert breaker.get_stats()["transitions"] == 3
+
+    def test_half_open_probe_failure_reopens(self) -> None:
+        """A failed probe re-opens the circuit for another cool-down."""
+        clock = FakeClock()
+        breaker = _breaker(clock)
+        breaker.record_failure()
+        breaker.record_failure()
+        clock.now += 30.0
+        breaker.allow_request()
+
+        breaker.record_failure()
+
+        assert breaker.state is CircuitState.OPEN
+        clock.now += 10.0
+        assert not breaker.allow_request()
+        assert breaker.get_stats()["rejected"] == 1
+
+    def test_lost_probe_is_replaced(self) -> None:
+        """A probe that never reports back does not block the circuit forever."""
+        clock = FakeClock()
+        breaker = _breaker(clock)
+        breaker.record_failure()
+        breaker.record_failure()
+        clock.now += 30.0
+        breaker.allow_request()
+
+        clock.now += 30.0
+
+        assert breaker.allow_request()
+
+    def test_is_rejecting_matches_probe_gate(self) -> None:
+        """is_rejecting stays True while a half-open probe is in flight, unlike is_open."""
+        clock = FakeClock()
+        breaker = _breaker(clock)
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.is_rejecting
+
+        clock.now += 30.0
+        assert not breaker.is_rejecting
+        assert breaker.allow_request()  # starts the probe
+
+        assert not breaker.is_open
+        assert breaker.is_rejecting
+        assert not breaker.allow_request()
+        breaker.record_success(0.1)
+        assert not breaker.is_rejecting
+
+    def test_rejects_invalid_window(self) -> None:
+        """Non-positive window sizes raise ValueError."""
+        with pytest.raises(ValueError, match="positive"):
+            CircuitBreaker("x", failure_rate_threshold=0.5, window_size=0, min_calls=1, slow_call_seconds=1.0, open_seconds=1.0)
+
+
+class TestExecutorIntegration:
+    """Tests for ApiRequestExecutor honouring circuit breakers."""
+
+    @staticmethod
+    def _executor(breaker: CircuitBreaker, cache_service: AsyncMock) -> ApiRequestExecutor:
+        cache_service.get_async = AsyncMock(return_value=None)
+        limiter = AsyncMock()
+        limiter.acquire = AsyncMock(return_value=0.0)
+        limiter.release = MagicMock()
+        executor = ApiRequestExecutor(
+            cache_service=cast("CacheServiceProtocol", cast(object, cache_service)),
+            rate_limiters=cast(dict[str, "ApiRateLimiter"], {"discogs": limiter}),
+            console_logger=logging.getLogger("test.console"),
+            error_logger=logging.getLogger("test.error"),
+            user_agent="TestAgent/1.0",
+            discogs_token="token",
+            cache_ttl_days=1,
+            default_max_retries=5,
+            default_retry_delay=1.0,
+            circuit_breakers={"discogs": breaker},
+        )
+        session = MagicMock(spec=aiohttp.ClientSession)
+        session.closed = False
+        session.headers = {}
+        session.timeout = aiohttp.ClientTimeout(total=30)
+        executor.set_session(session)
+        return executor
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_skips_request_without_caching(self) -> None:
+        """Requests to an open provider return None and leave the cache untouched."""
+        breaker = _breaker(FakeClock())
+        breaker.record_failure()
+        breaker.record_failure()
+        cache_service = AsyncMock()
+        executor = self._executor(breaker, cache_service)
+        executor._execute_with_retry = AsyncMock()  # type: ignore[method-assign]
+
+        assert await executor.execute_request("discogs", "https://api.discogs.com/database/search") is None
+
+        executor._execute_with_retry.assert_not_awaited()
+        cache_service.set_async.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_rejection_is_reported(self) -> None:
+        """A rejected request is reported to the enclosing track_rejections block."""
+        breaker = _breaker(FakeClock())
+        breaker.record_failure()
+        breaker.record_failure()
+        executor = self._executor(breaker, AsyncMock())
+
+        with track_rejections() as rejected:
+            assert await executor.execute_request("discogs", "https://api.discogs.com/database/search") is None
+
+        assert rejected == {"discogs"}
+        report_rejection("discogs")  # outside any block: ignored
+
+    @pytest.mark.asyncio
+    async def test_retries_stop_once_circuit_opens(self) -> None:
+        """Timeouts feed the breaker; retries and backoff stop when it opens."""
+        breaker = _breaker(FakeClock())
+        executor = self._executor(breaker, AsyncMock())
+        executor._execute_single_request = AsyncMock(side_effect=TimeoutError())  # type: ignore[method-assign]
+
+        with patch("services.api.request_executor.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            result = await executor.execute_request("discogs", "https://api.discogs.com/database/search")
+
+        assert result is None
+        assert executor._execute_single_request.await_count == 2
+        assert mock_sleep.await_count == 1
+        assert breaker.state is CircuitState.OPEN
+
+    @pytest.mark.asyncio
+    async def test_client_errors_count_as_healthy(self) -> None:
+        """A 404 means the provider answered and does not trip the breaker."""
+        breaker = _breaker(FakeClock())
+        executor = self._executor(breaker, AsyncMock())
+        error = aiohttp.ClientResponseError(request_info=MagicMock(), history=(), status=404, message="Not Found")
+
+        for attempt in range(3):
+            await executor._handle_client_error(error, api_name="discogs", attempt=attempt, max_retries=5, base_delay=0.0, url="u")
+
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.failure_rate == 0.0
+
+
+class TestCoordinatorIntegration:
+    """Tests for YearSearchCoordinator skipping open providers."""
+
+    @pytest.mark.asyncio
+    async def test_open_provider_is_skipped(self) -> None:
+        """Standard search does not call providers whose circuit is open."""
+        breaker = _breaker(FakeClock())
+        breaker.record_failure()
+        breaker.record_failure()
+        clients = [MagicMock(get_scored_releases=AsyncMock(return_value=[])) for _ in range(3)]
+        musicbrainz, discogs, applemusic = clients
+        coordinator = YearSearchCoordinator(
+            console_logger=logging.getLogger("test.console"),
+            error_logger=logging.getLogger("test.error"),
+            config=create_test_app_config(),
+            preferred_api="",
+            musicbrainz_client=musicbrainz,
+            discogs_client=discogs,
+            applemusic_client=applemusic,
+            release_scorer=MagicMock(),
+            circuit_breakers={"discogs": breaker},
+        )
+
+        await coordinator._execute_standard_api_search("artist", "album", None, "Artist", "Album")
+
+        discogs.get_scored_releases.assert_not_awaited()
+        musicbrainz.get_scored_releases.assert_awaited_once()
+        applemusic.get_scored_releases.assert_awaited_once()
+
+    @staticmethod
+    def _coordinator(breaker: CircuitBreaker, discogs: MagicMock) -> YearSearchCoordinator:
+        return YearSearchCoordinator(
+            console_logger=logging.getLogger("test.console"),
+            error_logger=logging.getLogger("test.error"),
+            config=create_test_app_config(),
+            preferred_api="",
+            musicbrainz_client=MagicMock(get_scored_releases=AsyncMock(return_value=[])),
+            discogs_client=discogs,
+            applemusic_client=MagicMock(get_scored_releases=AsyncMock(return_value=[])),
+            release_scorer=MagicMock(),
+            circuit_breakers={"discogs": breaker},
+        )
+
+    @pytest.mark.asyncio
+    async def test_provider_with_probe_in_flight_is_skipped(self) -> None:
+        """After the cool-down only the album that started the probe queries the provider."""
+        clock = FakeClock()
+        breaker = _breaker(clock)
+        breaker.record_failure()
+        breaker.record_failure()
+        clock.now += 30.0
+        discogs = MagicMock(get_scored_releases=AsyncMock(return_value=[]))
+        coordinator = self._coordinator(breaker, discogs)
+
+        assert coordinator._get_available_client("discogs") is discogs
+        assert breaker.allow_request()  # another album's probe
+
+        assert coordinator._get_available_client("discogs") is None
+        await coordinator._execute_standard_api_search("artist", "album", None, "Artist", "Album")
+        discogs.get_scored_releases.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_rejected_call_is_skipped_not_empty(self) -> None:
+        """A provider call emptied by circuit rejections raises CircuitOpenError instead of returning no results."""
+        breaker = _breaker(FakeClock())
+
+        async def rejected_search(*_args: object) -> list[object]:
+            report_rejection("discogs")
+            return []
+
+        discogs = MagicMock(get_scored_releases=AsyncMock(side_effect=rejected_search))
+        coordinator = self._coordinator(breaker, discogs)
+        error_logger = MagicMock(spec=logging.Logger)
+        coordinator.error_logger = error_logger
+
+        with pytest.raises(CircuitOpenError, match="discogs circuit open"):
+            await coordinator._call_api_with_proper_params(discogs, "discogs", "artist", "album", None)
+
+        assert await coordinator._execute_standard_api_search("artist", "album", None, "Artist", "Album") == []
+        error_logger.warning.assert_not_called()
+
+
+class TestOrchestratorIntegration:
+    """Tests for breaker wiring in ExternalApiOrchestrator."""
+
+    @staticmethod
+    def _orchestrator(enabled: bool = True) -> tuple[ExternalApiOrchestrator, MockAnalytics]:
+        config = create_test_app_config()
+        config.year_retrieval.circuit_breaker.enabled = enabled
+        analytics = MockAnalytics()
+        orchestrator = ExternalApiOrchestrator(
+            config=config,
+            console_logger=MockLogger(),  # type: ignore[arg-type]
+            error_logger=MockLogger(),  # type: ignore[arg-type]
+            analytics=analytics,
+            cache_service=MagicMock(),
+            pending_verification_service=MagicMock(),
+        )
+        return orchestrator, analytics
+
+    def test_breakers_shared_with_executor(self) -> None:
+        """Every rate-limited API gets a breaker shared with the executor."""
+        orchestrator, _ = self._orchestrator()
+
+        assert set(orchestrator.circuit_breakers) == set(orchestrator.rate_limiters)
+        assert orchestrator.request_executor.circuit_breakers is orchestrator.circuit_breakers
+
+    def test_disabled_creates_no_breakers(self) -> None:
+        """Disabling the feature leaves requests unguarded."""
+        orchestrator, _ = self._orchestrator(enabled=False)
+        assert orchestrator.circuit_breakers == {}
+
+    def test_state_changes_are_logged_and_recorded(self) -> None:
+        """Transitions are logged and recorded as analytics events."""
+        orchestrator, analytics = self._orchestrator()
+        breaker = orchestrator.circuit_breakers["itunes"]
+
+        for _ in range(breaker.min_calls):
+            breaker.record_failure()
+
+        error_logger = cast(MockLogger, orchestrator.error_logger)
+        assert any("Circuit closed -> open" in message for message in error_logger.warning_messages)
+        event = analytics.events[-1]
+        assert event["Function"] == "circuit_breaker[itunes]"
+        assert event["Event Type"] == "closed->open"
+        assert event["Success"] is False
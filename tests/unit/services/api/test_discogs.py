@@ -8,6 +8,7 @@ from urllib.parse import urlparse
 
 import pytest
 
+from core.models.track_models import FuzzyMatchConfig
 from services.api.discogs import DiscogsClient, DiscogsRelease
 from tests.factories import create_test_app_config  # sourcery skip: dont-import-test-modules
 from tests.mocks.csv_mock import MockLogger  # sourcery skip: dont-import-test-modules
@@ -520,3 +521,127 @@ class TestDiscogsClientAllure:
         assert result is None
         assert isinstance(client.console_logger, MockLogger)
         assert any("unexpected type" in msg for msg in client.console_logger.warning_messages)
+
+
+class TestArtistReleasePrefetch:
+    """Tests for artist-centric release list prefetch."""
+
+    ARTIST_ID = 3840
+
+    def _make_api(self, pages: list[list[dict[str, Any]]]) -> AsyncMock:
+        """Build a request mock serving artist lookup, release pages and searches."""
+
+        async def api(_api_name: str, url: str, *, params: dict[str, str] | None = None, **_kwargs: Any) -> dict[str, Any] | None:
+            params = params or {}
+            if params.get("type") == "artist":
+                return {"results": [{"id": 1, "title": "Radiohead Tribute"}, {"id": self.ARTIST_ID, "title": "Radiohead"}]}
+            if url.endswith(f"/artists/{self.ARTIST_ID}/releases"):
+                page = int(params["page"])
+                return {"pagination": {"page": page, "pages": len(pages)}, "releases": pages[page - 1]}
+            return {"results": []}
+
+        return AsyncMock(side_effect=api)
+
+    @staticmethod
+    def _client(api: AsyncMock, cache_service: MagicMock | None = None) -> DiscogsClient:
+        client = TestDiscogsClientAllure.create_discogs_client(mock_api_request=api, mock_cache_service=cache_service)
+        client.artist_prefetch = True
+        return client
+
+    @staticmethod
+    def _urls(api: AsyncMock) -> list[str]:
+        return [call.args[1] for call in api.await_args_list]
+
+    @pytest.mark.asyncio
+    async def test_albums_resolved_locally_from_one_listing(self) -> None:
+        """Albums of one artist share a single listing and skip search/detail/master fetches."""
+        api = self._make_api(
+            [
+                [
+                    {"id": 21491, "type": "master", "title": "OK Computer", "year": 1997, "artist": "Radiohead", "role": "Main"},
+                    {"id": 17800, "type": "master", "title": "Kid A", "year": 2000, "artist": "Radiohead", "role": "Main"},
+                    {"id": 999, "type": "release", "title": "Kid A", "year": 1999, "artist": "Various", "role": "Appearance"},
+                ]
+            ]
+        )
+        client = self._client(api)
+
+        ok_computer = await client.get_scored_releases("radiohead", "ok computer", None)
+        kid_a = await client.get_scored_releases("radiohead", "kid a", None)
+
+        assert [r["year"] for r in ok_computer] == ["1997"]
+        assert [r["year"] for r in kid_a] == ["2000"]
+        urls = self._urls(api)
+        assert urls.count(f"https://api.discogs.com/artists/{self.ARTIST_ID}/releases") == 1
+        assert not any("/masters/" in url or url.startswith("https://api.discogs.com/releases/") for url in urls)
+        assert client.prefetch_stats == {"hits": 2, "misses": 0}
+
+    @pytest.mark.asyncio
+    async def test_master_years_are_cached_persistently(self) -> None:
+        """Master years from the listing seed the discogs_master_<id> cache."""
+        cache_service = MagicMock()
+        cache_service.get_async = AsyncMock(return_value=None)
+        cache_service.set_async = AsyncMock()
+        api = self._make_api([[{"id": 21491, "type": "master", "title": "OK Computer", "year": 1997, "role": "Main"}]])
+        client = self._client(api, cache_service)
+
+        await client.get_artist_releases("radiohead")
+
+        cache_service.set_async.assert_any_await("discogs_master_21491", 1997, ttl=client.cache_ttl_days * 86400)
+
+    @pytest.mark.asyncio
+    async def test_paginates_until_last_page(self) -> None:
+        """All pages reported by pagination are fetched."""
+        api = self._make_api(
+            [
+                [{"id": 1, "type": "master", "title": "Pablo Honey", "year": 1993, "role": "Main"}],
+                [{"id": 2, "type": "master", "title": "The Bends", "year": 1995, "role": "Main"}],
+            ]
+        )
+        client = self._client(api)
+
+        entries = await client.get_artist_releases("radiohead")
+
+        assert entries is not None
+        assert [e["title"] for e in entries] == ["Pablo Honey", "The Bends"]
+
+    @pytest.mark.asyncio
+    async def test_unresolved_album_falls_back_to_search(self) -> None:
+        """Albums missing from the listing use the per-album database search."""
+        api = self._make_api([[{"id": 1, "type": "master", "title": "Pablo Honey", "year": 1993, "role": "Main"}]])
+        client = self._client(api)
+
+        result = await client.get_scored_releases("radiohead", "amnesiac", None)
+
+        assert result == []
+        assert any(call.kwargs["params"].get("release_title") == "amnesiac" for call in api.await_args_list)
+        assert client.prefetch_stats == {"hits": 0, "misses": 1}
+
+    @pytest.mark.asyncio
+    async def test_punctuation_variant_resolved_by_fuzzy_match(self) -> None:
+        """A hyphenated variant misses the exact match but resolves as a near match."""
+        api = self._make_api([[{"id": 21491, "type": "master", "title": "OK Computer", "year": 1997, "role": "Main"}]])
+        client = self._client(api)
+        client.fuzzy_match = FuzzyMatchConfig(enabled=True)
+
+        result = await client.get_scored_releases("radiohead", "ok-computer", None)
+
+        assert [r["year"] for r in result] == ["1997"]
+        assert client.prefetch_stats == {"hits": 1, "misses": 0}
+
+    @pytest.mark.asyncio
+    async def test_unknown_artist_is_not_prefetched(self) -> None:
+        """An artist lookup without an exact match disables prefetch for that artist."""
+        api = AsyncMock(return_value={"results": [{"id": 5, "title": "Someone Else"}]})
+        client = self._client(api)
+
+        assert await client.get_artist_releases("radiohead") is None
+
+    @pytest.mark.asyncio
+    async def test_ambiguous_artist_is_not_prefetched(self) -> None:
+        """Same-name artists told apart only by a "(2)" suffix leave the artist unresolved."""
+        api = AsyncMock(return_value={"results": [{"id": 5, "title": "Nirvana"}, {"id": 6, "title": "Nirvana (2)"}]})
+        client = self._client(api)
+
+        assert await client.get_artist_releases("nirvana") is None
+        assert not any("/artists/" in url for url in self._urls(api))
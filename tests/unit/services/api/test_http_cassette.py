@@ -0,0 +1,211 @@
+"""Tests for HttpCassette record/replay of external API traffic."""
+
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING, cast
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiohttp
+import pytest
+
+from core.models.track_models import CassetteMode
+from services.api.http_cassette import CASSETTE_FLUSH_THRESHOLD, HttpCassette
+from services.api.request_executor import ApiRequestExecutor
+
+if TYPE_CHECKING:
+    from core.models.protocols import CacheServiceProtocol
+    from services.api.api_base import ApiRateLimiter
+
+MB_URL = "https://musicbrainz.org/ws/2/release-group/"
+
+
+def _make_executor(
+    cassette: HttpCassette,
+    console_logger: logging.Logger,
+    error_logger: logging.Logger,
+) -> tuple[ApiRequestExecutor, AsyncMock]:
+    """Create an executor wired to a cassette and a mock cache."""
+    cache_service = AsyncMock()
+    cache_service.get_async = AsyncMock(return_value=None)
+    cache_service.set_async = AsyncMock()
+    limiter = AsyncMock()
+    limiter.acquire = AsyncMock(return_value=0.0)
+    limiter.release = MagicMock()
+    executor = ApiRequestExecutor(
+        cache_service=cast("CacheServiceProtocol", cast(object, cache_service)),
+        rate_limiters=cast(dict[str, "ApiRateLimiter"], {"musicbrainz": limiter}),
+        console_logger=console_logger,
+        error_logger=error_logger,
+        user_agent="TestAgent/1.0",
+        discogs_token=None,
+        cache_ttl_days=1,
+        default_max_retries=0,
+        default_retry_delay=0.0,
+        cassette=cassette,
+    )
+    return executor, cache_service
+
+
+class TestNormalization:
+    """Tests for request key normalization."""
+
+    def test_equivalent_requests_share_key(self) -> None:
+        """Host case, trailing slash and param order do not change the key."""
+        key_a = HttpCassette.build_key("musicbrainz", MB_URL, {"query": "x", "limit": "10"})
+        key_b = HttpCassette.build_key("musicbrainz", "HTTPS://MusicBrainz.org/ws/2/release-group", {"limit": "10", "query": "x"})
+        assert key_a == key_b
+
+    def test_embedded_query_string_is_merged(self) -> None:
+        """Params in the URL are treated the same as explicit params."""
+        key_a = HttpCassette.build_key("itunes", "https://itunes.apple.com/search?term=a%20b", None)
+        key_b = HttpCassette.build_key("itunes", "https://itunes.apple.com/search", {"term": "a b"})
+        assert key_a == key_b
+
+    def test_api_name_is_part_of_key(self) -> None:
+        """Identical URLs for different APIs produce different keys."""
+        assert HttpCassette.build_key("discogs", MB_URL, None) != HttpCassette.build_key("musicbrainz", MB_URL, None)
+
+
+class TestRecordReplay:
+    """Tests for the record/replay round trip."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("filename", ["cassette.jsonl", "cassette.jsonl.gz"])
+    async def test_round_trip(self, tmp_path: Path, filename: str) -> None:
+        """Recorded interactions are served back in replay mode."""
+        path = tmp_path / filename
+        recorder = HttpCassette(path, mode=CassetteMode.RECORD)
+        await recorder.record("musicbrainz", MB_URL, {"query": "x"}, status=200, elapsed=0.25, body={"count": 1})
+        await recorder.record("musicbrainz", MB_URL, {"query": "y"}, status=404, elapsed=0.1, body=None)
+        await recorder.flush()
+
+        player = HttpCassette(path, mode=CassetteMode.REPLAY, latency_scale=0)
+        assert await player.replay("musicbrainz", MB_URL, {"query": "x"}) == {"count": 1}
+        assert await player.replay("musicbrainz", MB_URL, {"query": "y"}) is None
+        assert await player.replay("musicbrainz", MB_URL, {"query": "z"}) is None
+        assert player.stats.replay_hits == 2
+        assert player.stats.replay_misses == 1
+        assert player.stats.misses_by_api == {"musicbrainz": 1}
+
+    @pytest.mark.asyncio
+    async def test_replay_scales_latency(self, tmp_path: Path) -> None:
+        """Replay sleeps for the recorded latency multiplied by the scale."""
+        path = tmp_path / "cassette.jsonl"
+        recorder = HttpCassette(path, mode=CassetteMode.RECORD)
+        await recorder.record("musicbrainz", MB_URL, None, status=200, elapsed=2.0, body={})
+        await recorder.flush()
+
+        player = HttpCassette(path, mode=CassetteMode.REPLAY, latency_scale=0.5)
+        with patch("services.api.http_cassette.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            await player.replay("musicbrainz", MB_URL, None)
+        mock_sleep.assert_awaited_once_with(1.0)
+        assert player.stats.replayed_latency == pytest.approx(1.0)
+
+    @pytest.mark.asyncio
+    async def test_record_flushes_at_threshold(self, tmp_path: Path) -> None:
+        """Buffered records are appended once the threshold is reached."""
+        path = tmp_path / "cassette.jsonl"
+        recorder = HttpCassette(path, mode=CassetteMode.RECORD)
+        for i in range(CASSETTE_FLUSH_THRESHOLD):
+            await recorder.record("musicbrainz", MB_URL, {"offset": str(i)}, status=200, elapsed=0.0, body={"i": i})
+        assert len(path.read_bytes().splitlines()) == CASSETTE_FLUSH_THRESHOLD
+
+    @pytest.mark.asyncio
+    async def test_malformed_lines_are_skipped(self, tmp_path: Path) -> None:
+        """Corrupt records do not prevent the rest of the cassette from loading."""
+        path = tmp_path / "cassette.jsonl"
+        recorder = HttpCassette(path, mode=CassetteMode.RECORD)
+        await recorder.record("musicbrainz", MB_URL, None, status=200, elapsed=0.0, body={"ok": True})
+        await recorder.flush()
+        with path.open("ab") as handle:
+            handle.write(b"{not json\n")
+
+        player = HttpCassette(path, mode=CassetteMode.REPLAY, latency_scale=0)
+        assert await player.replay("musicbrainz", MB_URL, None) == {"ok": True}
+
+    @pytest.mark.asyncio
+    async def test_missing_file_misses(self, tmp_path: Path) -> None:
+        """Replaying from a non-existent cassette misses every request."""
+        player = HttpCassette(tmp_path / "absent.jsonl", mode=CassetteMode.REPLAY)
+        assert await player.replay("musicbrainz", MB_URL, None) is None
+        assert player.stats.replay_misses == 1
+
+
+class TestExecutorIntegration:
+    """Tests for cassette hooks in ApiRequestExecutor."""
+
+    @pytest.mark.asyncio
+    async def test_replay_bypasses_network(
+        self,
+        tmp_path: Path,
+        console_logger: logging.Logger,
+        error_logger: logging.Logger,
+    ) -> None:
+        """Replay mode answers without a session and never reads or writes the persistent cache."""
+        path = tmp_path / "cassette.jsonl"
+        recorder = HttpCassette(path, mode=CassetteMode.RECORD)
+        await recorder.record("musicbrainz", MB_URL, {"query": "x"}, status=200, elapsed=0.0, body={"count": 3})
+        await recorder.flush()
+
+        executor, cache_service = _make_executor(HttpCassette(path, mode=CassetteMode.REPLAY), console_logger, error_logger)
+        result = await executor.execute_request("musicbrainz", MB_URL, params={"query": "x"})
+        missed = await executor.execute_request("musicbrainz", MB_URL, params={"query": "unrecorded"})
+
+        assert result == {"count": 3}
+        assert missed is None
+        assert executor.session is None
+        cache_service.get_async.assert_not_awaited()
+        cache_service.set_async.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_record_captures_cache_hits_once(
+        self,
+        tmp_path: Path,
+        console_logger: logging.Logger,
+        error_logger: logging.Logger,
+    ) -> None:
+        """Record mode writes responses served from the cache, so a warm cache leaves no gaps."""
+        cassette = HttpCassette(tmp_path / "cassette.jsonl", mode=CassetteMode.RECORD)
+        executor, cache_service = _make_executor(cassette, console_logger, error_logger)
+        cache_service.get_async = AsyncMock(return_value={"count": 5})
+
+        for _ in range(2):
+            assert await executor.execute_request("musicbrainz", MB_URL, params={"query": "x"}) == {"count": 5}
+        await cassette.flush()
+
+        assert cassette.stats.recorded == 1
+        assert cassette._interactions == {}
+        player = HttpCassette(cassette.path, mode=CassetteMode.REPLAY, latency_scale=0)
+        assert await player.replay("musicbrainz", MB_URL, {"query": "x"}) == {"count": 5}
+
+    @pytest.mark.asyncio
+    async def test_record_captures_live_response(
+        self,
+        tmp_path: Path,
+        console_logger: logging.Logger,
+        error_logger: logging.Logger,
+    ) -> None:
+        """Record mode stores the processed response of a live request."""
+        cassette = HttpCassette(tmp_path / "cassette.jsonl", mode=CassetteMode.RECORD)
+        executor, _ = _make_executor(cassette, console_logger, error_logger)
+
+        response = MagicMock()
+        response.status = 200
+        session = MagicMock(spec=aiohttp.ClientSession)
+        session.closed = False
+        session.headers = {}
+        session.timeout = aiohttp.ClientTimeout(total=30)
+        cm = MagicMock()
+        cm.__aenter__ = AsyncMock(return_value=response)
+        cm.__aexit__ = AsyncMock(return_value=None)
+        session.get.return_value = cm
+        executor.set_session(session)
+
+        with patch.object(executor, "_process_response", new_callable=AsyncMock, return_value={"count": 7}):
+            result = await executor.execute_request("musicbrainz", MB_URL, params={"query": "x"})
+        await cassette.flush()
+
+        assert result == {"count": 7}
+        assert cassette.stats.recorded == 1
+        player = HttpCassette(cassette.path, mode=CassetteMode.REPLAY, latency_scale=0)
+        assert await player.replay("musicbrainz", MB_URL, {"query": "x"}) == {"count": 7}
@@ -7,6 +7,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from core.models.track_models import FuzzyMatchConfig
 from services.api.musicbrainz import MusicBrainzClient
 from tests.mocks.csv_mock import MockLogger
 
@@ -483,3 +484,214 @@ class TestFetchReleasesForGroupsExceptionHandling:
         assert len(results) == 1
         assert results[0][0] is None
         assert any("Failed to fetch releases for MB RG ID rg-abc-123" in msg for msg in error_logger.warning_messages)
+
+
+class TestDiscographyPrefetch:
+    """Tests for artist-level discography prefetch via the browse endpoint."""
+
+    ARTIST_ID = "mbid-1"
+
+    @staticmethod
+    def _release_group(rg_id: str, title: str, first_release_date: str) -> dict[str, Any]:
+        return {
+            "id": rg_id,
+            "title": title,
+            "first-release-date": first_release_date,
+            "primary-type": "Album",
+            "artist-credit": [{"name": "Metallica", "artist": {"name": "Metallica"}}],
+        }
+
+    def _make_api(self, pages: list[list[dict[str, Any]]]) -> AsyncMock:
+        """Build a request mock serving artist lookup, browse pages and releases."""
+        total = sum(len(page) for page in pages)
+
+        async def api(_api_name: str, url: str, *, params: dict[str, str] | None = None, **_kwargs: Any) -> dict[str, Any] | None:
+            params = params or {}
+            if url.endswith("/artist/"):
+                return {"artists": [{"id": self.ARTIST_ID, "name": "Metallica", "sort-name": "Metallica"}]}
+            if url.endswith("/release-group") and params.get("artist") == self.ARTIST_ID:
+                page_index = int(params["offset"]) // 100
+                page = pages[page_index] if page_index < len(pages) else []
+                return {"release-group-count": total, "release-groups": page}
+            if url.endswith("/release/"):
+                return {"releases": [{"id": f"rel-{params['release-group']}", "title": "t", "date": "1986-03-03", "country": "US"}]}
+            return {"count": 0, "release-groups": []}
+
+        return AsyncMock(side_effect=api)
+
+    def _client(self, api: AsyncMock) -> MusicBrainzClient:
+        return MusicBrainzClient(
+            console_logger=MockLogger(),  # type: ignore[arg-type]
+            error_logger=MockLogger(),  # type: ignore[arg-type]
+            make_api_request_func=api,
+            score_release_func=MagicMock(return_value=80),
+            analytics=_mock_analytics(),
+            discography_prefetch=True,
+        )
+
+    @staticmethod
+    def _urls(api: AsyncMock) -> list[str]:
+        return [call.args[1] for call in api.await_args_list]
+
+    @pytest.mark.asyncio
+    async def test_albums_resolved_from_single_discography_fetch(self) -> None:
+        """Several albums of one artist share one browse fetch and skip searches."""
+        api = self._make_api(
+            [[self._release_group("rg-1", "Master of Puppets", "1986-03-03"), self._release_group("rg-2", "Ride the Lightning", "1984-07-27")]]
+        )
+        client = self._client(api)
+
+        first = await client.get_scored_releases("metallica", "master of puppets", None)
+        second = await client.get_scored_releases("metallica", "ride the lightning", None)
+
+        assert first[0]["year"] == "1986"
+        assert second[0]["year"] == "1984"
+        urls = self._urls(api)
+        assert urls.count("https://musicbrainz.org/ws/2/release-group") == 1
+        assert "https://musicbrainz.org/ws/2/release-group/" not in urls  # no per-album search
+        assert client.discography_stats == {"hits": 2, "misses": 0}
+
+    @pytest.mark.asyncio
+    async def test_pages_until_count_reached(self) -> None:
+        """Browse pages are fetched until the reported count is covered."""
+        page_one = [self._release_group(f"rg-{i}", f"Album {i}", "2000") for i in range(100)]
+        page_two = [self._release_group("rg-last", "Last Album", "2010")]
+        api = self._make_api([page_one, page_two])
+        client = self._client(api)
+
+        discography = await client.get_artist_discography("metallica")
+
+        assert discography is not None
+        assert len(discography) == 101
+        assert self._urls(api).count("https://musicbrainz.org/ws/2/release-group") == 2
+
+    @pytest.mark.asyncio
+    async def test_miss_falls_back_to_per_album_search(self) -> None:
+        """Albums absent from the discography still use the per-album search."""
+        api = self._make_api([[self._release_group("rg-1", "Master of Puppets", "1986")]])
+        client = self._client(api)
+
+        result = await client.get_scored_releases("metallica", "garage inc", None)
+
+        assert result == []
+        assert "https://musicbrainz.org/ws/2/release-group/" in self._urls(api)
+        assert client.discography_stats == {"hits": 0, "misses": 1}
+
+    @pytest.mark.asyncio
+    async def test_mismatched_artist_is_not_prefetched(self) -> None:
+        """A top artist hit with a different name disables prefetch for that artist."""
+        api = AsyncMock(return_value={"artists": [{"id": "other", "name": "Metallica Tribute"}]})
+        client = self._client(api)
+
+        assert await client.get_artist_discography("metallica") is None
+        assert len(api.await_args_list) == 1
+
+    @pytest.mark.asyncio
+    async def test_ambiguous_artist_is_not_prefetched(self) -> None:
+        """Several artists sharing the name disable prefetch; albums use the per-album search."""
+        artists = [
+            {"id": "mbid-grunge", "name": "Nirvana", "sort-name": "Nirvana"},
+            {"id": "mbid-60s", "name": "Nirvana", "sort-name": "Nirvana", "disambiguation": "60s band from the UK"},
+        ]
+
+        async def api(_api_name: str, url: str, *, params: dict[str, str] | None = None, **_kwargs: Any) -> dict[str, Any] | None:
+            if url.endswith("/artist/"):
+                return {"artists": artists[: int((params or {})["limit"])]}
+            return {"count": 0, "release-groups": []}
+
+        mock_api = AsyncMock(side_effect=api)
+        client = self._client(mock_api)
+
+        assert await client.get_artist_discography("nirvana") is None
+        assert await client.get_scored_releases("nirvana", "nevermind", None) == []
+        urls = self._urls(mock_api)
+        assert "https://musicbrainz.org/ws/2/release-group" not in urls  # no browse of either discography
+        assert "https://musicbrainz.org/ws/2/release-group/" in urls
+        assert client.discography_stats == {"hits": 0, "misses": 1}
+
+    def test_match_prefers_earliest_release_group(self) -> None:
+        """Duplicate titles are ordered by first-release-date, undated last."""
+        client = self._client(AsyncMock())
+        discography = [
+            self._release_group("rg-undated", "Kill 'Em All", ""),
+            self._release_group("rg-remaster", "Kill 'Em All", "2016-04-15"),
+            self._release_group("rg-original", "Kill 'Em All", "1983-07-25"),
+        ]
+
+        matches = client._match_discography(discography, "kill em all")
+
+        assert [rg["id"] for rg in matches] == ["rg-original", "rg-remaster", "rg-undated"]
+
+    @pytest.mark.asyncio
+    async def test_near_miss_resolved_from_discography(self) -> None:
+        """With fuzzy matching, an edition-suffixed album resolves without a per-album search."""
+        api = self._make_api([[self._release_group("rg-1", "Master of Puppets", "1986-03-03")]])
+        client = MusicBrainzClient(
+            console_logger=MockLogger(),  # type: ignore[arg-type]
+            error_logger=MockLogger(),  # type: ignore[arg-type]
+            make_api_request_func=api,
+            score_release_func=MagicMock(return_value=80),
+            analytics=_mock_analytics(),
+            discography_prefetch=True,
+            fuzzy_match=FuzzyMatchConfig(enabled=True),
+            remaster_keywords=["remastered", "deluxe"],
+        )
+
+        result = await client.get_scored_releases("metallica", "master of puppets (remastered deluxe box set)", None)
+        assert result[0]["year"] == "1986"
+        assert "https://musicbrainz.org/ws/2/release-group/" not in self._urls(api)
+
+        # A numbered sequel is not a near match of the original
+        assert await client.get_scored_releases("metallica", "master of puppets ii", None) == []
+        assert "https://musicbrainz.org/ws/2/release-group/" in self._urls(api)
+        assert client.discography_stats == {"hits": 1, "misses": 1}
+
+
+class TestBatchReleaseScoring:
+    """Tests for scoring all fetched releases of an album in one call."""
+
+    @staticmethod
+    def _release_results() -> list[tuple[dict[str, Any] | None, dict[str, Any]]]:
+        rg_info = {"id": "rg-1", "artist-credit": [{"name": "Metallica"}]}
+        releases = [
+            {"id": "rel-1", "title": "Master of Puppets", "date": "1986-03-03"},
+            {"id": "rel-2", "title": "Master of Puppets", "date": "1986-03-03", "artist-credit": [{"name": "Metallica & Friends"}]},
+            {"id": "rel-1", "title": "Master of Puppets", "date": "1986-03-03"},
+            {"id": "rel-3", "title": "Master of Puppets (Remastered)", "date": "2017-11-10"},
+        ]
+        return [({"releases": releases}, rg_info), (None, {"id": "rg-2"})]
+
+    @pytest.mark.asyncio
+    async def test_batch_scorer_receives_all_unique_releases(self) -> None:
+        """One batch call scores every unique release; zero scores are dropped."""
+        score_single = MagicMock()
+        score_batch = AsyncMock(return_value=[90, 0, 40])
+        client = MusicBrainzClient(
+            console_logger=MockLogger(),  # type: ignore[arg-type]
+            error_logger=MockLogger(),  # type: ignore[arg-type]
+            make_api_request_func=AsyncMock(),
+            score_release_func=score_single,
+            analytics=_mock_analytics(),
+            score_releases_func=score_batch,
+        )
+
+        scored = await client._process_and_score_releases(self._release_results(), "metallica", "master of puppets", "us")
+
+        score_single.assert_not_called()
+        score_batch.assert_awaited_once()
+        releases = score_batch.call_args.args[0]
+        assert [release["id"] for release in releases] == ["rel-1", "rel-2", "rel-3"]
+        assert [release["artist"] for release in releases] == ["Metallica", "Metallica & Friends", "Metallica"]
+        assert score_batch.call_args.kwargs == {"artist_region": "us", "source": "musicbrainz"}
+        assert [release["score"] for release in scored] == [90, 40]
+
+    @pytest.mark.asyncio
+    async def test_scores_one_by_one_without_batch_scorer(self) -> None:
+        """Clients created without a batch scorer keep the per-release function."""
+        score_single = MagicMock(side_effect=[90, 0, 40])
+        client = TestMusicBrainzClientAllure.create_musicbrainz_client(mock_score_release=score_single)
+
+        scored = await client._process_and_score_releases(self._release_results(), "metallica", "master of puppets", None)
+
+        assert score_single.call_count == 3
+        assert [release["score"] for release in scored] == [90, 40]
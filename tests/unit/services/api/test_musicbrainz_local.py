@@ -0,0 +1,247 @@
+"""Tests for the local MusicBrainz dump store and its client integration."""
+
+from __future__ import annotations
+
+import gzip
+import json
+from typing import TYPE_CHECKING, Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.api.musicbrainz import MusicBrainzClient
+from services.api.musicbrainz_local import DumpEntity, MusicBrainzLocalStore
+from tests.factories import create_test_app_config
+from tests.mocks.csv_mock import MockLogger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+RELEASE_GROUPS = [
+    {
+        "id": "rg-1",
+        "title": "Master of Puppets",
+        "primary-type": "Album",
+        "first-release-date": "1986-03-03",
+        "artist-credit": [{"name": "Metallica", "joinphrase": "", "artist": {"id": "a-1", "name": "Metallica"}}],
+    },
+    {
+        "id": "rg-2",
+        "title": "Lulu",
+        "primary-type": "Album",
+        "first-release-date": "2011-10-31",
+        "artist-credit": [
+            {"name": "Lou Reed", "joinphrase": " & ", "artist": {"name": "Lou Reed"}},
+            {"name": "Metallica", "joinphrase": "", "artist": {"name": "Metallica"}},
+        ],
+    },
+]
+
+RELEASES = [
+    {
+        "id": "rel-1",
+        "title": "Master of Puppets",
+        "status": "Official",
+        "country": "US",
+        "date": "1986-03-03",
+        "release-group": {"id": "rg-1"},
+        "media": [{"format": "Vinyl"}],
+        "label-info": [{"label": {"name": "Elektra"}, "catalog-number": "60439-1"}],
+    },
+    {"id": "rel-2", "title": "Master of Puppets", "status": "Official", "country": "DE", "date": "2017-11-10", "release-group": {"id": "rg-1"}},
+    {"id": "rel-orphan", "title": "No Group"},
+]
+
+
+def _write_jsonl(path: Path, records: list[dict[str, Any]]) -> Path:
+    path.write_text("\n".join(json.dumps(record) for record in records) + "\n", encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> Iterator[MusicBrainzLocalStore]:
+    """Store populated from JSON Lines dumps."""
+    local_store = MusicBrainzLocalStore(tmp_path / "mb.sqlite3")
+    local_store.import_file(_write_jsonl(tmp_path / "release-group.jsonl", RELEASE_GROUPS))
+    local_store.import_file(_write_jsonl(tmp_path / "release.jsonl", RELEASES))
+    yield local_store
+    local_store.close()
+
+
+class TestImport:
+    """Tests for dump ingestion."""
+
+    def test_json_lines_import(self, store: MusicBrainzLocalStore) -> None:
+        """Release groups, credits and releases are stored; orphan releases are skipped."""
+        assert store.counts() == {"artist-credit": 2, "artist-credit-name": 4, "release-group": 2, "release": 2}
+
+    def test_tsv_import(self, tmp_path: Path) -> None:
+        """Header-row TSV files (optionally gzipped) are imported with NULL markers."""
+        (tmp_path / "artist_credit.tsv").write_text("id\tname\nac-1\tBjörk\n", encoding="utf-8")
+        (tmp_path / "release_group.tsv").write_text(
+            "id\ttitle\tartist_credit\tprimary_type\tfirst_release_date\nrg-9\tHomogenic\tac-1\tAlbum\t1997-09-22\n", encoding="utf-8"
+        )
+        with gzip.open(tmp_path / "release.tsv.gz", "wt", encoding="utf-8") as handle:
+            handle.write("id\trelease_group\ttitle\tstatus\tcountry\tdate\tbarcode\tdisambiguation\tformat\tlabel\tcatalog_number\n")
+            handle.write("rel-9\trg-9\tHomogenic\tOfficial\tGB\t1997-09-22\t\\N\t\\N\tCD\tOne Little Indian\tTPLP71CD\n")
+
+        local_store = MusicBrainzLocalStore(tmp_path / "mb.sqlite3")
+        for name in ("artist_credit.tsv", "release_group.tsv", "release.tsv.gz"):
+            local_store.import_file(tmp_path / name)
+
+        groups = local_store.find_release_groups("björk", "homogenic")
+        assert [group["id"] for group in groups] == ["rg-9"]
+        release = local_store.get_releases("rg-9")["releases"][0]
+        assert release["barcode"] is None
+        assert release["media"] == [{"format": "CD"}]
+        assert release["label-info"] == [{"label": {"name": "One Little Indian"}, "catalog-number": "TPLP71CD"}]
+        local_store.close()
+
+    def test_tsv_collaboration_matches_each_artist(self, tmp_path: Path) -> None:
+        """Credited names from an artist_credit_name TSV make a collaboration findable by each artist."""
+        (tmp_path / "artist_credit.tsv").write_text("id\tname\nac-7\tLou Reed & Metallica\n", encoding="utf-8")
+        (tmp_path / "artist_credit_name.tsv").write_text(
+            "artist_credit\tposition\tname\tjoin_phrase\nac-7\t0\tLou Reed\t & \nac-7\t1\tMetallica\t\\N\n\\N\t0\tOrphan\t\\N\n",
+            encoding="utf-8",
+        )
+        (tmp_path / "release_group.tsv").write_text(
+            "id\ttitle\tartist_credit\tprimary_type\tfirst_release_date\nrg-7\tLulu\tac-7\tAlbum\t2011-10-31\n", encoding="utf-8"
+        )
+        local_store = MusicBrainzLocalStore(tmp_path / "mb.sqlite3")
+
+        results = [local_store.import_file(tmp_path / name) for name in ("artist_credit.tsv", "artist_credit_name.tsv", "release_group.tsv")]
+
+        assert (results[1].entity, results[1].imported, results[1].skipped) == (DumpEntity.ARTIST_CREDIT_NAME, 2, 1)
+        assert [group["id"] for group in local_store.find_release_groups("lou reed", "lulu")] == ["rg-7"]
+        assert [group["id"] for group in local_store.find_release_groups("metallica", "lulu")] == ["rg-7"]
+        assert [group["id"] for group in local_store.find_release_groups("lou reed & metallica", "lulu")] == ["rg-7"]
+        local_store.close()
+
+    def test_reimport_replaces_rows(self, tmp_path: Path, store: MusicBrainzLocalStore) -> None:
+        """Importing a newer dump updates existing rows instead of duplicating them."""
+        updated = [{**RELEASE_GROUPS[0], "first-release-date": "1986-02-24"}]
+        store.import_file(_write_jsonl(tmp_path / "release-group-update.jsonl", updated))
+
+        assert store.counts()["release-group"] == 2
+        assert store.find_release_groups("metallica", "master of puppets")[0]["first-release-date"] == "1986-02-24"
+
+    def test_malformed_lines_are_skipped(self, tmp_path: Path) -> None:
+        """Corrupt JSON lines are counted as skipped without aborting the import."""
+        path = tmp_path / "release-group.jsonl"
+        path.write_text(json.dumps(RELEASE_GROUPS[0]) + "\n{broken\n", encoding="utf-8")
+        local_store = MusicBrainzLocalStore(tmp_path / "mb.sqlite3")
+
+        result = local_store.import_file(path)
+
+        assert (result.imported, result.skipped) == (1, 1)
+        local_store.close()
+
+    @pytest.mark.parametrize(
+        ("file_name", "expected"),
+        [
+            ("release-group.jsonl", DumpEntity.RELEASE_GROUP),
+            ("release_group.tsv", DumpEntity.RELEASE_GROUP),
+            ("release.jsonl.gz", DumpEntity.RELEASE),
+            ("artist_credit.tsv", DumpEntity.ARTIST_CREDIT),
+            ("artist_credit_name.tsv.gz", DumpEntity.ARTIST_CREDIT_NAME),
+        ],
+    )
+    def test_infer_entity(self, tmp_path: Path, file_name: str, expected: DumpEntity) -> None:
+        """The entity type is derived from the file name."""
+        assert MusicBrainzLocalStore.infer_entity(tmp_path / file_name) is expected
+
+    def test_infer_entity_rejects_unknown_names(self, tmp_path: Path) -> None:
+        """Unrecognised file names raise ValueError."""
+        with pytest.raises(ValueError, match="Cannot infer"):
+            MusicBrainzLocalStore.infer_entity(tmp_path / "recordings.jsonl")
+
+
+class TestQueries:
+    """Tests for normalized lookups."""
+
+    def test_lookup_is_normalized(self, store: MusicBrainzLocalStore) -> None:
+        """Case and punctuation differences do not prevent a match."""
+        groups = store.find_release_groups("METALLICA", "Master of Puppets!")
+        assert [group["id"] for group in groups] == ["rg-1"]
+        assert groups[0]["artist-credit"] == [{"name": "Metallica"}]
+
+    def test_collaboration_matches_each_artist(self, store: MusicBrainzLocalStore) -> None:
+        """Every credited artist of a collaboration is indexed."""
+        assert [group["id"] for group in store.find_release_groups("lou reed", "lulu")] == ["rg-2"]
+        assert [group["id"] for group in store.find_release_groups("lou reed and metallica", "lulu")] == ["rg-2"]
+        assert store.find_release_groups("megadeth", "lulu") == []
+
+    def test_releases_are_api_shaped(self, store: MusicBrainzLocalStore) -> None:
+        """Releases come back in the /release browse shape, earliest first."""
+        response = store.get_releases("rg-1")
+        assert response["release-count"] == 2
+        first = response["releases"][0]
+        assert first["id"] == "rel-1"
+        assert first["media"] == [{"format": "Vinyl"}]
+        assert first["label-info"][0]["catalog-number"] == "60439-1"
+
+
+class TestClientIntegration:
+    """Tests for MusicBrainzClient answering from the local store."""
+
+    @staticmethod
+    def _client(store: MusicBrainzLocalStore | None, api: AsyncMock) -> MusicBrainzClient:
+        return MusicBrainzClient(
+            console_logger=MockLogger(),  # type: ignore[arg-type]
+            error_logger=MockLogger(),  # type: ignore[arg-type]
+            make_api_request_func=api,
+            score_release_func=MagicMock(return_value=80),
+            analytics=MagicMock(),
+            local_store=store,
+        )
+
+    @pytest.mark.asyncio
+    async def test_local_hit_skips_web_service(self, store: MusicBrainzLocalStore) -> None:
+        """Albums present in the dump are scored without any HTTP request."""
+        api = AsyncMock(return_value=None)
+        client = self._client(store, api)
+
+        releases = await client.get_scored_releases("metallica", "master of puppets", None)
+
+        assert {release["year"] for release in releases} == {"1986"}
+        assert releases[0]["label"] == "Elektra"
+        api.assert_not_awaited()
+        assert client.local_stats == {"hits": 1, "misses": 0}
+
+    @pytest.mark.asyncio
+    async def test_local_miss_falls_back_to_web_service(self, store: MusicBrainzLocalStore) -> None:
+        """Albums missing from the dump use the online search."""
+        api = AsyncMock(return_value={"count": 0, "release-groups": []})
+        client = self._client(store, api)
+
+        assert await client.get_scored_releases("metallica", "72 seasons", None) == []
+
+        api.assert_awaited()
+        assert client.local_stats == {"hits": 0, "misses": 1}
+
+
+class TestFromConfig:
+    """Tests for configuration-driven construction."""
+
+    def test_disabled_returns_none(self, tmp_path: Path) -> None:
+        """No store is opened when the feature is disabled."""
+        config = create_test_app_config(logs_base_dir=str(tmp_path))
+        assert MusicBrainzLocalStore.from_config(config) is None
+
+    def test_missing_database_returns_none(self, tmp_path: Path) -> None:
+        """An enabled store without an imported database is skipped."""
+        config = create_test_app_config(logs_base_dir=str(tmp_path))
+        config.year_retrieval.musicbrainz_local.enabled = True
+        assert MusicBrainzLocalStore.from_config(config) is None
+
+    def test_existing_database_is_opened(self, tmp_path: Path, store: MusicBrainzLocalStore) -> None:
+        """The configured database path is resolved against logs_base_dir."""
+        config = create_test_app_config(logs_base_dir=str(tmp_path))
+        config.year_retrieval.musicbrainz_local.enabled = True
+        config.year_retrieval.musicbrainz_local.database_path = store.path.name
+
+        opened = MusicBrainzLocalStore.from_config(config)
+
+        assert opened is not None
+        assert opened.path == store.path
@@ -418,6 +418,7 @@ class TestGetArtistStartYear:
         mock.generic_service = MagicMock()
         mock.generic_service.get = MagicMock(return_value=None)
         mock.generic_service.set = MagicMock()
+        mock.generic_service.wait_for_warmup = AsyncMock()
         return mock
 
     @pytest.fixture
@@ -30,7 +30,7 @@ def mock_cache_service() -> AsyncMock:
     service = AsyncMock()
     service.get_async = AsyncMock(return_value=None)
     service.set_async = AsyncMock()
-    service.invalidate = MagicMock()
+    service.invalidate_async = AsyncMock()
     return service
 
 
@@ -249,7 +249,7 @@ class TestCheckCache:
         result = await executor._check_cache("key", "api", "url")
 
         assert result is None
-        mock_cache_service.invalidate.assert_called_once_with("key")
+        mock_cache_service.invalidate_async.assert_awaited_once_with("key")
 
 
 class TestCacheResult:
@@ -0,0 +1,173 @@
+"""Tests for field projection of API responses before caching."""
+
+import logging
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, cast
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.api.response_projection import (
+    DISCOGS_RELEASE,
+    MB_RELEASE_LIST,
+    migrate_cached_responses,
+    project_response,
+    schema_for_cached_response,
+    schema_for_request,
+)
+from services.api.request_executor import ApiRequestExecutor
+
+if TYPE_CHECKING:
+    from core.models.protocols import CacheServiceProtocol
+    from services.api.api_base import ApiRateLimiter
+
+MB_RELEASES_RESPONSE: dict[str, Any] = {
+    "release-count": 1,
+    "release-offset": 0,
+    "releases": [
+        {
+            "id": "rel-1",
+            "title": "Master of Puppets",
+            "status": "Official",
+            "country": "US",
+            "date": "1986-03-03",
+            "barcode": "075596043917",
+            "packaging": "Jewel Case",
+            "quality": "normal",
+            "text-representation": {"language": "eng", "script": "Latn"},
+            "cover-art-archive": {"artwork": True, "count": 4},
+            "release-events": [{"date": "1986-03-03", "area": {"id": "x", "name": "United States"}}],
+            "media": [{"format": "CD", "track-count": 8, "position": 1, "tracks": [{"id": "t1"}]}],
+            "label-info": [{"catalog-number": "60439-2", "label": {"id": "l1", "name": "Elektra", "label-code": 192}}],
+            "artist-credit": [
+                {"name": "Metallica", "joinphrase": "", "artist": {"id": "a1", "name": "Metallica", "sort-name": "Metallica", "type": "Group"}}
+            ],
+        }
+    ],
+}
+
+DISCOGS_DETAIL_RESPONSE: dict[str, Any] = {
+    "id": 123,
+    "title": "Master Of Puppets",
+    "year": 1986,
+    "released": "1986-03-03",
+    "country": "US",
+    "master_id": 6495,
+    "tracklist": [{"position": "A1", "title": "Battery", "duration": "5:10"}],
+    "images": [{"uri": "https://img", "width": 600}],
+    "notes": "Long liner notes" * 20,
+    "formats": [{"name": "Vinyl", "qty": "1", "descriptions": ["LP", "Album"]}],
+    "labels": [{"name": "Elektra", "catno": "60439-1", "resource_url": "https://api"}],
+    "artists": [{"name": "Metallica", "id": 18839, "resource_url": "https://api"}],
+}
+
+
+class TestSchemaSelection:
+    """Tests for choosing a schema per endpoint."""
+
+    @pytest.mark.parametrize(
+        ("api_name", "url", "expected"),
+        [
+            ("musicbrainz", "https://musicbrainz.org/ws/2/release/", MB_RELEASE_LIST),
+            ("discogs", "https://api.discogs.com/releases/123", DISCOGS_RELEASE),
+            ("musicbrainz", "https://musicbrainz.org/ws/2/recording/", None),
+            ("unknown", "https://example.com/release/", None),
+        ],
+    )
+    def test_schema_for_request(self, api_name: str, url: str, expected: dict[str, Any] | None) -> None:
+        """Schemas are selected by API name and URL path."""
+        assert schema_for_request(api_name, url) is expected
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (MB_RELEASES_RESPONSE, MB_RELEASE_LIST),
+            (DISCOGS_DETAIL_RESPONSE, DISCOGS_RELEASE),
+            ({"releases": []}, None),
+            ({"message": "Release not found."}, None),
+            ("1986", None),
+        ],
+    )
+    def test_schema_for_cached_response(self, value: Any, expected: dict[str, Any] | None) -> None:
+        """Cached entries are recognised by their top-level shape."""
+        assert schema_for_cached_response(value) is expected
+
+
+class TestProjection:
+    """Tests for the projection itself."""
+
+    def test_keeps_only_consumed_fields(self) -> None:
+        """Nested lists and dicts are filtered recursively."""
+        projected = project_response(MB_RELEASES_RESPONSE, MB_RELEASE_LIST)
+        release = projected["releases"][0]
+
+        assert set(release) == {"id", "title", "status", "country", "date", "barcode", "media", "label-info", "artist-credit"}
+        assert release["media"] == [{"format": "CD"}]
+        assert release["label-info"] == [{"catalog-number": "60439-2", "label": {"name": "Elektra"}}]
+        assert release["artist-credit"][0]["artist"] == {"id": "a1", "name": "Metallica", "sort-name": "Metallica"}
+        assert projected["release-count"] == 1
+
+    def test_projection_is_idempotent(self) -> None:
+        """Projecting an already projected response changes nothing."""
+        once = project_response(DISCOGS_DETAIL_RESPONSE, DISCOGS_RELEASE)
+        assert project_response(once, DISCOGS_RELEASE) == once
+        assert "tracklist" not in once
+        assert once["formats"] == [{"name": "Vinyl", "descriptions": ["LP", "Album"]}]
+
+    def test_migration_projects_recognised_entries(self) -> None:
+        """Full responses are rewritten through the cache's replace callback with their expiry kept."""
+        cache: OrderedDict[str, tuple[Any, float]] = OrderedDict(
+            [
+                ("mb", (MB_RELEASES_RESPONSE, 100.0)),
+                ("discogs", (DISCOGS_DETAIL_RESPONSE, 200.0)),
+                ("year", ("1986", 300.0)),
+            ]
+        )
+
+        def replace(key: str, value: Any) -> None:
+            cache[key] = (value, cache[key][1])
+
+        assert migrate_cached_responses(cache, replace) == 2
+        assert list(cache) == ["mb", "discogs", "year"]
+        assert cache["discogs"][1] == 200.0
+        assert "tracklist" not in cache["discogs"][0]
+        assert migrate_cached_responses(cache, replace) == 0
+
+
+class TestExecutorProjection:
+    """Tests for projection inside ApiRequestExecutor."""
+
+    @staticmethod
+    def _executor(project_responses: bool, console_logger: logging.Logger, error_logger: logging.Logger) -> tuple[ApiRequestExecutor, AsyncMock]:
+        cache_service = AsyncMock()
+        cache_service.get_async = AsyncMock(return_value=None)
+        cache_service.set_async = AsyncMock()
+        executor = ApiRequestExecutor(
+            cache_service=cast("CacheServiceProtocol", cast(object, cache_service)),
+            rate_limiters=cast(dict[str, "ApiRateLimiter"], {"discogs": MagicMock()}),
+            console_logger=console_logger,
+            error_logger=error_logger,
+            user_agent="TestAgent/1.0",
+            discogs_token="token",
+            cache_ttl_days=1,
+            default_max_retries=0,
+            default_retry_delay=0.0,
+            project_responses=project_responses,
+        )
+        return executor, cache_service
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("enabled", [True, False])
+    async def test_projection_before_caching(self, enabled: bool, console_logger: logging.Logger, error_logger: logging.Logger) -> None:
+        """The projected response is both cached and returned when enabled."""
+        executor, cache_service = self._executor(enabled, console_logger, error_logger)
+        executor._prepare_request = MagicMock(return_value=({}, MagicMock(), MagicMock()))  # type: ignore[method-assign]
+        executor._execute_with_retry = AsyncMock(return_value=DISCOGS_DETAIL_RESPONSE)  # type: ignore[method-assign]
+
+        result = await executor.execute_request("discogs", "https://api.discogs.com/releases/123")
+
+        cached_value = cache_service.set_async.await_args.args[1]
+        assert cached_value == result
+        assert ("tracklist" in cached_value) is not enabled
+        assert result is not None
+        assert result["year"] == 1986
@@ -1,15 +1,27 @@
 """Comprehensive unit tests for the scoring module."""
 
-from unittest.mock import MagicMock
+import asyncio
+import dataclasses
+import logging
+import pickle
+import random
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from core.models.track_models import ScoringConfig
+from services.api.orchestrator import ExternalApiOrchestrator
 from services.api.year_scoring import (
     ArtistPeriodContext,
     ReleaseScorer,
+    ScoringContext,
     create_release_scorer,
 )
+from tests.factories import create_test_app_config
+from tests.mocks.csv_mock import MockAnalytics, MockLogger  # sourcery skip: dont-import-test-modules
 
 
 class TestArtistPeriodContext:
@@ -199,22 +211,19 @@ class TestReleaseScorer:
     def test_artist_period_context(self, scorer: ReleaseScorer) -> None:
         """Test scoring with artist period context."""
         context: ArtistPeriodContext = {"start_year": 1980, "end_year": 2000}
-        scorer.set_artist_period_context(context)
+        scoring_context = ScoringContext.from_artist_period(context)
 
         # Release within period should score better
         within_release = {"title": "Album", "artist": "Artist", "year": "1990", "source": "test"}
-        within_score = scorer.score_original_release(within_release, "artist", "album", artist_region=None)
+        within_score = scorer.score_original_release(within_release, "artist", "album", context=scoring_context)
 
         # Release outside period should be penalized
         outside_release = {"title": "Album", "artist": "Artist", "year": "2010", "source": "test"}
-        outside_score = scorer.score_original_release(outside_release, "artist", "album", artist_region=None)
+        outside_score = scorer.score_original_release(outside_release, "artist", "album", context=scoring_context)
 
         # Within period should score higher
         assert within_score > outside_score
 
-        # Clear context
-        scorer.clear_artist_period_context()
-
     def test_country_matching(self, scorer: ReleaseScorer) -> None:
         """Test country/region matching in scoring."""
         # Matching country should get bonus
@@ -244,15 +253,13 @@ class TestReleaseScorer:
     def test_score_release_complete(self, scorer: ReleaseScorer, sample_release: dict) -> None:
         """Test complete release scoring with all features."""
         context: ArtistPeriodContext = {"start_year": 2015, "end_year": 2023}
-        scorer.set_artist_period_context(context)
+        scoring_context = ScoringContext.from_artist_period(context, artist_region="us")
 
-        score = scorer.score_original_release(sample_release, "test artist", "test album", artist_region="us")
+        score = scorer.score_original_release(sample_release, "test artist", "test album", context=scoring_context)
 
         assert isinstance(score, int)
         assert score >= 0
 
-        scorer.clear_artist_period_context()
-
     def test_score_release_without_context(self, scorer: ReleaseScorer, sample_release: dict) -> None:
         """Test scoring without artist context."""
         score = scorer.score_original_release(sample_release, "test artist", "test album", artist_region=None)
@@ -698,31 +705,31 @@ class TestScoringBranchCoverage:
     def test_year_before_artist_start_penalty(self, scorer: ReleaseScorer) -> None:
         """Year before artist start should be penalized."""
         period: ArtistPeriodContext = {"start_year": 2000, "end_year": 2020}
-        scorer.set_artist_period_context(period)
+        scoring_context = ScoringContext.from_artist_period(period)
         early = {"title": "X", "artist": "A", "year": "1990", "source": "test"}
         within = {"title": "X", "artist": "A", "year": "2010", "source": "test"}
-        assert scorer.score_original_release(within, "a", "x", artist_region=None) > scorer.score_original_release(
-            early, "a", "x", artist_region=None
+        assert scorer.score_original_release(within, "a", "x", context=scoring_context) > scorer.score_original_release(
+            early, "a", "x", context=scoring_context
         )
 
     def test_year_near_artist_start_bonus(self, scorer: ReleaseScorer) -> None:
         """Year near artist start (0-1 years) should get a bonus."""
         period: ArtistPeriodContext = {"start_year": 2000, "end_year": 2020}
-        scorer.set_artist_period_context(period)
+        scoring_context = ScoringContext.from_artist_period(period)
         near_start = {"title": "X", "artist": "A", "year": "2000", "source": "test"}
         mid_career = {"title": "X", "artist": "A", "year": "2010", "source": "test"}
-        score_near = scorer.score_original_release(near_start, "a", "x", artist_region=None)
-        score_mid = scorer.score_original_release(mid_career, "a", "x", artist_region=None)
+        score_near = scorer.score_original_release(near_start, "a", "x", context=scoring_context)
+        score_mid = scorer.score_original_release(mid_career, "a", "x", context=scoring_context)
         assert score_near > score_mid
 
     def test_year_after_artist_end_penalty(self, scorer: ReleaseScorer) -> None:
         """Year well after artist end should be penalized."""
         period: ArtistPeriodContext = {"start_year": 1980, "end_year": 2000}
-        scorer.set_artist_period_context(period)
+        scoring_context = ScoringContext.from_artist_period(period)
         after = {"title": "X", "artist": "A", "year": "2020", "source": "test"}
         within = {"title": "X", "artist": "A", "year": "1995", "source": "test"}
-        assert scorer.score_original_release(within, "a", "x", artist_region=None) > scorer.score_original_release(
-            after, "a", "x", artist_region=None
+        assert scorer.score_original_release(within, "a", "x", context=scoring_context) > scorer.score_original_release(
+            after, "a", "x", context=scoring_context
         )
 
     def test_year_diff_from_rg_first_year(self, scorer: ReleaseScorer) -> None:
@@ -799,3 +806,190 @@ class TestExtractRgFirstYearDebugLog:
         assert result is None
         mock_logger.debug.assert_called_once()
         assert "Failed to extract RG first year" in mock_logger.debug.call_args[0][0]
+
+
+_CONCURRENCY_ALBUMS: list[tuple[str, str, ScoringContext]] = [
+    ("gorillaz", "demon days", ScoringContext(artist_region="gb", start_year=1998, end_year=None)),
+    ("kino", "gruppa krovi", ScoringContext(artist_region="ru", start_year=1981, end_year=1990)),
+    ("abba", "arrival", ScoringContext(artist_region="se", start_year=1972, end_year=1982)),
+    ("daft punk", "discovery", ScoringContext(artist_region="fr", start_year=1993, end_year=2021, album_orig="Discovery (Deluxe)")),
+]
+
+
+def _candidate_releases(album: str) -> list[dict[str, Any]]:
+    """Same candidates for every album, spanning years inside and outside each period."""
+    return [
+        {"title": album.title(), "artist": "x", "year": str(year), "country": country, "source": "musicbrainz"}
+        for year, country in [(1974, "SE"), (1988, "RU"), (2001, "FR"), (2005, "GB"), (2019, "US")]
+    ]
+
+
+def _score_album(scorer: ReleaseScorer, artist: str, album: str, context: ScoringContext) -> list[int]:
+    releases = _candidate_releases(album)
+    for release in releases:
+        release["artist"] = artist
+    return [scorer.score_original_release(release, artist, album, context=context) for release in releases]
+
+
+class TestConcurrentScoring:
+    """Per-call scoring contexts make a shared scorer safe under concurrency."""
+
+    @pytest.fixture
+    def scorer(self) -> ReleaseScorer:
+        """Create a scorer instance shared by all albums."""
+        return create_release_scorer()
+
+    @pytest.fixture
+    def serial_scores(self, scorer: ReleaseScorer) -> dict[str, list[int]]:
+        """Scores computed one album at a time."""
+        return {artist: _score_album(scorer, artist, album, context) for artist, album, context in _CONCURRENCY_ALBUMS}
+
+    def test_context_is_immutable(self) -> None:
+        """Contexts cannot be modified after creation."""
+        context = ScoringContext(artist_region="us")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            context.artist_region = "gb"  # type: ignore[misc]
+
+    def test_contexts_change_scores(self, serial_scores: dict[str, list[int]]) -> None:
+        """Different artist periods and regions produce different score vectors."""
+        assert len({tuple(scores) for scores in serial_scores.values()}) == len(_CONCURRENCY_ALBUMS)
+
+    def test_threads_match_serial(self, scorer: ReleaseScorer, serial_scores: dict[str, list[int]]) -> None:
+        """Interleaved scoring of many albums on one scorer equals serial results."""
+        jobs = _CONCURRENCY_ALBUMS * 25
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda job: (job[0], _score_album(scorer, *job)), jobs))
+
+        for artist, scores in results:
+            assert scores == serial_scores[artist]
+
+    def test_pickled_scorer_matches_serial(self, scorer: ReleaseScorer, serial_scores: dict[str, list[int]]) -> None:
+        """Scorer and contexts survive pickling, as needed for worker processes."""
+        restored: ReleaseScorer = pickle.loads(pickle.dumps(scorer))  # noqa: S301
+
+        for artist, album, context in _CONCURRENCY_ALBUMS:
+            assert _score_album(restored, artist, album, pickle.loads(pickle.dumps(context))) == serial_scores[artist]  # noqa: S301
+
+    @pytest.mark.asyncio
+    async def test_concurrent_albums_in_orchestrator_match_serial(self) -> None:
+        """Albums set up and scored concurrently by the orchestrator keep their own contexts."""
+        orchestrator = ExternalApiOrchestrator(
+            config=create_test_app_config(),
+            console_logger=MockLogger(),  # type: ignore[arg-type]
+            error_logger=MockLogger(),  # type: ignore[arg-type]
+            analytics=MockAnalytics(),
+            cache_service=MagicMock(),
+            pending_verification_service=MagicMock(),
+        )
+        contexts = {artist: context for artist, _, context in _CONCURRENCY_ALBUMS}
+        delays = {artist: 0.001 * (len(contexts) - index) for index, artist in enumerate(contexts)}
+
+        async def activity_period(artist: str) -> tuple[str | None, str | None]:
+            await asyncio.sleep(delays[artist])
+            context = contexts[artist]
+            return (str(context.start_year), str(context.end_year) if context.end_year else None)
+
+        async def region(artist: str) -> str | None:
+            await asyncio.sleep(delays[artist])
+            return contexts[artist].artist_region
+
+        orchestrator.musicbrainz_client = MagicMock(
+            get_artist_activity_period=AsyncMock(side_effect=activity_period),
+            get_artist_region=AsyncMock(side_effect=region),
+        )
+
+        async def process(artist: str, album: str) -> list[int]:
+            artist_region = await orchestrator._setup_artist_context(artist, artist)
+            await asyncio.sleep(delays[artist])
+            releases = _candidate_releases(album)
+            for release in releases:
+                release["artist"] = artist
+            return [int(orchestrator._score_release_wrapper(release, artist, album, artist_region)) for release in releases]
+
+        scorer = orchestrator.release_scorer
+        serial = {artist: _score_album(scorer, artist, album, replace(context, album_orig=None)) for artist, album, context in _CONCURRENCY_ALBUMS}
+        concurrent = await asyncio.gather(*(process(artist, album) for artist, album, _ in _CONCURRENCY_ALBUMS))
+
+        assert dict(zip(contexts, concurrent, strict=True)) == serial
+
+
+_BATCH_CONTEXTS = [
+    ScoringContext(),
+    ScoringContext(artist_region="gb", start_year=1979, end_year=1999),
+    ScoringContext(artist_region="uk", start_year=2000, album_orig="Blue Lines (Remastered)"),
+    ScoringContext(artist_region="us", end_year=1990),
+]
+
+
+def _random_releases(rng: random.Random, count: int, current_year: int) -> list[dict[str, Any]]:
+    """Varied candidate releases covering every scoring branch."""
+    titles = ["Blue Lines", "Blue Lines (Remastered)", "Blue Lines [Deluxe Edition]", "Blue Lines Live", "Protection", "Голубые линии", ""]
+    artists = ["Massive Attack", "massive attack!", "Massive", "Массив Атак", "Hans Zimmer", "", None]
+    years = ["1991", "1979", "1978", "2000", "2012", str(current_year), str(current_year + 1), "0999", "91", "abcd", "", None]
+    release: dict[str, Any]
+    releases: list[dict[str, Any]] = []
+    for _ in range(count):
+        release = {
+            "title": rng.choice(titles),
+            "artist": rng.choice(artists),
+            "year": rng.choice(years),
+            "country": rng.choice(["GB", "UK", "US", "JP", "SE", "", None]),
+            "status": rng.choice(["Official", "Bootleg", "Promotion", "Pseudo-Release", ""]),
+            "genre": rng.choice(["Soundtrack", "Trip Hop", ""]),
+            "is_reissue": rng.random() < 0.2,
+        }
+        release[rng.choice(["album_type", "type"])] = rng.choice(["Album", "EP", "Single", "Compilation", "Live", "", None])
+        if rng.random() < 0.5:
+            release["releasegroup_first_date"] = rng.choice(["1991-04-08", "1985", "2010-01", "0000", "n/a"])
+        if rng.random() < 0.7:
+            release["source"] = rng.choice(["musicbrainz", "discogs", "itunes", "lastfm"])
+        releases.append(release)
+    return releases
+
+
+class TestBatchScoring:
+    """Batch scoring returns exactly the scores of the scalar path."""
+
+    @pytest.fixture(params=["python", "numpy"])
+    def scorer(self, request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> ReleaseScorer:
+        """Scorer with edition stripping; the batch tail runs on the requested backend."""
+        if request.param == "numpy":
+            pytest.importorskip("numpy")
+        else:
+            monkeypatch.setattr("services.api.year_scoring.np", None)
+        logger = logging.getLogger("test.batch_scoring")
+        logger.setLevel(logging.INFO)
+        return create_release_scorer(console_logger=logger, remaster_keywords=["remastered", "deluxe"])
+
+    @pytest.mark.parametrize("context", _BATCH_CONTEXTS)
+    @pytest.mark.parametrize(("artist_norm", "album_norm"), [("massive attack", "blue lines"), ("various artists", "blue lines")])
+    def test_matches_scalar_path(self, scorer: ReleaseScorer, context: ScoringContext, artist_norm: str, album_norm: str) -> None:
+        """Every release scores identically in batch and one by one."""
+        releases = _random_releases(random.Random(42), 300, scorer.current_year)  # noqa: S311
+
+        batch = scorer.score_releases(releases, artist_norm, album_norm, source="discogs", context=context)
+        scalar = [scorer.score_original_release(release, artist_norm, album_norm, source="discogs", context=context) for release in releases]
+
+        assert batch == scalar
+        assert all(type(score) is int for score in batch)
+        assert any(batch)
+
+    def test_small_and_empty_batches(self, scorer: ReleaseScorer) -> None:
+        """Batches below the array threshold take the same path result."""
+        releases = _random_releases(random.Random(7), 3, scorer.current_year)  # noqa: S311
+        scalar = [scorer.score_original_release(release, "massive attack", "blue lines") for release in releases]
+
+        assert scorer.score_releases(releases, "massive attack", "blue lines") == scalar
+        assert scorer.score_releases([], "massive attack", "blue lines") == []
+
+    def test_debug_logging_uses_scalar_path(self) -> None:
+        """With debug logging enabled each release is scored (and logged) individually."""
+        logger = logging.getLogger("test.batch_scoring.debug")
+        logger.setLevel(logging.DEBUG)
+        scorer = create_release_scorer(console_logger=logger)
+        releases = _random_releases(random.Random(3), 5, scorer.current_year)  # noqa: S311
+
+        with patch.object(scorer, "score_original_release", wraps=scorer.score_original_release) as scalar:
+            scorer.score_releases(releases, "massive attack", "blue lines")
+
+        assert scalar.call_count == len(releases)
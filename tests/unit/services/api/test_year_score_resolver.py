@@ -701,3 +701,24 @@ class TestCorrectReissueDetection:
         # With no keywords, the year gap detection may still work
         # but this documents the behavior
         assert best_year in ("2000", "2020")  # Either is acceptable without keywords
+
+
+class TestIsDefinitive:
+    """Tests for the log-free early-stop check."""
+
+    @pytest.mark.parametrize(
+        ("releases", "expected"),
+        [
+            ([], False),
+            ([("2020", 90)], True),
+            ([("2010", 72)], False),  # single old year with modest score is suspicious
+            ([("2030", 95)], False),  # future year
+            ([("2020", 60), ("2019", 10)], False),  # below threshold
+            ([("2020", 72), ("2019", 65)], False),  # close scores
+            ([("2020", 72), ("2019", 50)], True),  # clear margin
+            ([("2020", 80), ("2019", 78)], True),  # very high score
+        ],
+    )
+    def test_matches_expected(self, resolver: YearScoreResolver, releases: list[tuple[str, int]], expected: bool) -> None:
+        """Threshold, margin, future and single-result rules are applied."""
+        assert resolver.is_definitive([create_scored_release(year, score) for year, score in releases]) is expected
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -9,7 +10,9 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from core.models.script_detection import ScriptType
-from services.api.year_search_coordinator import YearSearchCoordinator
+from core.models.track_models import HedgingConfig
+from services.api.year_score_resolver import YearScoreResolver
+from services.api.year_search_coordinator import MAX_LATENCY_SAMPLES, YearSearchCoordinator
 from tests.factories import create_test_app_config
 
 if TYPE_CHECKING:
@@ -640,3 +643,216 @@ class TestDebugApiLogging:
         assert len(warning_calls) == 1
         assert warning_calls[0][0][1] == "musicbrainz"
         assert warning_calls[0][0][2] == "chinese"
+
+
+class TestHedgedSearch:
+    """Tests for speculative fan-out with early cancellation."""
+
+    @staticmethod
+    def _release(year: str, score: int, source: str) -> dict[str, Any]:
+        return {"title": "Album", "year": year, "score": score, "source": source}
+
+    @staticmethod
+    def _delayed(delay: float, result: list[dict[str, Any]]) -> AsyncMock:
+        async def call(*_args: Any) -> list[dict[str, Any]]:
+            await asyncio.sleep(delay)
+            return result
+
+        return AsyncMock(side_effect=call)
+
+    @staticmethod
+    def _coordinator(
+        *,
+        console_logger: logging.Logger,
+        error_logger: logging.Logger,
+        default_config: AppConfig,
+        clients: tuple[AsyncMock, AsyncMock, AsyncMock],
+        delay_seconds: float = 0.05,
+        rate_limiters: dict[str, Any] | None = None,
+    ) -> YearSearchCoordinator:
+        config = default_config.model_copy(deep=True)
+        config.year_retrieval.hedging = HedgingConfig(enabled=True, delay_seconds=delay_seconds, idle_utilization=0.5)
+        resolver = YearScoreResolver(
+            console_logger=console_logger,
+            min_valid_year=1900,
+            current_year=2024,
+            definitive_score_threshold=70,
+            definitive_score_diff=15,
+        )
+        musicbrainz, discogs, applemusic = clients
+        return YearSearchCoordinator(
+            console_logger=console_logger,
+            error_logger=error_logger,
+            config=config,
+            preferred_api="",
+            musicbrainz_client=musicbrainz,
+            discogs_client=discogs,
+            applemusic_client=applemusic,
+            release_scorer=MagicMock(),
+            year_score_resolver=resolver,
+            rate_limiters=rate_limiters,
+        )
+
+    @pytest.mark.asyncio
+    async def test_hedge_starts_fallback_after_delay_and_wins(
+        self,
+        *,
+        console_logger: logging.Logger,
+        error_logger: logging.Logger,
+        default_config: AppConfig,
+        mock_musicbrainz_client: AsyncMock,
+        mock_discogs_client: AsyncMock,
+        mock_applemusic_client: AsyncMock,
+    ) -> None:
+        """A slow primary is hedged; a definitive fallback result cancels it."""
+        mock_discogs_client.get_scored_releases = self._delayed(5.0, [self._release("2019", 90, "discogs")])
+        mock_musicbrainz_client.get_scored_releases = self._delayed(5.0, [])
+        mock_applemusic_client.get_scored_releases = self._delayed(0.0, [self._release("2020", 90, "itunes")])
+        coordinator = self._coordinator(
+            console_logger=console_logger,
+            error_logger=error_logger,
+            default_config=default_config,
+            clients=(mock_musicbrainz_client, mock_discogs_client, mock_applemusic_client),
+        )
+
+        start = asyncio.get_running_loop().time()
+        results = await coordinator._try_script_optimized_search(ScriptType.CYRILLIC, "artist", "album", None)
+        elapsed = asyncio.get_running_loop().time() - start
+
+        assert results is not None
+        assert [r["source"] for r in results] == ["itunes"]
+        assert elapsed < 1.0
+        assert coordinator.hedge_stats["wins"] == 1
+        assert coordinator.hedge_stats["cancelled"] == 2
+
+    @pytest.mark.asyncio
+    async def test_no_hedge_when_primary_answers_first(
+        self,
+        *,
+        console_logger: logging.Logger,
+        error_logger: logging.Logger,
+        default_config: AppConfig,
+        mock_musicbrainz_client: AsyncMock,
+        mock_discogs_client: AsyncMock,
+        mock_applemusic_client: AsyncMock,
+    ) -> None:
+        """Results before the hedge delay stop the fallback providers from starting."""
+        mock_discogs_client.get_scored_releases = self._delayed(0.0, [self._release("2019", 60, "discogs")])
+        mock_musicbrainz_client.get_scored_releases = self._delayed(0.0, [])
+        coordinator = self._coordinator(
+            console_logger=console_logger,
+            error_logger=error_logger,
+            default_config=default_config,
+            clients=(mock_musicbrainz_client, mock_discogs_client, mock_applemusic_client),
+            delay_seconds=1.0,
+        )
+
+        results = await coordinator._try_script_optimized_search(ScriptType.CYRILLIC, "artist", "album", None)
+
+        assert results == [self._release("2019", 60, "discogs")]
+        mock_musicbrainz_client.get_scored_releases.assert_awaited_once()
+        mock_applemusic_client.get_scored_releases.assert_not_awaited()
+        assert coordinator.hedge_stats["launched"] == 0
+
+    @pytest.mark.asyncio
+    async def test_primaries_start_together(
+        self,
+        *,
+        console_logger: logging.Logger,
+        error_logger: logging.Logger,
+        default_config: AppConfig,
+        mock_musicbrainz_client: AsyncMock,
+        mock_discogs_client: AsyncMock,
+        mock_applemusic_client: AsyncMock,
+    ) -> None:
+        """Primary providers run concurrently without waiting for the hedge delay."""
+        mock_discogs_client.get_scored_releases = self._delayed(0.3, [self._release("2019", 60, "discogs")])
+        mock_musicbrainz_client.get_scored_releases = self._delayed(0.3, [self._release("2019", 60, "musicbrainz")])
+        coordinator = self._coordinator(
+            console_logger=console_logger,
+            error_logger=error_logger,
+            default_config=default_config,
+            clients=(mock_musicbrainz_client, mock_discogs_client, mock_applemusic_client),
+            delay_seconds=10.0,
+        )
+
+        start = asyncio.get_running_loop().time()
+        results = await coordinator._try_script_optimized_search(ScriptType.CYRILLIC, "artist", "album", None)
+        elapsed = asyncio.get_running_loop().time() - start
+
+        assert results is not None
+        assert sorted(r["source"] for r in results) == ["discogs", "musicbrainz"]
+        assert elapsed < 0.55
+        mock_applemusic_client.get_scored_releases.assert_not_awaited()
+        assert coordinator.hedge_stats["launched"] == 0
+
+    @pytest.mark.asyncio
+    async def test_idle_budget_starts_provider_immediately(
+        self,
+        *,
+        console_logger: logging.Logger,
+        error_logger: logging.Logger,
+        default_config: AppConfig,
+        mock_musicbrainz_client: AsyncMock,
+        mock_discogs_client: AsyncMock,
+        mock_applemusic_client: AsyncMock,
+    ) -> None:
+        """Fallback providers whose rate window is idle are started without waiting."""
+        mock_discogs_client.get_scored_releases = self._delayed(0.2, [])
+        limiter = MagicMock()
+        limiter.get_stats.return_value = {"window_utilization": 0.0}
+        coordinator = self._coordinator(
+            console_logger=console_logger,
+            error_logger=error_logger,
+            default_config=default_config,
+            clients=(mock_musicbrainz_client, mock_discogs_client, mock_applemusic_client),
+            delay_seconds=10.0,
+            rate_limiters={"musicbrainz": limiter, "itunes": limiter},
+        )
+
+        assert await coordinator._try_script_optimized_search(ScriptType.CYRILLIC, "artist", "album", None) is None
+
+        mock_musicbrainz_client.get_scored_releases.assert_awaited_once()
+        mock_applemusic_client.get_scored_releases.assert_awaited_once()
+        assert coordinator.hedge_stats["launched"] == 1
+
+    @pytest.mark.asyncio
+    async def test_standard_search_cancels_after_definitive(
+        self,
+        *,
+        console_logger: logging.Logger,
+        error_logger: logging.Logger,
+        default_config: AppConfig,
+        mock_musicbrainz_client: AsyncMock,
+        mock_discogs_client: AsyncMock,
+        mock_applemusic_client: AsyncMock,
+    ) -> None:
+        """Concurrent providers still running after a definitive result are cancelled."""
+        mock_musicbrainz_client.get_scored_releases = self._delayed(0.0, [self._release("1999", 95, "musicbrainz")])
+        mock_discogs_client.get_scored_releases = self._delayed(5.0, [self._release("2005", 99, "discogs")])
+        coordinator = self._coordinator(
+            console_logger=console_logger,
+            error_logger=error_logger,
+            default_config=default_config,
+            clients=(mock_musicbrainz_client, mock_discogs_client, mock_applemusic_client),
+        )
+
+        results = await coordinator.fetch_all_api_results("artist", "album", None, "Artist", "Album")
+
+        assert [r["source"] for r in results] == ["musicbrainz"]
+        assert coordinator.hedge_stats["early_stops"] == 1
+        stats = coordinator.get_search_stats()
+        assert stats["albums"] == 1
+        assert stats["latency_p50"] < 1.0
+        assert stats["latency_p95"] is None
+
+    def test_latency_samples_are_bounded(self, coordinator: YearSearchCoordinator) -> None:
+        """Only the most recent latency samples are kept; the album count covers every search."""
+        coordinator.search_latencies.extend([1.0] * (MAX_LATENCY_SAMPLES + 10))
+        coordinator.searched_albums = MAX_LATENCY_SAMPLES + 10
+
+        stats = coordinator.get_search_stats()
+
+        assert len(coordinator.search_latencies) == MAX_LATENCY_SAMPLES
+        assert stats["albums"] == MAX_LATENCY_SAMPLES + 10
+        assert stats["latency_p95"] == 1.0
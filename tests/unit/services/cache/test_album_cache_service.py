@@ -369,3 +369,124 @@ class TestAlbumCacheService:
         await service.store_album_year(artist, album, year)
         result = await service.get_album_year(artist, album)
         assert result == year
+
+    @pytest.mark.asyncio
+    async def test_find_similar_album_year_entry(self) -> None:
+        """Near-miss album names of the same artist resolve to the cached entry."""
+        service = TestAlbumCacheService.create_service()
+        await service.initialize()
+        await service.store_album_year("Radiohead", "OK Computer", "1997", confidence=95)
+        await service.store_album_year("Radiohead", "Kid A", "2000", confidence=95)
+
+        near = await service.find_similar_album_year_entry("radiohead", "OK Computer (Remaster)", min_similarity=0.85)
+        assert near is not None
+        assert near.year == "1997"
+
+        # Different artist, numbered sequel and unrelated titles do not match
+        assert await service.find_similar_album_year_entry("Muse", "OK Computer", min_similarity=0.85) is None
+        assert await service.find_similar_album_year_entry("Radiohead", "Kid A 2", min_similarity=0.85) is None
+        assert await service.find_similar_album_year_entry("Radiohead", "Amnesiac", min_similarity=0.85) is None
+
+    @pytest.mark.asyncio
+    async def test_similar_album_index_follows_updates(self) -> None:
+        """Albums stored or invalidated after the index is built are reflected in lookups."""
+        service = TestAlbumCacheService.create_service()
+        await service.initialize()
+        await service.store_album_year("Radiohead", "OK Computer", "1997", confidence=95)
+        assert await service.find_similar_album_year_entry("Radiohead", "In Rainbow", min_similarity=0.85) is None
+
+        await service.store_album_year("Radiohead", "In Rainbows", "2007", confidence=95)
+        near = await service.find_similar_album_year_entry("Radiohead", "In Rainbow", min_similarity=0.85)
+        assert near is not None
+        assert near.album == "In Rainbows"
+
+        await service.invalidate_album("Radiohead", "In Rainbows")
+        assert await service.find_similar_album_year_entry("Radiohead", "In Rainbow", min_similarity=0.85) is None
+
+    @pytest.mark.asyncio
+    async def test_bulk_lookup_returns_hits_only(self) -> None:
+        """Bulk lookups skip misses, collisions and expired entries, removing the expired ones."""
+        service = TestAlbumCacheService.create_service()
+        await service.initialize()
+        with patch("services.cache.album_cache.time.time", return_value=1000.0):
+            await service.store_album_year("Old", "Album", "1970")
+        await service.store_album_year("Queen", "Jazz", "1978", confidence=90)
+        await service.store_album_year("Queen", "News of the World", "1977")
+        service.album_years_cache[UnifiedHashService.hash_album_key("Queen", "News of the World")] = AlbumCacheEntry(
+            artist="Different Artist", album="Different Album", year="1999", timestamp=time.time()
+        )
+
+        entries = await service.get_album_year_entries_bulk(
+            [("Queen", "Jazz"), ("Queen", "News of the World"), ("Old", "Album"), ("Queen", "Innuendo")]
+        )
+
+        assert list(entries) == [("Queen", "Jazz")]
+        assert entries["Queen", "Jazz"].confidence == 90
+        assert UnifiedHashService.hash_album_key("Old", "Album") not in service.album_years_cache
+
+    @pytest.mark.asyncio
+    async def test_lookups_are_counted_by_miss_reason(self) -> None:
+        """Single and bulk lookups record hits and absent, collision and expired misses."""
+        service = TestAlbumCacheService.create_service()
+        await service.initialize()
+        with patch("services.cache.album_cache.time.time", return_value=1000.0):
+            await service.store_album_year("Old", "Album", "1970")
+        await service.store_album_year("Queen", "Jazz", "1978")
+        await service.store_album_year("Queen", "News of the World", "1977")
+        service.album_years_cache[UnifiedHashService.hash_album_key("Queen", "News of the World")] = AlbumCacheEntry(
+            artist="Different Artist", album="Different Album", year="1999", timestamp=time.time()
+        )
+
+        assert await service.get_album_year("Queen", "Jazz") == "1978"
+        assert await service.get_album_year_entry("Queen", "News of the World") is None
+        await service.get_album_year_entries_bulk([("Queen", "Jazz"), ("Old", "Album"), ("Queen", "Innuendo")])
+
+        metrics = service.get_stats()["metrics"]
+        assert metrics["hits"] == 2
+        assert metrics["miss_reasons"] == {"absent": 1, "expired": 1, "collision": 1}
+        assert metrics["lookup_latency"]["count"] == 5
+        assert list(metrics["content_types"]) == [CacheContentType.ALBUM_YEAR.value]
+
+    @pytest.mark.asyncio
+    async def test_shared_saves_merge_results_of_other_processes(self, tmp_path: Path) -> None:
+        """With a shared cache each save keeps what another process saved and adopts it."""
+        config = create_test_app_config(logs_base_dir=str(tmp_path), caching={"shared": {"enabled": True}})
+        daemon = TestAlbumCacheService.create_service(config)
+        cli = TestAlbumCacheService.create_service(config)
+        await daemon.initialize()
+        await cli.initialize()
+
+        await daemon.store_album_year("Queen", "Jazz", "1978")
+        await daemon.store_album_year("Queen", "Innuendo", "1991")
+        await daemon.save_to_disk()
+        await cli.store_album_year("Blur", "Parklife", "1994")
+        await cli.invalidate_album("Queen", "Innuendo")
+        await cli.save_to_disk()
+
+        assert await cli.get_album_year("Queen", "Jazz") == "1978"
+        await daemon.save_to_disk()
+        assert await daemon.get_album_year("Blur", "Parklife") == "1994"
+        assert await daemon.get_album_year("Queen", "Innuendo") is None
+
+        reloaded = TestAlbumCacheService.create_service(config)
+        await reloaded.initialize()
+        assert {entry.album for entry in reloaded.album_years_cache.values()} == {"Jazz", "Parklife"}
+
+    @pytest.mark.asyncio
+    async def test_shared_save_keeps_newer_entry(self, tmp_path: Path) -> None:
+        """When both processes stored an album, the later year wins in both."""
+        config = create_test_app_config(logs_base_dir=str(tmp_path), caching={"shared": {"enabled": True}})
+        first = TestAlbumCacheService.create_service(config)
+        second = TestAlbumCacheService.create_service(config)
+        await first.initialize()
+        await second.initialize()
+
+        now = time.time()
+        with patch("services.cache.album_cache.time.time", return_value=now):
+            await second.store_album_year("Queen", "Jazz", "1978")
+        with patch("services.cache.album_cache.time.time", return_value=now - 60):
+            await first.store_album_year("Queen", "Jazz", "1977")
+        await second.save_to_disk()
+        await first.save_to_disk()
+
+        assert await first.get_album_year("Queen", "Jazz") == "1978"
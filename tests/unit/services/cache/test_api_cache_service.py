@@ -4,15 +4,17 @@ from __future__ import annotations
 
 import asyncio
 import json
+import time
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, cast
 from unittest.mock import MagicMock, patch
 import pytest
 
-from core.models.track_models import CachedApiResult
+from core.models.track_models import CachedApiResult, TrackDict
+from core.tracks.track_delta import TrackDelta
 from services.cache.api_cache import ApiCacheService
-from services.cache.cache_config import CacheEvent, CacheEventType
+from services.cache.cache_config import CacheContentType, CacheEvent, CacheEventType
 from services.cache.hash_service import UnifiedHashService
 from tests.factories import create_test_app_config
 
@@ -131,6 +133,40 @@ class TestApiCacheService:
         assert result is not None
         assert result.year == "1975"
 
+    @pytest.mark.asyncio
+    async def test_album_index_follows_cache(self) -> None:
+        """The (artist, album) index matches normalized names and drops expired keys."""
+        service = TestApiCacheService.create_service()
+        await service.set_cached_result("Björk", "Homogenic", source="musicbrainz", success=True, data={"year": "1997"})
+        await service.set_cached_result("björk ", "HOMOGENIC", source="discogs", success=False)
+        assert len(service._album_keys[("björk", "homogenic")]) == 2
+
+        failed_ttl = service.cache_config.get_policy(CacheContentType.FAILED_API_LOOKUP).ttl_seconds
+        with patch("services.cache.api_cache.time.time", return_value=time.time() + failed_ttl + 1):
+            await service.cleanup_expired()
+        assert service._album_keys[("björk", "homogenic")] == {UnifiedHashService.hash_api_key("Björk", "Homogenic", "musicbrainz")}
+
+        assert await service.invalidate_for_albums([("BJÖRK", "homogenic"), ("Nobody", "Nothing")]) == 1
+        assert not service.api_cache
+        assert not service._album_keys
+
+    @pytest.mark.asyncio
+    async def test_invalidate_for_delta(self) -> None:
+        """Removed tracks and renamed tracks invalidate their old albums in one batch."""
+        service = TestApiCacheService.create_service()
+        for album in ("Removed", "Renamed", "Retagged", "Untouched"):
+            await service.set_cached_result("Artist", album, source="musicbrainz", success=True, data={"year": "2000"})
+
+        def track(track_id: str, album: str, genre: str = "Rock") -> TrackDict:
+            return TrackDict(id=track_id, name="Song", artist="Artist", album=album, genre=genre, date_added="2020-01-01 00:00:00")
+
+        previous = {"1": track("1", "Removed"), "2": track("2", "Renamed"), "3": track("3", "Retagged"), "4": track("4", "Untouched")}
+        current = {"2": track("2", "Renamed (Remastered)"), "3": track("3", "Retagged", genre="Jazz"), "4": track("4", "Untouched")}
+        delta = TrackDelta(new_ids=[], updated_ids=["2", "3"], removed_ids=["1"])
+
+        assert await service.invalidate_for_delta(delta, previous, current) == 2
+        assert {result.album for result in service.api_cache.values()} == {"Retagged", "Untouched"}
+
     @pytest.mark.asyncio
     async def test_invalidate_all(self) -> None:
         """Test clearing all cache entries."""
@@ -154,14 +190,10 @@ class TestApiCacheService:
         # Add failed entries that should expire
         await service.set_cached_result("Artist2", "Album2", source="source2", success=False)
         await service.set_cached_result("Artist3", "Album3", source="source3", success=False)
-        key2 = UnifiedHashService.hash_api_key("Artist2", "Album2", "source2")
-        key3 = UnifiedHashService.hash_api_key("Artist3", "Album3", "source3")
-
-        if key2 in service.api_cache:
-            service.api_cache[key2].timestamp = 0.0
-        if key3 in service.api_cache:
-            service.api_cache[key3].timestamp = 0.0
-        removed_count = await service.cleanup_expired()
+        # Expiry is indexed when results are stored: age them by moving the clock past the failed-lookup TTL
+        failed_ttl = service.cache_config.get_policy(CacheContentType.FAILED_API_LOOKUP).ttl_seconds
+        with patch("services.cache.api_cache.time.time", return_value=time.time() + failed_ttl + 1):
+            removed_count = await service.cleanup_expired()
         assert removed_count == 2
         assert len(service.api_cache) == 1
         assert await service.get_cached_result("Artist1", "Album1", "source1") is not None
@@ -297,6 +329,23 @@ class TestApiCacheService:
         assert "failed_policy" in stats
         assert stats["persistent"] is True
 
+    @pytest.mark.asyncio
+    async def test_stats_follow_overwrites_and_removals(self) -> None:
+        """Result counts are kept up to date as results are replaced, invalidated and cleared."""
+        service = TestApiCacheService.create_service()
+        await service.set_cached_result("Artist", "Album", source="musicbrainz", success=True, data={"year": "2001"})
+        await service.set_cached_result("Artist", "Album", source="discogs", success=True, data={"year": "2001"})
+        await service.set_cached_result("Artist", "Album", source="musicbrainz", success=False)
+        assert (service.get_stats()["successful_responses"], service.get_stats()["failed_lookups"]) == (1, 1)
+
+        await service.invalidate_for_album("Artist", "Album")
+        assert (service.get_stats()["successful_responses"], service.get_stats()["failed_lookups"]) == (0, 0)
+
+        await service.set_cached_result("Other", "Album", source="discogs", success=True, data={"year": "1999"})
+        await service.invalidate_all()
+        assert service.get_stats()["successful_responses"] == 0
+        assert await service.cleanup_expired() == 0
+
     @pytest.mark.asyncio
     async def test_edge_cases(self) -> None:
         """Test edge cases."""
@@ -481,3 +530,44 @@ class TestApiCacheService:
             task.cancel()
         await asyncio.gather(*service._background_tasks, return_exceptions=True)
         service._background_tasks.clear()
+
+    @pytest.mark.asyncio
+    async def test_lookups_are_counted_per_source(self) -> None:
+        """Cached failures count as negative misses; outcomes are split by API source."""
+        service = TestApiCacheService.create_service()
+        await service.initialize()
+        await service.set_cached_result("Muse", "Drones", source="musicbrainz", success=True, data={"year": "2015"})
+        await service.set_cached_result("Muse", "Origin", source="discogs", success=False)
+
+        await service.get_cached_result("Muse", "Drones", "musicbrainz")
+        await service.get_cached_result("Muse", "Origin", "discogs")
+        await service.get_cached_result("Muse", "Showbiz", "discogs")
+
+        metrics = service.get_stats()["metrics"]
+        assert metrics["content_types"]["musicbrainz"]["hits"] == 1
+        assert metrics["content_types"]["discogs"]["miss_reasons"] == {"absent": 1, "negative": 1}
+
+    @pytest.mark.asyncio
+    async def test_shared_saves_merge_lookups_of_other_processes(self, tmp_path: Path) -> None:
+        """With a shared cache a lookup saved by one process is a hit in the other after its save."""
+        config = create_test_app_config(logs_base_dir=str(tmp_path), caching={"shared": {"enabled": True}})
+        daemon = TestApiCacheService.create_service(config)
+        cli = TestApiCacheService.create_service(config)
+        await daemon.initialize()
+        await cli.initialize()
+
+        await daemon.set_cached_result("Muse", "Drones", source="musicbrainz", success=True, data={"year": "2015"})
+        await daemon.save_to_disk()
+        await cli.set_cached_result("Muse", "Origin", source="discogs", success=False)
+        await cli.save_to_disk()
+        await daemon.save_to_disk()
+
+        assert await cli.get_cached_result("Muse", "Drones", "musicbrainz") is not None
+        assert await daemon.get_cached_result("Muse", "Origin", "discogs") is not None
+        assert daemon.get_stats()["successful_responses"] == 1
+        with daemon.api_cache_file.open(encoding="utf-8") as handle:
+            assert len(json.load(handle)) == 2
+
+        await cli.invalidate_all()
+        await cli.save_to_disk()
+        assert not cli.api_cache_file.exists()
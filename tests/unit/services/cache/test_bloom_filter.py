@@ -0,0 +1,38 @@
+"""Tests for the Bloom filter used for fast negative membership checks."""
+
+from __future__ import annotations
+
+import pytest
+
+from services.cache.bloom_filter import BloomFilter
+
+
+class TestBloomFilter:
+    """Tests for BloomFilter."""
+
+    def test_no_false_negatives_and_few_false_positives(self) -> None:
+        """Every added key is found; unseen keys rarely are."""
+        bloom = BloomFilter.from_keys(f"album-{i}" for i in range(5000))
+
+        assert len(bloom) == 5000
+        assert all(f"album-{i}" in bloom for i in range(5000))
+        false_positives = sum(f"other-{i}" in bloom for i in range(10_000))
+        assert false_positives < 200  # 1% target rate, with slack
+
+    def test_round_trips_through_bytes(self) -> None:
+        """A restored filter answers exactly like the original."""
+        bloom = BloomFilter.for_capacity(100)
+        bloom.add("known")
+
+        restored = BloomFilter.from_bytes(bloom.to_bytes())
+
+        assert "known" in restored
+        assert "unknown" not in restored
+        assert len(restored) == 1
+        assert restored.to_bytes() == bloom.to_bytes()
+
+    @pytest.mark.parametrize("data", [b"", b"BLM1", b"XXXX" + bytes(17) + bytes(8), BloomFilter.for_capacity(10).to_bytes()[:-1]])
+    def test_rejects_malformed_data(self, data: bytes) -> None:
+        """Truncated or foreign data is refused so owners can rebuild."""
+        with pytest.raises(ValueError, match="Bloom filter data"):
+            BloomFilter.from_bytes(data)
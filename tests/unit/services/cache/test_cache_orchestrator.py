@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
+import threading
 from collections import OrderedDict
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, cast
 from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
@@ -16,6 +18,9 @@ from services.cache.orchestrator import CacheOrchestrator
 from tests.factories import create_test_app_config
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Coroutine
+    from pathlib import Path
+
     from core.models.protocols import CacheableValue
     from core.models.track_models import AppConfig
 
@@ -72,6 +77,70 @@ class TestCacheOrchestrator:
         ):
             await orchestrator.initialize()
 
+    @pytest.mark.asyncio
+    async def test_lazy_warmup_loads_in_background(self, tmp_path: Path) -> None:
+        """With lazy warm-up initialize returns at once and each cache waits for its own load."""
+        config = create_test_app_config(logs_base_dir=str(tmp_path))
+        eager = self.create_orchestrator(config)
+        await eager.initialize()
+        await eager.store_album_year("Muse", "Drones", "2015")
+        await eager.set_cached_api_result("Muse", "Drones", "musicbrainz", "2015")
+        eager.set("tracks_all", ["cached"])
+        await eager.save_all_to_disk()
+        await eager.shutdown()
+
+        orchestrator = self.create_orchestrator(config.model_copy(update={"caching": config.caching.model_copy(update={"lazy_warmup": True})}))
+        with patch.object(orchestrator.api_service, "cleanup_expired", new_callable=AsyncMock) as mock_cleanup:
+            await orchestrator.initialize()
+
+            assert await orchestrator.get_async("tracks_all") == ["cached"]
+            assert await orchestrator.get_album_year("Muse", "Drones") == "2015"
+            cached = await orchestrator.get_cached_api_result("Muse", "Drones", "musicbrainz")
+            assert cached is not None
+            assert cached.year == "2015"
+            await orchestrator.load_cache()
+            await orchestrator.shutdown()
+
+        # Expired API entries are cleaned up after the warm-up instead of during initialize
+        mock_cleanup.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_async_access_awaits_warmup_without_blocking_loop(self, tmp_path: Path) -> None:
+        """Coroutines wait for a slow generic warm-up on the event loop; stats report it instead of blocking."""
+        config = create_test_app_config(logs_base_dir=str(tmp_path))
+        eager = self.create_orchestrator(config)
+        await eager.initialize()
+        eager.set("tracks_all", ["cached"])
+        await eager.save_all_to_disk()
+        await eager.shutdown()
+
+        orchestrator = self.create_orchestrator(config.model_copy(update={"caching": config.caching.model_copy(update={"lazy_warmup": True})}))
+        release = threading.Event()
+        load_blocking = orchestrator.generic_service._load_blocking
+
+        def slow_load() -> Any:
+            release.wait(5)
+            return load_blocking()
+
+        with patch.object(orchestrator.generic_service, "_load_blocking", slow_load):
+            await orchestrator.initialize()
+            lookup = asyncio.create_task(orchestrator.get_async("tracks_all"))
+            await asyncio.sleep(0.05)
+
+            # The loop kept running: the lookup is parked and stats return at once
+            assert not lookup.done()
+            assert orchestrator.generic_service.get_stats()["warming_up"]
+            # Synchronous access from the loop would freeze it, so it is refused
+            with pytest.raises(RuntimeError, match="warming up"):
+                orchestrator.get("tracks_all")
+
+            release.set()
+            assert await asyncio.wait_for(lookup, timeout=5) == ["cached"]
+            await orchestrator.invalidate_async("tracks_all")
+            assert await orchestrator.get_async("tracks_all") is None
+            assert not orchestrator.generic_service.get_stats()["warming_up"]
+            await orchestrator.shutdown()
+
     # Album cache tests
 
     @pytest.mark.asyncio
@@ -275,7 +344,7 @@ class TestCacheOrchestrator:
 
     @pytest.mark.asyncio
     async def test_load_cache_noop(self) -> None:
-        """Test that load_cache is a no-op (services load during init)."""
+        """Test that load_cache returns once the services are loaded."""
         orchestrator = self.create_orchestrator()
 
         # Should not raise
@@ -359,6 +428,33 @@ class TestCacheOrchestrator:
 
             mock_stop.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_shared_cache_is_synced_until_shutdown(self) -> None:
+        """With a shared cache the caches are merge-saved every interval; shutdown stops the sync."""
+        config = create_test_app_config(caching={"shared": {"enabled": True, "sync_interval_seconds": 60}})
+        orchestrator = self.create_orchestrator(config)
+        real_wait_for = asyncio.wait_for
+        intervals = iter([True])
+
+        async def elapse_first_interval(awaitable: Awaitable[Any], timeout: float) -> Any:
+            if next(intervals, False):
+                cast("Coroutine[Any, Any, Any]", awaitable).close()
+                raise TimeoutError
+            return await real_wait_for(awaitable, timeout)
+
+        with (
+            patch.object(orchestrator.album_service, "initialize", new_callable=AsyncMock),
+            patch.object(orchestrator.api_service, "initialize", new_callable=AsyncMock),
+            patch.object(orchestrator.generic_service, "initialize", new_callable=AsyncMock),
+            patch.object(orchestrator, "save_all_to_disk", new_callable=AsyncMock) as mock_save,
+            patch("services.cache.orchestrator.asyncio.wait_for", side_effect=elapse_first_interval),
+        ):
+            await orchestrator.initialize()
+            await asyncio.sleep(0)
+            await orchestrator.shutdown()
+
+        mock_save.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_get_cached_api_result(self) -> None:
         """Test that get_cached_api_result delegates to api service."""
@@ -397,3 +493,34 @@ class TestCacheOrchestrator:
             # success should be False for negative/None results
             call_args = mock_set.call_args
             assert call_args.kwargs["success"] is False  # success parameter
+
+    # Instrumentation tests
+
+    @pytest.mark.asyncio
+    async def test_metrics_summary_is_written_as_json(self, tmp_path: Path) -> None:
+        """The end-of-run summary holds every tier and the read-through lookups."""
+        orchestrator = self.create_orchestrator(create_test_app_config(logs_base_dir=str(tmp_path)))
+        await orchestrator.store_album_year("Muse", "Drones", "2015")
+        await orchestrator.get_album_year("Muse", "Drones")
+
+        async def _compute_value() -> CacheableValue:
+            """Compute the cached value."""
+            return "computed"
+
+        await orchestrator.get_async("tracks_all", lambda: asyncio.ensure_future(_compute_value()))
+        await orchestrator.get_async("tracks_all", lambda: asyncio.ensure_future(_compute_value()))
+
+        path = await orchestrator.write_metrics_summary()
+
+        summary = json.loads(path.read_text(encoding="utf-8"))
+        assert path == tmp_path / "analytics" / "cache_metrics.json"
+        assert set(summary["tiers"]) == {"album", "api", "generic"}
+        assert summary["tiers"]["album"]["hits"] == 1
+        assert summary["tiers"]["generic"]["miss_reasons"] == {"absent": 1}
+        assert summary["read_through"]["content_types"]["tracks"] == {
+            "lookups": 2,
+            "hits": 1,
+            "misses": 1,
+            "hit_ratio": 0.5,
+            "miss_reasons": {"absent": 1},
+        }
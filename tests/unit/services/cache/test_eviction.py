@@ -0,0 +1,96 @@
+"""Tests for size-aware GDSF eviction of the generic cache."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from core.models.track_models import TrackDict
+from services.cache.eviction import GdsfEviction, content_type_of, estimate_size
+
+
+class TestContentTypeOf:
+    """Tests for content_type_of."""
+
+    @pytest.mark.parametrize(
+        ("key", "expected"),
+        [
+            ("tracks_all", "tracks"),
+            ("tracks_Radiohead", "tracks"),
+            ("api_request_musicbrainz_0123abcd", "api_request:musicbrainz"),
+            ("discogs_master_42", "discogs_master"),
+            ("discogs_radiohead_ok computer", "discogs"),
+            ("artist_start_year:radiohead", "artist_start_year"),
+            ("trackside", "other"),
+            (42, "other"),
+        ],
+    )
+    def test_key_namespaces(self, key: str | int, expected: str) -> None:
+        """Keys are grouped by their namespace prefix."""
+        assert content_type_of(key) == expected
+
+
+class TestEstimateSize:
+    """Tests for estimate_size."""
+
+    def test_close_to_json_size(self) -> None:
+        """Estimates track the JSON-encoded size of plain data."""
+        value = {"releases": [{"title": f"Album {i}", "year": 1990 + i, "official": True} for i in range(20)]}
+
+        assert estimate_size(value) == pytest.approx(len(json.dumps(value, separators=(",", ":"))), rel=0.1)
+
+    def test_long_lists_are_sampled(self) -> None:
+        """Long sequences are extrapolated from a sample and stay proportional to length."""
+        tracks = [TrackDict(id=str(i), name=f"Song {i}", artist="Artist", album="Album", genre="Rock") for i in range(10_000)]
+
+        assert estimate_size(tracks) == pytest.approx(100 * estimate_size(tracks[:100]), rel=0.05)
+
+
+class TestGdsfEviction:
+    """Tests for GdsfEviction."""
+
+    def test_large_cold_entries_are_evicted_first(self) -> None:
+        """Lower hits per byte means lower priority."""
+        eviction = GdsfEviction()
+        eviction.admit("small", 10, "tracks")
+        eviction.admit("large", 10_000, "api_request:musicbrainz")
+        eviction.admit("hot_large", 10_000, "api_request:musicbrainz")
+        for _ in range(5):
+            eviction.touch("hot_large")
+
+        assert eviction.pop_victim() == "large"
+        assert eviction.pop_victim() == "hot_large"
+        assert eviction.pop_victim() == "small"
+        assert eviction.pop_victim() is None
+
+    def test_inflation_ages_out_idle_entries(self) -> None:
+        """Entries hit before the last evictions lose to newly stored entries."""
+        eviction = GdsfEviction()
+        eviction.admit("old", 100, "other")
+        eviction.touch("old")
+        eviction.touch("old")
+        eviction.admit("mid", 40, "other")
+        assert eviction.pop_victim() == "mid"
+
+        # Without inflation the new entry (1 hit / 100 bytes) would rank below "old" (3 hits / 100 bytes)
+        eviction.admit("new", 100, "other")
+
+        assert eviction.pop_victim() == "old"
+
+    def test_bytes_held_and_evicted_per_content_type(self) -> None:
+        """Byte counts follow admissions, replacements, removals and evictions."""
+        eviction = GdsfEviction()
+        eviction.admit("a", 100, "tracks")
+        eviction.admit("a", 40, "tracks")
+        eviction.admit("b", 500, "discogs")
+        eviction.admit("c", 7, "discogs")
+        eviction.discard("c")
+
+        assert eviction.pop_victim() == "b"
+        assert eviction.bytes_held == 40
+        assert eviction.evicted_bytes == 500
+        assert eviction.stats_by_content_type() == {
+            "discogs": {"entries": 0, "bytes": 0, "evicted_entries": 1, "evicted_bytes": 500},
+            "tracks": {"entries": 1, "bytes": 40, "evicted_entries": 0, "evicted_bytes": 0},
+        }
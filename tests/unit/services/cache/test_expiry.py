@@ -0,0 +1,60 @@
+"""Tests for the heap-based expiry index of the cache services."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from services.cache.expiry import ExpiryIndex
+
+
+class TestExpiryIndex:
+    """Tests for ExpiryIndex."""
+
+    def test_pops_only_due_keys_in_expiry_order(self) -> None:
+        """Keys come out once their time has come, earliest first."""
+        index = ExpiryIndex()
+        index.schedule("late", 300.0)
+        index.schedule("early", 100.0)
+        index.schedule("middle", 200.0)
+
+        assert index.pop_expired(50.0) == []
+        assert index.pop_expired(200.0) == ["early", "middle"]
+        assert len(index) == 1
+        assert "late" in index
+
+    def test_rescheduled_and_discarded_keys_are_not_popped(self) -> None:
+        """Stale heap nodes of moved or removed keys are skipped."""
+        index = ExpiryIndex()
+        index.schedule("moved", 100.0)
+        index.schedule("moved", 500.0)
+        index.schedule("gone", 100.0)
+        index.discard("gone")
+        index.discard("never scheduled")
+
+        assert index.count_expired(200.0) == 0
+        assert index.pop_expired(200.0) == []
+        assert index.count_expired(500.0) == 1
+        assert index.pop_expired(500.0) == ["moved"]
+
+    def test_count_expired_matches_pop(self) -> None:
+        """Counting due keys agrees with popping them and leaves the index intact."""
+        index = ExpiryIndex()
+        for i in range(100):
+            index.schedule(f"key-{i}", float(i % 10))
+        for i in range(0, 100, 3):
+            index.schedule(f"key-{i}", 50.0)
+
+        due = index.count_expired(4.5)
+
+        assert len(index) == 100
+        assert due == len(index.pop_expired(4.5))
+
+    def test_stale_nodes_are_rebuilt_away(self) -> None:
+        """Rescheduling a key many times does not grow the heap without bound."""
+        index = ExpiryIndex()
+        with patch("services.cache.expiry._MIN_REBUILD_SIZE", 10):
+            for i in range(1000):
+                index.schedule("hot", float(i))
+
+        assert len(index._heap) <= 10
+        assert index.pop_expired(1000.0) == ["hot"]
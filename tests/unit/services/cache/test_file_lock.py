@@ -0,0 +1,51 @@
+"""Tests for the cross-process lock guarding shared cache files."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+
+from services.cache.file_lock import CacheFileLock
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class TestCacheFileLock:
+    """Tests for CacheFileLock."""
+
+    def test_second_holder_times_out_until_release(self, tmp_path: Path) -> None:
+        """Another holder of the same file waits for the lock and gives up after the timeout."""
+        cache_file = tmp_path / "cache.json"
+        first = CacheFileLock(cache_file, timeout=1)
+        second = CacheFileLock(cache_file, timeout=0.1)
+        assert first.path == tmp_path / "cache.json.lock"
+
+        first.acquire()
+        with pytest.raises(TimeoutError, match="cache lock"):
+            second.acquire()
+
+        first.release()
+        second.acquire()
+        second.release()
+
+    @pytest.mark.asyncio
+    async def test_async_holders_are_serialized(self, tmp_path: Path) -> None:
+        """Tasks using the lock as a context manager run their critical sections one at a time."""
+        lock = CacheFileLock(tmp_path / "album_years.csv", timeout=1)
+        events: list[str] = []
+
+        async def hold(name: str) -> None:
+            async with lock:
+                events.append(f"{name} in")
+                await asyncio.sleep(0.01)
+                events.append(f"{name} out")
+
+        await asyncio.gather(hold("a"), hold("b"))
+
+        assert events == ["a in", "a out", "b in", "b out"]
+        other = CacheFileLock(tmp_path / "album_years.csv", timeout=0.1)
+        other.acquire()
+        other.release()
@@ -240,7 +240,7 @@ class TestGenericCacheService:
 
     @pytest.mark.asyncio
     async def test_save_to_disk_persists_entries(self) -> None:
-        """Ensure cache entries are written to the configured JSON file."""
+        """Ensure cache entries are written to the log next to the configured file."""
         with tempfile.TemporaryDirectory() as tmp_dir:
             cache_path = Path(tmp_dir) / "generic_cache.json"
             service = TestGenericCacheService.create_service(create_test_app_config(max_generic_entries=100))
@@ -253,11 +253,12 @@ class TestGenericCacheService:
             finally:
                 await service.stop_cleanup_task()
 
-            with cache_path.open(encoding="utf-8") as handle:
-                payload = json.load(handle)
+            with service.log_file.open(encoding="utf-8") as handle:
+                records = [json.loads(line) for line in handle]
 
-            assert payload
-            assert any(entry["value"] for entry in payload.values())
+            assert service.log_file == cache_path.with_suffix(".jsonl")
+            assert records
+            assert any(record["v"] for record in records)
 
     @pytest.mark.asyncio
     async def test_load_from_disk_restores_entries(self) -> None:
@@ -283,6 +284,74 @@ class TestGenericCacheService:
             finally:
                 await service.stop_cleanup_task()
 
+    @pytest.mark.asyncio
+    async def test_save_appends_only_changed_keys(self, tmp_path: Path) -> None:
+        """A save after the first writes one record per key touched since."""
+        service = TestGenericCacheService.create_service(create_test_app_config(max_generic_entries=1000))
+        service.cache_file = tmp_path / "generic_cache.json"
+        for i in range(500):
+            service.set(f"key-{i}", {"payload": "x" * 100}, ttl=60)
+        await service.save_to_disk()
+        size_after_compaction = service.log_file.stat().st_size
+
+        service.set("key-1", {"payload": "updated"}, ttl=60)
+        service.invalidate("key-2")
+        await service.save_to_disk()
+
+        with service.log_file.open(encoding="utf-8") as handle:
+            appended = handle.readlines()[500:]
+        assert len(appended) == 2
+        assert service.log_file.stat().st_size - size_after_compaction < 300
+        assert service.get_stats()["log_records"] == 502
+
+        reloaded = TestGenericCacheService.create_service(create_test_app_config(max_generic_entries=1000))
+        reloaded.cache_file = service.cache_file
+        await reloaded._load_from_disk()
+        assert reloaded.get("key-1") == {"payload": "updated"}
+        assert reloaded.get("key-2") is None
+        assert len(reloaded.cache) == 499
+
+    @pytest.mark.asyncio
+    async def test_log_is_compacted_when_mostly_stale(self, tmp_path: Path) -> None:
+        """Overwritten and expired records are dropped once they outnumber live entries."""
+        service = TestGenericCacheService.create_service(create_test_app_config(max_generic_entries=1000))
+        service.cache_file = tmp_path / "generic_cache.json"
+        service.set("short-lived", "gone soon", ttl=60)
+        for round_number in range(3):
+            for i in range(400):
+                service.set(f"key-{i}", round_number, ttl=60)
+            await service.save_to_disk()
+        assert service.get_stats()["log_records"] == 401
+
+        service.cache[UnifiedHashService.hash_generic_key("short-lived")] = ("gone soon", 0.0)
+        with patch("services.cache.generic_cache._MIN_COMPACTION_RECORDS", 100), patch("services.cache.generic_cache._COMPACTION_RATIO", 1):
+            for i in range(400):
+                service.set(f"key-{i}", "final", ttl=60)
+            await service.save_to_disk()
+
+        with service.log_file.open(encoding="utf-8") as handle:
+            records = [json.loads(line) for line in handle]
+        assert len(records) == 400
+        assert {record["v"] for record in records} == {"final"}
+
+    @pytest.mark.asyncio
+    async def test_load_skips_torn_record_and_migrates_legacy_file(self, tmp_path: Path) -> None:
+        """A partial last line is ignored and the next save rewrites the log; the legacy snapshot is removed."""
+        cache_path = tmp_path / "generic_cache.json"
+        cache_path.write_text("{}", encoding="utf-8")
+        key = UnifiedHashService.hash_generic_key("kept")
+        log_path = cache_path.with_suffix(".jsonl")
+        log_path.write_text(json.dumps({"k": key, "v": "value", "e": 9999999999.0}) + '\n{"k": "torn', encoding="utf-8")
+
+        service = TestGenericCacheService.create_service()
+        service.cache_file = cache_path
+        await service._load_from_disk()
+        assert service.get("kept") == "value"
+
+        await service.save_to_disk()
+        assert log_path.read_text(encoding="utf-8").count("\n") == 1
+        assert not cache_path.exists()
+
     def test_default_ttl_override_from_config(self) -> None:
         """Ensure explicit TTL in config is applied."""
         service = TestGenericCacheService.create_service(
@@ -395,3 +464,132 @@ class TestGenericCacheService:
 
         finally:
             await service.stop_cleanup_task()
+
+    def test_byte_budget_evicts_large_cold_entries_first(self) -> None:
+        """Over the byte budget, large rarely read values go before small frequently read ones."""
+        service = TestGenericCacheService.create_service(create_test_app_config(max_generic_entries=100, max_generic_bytes=1500))
+        service.set("artist_start_year:radiohead", 1985)
+        service.set("api_request_musicbrainz_hot", {"releases": "x" * 600})
+        for _ in range(5):
+            assert service.get("artist_start_year:radiohead") == 1985
+            assert service.get("api_request_musicbrainz_hot") is not None
+
+        service.set("api_request_discogs_cold", {"releases": "y" * 600})
+        service.set("tracks_all", ["z" * 600])
+
+        assert service.get("api_request_discogs_cold") is None
+        assert service.get("artist_start_year:radiohead") == 1985
+        assert service.get("api_request_musicbrainz_hot") is not None
+        stats = service.get_stats()
+        assert stats["bytes_held"] <= 1500
+        assert stats["content_types"]["api_request:discogs"]["evicted_entries"] == 1
+        assert stats["content_types"]["artist_start_year"] == {"entries": 1, "bytes": 4, "evicted_entries": 0, "evicted_bytes": 0}
+
+    @pytest.mark.asyncio
+    async def test_cleanup_follows_latest_ttl(self) -> None:
+        """Cleanup and stats use each key's latest expiry; removed keys are not counted."""
+        service = TestGenericCacheService.create_service()
+        service.set("refreshed", 1, ttl=-1)
+        service.set("refreshed", 2, ttl=60)
+        service.set("expired", 3, ttl=-1)
+        service.set("invalidated", 4, ttl=-1)
+        service.invalidate("invalidated")
+
+        stats = service.get_stats()
+        assert (stats["valid_entries"], stats["expired_entries"]) == (1, 1)
+        assert service.cleanup_expired() == 1
+        assert service.get("refreshed") == 2
+        assert service.get_stats()["expired_entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_content_types_survive_reload(self, tmp_path: Path) -> None:
+        """Restored entries keep their content type and count towards the byte budget."""
+        service = TestGenericCacheService.create_service()
+        service.cache_file = tmp_path / "generic_cache.json"
+        service.set("tracks_all", [{"id": "1", "name": "Airbag"}], ttl=60)
+        service.set("discogs_master_42", {"year": 1997}, ttl=60)
+        await service.save_to_disk()
+
+        reloaded = TestGenericCacheService.create_service()
+        reloaded.cache_file = service.cache_file
+        await reloaded._load_from_disk()
+
+        stats = reloaded.get_stats()
+        assert set(stats["content_types"]) == {"tracks", "discogs_master"}
+        assert stats["bytes_held"] == service.get_stats()["bytes_held"]
+
+    @pytest.mark.asyncio
+    async def test_lookups_are_counted_per_key_namespace(self, tmp_path: Path) -> None:
+        """Hits and absent/expired misses are split by key namespace; saves are timed."""
+        service = TestGenericCacheService.create_service()
+        service.cache_file = tmp_path / "generic_cache.json"
+        service.set("tracks_all", ["track"], ttl=60)
+        service.set("discogs_master_42", {"year": 1997}, ttl=-1)
+
+        service.get("tracks_all")
+        service.get("tracks_Muse")
+        service.get("discogs_master_42")
+        await service.save_to_disk()
+
+        metrics = service.get_stats()["metrics"]
+        assert metrics["content_types"]["tracks"]["hits"] == 1
+        assert metrics["content_types"]["tracks"]["miss_reasons"] == {"absent": 1}
+        assert metrics["content_types"]["discogs_master"]["miss_reasons"] == {"expired": 1}
+        assert metrics["persist_latency"]["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_shared_log_merges_appends_and_compactions_of_other_processes(self, tmp_path: Path) -> None:
+        """With a shared log each save takes in what another process appended or compacted."""
+        config = create_test_app_config(logs_base_dir=str(tmp_path), max_generic_entries=100, caching={"shared": {"enabled": True}})
+        daemon = TestGenericCacheService.create_service(config)
+        cli = TestGenericCacheService.create_service(config)
+        daemon.set("discogs_master_1", {"year": 1997}, ttl=600)
+        daemon.set("discogs_master_2", {"year": 2001}, ttl=600)
+        await daemon.save_to_disk()
+        cli.set("discogs_master_3", {"year": 2015}, ttl=600)
+        await cli.save_to_disk()
+        assert cli.get("discogs_master_1") == {"year": 1997}
+
+        # Appended by the daemon: the CLI reads only the new records
+        daemon.set("discogs_master_4", {"year": 1984}, ttl=600)
+        daemon.invalidate("discogs_master_1")
+        await daemon.save_to_disk()
+        cli.set("discogs_master_2", {"year": 2002}, ttl=600)
+        with patch.object(cli, "_replay_log", side_effect=AssertionError("full replay")):
+            await cli.save_to_disk()
+        assert cli.get("discogs_master_4") == {"year": 1984}
+        assert cli.get("discogs_master_1") is None
+        assert cli.get("discogs_master_2") == {"year": 2002}
+
+        # Compacted by the CLI: the daemon replays the rewritten log
+        cli._compaction_pending = True
+        await cli.save_to_disk()
+        await daemon.save_to_disk()
+        assert daemon.get("discogs_master_2") == {"year": 2002}
+        assert daemon.get("discogs_master_3") == {"year": 2015}
+        assert daemon.get("discogs_master_1") is None
+        assert len(daemon.cache) == 3
+
+    @pytest.mark.asyncio
+    async def test_replace_value_is_persisted_and_reaccounted(self, tmp_path: Path) -> None:
+        """A replaced value keeps its expiry and LRU position, is saved and re-sized for the byte budget."""
+        service = TestGenericCacheService.create_service()
+        service.cache_file = tmp_path / "generic_cache.json"
+        service.set("api_request_discogs_1", {"payload": "x" * 1000, "year": 1997}, ttl=600)
+        service.set("tracks_all", ["track"], ttl=600)
+        await service.save_to_disk()
+        key = UnifiedHashService.hash_generic_key("api_request_discogs_1")
+        expires_at = service.cache[key][1]
+        bytes_before = service.get_stats()["bytes_held"]
+
+        assert service.replace_value(key, {"year": 1997})
+        assert not service.replace_value("missing", {})
+        assert service.cache[key] == ({"year": 1997}, expires_at)
+        assert next(iter(service.cache)) == key
+        assert service.get_stats()["bytes_held"] < bytes_before - 900
+        await service.save_to_disk()
+
+        reloaded = TestGenericCacheService.create_service()
+        reloaded.cache_file = service.cache_file
+        await reloaded._load_from_disk()
+        assert reloaded.get("api_request_discogs_1") == {"year": 1997}
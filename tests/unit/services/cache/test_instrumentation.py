@@ -0,0 +1,68 @@
+"""Tests for cache hit/miss and latency instrumentation."""
+
+from __future__ import annotations
+
+import time
+
+from services.cache.instrumentation import CacheTierMetrics, LatencyHistogram, MissReason
+
+
+class TestLatencyHistogram:
+    """Tests for LatencyHistogram."""
+
+    def test_percentiles_are_bucket_upper_bounds(self) -> None:
+        """Percentiles report the upper bound of the bucket they fall in."""
+        histogram = LatencyHistogram()
+        histogram.record(0.2, count=98)
+        histogram.record(4.0)
+        histogram.record(2000.0)
+
+        summary = histogram.summary()
+
+        assert summary["count"] == 100
+        assert summary["p50_ms"] == 0.25
+        assert summary["p99_ms"] == 5.0
+        assert summary["max_ms"] == 2000.0
+        assert summary["mean_ms"] == round((0.2 * 98 + 4.0 + 2000.0) / 100, 4)
+
+    def test_empty_histogram(self) -> None:
+        """Nothing recorded reports zeros."""
+        assert LatencyHistogram().summary() == {"count": 0, "mean_ms": 0.0, "p50_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+
+
+class TestCacheTierMetrics:
+    """Tests for CacheTierMetrics."""
+
+    def test_summary_counts_outcomes_per_content_type(self) -> None:
+        """Hits and misses are totalled per tier and per content type with their reasons."""
+        metrics = CacheTierMetrics("album")
+        started = time.perf_counter()
+        metrics.record_hit("album_year", started)
+        metrics.record_miss("album_year", MissReason.EXPIRED, started)
+        metrics.record_miss("album_year:near_match", MissReason.ABSENT, started)
+        metrics.record_persist(started)
+
+        summary = metrics.summary()
+
+        assert summary["lookups"] == 3
+        assert summary["hits"] == 1
+        assert summary["misses"] == 2
+        assert summary["hit_ratio"] == 0.3333
+        assert summary["miss_reasons"] == {"absent": 1, "expired": 1}
+        assert summary["content_types"]["album_year"]["hit_ratio"] == 0.5
+        assert summary["content_types"]["album_year:near_match"]["miss_reasons"] == {"absent": 1}
+        assert summary["lookup_latency"]["count"] == 3
+        assert summary["persist_latency"]["count"] == 1
+
+    def test_batch_duration_is_spread_over_keys(self) -> None:
+        """A batched lookup counts every key and records its duration once per key."""
+        metrics = CacheTierMetrics("album")
+        started = time.perf_counter() - 0.01
+
+        metrics.record_batch("album_year", started, 3, {MissReason.ABSENT: 1, MissReason.COLLISION: 0})
+
+        summary = metrics.summary()
+        assert summary["lookups"] == 4
+        assert summary["miss_reasons"] == {"absent": 1}
+        assert summary["lookup_latency"]["count"] == 4
+        assert 2.5 <= summary["lookup_latency"]["max_ms"] < 25
@@ -0,0 +1,280 @@
+"""Tests for the SQLite backend of the album-year and API caches."""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+import json
+import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from core.models.cache_types import AlbumCacheEntry
+from core.models.track_models import CacheBackend, CachedApiResult
+from services.cache.album_cache import AlbumCacheService
+from services.cache.api_cache import ApiCacheService
+from services.cache.hash_service import UnifiedHashService
+from services.cache.orchestrator import CacheOrchestrator
+from services.cache.sqlite_store import SqliteCacheStore
+from tests.factories import create_test_app_config
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> SqliteCacheStore:
+    """Store in a temporary directory."""
+    return SqliteCacheStore(tmp_path / "caches.sqlite3")
+
+
+def _album_service(store: SqliteCacheStore, tmp_path: Path) -> AlbumCacheService:
+    service = AlbumCacheService(create_test_app_config(), MagicMock(), store=store)
+    service.album_years_cache_file = tmp_path / "album_years.csv"
+    return service
+
+
+def _api_service(store: SqliteCacheStore, tmp_path: Path) -> ApiCacheService:
+    service = ApiCacheService(create_test_app_config(), MagicMock(), store=store)
+    service.api_cache_file = tmp_path / "cache.json"
+    return service
+
+
+def _result(artist: str, album: str, source: str, year: str | None, timestamp: float | None = None) -> CachedApiResult:
+    return CachedApiResult(artist=artist, album=album, year=year, source=source, timestamp=timestamp or time.time(), metadata={"score": 90})
+
+
+class TestSqliteCacheStore:
+    """Tests for SqliteCacheStore."""
+
+    def test_database_uses_wal(self, store: SqliteCacheStore) -> None:
+        """The database is opened in WAL mode."""
+        assert store.album_count() == 0
+        row = store._fetchone("PRAGMA journal_mode")
+        assert row is not None
+        assert row[0] == "wal"
+
+    def test_album_batch_round_trip(self, store: SqliteCacheStore) -> None:
+        """Upserts, deletes and clears are applied per batch."""
+        entries = {f"k{i}": AlbumCacheEntry(artist="Artist", album=f"Album {i}", year="2001", timestamp=1.0, confidence=i) for i in range(3)}
+        store.write_album_entries(entries)
+        store.write_album_entries({"k0": AlbumCacheEntry(artist="Artist", album="Album 0", year="1999", timestamp=2.0)}, ["k1"])
+
+        assert store.album_count() == 2
+        assert store.get_album_entry("k0") == AlbumCacheEntry(artist="Artist", album="Album 0", year="1999", timestamp=2.0)
+        assert store.get_album_entry("k1") is None
+        assert set(store.album_entries()) == {"k0", "k2"}
+
+        store.write_album_entries({}, clear=True)
+        assert store.album_count() == 0
+
+    def test_failed_batch_is_rolled_back(self, store: SqliteCacheStore) -> None:
+        """A batch that fails midway leaves the table unchanged."""
+        store.write_album_entries({"k0": AlbumCacheEntry(artist="A", album="B", year="2001", timestamp=1.0)})
+        broken = AlbumCacheEntry(artist="A", album="C", year="2001", timestamp=1.0)
+        broken.year = None  # type: ignore[assignment]  # violates NOT NULL
+
+        with pytest.raises(Exception, match="NOT NULL"):
+            store.write_album_entries({"k1": broken}, ["k0"])
+
+        assert store.get_album_entry("k0") is not None
+
+    def test_api_keys_found_by_normalized_album(self, store: SqliteCacheStore) -> None:
+        """Per-album lookups go through the (artist, album) index with normalized names."""
+        store.write_api_results(
+            {
+                UnifiedHashService.hash_api_key("Björk", "Homogenic", source): _result("Björk", "Homogenic", source, "1997")
+                for source in ("musicbrainz", "discogs")
+            }
+        )
+
+        assert len(store.api_keys_for_albums([("björk", "homogenic")])) == 2
+        assert store.api_counts() == (2, 2)
+        plan = store._fetchall("EXPLAIN QUERY PLAN SELECT key FROM api_results WHERE artist_norm = ? AND album_norm = ?", ("a", "b"))
+        assert "api_results_artist_album" in str(plan)
+
+    def test_reads_do_not_wait_for_writers(self, store: SqliteCacheStore) -> None:
+        """Reads use their own connection: neither this store's write lock nor another process's transaction blocks them."""
+        store.write_album_entries({"k0": AlbumCacheEntry(artist="A", album="B", year="2001", timestamp=1.0)})
+        other_process = sqlite3.connect(store.path, isolation_level=None)
+        other_process.execute("BEGIN IMMEDIATE")
+        other_process.execute("DELETE FROM album_years")
+        try:
+            with store._lock:
+                assert store.get_album_entry("k0") is not None
+                assert store.album_count() == 1
+        finally:
+            other_process.execute("ROLLBACK")
+            other_process.close()
+        store.close()
+        assert store.album_count() == 1
+
+
+class TestAlbumCacheServiceSqlite:
+    """Tests for AlbumCacheService with the SQLite store."""
+
+    @pytest.mark.asyncio
+    async def test_csv_imported_once_and_read_lazily(self, store: SqliteCacheStore, tmp_path: Path) -> None:
+        """The CSV is imported into an empty store; entries are read on demand."""
+        with (tmp_path / "album_years.csv").open("w", encoding="utf-8", newline="") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(["artist", "album", "year", "timestamp", "confidence"])
+            writer.writerow(["Radiohead", "OK Computer", "1997", f"{time.time():.6f}", "90"])
+            writer.writerow(["Radiohead", "Kid A", "2000", f"{time.time():.6f}", "80"])
+
+        service = _album_service(store, tmp_path)
+        await service.initialize()
+
+        assert store.album_count() == 2
+        assert not service.album_years_cache
+        assert await service.get_album_year("Radiohead", "Kid A") == "2000"
+        assert len(service.album_years_cache) == 1
+
+        (tmp_path / "album_years.csv").write_text("artist,album,year\nOther,Album,1990\n", encoding="utf-8")
+        await _album_service(store, tmp_path).initialize()
+        assert store.album_count() == 2
+
+    @pytest.mark.asyncio
+    async def test_save_writes_only_changes(self, store: SqliteCacheStore, tmp_path: Path) -> None:
+        """Stores and invalidations reach the store on save; removed entries are not read back."""
+        store.write_album_entries(
+            {UnifiedHashService.hash_album_key("A", f"Album {i}"): AlbumCacheEntry("A", f"Album {i}", "2001", time.time()) for i in range(3)}
+        )
+        service = _album_service(store, tmp_path)
+        await service.initialize()
+
+        await service.store_album_year("A", "Album 0", "1999", confidence=95)
+        await service.invalidate_album("A", "Album 1")
+        assert await service.get_album_year("A", "Album 1") is None
+        await service.save_to_disk()
+
+        assert store.album_count() == 2
+        stored = store.get_album_entry(UnifiedHashService.hash_album_key("A", "Album 0"))
+        assert stored is not None
+        assert stored.year == "1999"
+        assert service.get_stats()["total_albums"] == 2
+
+        await service.invalidate_all()
+        assert await service.get_album_year("A", "Album 2") is None
+        await service.save_to_disk()
+        assert store.album_count() == 0
+
+    @pytest.mark.asyncio
+    async def test_removal_being_saved_is_not_read_back(self, store: SqliteCacheStore, tmp_path: Path) -> None:
+        """While a save is writing, lookups of its keys do not see the rows it is replacing."""
+        key = UnifiedHashService.hash_album_key("A", "Album 0")
+        store.write_album_entries({key: AlbumCacheEntry("A", "Album 0", "2001", time.time())})
+        service = _album_service(store, tmp_path)
+        await service.initialize()
+        await service.invalidate_album("A", "Album 0")
+        writing, release = threading.Event(), threading.Event()
+        write_album_entries = store.write_album_entries
+
+        def slow_write(*args: Any, **kwargs: Any) -> None:
+            writing.set()
+            release.wait(5)
+            write_album_entries(*args, **kwargs)
+
+        with patch.object(store, "write_album_entries", side_effect=slow_write):
+            save = asyncio.create_task(service.save_to_disk())
+            await asyncio.to_thread(writing.wait, 5)
+            assert await service.get_album_year("A", "Album 0") is None
+            release.set()
+            await save
+
+        assert store.album_count() == 0
+
+    @pytest.mark.asyncio
+    async def test_bulk_lookup_reads_store_in_batches(self, store: SqliteCacheStore, tmp_path: Path) -> None:
+        """Bulk lookups read unloaded entries with chunked queries; pending deletions stay deleted."""
+        store.write_album_entries(
+            {UnifiedHashService.hash_album_key("A", f"Album {i}"): AlbumCacheEntry("A", f"Album {i}", "2001", time.time()) for i in range(5)}
+        )
+        service = _album_service(store, tmp_path)
+        await service.initialize()
+        await service.invalidate_album("A", "Album 0")
+
+        with patch("services.cache.sqlite_store._MAX_QUERY_PARAMETERS", 2):
+            entries = await service.get_album_year_entries_bulk([("A", f"Album {i}") for i in range(6)])
+
+        assert sorted(album for _, album in entries) == ["Album 1", "Album 2", "Album 3", "Album 4"]
+        assert len(service.album_years_cache) == 4
+
+    @pytest.mark.asyncio
+    async def test_near_match_reads_all_entries(self, store: SqliteCacheStore, tmp_path: Path) -> None:
+        """Near-match lookups index every stored album of the artist."""
+        store.write_album_entries(
+            {UnifiedHashService.hash_album_key("Muse", "Absolution"): AlbumCacheEntry("Muse", "Absolution", "2003", time.time())}
+        )
+        service = _album_service(store, tmp_path)
+        await service.initialize()
+
+        entry = await service.find_similar_album_year_entry("Muse", "Absolution!", min_similarity=0.8)
+
+        assert entry is not None
+        assert entry.year == "2003"
+
+
+class TestApiCacheServiceSqlite:
+    """Tests for ApiCacheService with the SQLite store."""
+
+    @pytest.mark.asyncio
+    async def test_json_imported_and_expired_failures_dropped(self, store: SqliteCacheStore, tmp_path: Path) -> None:
+        """The JSON cache is imported; expired failed lookups are deleted in SQL."""
+        fresh = _result("Muse", "Origin of Symmetry", "musicbrainz", "2001")
+        stale = _result("Muse", "Unknown", "discogs", None, timestamp=1.0)
+        payload = {UnifiedHashService.hash_api_key(r.artist, r.album, r.source): r.model_dump() for r in (fresh, stale)}
+        (tmp_path / "cache.json").write_text(json.dumps(payload), encoding="utf-8")
+
+        service = _api_service(store, tmp_path)
+        await service.initialize()
+
+        assert store.api_counts() == (1, 1)
+        assert not service.api_cache
+        cached = await service.get_cached_result("Muse", "Origin of Symmetry", "musicbrainz")
+        assert cached is not None
+        assert cached.metadata == {"score": 90}
+
+    @pytest.mark.asyncio
+    async def test_invalidate_for_album_removes_unloaded_results(self, store: SqliteCacheStore, tmp_path: Path) -> None:
+        """Results never read during the run are still invalidated through the index."""
+        store.write_api_results(
+            {
+                UnifiedHashService.hash_api_key("Muse", "Drones", source): _result("Muse", "Drones", source, "2015")
+                for source in ("musicbrainz", "discogs")
+            }
+        )
+        service = _api_service(store, tmp_path)
+        await service.initialize()
+
+        await service.invalidate_for_album("muse", "drones")
+        assert await service.get_cached_result("Muse", "Drones", "discogs") is None
+        await service.save_to_disk()
+
+        assert store.api_counts() == (0, 0)
+
+
+class TestCacheOrchestratorSqlite:
+    """Tests for the orchestrator's SQLite backend wiring."""
+
+    @pytest.mark.asyncio
+    async def test_services_share_one_store(self, tmp_path: Path) -> None:
+        """Both services use the store configured by ``caching.backend``."""
+        config = create_test_app_config(logs_base_dir=str(tmp_path), caching={"backend": CacheBackend.SQLITE})
+        orchestrator = CacheOrchestrator(config, MagicMock())
+        await orchestrator.initialize()
+        try:
+            await orchestrator.store_album_year("Muse", "Drones", "2015")
+            await orchestrator.set_cached_api_result("Muse", "Drones", "musicbrainz", "2015")
+            await orchestrator.save_all_to_disk()
+        finally:
+            await orchestrator.shutdown()
+
+        assert orchestrator.sqlite_store is not None
+        assert orchestrator.sqlite_store.path == tmp_path / "cache" / "caches.sqlite3"
+        assert orchestrator.sqlite_store.album_count() == 1
+        assert orchestrator.sqlite_store.api_counts() == (1, 1)
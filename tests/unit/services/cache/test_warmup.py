@@ -0,0 +1,76 @@
+"""Tests for background cache warm-up."""
+
+from __future__ import annotations
+
+import logging
+import threading
+
+import pytest
+
+from services.cache.warmup import CacheWarmup
+
+LOGGER = logging.getLogger("test.warmup")
+
+
+class TestCacheWarmup:
+    """Tests for CacheWarmup."""
+
+    @pytest.mark.asyncio
+    async def test_unstarted_warmup_never_waits(self) -> None:
+        """Services that loaded eagerly pass every wait and run callbacks right away."""
+        warmup: CacheWarmup[int] = CacheWarmup("Service", LOGGER)
+        called: list[bool] = []
+
+        await warmup.wait()
+        warmup.wait_blocking()
+        warmup.when_loaded(lambda: called.append(True))
+
+        assert not warmup.loading
+        assert called == [True]
+
+    @pytest.mark.asyncio
+    async def test_load_runs_off_loop_and_applies_once(self) -> None:
+        """The load runs on the loading thread; its result is applied once on the loop thread."""
+        release = threading.Event()
+        load_threads: list[str] = []
+        applied: list[tuple[int, str]] = []
+        callbacks: list[bool] = []
+
+        def load() -> int:
+            load_threads.append(threading.current_thread().name)
+            release.wait(5)
+            return 42
+
+        warmup: CacheWarmup[int] = CacheWarmup("Service", LOGGER)
+        warmup.start(load, lambda value: applied.append((value, threading.current_thread().name)))
+        warmup.when_loaded(lambda: callbacks.append(True))
+        assert warmup.loading
+        assert not applied
+
+        release.set()
+        await warmup.wait()
+        await warmup.wait()
+        warmup.wait_blocking()
+
+        assert len(load_threads) == 1
+        assert load_threads[0].startswith("cache-warmup")
+        assert applied == [(42, threading.current_thread().name)]
+        assert callbacks == [True]
+        assert not warmup.loading
+
+    @pytest.mark.asyncio
+    async def test_failed_load_is_raised_to_every_waiter(self) -> None:
+        """A failed load stays pending so the service never saves over its files."""
+
+        def load() -> int:
+            msg = "corrupt cache"
+            raise ValueError(msg)
+
+        warmup: CacheWarmup[int] = CacheWarmup("Service", LOGGER)
+        warmup.start(load, lambda _: None)
+
+        with pytest.raises(ValueError, match="corrupt cache"):
+            await warmup.wait()
+        with pytest.raises(ValueError, match="corrupt cache"):
+            warmup.wait_blocking()
+        assert warmup.loading
@@ -11,6 +11,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from services.cache.bloom_filter import BloomFilter
 from services.pending_verification import (
     PendingAlbumEntry,
     PendingVerificationService,
@@ -385,6 +386,49 @@ async def test_remove_from_pending_resets_attempt_count(
     assert await service.get_attempt_count("Artist", "Album") == 0
 
 
+@pytest.mark.asyncio
+async def test_unresolvable_filter_tracks_recent_rejections(service: PendingVerificationService) -> None:
+    """Only albums FALLBACK rejected within the interval pass the filter, until removed."""
+    await service.initialize()
+
+    await service.mark_for_verification("Artist", "Rejected", reason=VerificationReason.SUSPICIOUS_YEAR_CHANGE)
+    await service.mark_for_verification("Artist", "Unknown", reason=VerificationReason.NO_YEAR_FOUND)
+
+    assert service.might_be_unresolvable("Artist", "Rejected") is True
+    assert service.might_be_unresolvable("Artist", "Unknown") is False
+    assert service.might_be_unresolvable("Artist", "Never Seen") is False
+
+    await service.remove_from_pending("Artist", "Rejected")
+    assert service.might_be_unresolvable("Artist", "Rejected") is False
+
+
+@pytest.mark.asyncio
+async def test_unresolvable_filter_reused_from_disk_until_csv_changes(
+    config: AppConfig,
+    console_logger: MagicMock,
+    error_logger: MagicMock,
+) -> None:
+    """The persisted filter is trusted while it matches the CSV and rebuilt once the CSV changes."""
+    service = PendingVerificationService(config, console_logger, error_logger)
+    await service.initialize()
+    await service.mark_for_verification("Artist", "Rejected", reason=VerificationReason.IMPLAUSIBLE_EXISTING_YEAR)
+
+    # Swap in an empty filter stamped for the current CSV: a reload must use it as-is
+    filter_path = Path(service.unresolvable_filter_path)
+    stamp = filter_path.read_bytes()[:16]
+    filter_path.write_bytes(stamp + BloomFilter.for_capacity(1).to_bytes())
+    reloaded = PendingVerificationService(config, console_logger, error_logger)
+    await reloaded.initialize()
+    assert reloaded.might_be_unresolvable("Artist", "Rejected") is False
+
+    # Any edit to the CSV makes the persisted filter stale
+    with Path(service.pending_file_path).open("a", encoding="utf-8") as csv_file:
+        csv_file.write("\n")
+    rebuilt = PendingVerificationService(config, console_logger, error_logger)
+    await rebuilt.initialize()
+    assert rebuilt.might_be_unresolvable("Artist", "Rejected") is True
+
+
 @pytest.mark.asyncio
 async def test_malformed_attempt_count_defaults_to_zero(
     console_logger: MagicMock,
@@ -0,0 +1,128 @@
+"""Benchmark the file and SQLite backends of the album-year and API caches.
+
+Builds a library-sized album-year cache and API cache, imports them into
+SQLite, then measures for each backend the startup time and the bytes a
+typical incremental run writes (a few hundred lookups, stores and
+invalidations followed by one save). The file backend loads and rewrites
+``album_years.csv`` and ``cache.json`` in full; the SQLite backend reads
+entries on demand and commits the changed rows (measured as WAL growth).
+
+Usage:
+    uv run python tools/benchmark_cache_backends.py [--albums 20000] [--changes 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project source to path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.models.track_models import AppConfig, CacheBackend  # noqa: E402
+from services.cache.album_cache import AlbumCacheService  # noqa: E402
+from services.cache.api_cache import ApiCacheService  # noqa: E402
+from services.cache.sqlite_store import SqliteCacheStore  # noqa: E402
+from tests.factories import create_test_app_config  # noqa: E402
+
+LOGGER = logging.getLogger("benchmark.cache_backends")
+SOURCES = ("musicbrainz", "discogs")
+
+
+def _services(config: AppConfig, store: SqliteCacheStore | None) -> tuple[AlbumCacheService, ApiCacheService]:
+    return AlbumCacheService(config, LOGGER, store=store), ApiCacheService(config, LOGGER, store=store)
+
+
+async def _populate(config: AppConfig, albums: int) -> None:
+    """Write the file caches as a long-running library would have them."""
+    album_service, api_service = _services(config, None)
+    for i in range(albums):
+        artist, album, year = f"Artist {i // 8}", f"Album {i}", str(1960 + i % 60)
+        await album_service.store_album_year(artist, album, year, confidence=80)
+        for source in SOURCES:
+            data = {"year": year, "title": album, "country": "US", "label": f"Label {i % 97}"}
+            await api_service.set_cached_result(artist, album, source=source, success=True, data=data, metadata={"score": 85})
+    await album_service.save_to_disk()
+    await api_service.save_to_disk()
+
+
+async def _run(album_service: AlbumCacheService, api_service: ApiCacheService, albums: int, changes: int, rng: random.Random) -> None:
+    """Incremental run: lookups, new years, re-fetched results and invalidations."""
+    for i in rng.sample(range(albums), changes):
+        artist, album = f"Artist {i // 8}", f"Album {i}"
+        await album_service.get_album_year_entry(artist, album)
+        await api_service.get_cached_result(artist, album, "musicbrainz")
+    for i in rng.sample(range(albums), changes // 2):
+        await album_service.store_album_year(f"Artist {i // 8}", f"Album {i}", "2001", confidence=95)
+        await api_service.set_cached_result(f"Artist {i // 8}", f"Album {i}", source="discogs", success=True, data={"year": "2001"})
+    for i in rng.sample(range(albums), changes // 2):
+        await album_service.invalidate_album(f"Artist {i // 8}", f"Album {i}")
+        await api_service.invalidate_for_album(f"Artist {i // 8}", f"Album {i}")
+    await album_service.save_to_disk()
+    await api_service.save_to_disk()
+
+
+async def _measure(config: AppConfig, store: SqliteCacheStore | None, albums: int, changes: int, seed: int) -> tuple[float, int]:
+    album_service, api_service = _services(config, store)
+    started = time.perf_counter()
+    await album_service.initialize()
+    await api_service.initialize()
+    startup = time.perf_counter() - started
+
+    if store is None:
+        await _run(album_service, api_service, albums, changes, random.Random(seed))  # noqa: S311
+        written = album_service.album_years_cache_file.stat().st_size + api_service.api_cache_file.stat().st_size
+    else:
+        # Checkpoint first so the WAL only holds this run's commits
+        store.close()
+        await _run(album_service, api_service, albums, changes, random.Random(seed))  # noqa: S311
+        written = store.path.with_name(store.path.name + "-wal").stat().st_size
+        store.close()
+    return startup, written
+
+
+async def _main(albums: int, changes: int, seed: int, directory: Path) -> None:
+    config = create_test_app_config(logs_base_dir=str(directory))
+    await _populate(config, albums)
+
+    sqlite_config = config.model_copy(update={"caching": config.caching.model_copy(update={"backend": CacheBackend.SQLITE})})
+    store = SqliteCacheStore(directory / "cache" / "caches.sqlite3")
+    migration_started = time.perf_counter()
+    for service in _services(sqlite_config, store):
+        await service.initialize()
+    migration = time.perf_counter() - migration_started
+    store.close()
+
+    files_startup, files_written = await _measure(config, None, albums, changes, seed)
+    sqlite_startup, sqlite_written = await _measure(sqlite_config, SqliteCacheStore(store.path), albums, changes, seed)
+
+    print(f"{albums} albums, {albums * len(SOURCES)} API results; run with {changes} lookups, {changes // 2} stores, {changes // 2} invalidations")
+    print(f"  one-shot import into SQLite: {migration * 1000:8.1f} ms")
+    print(f"  {'backend':<8} {'startup':>10} {'written per run':>16}")
+    print(f"  {'files':<8} {files_startup * 1000:8.1f}ms {files_written / 1024:13.1f} KiB")
+    print(f"  {'sqlite':<8} {sqlite_startup * 1000:8.1f}ms {sqlite_written / 1024:13.1f} KiB")
+
+
+def main() -> None:
+    """Run the benchmark and print startup time and write volume per backend."""
+    parser = argparse.ArgumentParser(description="Benchmark album-year and API cache backends")
+    parser.add_argument("--albums", type=int, default=20000, help="Albums in the caches (default: 20000)")
+    parser.add_argument("--changes", type=int, default=200, help="Lookups per run; half as many stores and invalidations (default: 200)")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for the touched albums")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        asyncio.run(_main(args.albums, args.changes, args.seed, Path(tmp_dir)))
+
+
+if __name__ == "__main__":
+    main()
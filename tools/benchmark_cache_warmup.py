@@ -0,0 +1,94 @@
+"""Benchmark eager and lazy cache warm-up at startup.
+
+Builds library-sized album-year, API and generic caches on disk, then
+measures for both modes how long ``CacheOrchestrator.initialize`` blocks
+startup (the delay before the first AppleScript call), when the first
+album-year lookup returns after a simulated AppleScript track fetch, and
+when all caches are loaded.
+
+Usage:
+    uv run python tools/benchmark_cache_warmup.py [--albums 20000] [--fetch-ms 1000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+# Add project source to path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from services.cache.orchestrator import CacheOrchestrator  # noqa: E402
+from tests.factories import create_test_app_config  # noqa: E402
+
+if TYPE_CHECKING:
+    from core.models.track_models import AppConfig
+
+LOGGER = logging.getLogger("benchmark.cache_warmup")
+SOURCES = ("musicbrainz", "discogs")
+
+
+async def _populate(config: AppConfig, albums: int) -> None:
+    """Write the caches as a long-running library would have them."""
+    orchestrator = CacheOrchestrator(config, LOGGER)
+    await orchestrator.initialize()
+    for i in range(albums):
+        artist, album, year = f"Artist {i // 8}", f"Album {i}", str(1960 + i % 60)
+        await orchestrator.store_album_year(artist, album, year, confidence=80)
+        for source in SOURCES:
+            await orchestrator.set_cached_api_result(artist, album, source, year, metadata={"title": album, "label": f"Label {i % 97}"})
+        orchestrator.set(f"tracks_{artist}", [{"id": str(i), "name": f"Track {i}", "album": album}])
+    await orchestrator.save_all_to_disk()
+    await orchestrator.shutdown()
+
+
+async def _measure(config: AppConfig, fetch_seconds: float) -> tuple[float, float, float]:
+    orchestrator = CacheOrchestrator(config, LOGGER)
+    started = time.perf_counter()
+    await orchestrator.initialize()
+    ready = time.perf_counter() - started
+    # Stand-in for fetching tracks from Music.app before the first cache lookup
+    await asyncio.sleep(fetch_seconds)
+    await orchestrator.get_album_year("Artist 0", "Album 0")
+    first_lookup = time.perf_counter() - started
+    await orchestrator.load_cache()
+    loaded = time.perf_counter() - started
+    await orchestrator.shutdown()
+    return ready, first_lookup, loaded
+
+
+async def _main(albums: int, fetch_seconds: float, directory: Path) -> None:
+    config = create_test_app_config(logs_base_dir=str(directory))
+    await _populate(config, albums)
+
+    print(f"{albums} albums, {albums * len(SOURCES)} API results, {albums // 8} generic entries; {fetch_seconds * 1000:.0f} ms track fetch")
+    print(f"  {'mode':<6} {'initialize':>11} {'first lookup':>13} {'all loaded':>11}")
+    for lazy in (False, True):
+        mode_config = config.model_copy(update={"caching": config.caching.model_copy(update={"lazy_warmup": lazy})})
+        ready, first_lookup, loaded = await _measure(mode_config, fetch_seconds)
+        mode = "lazy" if lazy else "eager"
+        print(f"  {mode:<6} {ready * 1000:9.1f}ms {first_lookup * 1000:11.1f}ms {loaded * 1000:9.1f}ms")
+
+
+def main() -> None:
+    """Run the benchmark and print startup latency per warm-up mode."""
+    parser = argparse.ArgumentParser(description="Benchmark eager and lazy cache warm-up")
+    parser.add_argument("--albums", type=int, default=20000, help="Albums in the caches (default: 20000)")
+    parser.add_argument("--fetch-ms", type=float, default=1000, help="Simulated AppleScript fetch before the first lookup (default: 1000)")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        asyncio.run(_main(args.albums, args.fetch_ms / 1000, Path(tmp_dir)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Benchmark bytes written when persisting the generic cache.
+
+Fills a large cache, saves it once, touches a few keys (updates and
+invalidations, as an incremental run does) and saves again. The baseline
+rewrites the whole cache as the former JSON snapshot; the append-only log
+writes one record per touched key.
+
+Usage:
+    uv run python tools/benchmark_generic_cache_log.py [--entries 50000] [--touched 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project source to path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from services.cache.generic_cache import GenericCacheService  # noqa: E402
+from tests.factories import create_test_app_config  # noqa: E402
+
+LOGGER = logging.getLogger("benchmark.generic_cache_log")
+
+
+def _snapshot_bytes(service: GenericCacheService) -> int:
+    """Size of the former full JSON snapshot of the cache."""
+    payload = {key: {"value": value, "expires_at": expires_at} for key, (value, expires_at) in service.cache.items()}
+    return len(json.dumps(payload, indent=2).encode())
+
+
+async def _run(entries: int, touched: int, seed: int, directory: Path) -> None:
+    rng = random.Random(seed)  # noqa: S311
+    service = GenericCacheService(create_test_app_config(max_generic_entries=entries * 2), LOGGER)
+    service.cache_file = directory / "generic_cache.json"
+    for i in range(entries):
+        service.set(f"request-{i}", {"status": 200, "year": str(1960 + i % 60), "tags": ["rock", "live"]}, ttl=86400)
+    await service.save_to_disk()
+    compacted = service.log_file.stat().st_size
+
+    keys = rng.sample(range(entries), touched)
+    for i in keys[: touched // 2]:
+        service.set(f"request-{i}", {"status": 200, "year": "2001", "tags": ["updated"]}, ttl=86400)
+    for i in keys[touched // 2 :]:
+        service.invalidate(f"request-{i}")
+
+    started = time.perf_counter()
+    await service.save_to_disk()
+    append_seconds = time.perf_counter() - started
+    appended = service.log_file.stat().st_size - compacted
+
+    started = time.perf_counter()
+    snapshot = _snapshot_bytes(service)
+    snapshot_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    reloaded = GenericCacheService(create_test_app_config(max_generic_entries=entries * 2), LOGGER)
+    reloaded.cache_file = service.cache_file
+    await reloaded.initialize()
+    load_seconds = time.perf_counter() - started
+    await reloaded.stop_cleanup_task()
+    assert reloaded.cache.keys() == service.cache.keys()
+
+    print(f"{entries} entries, {touched} touched keys ({touched // 2} updated, {touched - touched // 2} invalidated)")
+    print(f"  full JSON snapshot: {snapshot / 1024:10.1f} KiB  ({snapshot_seconds * 1000:6.1f} ms to serialize)")
+    print(f"  log append:         {appended / 1024:10.1f} KiB  ({append_seconds * 1000:6.1f} ms to save)")
+    print(f"  log after compaction: {compacted / 1024:8.1f} KiB, streaming reload {load_seconds * 1000:.1f} ms")
+
+
+def main() -> None:
+    """Run the benchmark and print bytes written per save."""
+    parser = argparse.ArgumentParser(description="Benchmark generic cache persistence")
+    parser.add_argument("--entries", type=int, default=50000, help="Entries in the cache (default: 50000)")
+    parser.add_argument("--touched", type=int, default=200, help="Keys updated or invalidated before the second save (default: 200)")
+    parser.add_argument("--seed", type=int, default=41, help="Random seed for the touched keys")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        asyncio.run(_run(args.entries, args.touched, args.seed, Path(tmp_dir)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Benchmark for the Aho-Corasick keyword matcher.
+
+Classifies a synthetic library of album names the way a run does: album
+type (special/compilation/reissue, word boundaries), soundtrack detection
+and edition-keyword checks. The previous approach searches each pattern
+separately (a compiled regex per album-type pattern, a substring check per
+keyword); the matcher finds all keywords of a set in one scan per name.
+
+Usage:
+    uv run python tools/benchmark_keyword_matching.py [--albums 30000] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import sys
+import timeit
+from pathlib import Path
+
+# Add project source to path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from core.models import album_type  # noqa: E402
+from core.models.keyword_matcher import get_keyword_matcher  # noqa: E402
+
+SOUNDTRACK_PATTERNS = frozenset({"soundtrack", "original score", "OST", "motion picture", "film score"})
+EDITION_KEYWORDS = ("remaster", "remastered", "reissue", "anniversary", "deluxe edition", "expanded edition", "special edition", "bonus")
+WORDS = ["black", "night", "river", "echo", "glass", "summer", "ghost", "iron", "velvet", "north", "dream", "fire", "stone", "moon"]
+SUFFIXES = ["", "", "", "", " (Remastered)", " (Deluxe Edition)", " - Greatest Hits", " B-Sides", " Original Soundtrack", " [Live]"]
+
+
+def _library(albums: int, seed: int) -> list[str]:
+    rng = random.Random(seed)  # noqa: S311
+    return [" ".join(rng.sample(WORDS, rng.randint(1, 4))).title() + rng.choice(SUFFIXES) for _ in range(albums)]
+
+
+def _pattern_sets() -> tuple[frozenset[str], ...]:
+    patterns = album_type.get_patterns()
+    return patterns.special, patterns.compilation, patterns.reissue
+
+
+def _per_pattern_pass(names: list[str], compiled: list[list[tuple[str, re.Pattern[str]]]]) -> list[tuple[object, ...]]:
+    """Previous approach: one search per pattern."""
+    results: list[tuple[object, ...]] = []
+    for name in names:
+        normalized = album_type._normalize_for_matching(name)  # noqa: SLF001
+        category = next(
+            (index for index, patterns in enumerate(compiled) if any(matcher.search(normalized) for _, matcher in patterns)),
+            None,
+        )
+        name_lower = name.lower()
+        soundtrack = any(pattern.lower() in name_lower for pattern in SOUNDTRACK_PATTERNS)
+        edition = any(keyword in name_lower for keyword in EDITION_KEYWORDS)
+        results.append((category, soundtrack, edition))
+    return results
+
+
+def _matcher_pass(names: list[str]) -> list[tuple[object, ...]]:
+    """One automaton scan per keyword set."""
+    pattern_sets = _pattern_sets()
+    type_matcher = album_type._build_matcher(*pattern_sets)  # noqa: SLF001
+    soundtrack_matcher = get_keyword_matcher(SOUNDTRACK_PATTERNS)
+    edition_matcher = get_keyword_matcher(EDITION_KEYWORDS)
+    results: list[tuple[object, ...]] = []
+    for name in names:
+        matched = {match.pattern for match in type_matcher.find_all(album_type._normalize_for_matching(name))}  # noqa: SLF001
+        category = next((index for index, patterns in enumerate(pattern_sets) if matched & patterns), None)
+        results.append((category, soundtrack_matcher.contains_any(name), edition_matcher.contains_any(name)))
+    return results
+
+
+def main() -> None:
+    """Run the benchmark and print timings."""
+    parser = argparse.ArgumentParser(description="Benchmark multi-pattern keyword matching")
+    parser.add_argument("--albums", type=int, default=30000, help="Album names classified per pass (default: 30000)")
+    parser.add_argument("--repeat", type=int, default=3, help="Passes per measurement (default: 3)")
+    parser.add_argument("--seed", type=int, default=30000, help="Random seed for the synthetic names")
+    args = parser.parse_args()
+
+    names = _library(args.albums, args.seed)
+    compiled = [
+        [(pattern, re.compile(rf"\b{re.escape(pattern.replace('-', ' ').replace('_', ' '))}\b")) for pattern in patterns]
+        for patterns in _pattern_sets()
+    ]
+    pattern_count = sum(len(patterns) for patterns in compiled) + len(SOUNDTRACK_PATTERNS) + len(EDITION_KEYWORDS)
+
+    if _per_pattern_pass(names, compiled) != _matcher_pass(names):
+        sys.exit("Matcher results differ from per-pattern search")
+
+    per_pattern = min(timeit.repeat(lambda: _per_pattern_pass(names, compiled), number=1, repeat=args.repeat))
+    matcher = min(timeit.repeat(lambda: _matcher_pass(names), number=1, repeat=args.repeat))
+
+    print(f"{args.albums} album names, {pattern_count} patterns, best of {args.repeat} passes")
+    print(f"  per-pattern search: {per_pattern * 1000:8.1f} ms")
+    print(f"  keyword matcher:    {matcher * 1000:8.1f} ms  ({per_pattern / matcher:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""Profiling benchmark for the memoized name normalizers.
+
+Simulates the normalization work of a year pass over a synthetic library:
+per track the artist and album are normalized for matching and the album
+type is detected; per album the API clients normalize the search terms and
+candidate artists, and every candidate release is scored. The pass runs
+once with the memoized normalizers and once with the original functions,
+reports the CPU time of both and the per-function hit rates.
+
+Usage:
+    uv run python tools/benchmark_normalization.py [--albums 5000] [--tracks 10] [--releases 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import inspect
+import logging
+import random
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+# Add project source to path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from core.models import album_type, normalization  # noqa: E402
+from services.api import discogs, year_scoring  # noqa: E402
+from services.api.api_base import BaseApiClient  # noqa: E402
+from services.api.discogs import DiscogsClient  # noqa: E402
+from services.api.year_scoring import ReleaseScorer, ScoringContext, create_release_scorer  # noqa: E402
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+REMASTER_KEYWORDS = ["remaster", "remastered", "deluxe", "edition", "anniversary", "expanded", "bonus"]
+EDITIONS = ["", "", "", " (Remastered)", " (Deluxe Edition)", " [Bonus Tracks]", " (Live)"]
+WORDS = ["black", "night", "river", "echo", "glass", "summer", "ghost", "iron", "velvet", "north", "hits", "sessions", "demo"]
+
+# Memoized functions and every namespace they are looked up from
+MEMOIZED_ATTRIBUTES: list[tuple[object, str]] = [
+    (normalization, "normalize_for_matching"),
+    (year_scoring, "normalize_for_matching"),
+    (discogs, "normalize_for_matching"),
+    (year_scoring, "_strip_keyword_segments"),
+    (album_type, "_normalize_for_matching"),
+    (ReleaseScorer, "_normalize_name"),
+    (BaseApiClient, "_normalize_name"),
+    (DiscogsClient, "_normalize_artist_for_matching"),
+]
+
+Album = tuple[str, str, list[dict[str, Any]]]
+
+
+def _library(albums: int, releases: int, seed: int) -> list[Album]:
+    """Build albums of ~5 per artist, each with candidate releases."""
+    rng = random.Random(seed)  # noqa: S311
+    artists = [" ".join(rng.sample(WORDS, 2)).title() for _ in range(max(1, albums // 5))]
+    library: list[Album] = []
+    for _ in range(albums):
+        artist = rng.choice(artists)
+        album = " ".join(rng.sample(WORDS, rng.randint(1, 3))).title()
+        candidates = [
+            {
+                "title": album + rng.choice(EDITIONS),
+                "artist": rng.choice([artist, artist, artist.upper(), f"{artist} (2)", "Various Artists"]),
+                "year": str(rng.randint(1970, 2024)),
+                "country": rng.choice(["US", "GB", "DE", "JP"]),
+                "status": "Official",
+                "album_type": rng.choice(["Album", "Compilation", "EP"]),
+            }
+            for _ in range(releases)
+        ]
+        library.append((artist, album + rng.choice(EDITIONS), candidates))
+    return library
+
+
+def _year_pass(library: list[Album], tracks_per_album: int, scorer: ReleaseScorer) -> None:
+    """Run the normalization-heavy part of a year pass."""
+    for artist, album, candidates in library:
+        for _ in range(tracks_per_album):
+            normalization.normalize_for_matching(artist)
+            normalization.normalize_for_matching(album)
+            album_type.detect_album_type(album)
+
+        artist_norm = BaseApiClient._normalize_name(artist)  # noqa: SLF001
+        album_norm = BaseApiClient._normalize_name(album)  # noqa: SLF001
+        context = ScoringContext(album_orig=album)
+        for release in candidates:
+            DiscogsClient._normalize_artist_for_matching(release["artist"])  # noqa: SLF001
+            scorer.score_original_release(release, artist_norm, album_norm, source="musicbrainz", context=context)
+
+
+@contextmanager
+def _unmemoized() -> Iterator[None]:
+    """Temporarily restore the original, unmemoized functions."""
+    originals = [(owner, name, inspect.getattr_static(owner, name)) for owner, name in MEMOIZED_ATTRIBUTES]
+    for owner, name, value in originals:
+        if isinstance(value, staticmethod):
+            setattr(owner, name, staticmethod(value.__func__.__wrapped__))
+        else:
+            setattr(owner, name, value.__wrapped__)
+    try:
+        yield
+    finally:
+        for owner, name, value in originals:
+            setattr(owner, name, value)
+
+
+def _cpu_seconds(library: list[Album], tracks_per_album: int, scorer: ReleaseScorer) -> float:
+    start = time.process_time()
+    _year_pass(library, tracks_per_album, scorer)
+    return time.process_time() - start
+
+
+def main() -> None:
+    """Run the benchmark and print CPU times and hit rates."""
+    parser = argparse.ArgumentParser(description="Benchmark memoized name normalization")
+    parser.add_argument("--albums", type=int, default=5000, help="Albums in the year pass (default: 5000)")
+    parser.add_argument("--tracks", type=int, default=10, help="Tracks per album (default: 10)")
+    parser.add_argument("--releases", type=int, default=20, help="Candidate releases per album (default: 20)")
+    parser.add_argument("--seed", type=int, default=5000, help="Random seed for the synthetic library")
+    args = parser.parse_args()
+
+    logger = logging.getLogger("benchmark")
+    logger.setLevel(logging.INFO)
+    scorer = create_release_scorer(console_logger=logger, remaster_keywords=REMASTER_KEYWORDS)
+    library = _library(args.albums, args.releases, args.seed)
+
+    with _unmemoized():
+        uncached = _cpu_seconds(library, args.tracks, scorer)
+    normalization.clear_normalization_caches()
+    cached = _cpu_seconds(library, args.tracks, scorer)
+
+    print(f"{args.albums} albums x {args.tracks} tracks, {args.releases} candidate releases per album")
+    print(f"  unmemoized: {uncached:7.2f} s CPU")
+    print(f"  memoized:   {cached:7.2f} s CPU  ({1 - cached / uncached:.0%} less)")
+    print()
+    print(f"  {'function':42} {'calls':>9} {'hit rate':>9} {'size':>7}")
+    for name, stats in normalization.get_normalization_stats().items():
+        calls = int(stats["hits"] + stats["misses"])
+        print(f"  {name:42} {calls:9d} {stats['hit_rate']:9.1%} {int(stats['size']):7d}")
+
+
+if __name__ == "__main__":
+    main()
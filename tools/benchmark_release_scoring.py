@@ -0,0 +1,97 @@
+"""Microbenchmark for scalar vs batch release scoring.
+
+Scores a synthetic album result set (MusicBrainz-style: many releases of the
+same few titles) with ``ReleaseScorer.score_original_release`` per release
+and with ``ReleaseScorer.score_releases`` for the whole batch, verifies the
+scores are identical and prints per-album timings.
+
+Usage:
+    uv run python tools/benchmark_release_scoring.py [--releases 100] [--repeat 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import random
+import sys
+import timeit
+from pathlib import Path
+from typing import Any
+
+# Add project source to path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from services.api import year_scoring  # noqa: E402
+from services.api.year_scoring import ReleaseScorer, ScoringContext, create_release_scorer  # noqa: E402
+
+REMASTER_KEYWORDS = ["remaster", "remastered", "deluxe", "edition", "anniversary", "expanded"]
+TITLES = [
+    "OK Computer",
+    "OK Computer (Remastered)",
+    "OK Computer (Collector's Edition)",
+    "OK Computer OKNOTOK 1997 2017",
+    "OK Computer [Deluxe Edition]",
+]
+ARTISTS = ["Radiohead", "Radiohead", "Radiohead", "Radiohead & Friends", "Various Artists"]
+COUNTRIES = ["GB", "US", "JP", "DE", "XE", "NL", ""]
+STATUSES = ["Official", "Official", "Official", "Promotion", "Bootleg"]
+TYPES = ["Album", "Album", "Album", "Compilation", "Live", "EP"]
+
+
+def _releases(count: int, seed: int) -> list[dict[str, Any]]:
+    """Build a reproducible candidate set for one album."""
+    rng = random.Random(seed)  # noqa: S311
+    return [
+        {
+            "title": rng.choice(TITLES),
+            "artist": rng.choice(ARTISTS),
+            "year": str(rng.choice([1997, 1997, 1998, 2008, 2009, 2016, 2017])),
+            "country": rng.choice(COUNTRIES),
+            "status": rng.choice(STATUSES),
+            "album_type": rng.choice(TYPES),
+            "releasegroup_first_date": "1997-05-21",
+            "is_reissue": rng.random() < 0.3,
+        }
+        for _ in range(count)
+    ]
+
+
+def _scalar(scorer: ReleaseScorer, releases: list[dict[str, Any]], context: ScoringContext) -> list[int]:
+    return [scorer.score_original_release(release, "radiohead", "ok computer", source="musicbrainz", context=context) for release in releases]
+
+
+def _batch(scorer: ReleaseScorer, releases: list[dict[str, Any]], context: ScoringContext) -> list[int]:
+    return scorer.score_releases(releases, "radiohead", "ok computer", source="musicbrainz", context=context)
+
+
+def main() -> None:
+    """Run the benchmark and print timings."""
+    parser = argparse.ArgumentParser(description="Benchmark scalar vs batch release scoring")
+    parser.add_argument("--releases", type=int, default=100, help="Releases per album (default: 100)")
+    parser.add_argument("--repeat", type=int, default=200, help="Albums scored per measurement (default: 200)")
+    parser.add_argument("--seed", type=int, default=1997, help="Random seed for the synthetic releases")
+    args = parser.parse_args()
+
+    logger = logging.getLogger("benchmark")
+    logger.setLevel(logging.INFO)
+    scorer = create_release_scorer(console_logger=logger, remaster_keywords=REMASTER_KEYWORDS)
+    context = ScoringContext(artist_region="gb", start_year=1985, album_orig="OK Computer")
+    releases = _releases(args.releases, args.seed)
+
+    if _scalar(scorer, releases, context) != _batch(scorer, releases, context):
+        sys.exit("Batch scores differ from scalar scores")
+
+    backend = "numpy" if year_scoring.np is not None else "pure python"
+    scalar_seconds = min(timeit.repeat(lambda: _scalar(scorer, releases, context), number=args.repeat, repeat=5))
+    batch_seconds = min(timeit.repeat(lambda: _batch(scorer, releases, context), number=args.repeat, repeat=5))
+
+    per_album = 1000 / args.repeat
+    print(f"{args.releases} releases per album, best of 5 x {args.repeat} albums, batch backend: {backend}")
+    print(f"  scalar: {scalar_seconds * per_album:8.3f} ms/album")
+    print(f"  batch:  {batch_seconds * per_album:8.3f} ms/album  ({scalar_seconds / batch_seconds:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
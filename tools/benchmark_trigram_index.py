@@ -0,0 +1,100 @@
+"""Benchmark for trigram fuzzy album lookup.
+
+Looks up near-miss album names (dropped article, typo, punctuation) in a
+synthetic library. The baseline scores every indexed name with the same
+Dice similarity; the index only scores names sharing a trigram with the
+query and keeps the top-k with a heap.
+
+Usage:
+    uv run python tools/benchmark_trigram_index.py [--albums 30000] [--queries 500] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import timeit
+from pathlib import Path
+
+# Add project source to path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from core.models.normalization import normalize_for_matching  # noqa: E402
+from core.models.trigram_index import TrigramIndex, _profile  # noqa: E402
+
+# Consonant-vowel syllables for pronounceable artist-style words
+SYLLABLES = [consonant + vowel for consonant in "bdfgklmnprstvz" for vowel in "aeiou"]
+MIN_SIMILARITY = 0.8
+LIMIT = 5
+
+
+def _library(albums: int, rng: random.Random) -> list[str]:
+    vocabulary = ["".join(rng.choices(SYLLABLES, k=rng.randint(2, 4))) for _ in range(albums // 5)] + ["the", "of"]
+    return [" ".join(rng.sample(vocabulary, rng.randint(2, 5))).title() for _ in range(albums)]
+
+
+def _near_miss(name: str, rng: random.Random) -> str:
+    """Drop a character, remove an article or add punctuation."""
+    variant = rng.randrange(3)
+    if variant == 0:
+        position = rng.randrange(len(name))
+        return name[:position] + name[position + 1 :]
+    if variant == 1:
+        return name.replace("The ", "", 1) if "The " in name else name + "."
+    return name.replace(" ", ", ", 1)
+
+
+def _linear_scan(profiles: list[tuple[frozenset[str], frozenset[str]]], queries: list[str]) -> list[list[int]]:
+    """Baseline: score the query against every name."""
+    results: list[list[int]] = []
+    for query in queries:
+        trigrams, numbers = _profile(normalize_for_matching(query))
+        scored = []
+        for position, (entry_trigrams, entry_numbers) in enumerate(profiles):
+            similarity = 2 * len(trigrams & entry_trigrams) / (len(trigrams) + len(entry_trigrams))
+            if similarity >= MIN_SIMILARITY and entry_numbers == numbers:
+                scored.append((similarity, position))
+        scored.sort(key=lambda item: -item[0])
+        results.append(sorted(position for _, position in scored[:LIMIT]))
+    return results
+
+
+def _indexed(index: TrigramIndex[int], queries: list[str]) -> list[list[int]]:
+    return [sorted(match.value for match in index.search(query, limit=LIMIT, min_similarity=MIN_SIMILARITY)) for query in queries]
+
+
+def main() -> None:
+    """Run the benchmark and print timings."""
+    parser = argparse.ArgumentParser(description="Benchmark trigram fuzzy album lookup")
+    parser.add_argument("--albums", type=int, default=30000, help="Indexed album names (default: 30000)")
+    parser.add_argument("--queries", type=int, default=500, help="Near-miss lookups per pass (default: 500)")
+    parser.add_argument("--repeat", type=int, default=3, help="Passes per measurement (default: 3)")
+    parser.add_argument("--seed", type=int, default=39, help="Random seed for the synthetic names")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)  # noqa: S311
+    names = _library(args.albums, rng)
+    queries = [_near_miss(rng.choice(names), rng) for _ in range(args.queries)]
+
+    build_start = timeit.default_timer()
+    index: TrigramIndex[int] = TrigramIndex()
+    for position, name in enumerate(names):
+        index.add(name, position)
+    build = timeit.default_timer() - build_start
+    profiles = [_profile(normalize_for_matching(name)) for name in names]
+
+    found = sum(bool(hits) for hits in _indexed(index, queries))
+
+    scan = min(timeit.repeat(lambda: _linear_scan(profiles, queries), number=1, repeat=args.repeat))
+    indexed = min(timeit.repeat(lambda: _indexed(index, queries), number=1, repeat=args.repeat))
+
+    print(f"{args.albums} album names, {args.queries} near-miss lookups ({found} matched), best of {args.repeat} passes")
+    print(f"  index build:  {build * 1000:8.1f} ms")
+    print(f"  linear scan:  {scan * 1000:8.1f} ms")
+    print(f"  trigram index:{indexed * 1000:8.1f} ms  ({scan / indexed:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
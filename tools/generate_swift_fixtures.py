@@ -30,7 +30,7 @@ from core.models.normalization import normalize_for_matching  # noqa: E402
 from core.models.track_models import ScoringConfig, TrackDict  # noqa: E402
 from core.tracks.year_consistency import YearConsistencyChecker  # noqa: E402
 from services.api.year_score_resolver import YearScoreResolver  # noqa: E402
-from services.api.year_scoring import ReleaseScorer  # noqa: E402
+from services.api.year_scoring import ReleaseScorer, ScoringContext  # noqa: E402
 
 # Quiet logger for deterministic output
 _logger = logging.getLogger("fixture_gen")
@@ -945,19 +945,19 @@ def generate_scoring_fixtures() -> list[dict[str, Any]]:
         artist_norm = normalize_for_matching(query_artist)
         album_norm = normalize_for_matching(query_album)
 
-        # Set artist period context if provided
-        if "artistPeriod" in case:
-            scorer.artist_period_context = case["artistPeriod"]
-        else:
-            scorer.artist_period_context = None
+        # Artist period context (if provided) travels with the call
+        context = ScoringContext.from_artist_period(
+            case.get("artistPeriod"),
+            artist_region=case.get("artistRegion"),
+            album_orig=query_album,
+        )
 
         score = scorer.score_original_release(
             release=release,
             artist_norm=artist_norm,
             album_norm=album_norm,
-            artist_region=case.get("artistRegion"),
             source=str(release.get("source", "unknown")),
-            album_orig=query_album,
+            context=context,
         )
 
         fixtures.append(
@@ -984,7 +984,6 @@ def generate_scoring_fixtures() -> list[dict[str, Any]]:
         query_album = str(rset["queryAlbum"])
         artist_norm = normalize_for_matching(query_artist)
         album_norm = normalize_for_matching(query_album)
-        scorer.artist_period_context = None
 
         scored: list[dict[str, Any]] = []
         for cand in rset["candidates"]: